@@ -0,0 +1,72 @@
+"""
+Event Serialization Performance Evaluation
+==========================================
+
+Measures how many streamed events per second AgentOS can turn into SSE
+messages, for a token-streaming run of 500 RunContentEvents. Compared with
+serializing the events through dataclasses.asdict and the json module.
+"""
+
+import json
+from dataclasses import asdict
+
+from agno.eval.performance import PerformanceEval
+from agno.os.utils import format_sse_event
+from agno.run.agent import RunContentEvent
+from agno.utils.serialize import json_serializer
+
+# ---------------------------------------------------------------------------
+# Create Benchmark Events
+# ---------------------------------------------------------------------------
+NUM_TOKENS = 500
+
+events = [
+    RunContentEvent(
+        agent_id="streaming-agent",
+        agent_name="Streaming Agent",
+        run_id="run-id",
+        session_id="session-id",
+        content=f"token{i} ",
+    )
+    for i in range(NUM_TOKENS)
+]
+
+
+# ---------------------------------------------------------------------------
+# Create Benchmark Functions
+# ---------------------------------------------------------------------------
+def serialize_events():
+    return [format_sse_event(event) for event in events]
+
+
+def serialize_events_with_asdict():
+    messages = []
+    for event in events:
+        event_dict = {k: v for k, v in asdict(event).items() if v is not None}
+        data = json.dumps(
+            event_dict, separators=(",", ":"), default=json_serializer, ensure_ascii=False
+        )
+        messages.append(f"event: {event.event}\ndata: {data}\n\n")
+    return messages
+
+
+# ---------------------------------------------------------------------------
+# Create Evaluations
+# ---------------------------------------------------------------------------
+asdict_perf = PerformanceEval(
+    name="Event serialization (asdict)",
+    func=serialize_events_with_asdict,
+    num_iterations=100,
+)
+sse_perf = PerformanceEval(
+    name="Event serialization", func=serialize_events, num_iterations=100
+)
+
+# ---------------------------------------------------------------------------
+# Run Evaluations
+# ---------------------------------------------------------------------------
+if __name__ == "__main__":
+    for perf in (asdict_perf, sse_perf):
+        result = perf.run(print_results=True, print_summary=True)
+        if result.avg_run_time > 0:
+            print(f"{perf.name}: {NUM_TOKENS / result.avg_run_time:,.0f} events/sec")
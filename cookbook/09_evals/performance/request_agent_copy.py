@@ -0,0 +1,63 @@
+"""
+Per-Request Agent Copy Performance Evaluation
+=============================================
+
+Compares the cost of the per-request agent copy AgentOS makes (request_copy)
+with a full deep_copy, for an agent configured with many tools.
+"""
+
+from agno.agent import Agent
+from agno.eval.performance import PerformanceEval
+from agno.tools import tool
+
+
+# ---------------------------------------------------------------------------
+# Create Benchmark Agent
+# ---------------------------------------------------------------------------
+def make_tool(index: int):
+    @tool(name=f"lookup_{index}")
+    def lookup(query: str) -> str:
+        """Look up a record by query."""
+        return f"record {index} for {query}"
+
+    return lookup
+
+
+agent = Agent(
+    id="tooled-agent",
+    tools=[make_tool(i) for i in range(40)],
+    instructions=["Answer with the records you find.", "Be concise."],
+    session_state={"visits": 0},
+    metadata={"team": "support"},
+)
+
+
+# ---------------------------------------------------------------------------
+# Create Benchmark Functions
+# ---------------------------------------------------------------------------
+def deep_copy_agent():
+    return agent.deep_copy()
+
+
+def request_copy_agent():
+    return agent.request_copy()
+
+
+# ---------------------------------------------------------------------------
+# Create Evaluations
+# ---------------------------------------------------------------------------
+deep_copy_perf = PerformanceEval(
+    name="Agent deep_copy", func=deep_copy_agent, num_iterations=1000
+)
+request_copy_perf = PerformanceEval(
+    name="Agent request_copy", func=request_copy_agent, num_iterations=1000
+)
+
+# ---------------------------------------------------------------------------
+# Run Evaluations
+# ---------------------------------------------------------------------------
+if __name__ == "__main__":
+    for perf in (deep_copy_perf, request_copy_perf):
+        result = perf.run(print_results=True, print_summary=True)
+        if result.avg_run_time > 0:
+            print(f"{perf.name}: {1 / result.avg_run_time:,.0f} copies/sec")
@@ -0,0 +1,68 @@
+"""
+Tool Preparation Performance Evaluation
+=======================================
+
+Measures the per-run tool preparation of an agent with 50 tools: every run
+copies each Function and processes its entrypoint. Processed entrypoints are
+cached, so only the first run builds the JSON schemas.
+"""
+
+from typing import List, Optional
+
+from agno.eval.performance import PerformanceEval
+from agno.tools import tool
+from agno.tools.function import Function, clear_compiled_entrypoints
+
+
+# ---------------------------------------------------------------------------
+# Create Benchmark Tools
+# ---------------------------------------------------------------------------
+def make_tool(index: int) -> Function:
+    @tool(name=f"search_orders_{index}")
+    def search_orders(
+        customer_id: str, statuses: Optional[List[str]] = None, limit: int = 10
+    ) -> str:
+        """Search the orders of a customer.
+
+        Args:
+            customer_id: The ID of the customer.
+            statuses: Only return orders with these statuses.
+            limit: Maximum number of orders to return.
+        """
+        return f"{limit} orders of {customer_id}"
+
+    return search_orders
+
+
+tools = [make_tool(i) for i in range(50)]
+
+
+# ---------------------------------------------------------------------------
+# Create Benchmark Functions
+# ---------------------------------------------------------------------------
+def prepare_tools():
+    for function in tools:
+        function.model_copy(deep=True).process_entrypoint(strict=False)
+
+
+def prepare_tools_uncached():
+    clear_compiled_entrypoints()
+    prepare_tools()
+
+
+# ---------------------------------------------------------------------------
+# Create Evaluations
+# ---------------------------------------------------------------------------
+uncached_perf = PerformanceEval(
+    name="Tool preparation (uncached)", func=prepare_tools_uncached, num_iterations=100
+)
+cached_perf = PerformanceEval(
+    name="Tool preparation (cached)", func=prepare_tools, num_iterations=100
+)
+
+# ---------------------------------------------------------------------------
+# Run Evaluations
+# ---------------------------------------------------------------------------
+if __name__ == "__main__":
+    uncached_perf.run(print_results=True, print_summary=True)
+    cached_perf.run(print_results=True, print_summary=True)
@@ -166,6 +166,62 @@ async def aread_session(
         return None
 
 
+def read_session_lazy(agent: Agent, session_id: str, user_id: Optional[str] = None) -> Optional[AgentSession]:
+    """Get an AgentSession from the database, deserializing its runs only when accessed.
+
+    Databases storing runs in their own table only load the last num_history_runs runs,
+    the older runs are loaded the first time they are needed.
+    """
+    try:
+        if not agent.db:
+            raise ValueError("Db not initialized")
+        db = cast(BaseDb, agent.db)
+        session_raw, has_older_runs = db.get_session_with_last_runs(
+            session_id=session_id,
+            session_type=SessionType.AGENT,
+            user_id=user_id,
+            last_n_runs=agent.num_history_runs,
+        )
+        if session_raw is None:
+            return None
+
+        def load_older_runs() -> List[Dict[str, Any]]:
+            log_debug(f"Loading older runs of AgentSession: {session_id}")
+            return cast(List[Dict[str, Any]], db.get_runs(session_id, user_id=user_id, deserialize=False))
+
+        return AgentSession.from_dict_lazy(session_raw, load_older_runs=load_older_runs if has_older_runs else None)
+    except Exception as e:
+        import traceback
+
+        traceback.print_exc(limit=3)
+        log_warning(f"Error getting session from db: {str(e)}")
+        return None
+
+
+async def aread_session_lazy(agent: Agent, session_id: str, user_id: Optional[str] = None) -> Optional[AgentSession]:
+    """Get an AgentSession from an async database, deserializing its runs only when accessed.
+
+    Async databases keep the runs in the sessions table, so all runs are read: num_history_runs does not
+    window the read, only the deserialization of the runs is deferred.
+    """
+    try:
+        if not agent.db:
+            raise ValueError("Db not initialized")
+        log_debug(f"Async databases don't window session reads, loading all runs of AgentSession: {session_id}")
+        session_raw = await agent.db.get_session(  # type: ignore
+            session_id=session_id, session_type=SessionType.AGENT, user_id=user_id, deserialize=False
+        )
+        if session_raw is None:
+            return None
+        return AgentSession.from_dict_lazy(session_raw)
+    except Exception as e:
+        import traceback
+
+        traceback.print_exc(limit=3)
+        log_warning(f"Error getting session from db: {str(e)}")
+        return None
+
+
 def upsert_session(
     agent: Agent, session: Union[AgentSession, TeamSession, WorkflowSession]
 ) -> Optional[Union[AgentSession, TeamSession, WorkflowSession]]:
@@ -308,9 +364,15 @@ def read_or_create_session(
     if agent.db is not None and agent.team_id is None and agent.workflow_id is None:
         log_debug(f"Reading AgentSession: {session_id}")
 
-        agent_session = cast(AgentSession, read_session(agent, session_id=session_id, user_id=user_id))
+        if agent.lazy_load_session_runs:
+            agent_session = read_session_lazy(agent, session_id=session_id, user_id=user_id)
+        else:
+            agent_session = cast(AgentSession, read_session(agent, session_id=session_id, user_id=user_id))
 
-    if agent_session is None:
+    if agent_session is not None:
+        # Runs are saved through upsert_run, so saving the session only writes the runs upserted from now on
+        agent_session.mark_runs_saved()
+    else:
         # Creating new session if none found
         log_debug(f"Creating new AgentSession: {session_id}")
         session_data = {}
@@ -327,6 +389,7 @@ def read_or_create_session(
             metadata=agent.metadata,
             created_at=int(time()),
         )
+        agent_session.mark_runs_saved()
         if agent.introduction is not None:
             agent_session.upsert_run(
                 RunOutput(
@@ -371,11 +434,20 @@ async def aread_or_create_session(
     if agent.db is not None and agent.team_id is None and agent.workflow_id is None:
         log_debug(f"Reading AgentSession: {session_id}")
         if _init.has_async_db(agent):
-            agent_session = cast(AgentSession, await aread_session(agent, session_id=session_id, user_id=user_id))
+            if agent.lazy_load_session_runs:
+                agent_session = await aread_session_lazy(agent, session_id=session_id, user_id=user_id)
+            else:
+                agent_session = cast(AgentSession, await aread_session(agent, session_id=session_id, user_id=user_id))
         else:
-            agent_session = cast(AgentSession, read_session(agent, session_id=session_id, user_id=user_id))
-
-    if agent_session is None:
+            if agent.lazy_load_session_runs:
+                agent_session = read_session_lazy(agent, session_id=session_id, user_id=user_id)
+            else:
+                agent_session = cast(AgentSession, read_session(agent, session_id=session_id, user_id=user_id))
+
+    if agent_session is not None:
+        # Runs are saved through upsert_run, so saving the session only writes the runs upserted from now on
+        agent_session.mark_runs_saved()
+    else:
         # Creating new session if none found
         log_debug(f"Creating new AgentSession: {session_id}")
         session_data = {}
@@ -392,6 +464,7 @@ async def aread_or_create_session(
             metadata=agent.metadata,
             created_at=int(time()),
         )
+        agent_session.mark_runs_saved()
         if agent.introduction is not None:
             agent_session.upsert_run(
                 RunOutput(
@@ -468,6 +541,8 @@ def to_dict(agent: Agent) -> Dict[str, Any]:
         config["overwrite_db_session_state"] = agent.overwrite_db_session_state
     if agent.cache_session:
         config["cache_session"] = agent.cache_session
+    if agent.lazy_load_session_runs:
+        config["lazy_load_session_runs"] = agent.lazy_load_session_runs
     if agent.search_past_sessions:
         config["search_past_sessions"] = agent.search_past_sessions
     if agent.num_past_sessions_to_search is not None:
@@ -911,6 +986,7 @@ def from_dict(cls: Type[Agent], data: Dict[str, Any], registry: Optional[Registr
         enable_agentic_state=config.get("enable_agentic_state", False),
         overwrite_db_session_state=config.get("overwrite_db_session_state", False),
         cache_session=config.get("cache_session", False),
+        lazy_load_session_runs=config.get("lazy_load_session_runs", False),
         search_past_sessions=config.get("search_past_sessions", config.get("search_session_history", False)),
         num_past_sessions_to_search=config.get("num_past_sessions_to_search", config.get("num_history_sessions")),
         num_past_session_runs_in_search=config.get(
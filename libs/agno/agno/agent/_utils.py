@@ -175,6 +175,58 @@ def deep_copy(agent: Agent, *, update: Optional[Dict[str, Any]] = None) -> Agent
         raise
 
 
+# Mutable containers a request can change in place, copied for every request copy
+REQUEST_COPIED_FIELDS = (
+    "session_state",
+    "dependencies",
+    "metadata",
+    "knowledge_filters",
+)
+
+
+def request_copy(agent: Agent) -> Agent:
+    """Create a lightweight copy of this Agent for a single request.
+
+    Unlike deep_copy(), __init__ is not run again and the configuration (model, tools, knowledge,
+    instructions, prompts, hooks) is shared with the original. Only the state a run can change is
+    isolated: the fields in REQUEST_COPIED_FIELDS are copied and the internal run state is reset.
+    Use deep_copy() when tools must not be shared between copies.
+
+    Args:
+        agent: The Agent instance to copy.
+
+    Returns:
+        Agent: A new Agent instance.
+    """
+    from copy import copy
+
+    new_agent = copy(agent)
+
+    for field_name in REQUEST_COPIED_FIELDS:
+        field_value = getattr(agent, field_name)
+        if field_value is not None:
+            setattr(new_agent, field_name, deep_copy_field(agent, field_name, field_value))
+
+    # The tools are shared, but not the list holding them, so tools added to the copy don't leak
+    if isinstance(agent.tools, list):
+        new_agent.tools = list(agent.tools)
+    if agent.reasoning_agent is not None:
+        new_agent.reasoning_agent = agent.reasoning_agent.request_copy()
+
+    # The copy is not part of the team or workflow of the original
+    new_agent.team_id = None
+    new_agent.workflow_id = None
+    # Reset the run state, as __init__ would
+    new_agent._cached_session = None
+    new_agent._tool_instructions = None
+    new_agent._team = None
+    new_agent._mcp_tools_initialized_on_run = []
+    new_agent._connectable_tools_initialized_on_run = []
+    new_agent._callable_tools_cache = {}
+    new_agent._callable_knowledge_cache = {}
+    return new_agent
+
+
 def deep_copy_field(agent: Agent, field_name: str, field_value: Any) -> Any:
     """Helper function to deep copy a field based on its type."""
     from copy import copy, deepcopy
@@ -96,6 +96,10 @@ class Agent:
     overwrite_db_session_state: bool = False
     # If True, cache the current Agent session in memory for faster access
     cache_session: bool = False
+    # If True, runs read from the database are only deserialized when accessed.
+    # Databases storing runs in their own table only load the last num_history_runs runs, older runs are loaded on demand.
+    # Other databases, including all async databases, read all runs of the session.
+    lazy_load_session_runs: bool = False
 
     search_past_sessions: Optional[bool] = False
     num_past_sessions_to_search: Optional[int] = None
@@ -399,6 +403,7 @@ class Agent:
         overwrite_db_session_state: bool = False,
         enable_agentic_state: bool = False,
         cache_session: bool = False,
+        lazy_load_session_runs: bool = False,
         search_past_sessions: Optional[bool] = False,
         num_past_sessions_to_search: Optional[int] = None,
         num_past_session_runs_in_search: Optional[int] = None,
@@ -523,6 +528,7 @@ class Agent:
         self.overwrite_db_session_state = overwrite_db_session_state
         self.enable_agentic_state = enable_agentic_state
         self.cache_session = cache_session
+        self.lazy_load_session_runs = lazy_load_session_runs
 
         # Deprecated param mapping
         if search_session_history is not None and not search_past_sessions:
@@ -944,6 +950,9 @@ class Agent:
     def deep_copy(self, *, update: Optional[Dict[str, Any]] = None) -> Agent:
         return _utils.deep_copy(self, update=update)
 
+    def request_copy(self) -> Agent:
+        return _utils.request_copy(self)
+
     # ---------------------------------------------------------------
     # _storage module delegates
     # ---------------------------------------------------------------
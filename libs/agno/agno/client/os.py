@@ -1742,6 +1742,8 @@ class AgentOSClient:
         sort_order: str = "desc",
         db_id: Optional[str] = None,
         table: Optional[str] = None,
+        cursor: Optional[str] = None,
+        with_total_count: Optional[bool] = None,
         headers: Optional[Dict[str, str]] = None,
     ) -> PaginatedResponse[SessionSchema]:
         """Get a paginated list of sessions.
@@ -1757,6 +1759,9 @@ class AgentOSClient:
             sort_order: Sort order (asc or desc)
             db_id: Optional database ID to use
             table: Optional table name to use
+            cursor: Page by cursor instead of by page number: an empty cursor for the first page,
+                then the next_cursor of the previous page (optional)
+            with_total_count: With cursor pagination, whether to count the matching sessions (optional)
             headers: HTTP headers to include in the request (optional)
 
         Returns:
@@ -1773,6 +1778,8 @@ class AgentOSClient:
             "user_id": user_id,
             "session_name": session_name,
             "component_id": component_id,
+            "cursor": cursor,
+            "with_total_count": str(with_total_count).lower() if with_total_count is not None else None,
         }
 
         params = {k: v for k, v in params.items() if v is not None}
@@ -1,7 +1,12 @@
 import asyncio
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from dataclasses import dataclass, field
+from hashlib import sha256
 from textwrap import dedent
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, Union
 
 from pydantic import BaseModel
 
@@ -49,6 +54,40 @@ DEFAULT_COMPRESSION_PROMPT = dedent("""\
     """)
 
 
+# Maximum number of compressed tool results kept in the process-wide cache
+COMPRESSION_CACHE_MAX_ENTRIES = 1024
+
+# Compressed tool results by content hash, shared by all CompressionManagers of the process
+_compression_cache: "OrderedDict[str, str]" = OrderedDict()
+_compression_cache_lock = threading.Lock()
+# Run metrics are accumulated from the compression threads
+_metrics_lock = threading.Lock()
+# Number of compression threads used by compress when max_concurrent_compressions is not set
+DEFAULT_COMPRESSION_THREADS = 4
+
+
+def _get_cached_compression(key: str) -> Optional[str]:
+    with _compression_cache_lock:
+        compressed = _compression_cache.get(key)
+        if compressed is not None:
+            _compression_cache.move_to_end(key)
+        return compressed
+
+
+def _set_cached_compression(key: str, compressed: str) -> None:
+    with _compression_cache_lock:
+        _compression_cache[key] = compressed
+        _compression_cache.move_to_end(key)
+        while len(_compression_cache) > COMPRESSION_CACHE_MAX_ENTRIES:
+            _compression_cache.popitem(last=False)
+
+
+def clear_compression_cache() -> None:
+    """Clear the process-wide cache of compressed tool results."""
+    with _compression_cache_lock:
+        _compression_cache.clear()
+
+
 @dataclass
 class CompressionManager:
     model: Optional[Model] = None  # model used for compression
@@ -56,6 +95,11 @@ class CompressionManager:
     compress_tool_results_limit: Optional[int] = None
     compress_token_limit: Optional[int] = None
     compress_tool_call_instructions: Optional[str] = None
+    # Maximum number of tool results compressed at the same time. None compresses them all at once in acompress,
+    # and uses DEFAULT_COMPRESSION_THREADS threads in compress.
+    max_concurrent_compressions: Optional[int] = None
+    # Reuse the compression of identical tool results, across runs and managers of the process
+    cache_compressed_results: bool = True
 
     stats: Dict[str, Any] = field(default_factory=dict)
 
@@ -66,6 +110,54 @@ class CompressionManager:
     def _is_tool_result_message(self, msg: Message) -> bool:
         return msg.role == "tool"
 
+    def _get_tool_content(self, tool_result: Message) -> str:
+        return f"Tool: {tool_result.tool_name or 'unknown'}\n{tool_result.content}"
+
+    def _get_cache_key(self, tool_content: str) -> str:
+        """Hash the tool content with everything else that changes its compression."""
+        model_key = f"{self.model.provider}:{self.model.id}" if isinstance(self.model, Model) else str(self.model)
+        compression_prompt = self.compress_tool_call_instructions or DEFAULT_COMPRESSION_PROMPT
+        return sha256("\x00".join((model_key, compression_prompt, tool_content)).encode("utf-8")).hexdigest()
+
+    def _group_uncompressed_tools(self, messages: List[Message]) -> Dict[str, List[Message]]:
+        """Group the uncompressed tool results by content, so identical results are compressed once."""
+        groups: Dict[str, List[Message]] = {}
+        for msg in messages:
+            if msg.role == "tool" and msg.compressed_content is None:
+                groups.setdefault(self._get_tool_content(msg), []).append(msg)
+        return groups
+
+    def _apply_compression(self, tool_msgs: List[Message], compressed: Optional[str]) -> None:
+        """Set the compressed content of tool results with the same content and track stats."""
+        for tool_msg in tool_msgs:
+            if compressed:
+                original_len = len(str(tool_msg.content)) if tool_msg.content else 0
+                tool_msg.compressed_content = compressed
+                # Count actual tool results (Gemini combines multiple in one message)
+                tool_results_count = len(tool_msg.tool_calls) if tool_msg.tool_calls else 1
+                self.stats["tool_results_compressed"] = (
+                    self.stats.get("tool_results_compressed", 0) + tool_results_count
+                )
+                self.stats["original_size"] = self.stats.get("original_size", 0) + original_len
+                self.stats["compressed_size"] = self.stats.get("compressed_size", 0) + len(compressed)
+            else:
+                log_warning(f"Compression failed for {tool_msg.tool_name}")
+
+    def _split_cached(self, groups: Dict[str, List[Message]]) -> List[Tuple[str, List[Message]]]:
+        """Apply cached compressions and return the groups of tool results left to compress."""
+        if not self.cache_compressed_results:
+            return list(groups.items())
+
+        to_compress = []
+        for tool_content, tool_msgs in groups.items():
+            compressed = _get_cached_compression(self._get_cache_key(tool_content))
+            if compressed is not None:
+                self.stats["cache_hits"] = self.stats.get("cache_hits", 0) + len(tool_msgs)
+                self._apply_compression(tool_msgs, compressed)
+            else:
+                to_compress.append((tool_content, tool_msgs))
+        return to_compress
+
     def should_compress(
         self,
         messages: List[Message],
@@ -110,7 +202,7 @@ class CompressionManager:
         if not tool_result:
             return None
 
-        tool_content = f"Tool: {tool_result.tool_name or 'unknown'}\n{tool_result.content}"
+        tool_content = self._get_tool_content(tool_result)
 
         self.model = get_model(self.model)
         if not self.model:
@@ -132,8 +224,11 @@ class CompressionManager:
             if run_metrics is not None:
                 from agno.metrics import ModelType, accumulate_model_metrics
 
-                accumulate_model_metrics(response, self.model, ModelType.COMPRESSION_MODEL, run_metrics)
+                with _metrics_lock:
+                    accumulate_model_metrics(response, self.model, ModelType.COMPRESSION_MODEL, run_metrics)
 
+            if self.cache_compressed_results and response.content:
+                _set_cached_compression(self._get_cache_key(tool_content), response.content)
             return response.content
         except Exception as e:
             log_error(f"Error compressing tool result: {str(e)}")
@@ -144,30 +239,40 @@ class CompressionManager:
         messages: List[Message],
         run_metrics: Optional["RunMetrics"] = None,
     ) -> None:
-        """Compress uncompressed tool results"""
+        """Compress uncompressed tool results, up to max_concurrent_compressions at a time.
+
+        The compression threads share self.model. Model.response is called without tools, so it only reads the
+        model settings; the provider client is created lazily and a client created by two threads at once is
+        created twice, with one of them kept on the model.
+        """
         if not self.compress_tool_results:
             return
 
-        uncompressed_tools = [msg for msg in messages if msg.role == "tool" and msg.compressed_content is None]
+        groups = self._group_uncompressed_tools(messages)
+        if not groups:
+            return
 
-        if not uncompressed_tools:
+        # Resolve the model once, before the compression threads use it
+        self.model = get_model(self.model)
+        to_compress = self._split_cached(groups)
+        if not to_compress:
             return
 
-        # Compress uncompressed tool results
-        for tool_msg in uncompressed_tools:
-            original_len = len(str(tool_msg.content)) if tool_msg.content else 0
-            compressed = self._compress_tool_result(tool_msg, run_metrics=run_metrics)
-            if compressed:
-                tool_msg.compressed_content = compressed
-                # Count actual tool results (Gemini combines multiple in one message)
-                tool_results_count = len(tool_msg.tool_calls) if tool_msg.tool_calls else 1
-                self.stats["tool_results_compressed"] = (
-                    self.stats.get("tool_results_compressed", 0) + tool_results_count
-                )
-                self.stats["original_size"] = self.stats.get("original_size", 0) + original_len
-                self.stats["compressed_size"] = self.stats.get("compressed_size", 0) + len(compressed)
-            else:
-                log_warning(f"Compression failed for {tool_msg.tool_name}")
+        max_concurrent = self.max_concurrent_compressions or DEFAULT_COMPRESSION_THREADS
+        max_workers = max(1, min(max_concurrent, len(to_compress)))
+        if max_workers == 1:
+            for _, tool_msgs in to_compress:
+                self._apply_compression(tool_msgs, self._compress_tool_result(tool_msgs[0], run_metrics=run_metrics))
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="agno-compression") as executor:
+            # Each thread gets a copy of the current context, so context variables (e.g. tracing) are kept
+            futures = [
+                executor.submit(copy_context().run, self._compress_tool_result, tool_msgs[0], run_metrics=run_metrics)
+                for _, tool_msgs in to_compress
+            ]
+            for (_, tool_msgs), future in zip(to_compress, futures):
+                self._apply_compression(tool_msgs, future.result())
 
     # * Async methods *#
     async def ashould_compress(
@@ -215,7 +320,7 @@ class CompressionManager:
         if not tool_result:
             return None
 
-        tool_content = f"Tool: {tool_result.tool_name or 'unknown'}\n{tool_result.content}"
+        tool_content = self._get_tool_content(tool_result)
 
         self.model = get_model(self.model)
         if not self.model:
@@ -239,6 +344,8 @@ class CompressionManager:
 
                 accumulate_model_metrics(response, self.model, ModelType.COMPRESSION_MODEL, run_metrics)
 
+            if self.cache_compressed_results and response.content:
+                _set_cached_compression(self._get_cache_key(tool_content), response.content)
             return response.content
         except Exception as e:
             log_error(f"Error compressing tool result: {str(e)}")
@@ -249,32 +356,34 @@ class CompressionManager:
         messages: List[Message],
         run_metrics: Optional["RunMetrics"] = None,
     ) -> None:
-        """Async compress uncompressed tool results"""
+        """Async compress uncompressed tool results, all at once or up to max_concurrent_compressions at a time"""
         if not self.compress_tool_results:
             return
 
-        uncompressed_tools = [msg for msg in messages if msg.role == "tool" and msg.compressed_content is None]
+        groups = self._group_uncompressed_tools(messages)
+        if not groups:
+            return
 
-        if not uncompressed_tools:
+        self.model = get_model(self.model)
+        to_compress = self._split_cached(groups)
+        if not to_compress:
             return
 
-        # Track original sizes before compression
-        original_sizes = [len(str(msg.content)) if msg.content else 0 for msg in uncompressed_tools]
+        semaphore = (
+            asyncio.Semaphore(max(1, self.max_concurrent_compressions))
+            if self.max_concurrent_compressions is not None
+            else None
+        )
+
+        async def compress_with_limit(tool_msg: Message) -> Optional[str]:
+            if semaphore is None:
+                return await self._acompress_tool_result(tool_msg, run_metrics=run_metrics)
+            async with semaphore:
+                return await self._acompress_tool_result(tool_msg, run_metrics=run_metrics)
 
         # Parallel compression using asyncio.gather
-        tasks = [self._acompress_tool_result(msg, run_metrics=run_metrics) for msg in uncompressed_tools]
-        results = await asyncio.gather(*tasks)
+        results = await asyncio.gather(*[compress_with_limit(tool_msgs[0]) for _, tool_msgs in to_compress])
 
         # Apply results and track stats
-        for msg, compressed, original_len in zip(uncompressed_tools, results, original_sizes):
-            if compressed:
-                msg.compressed_content = compressed
-                # Count actual tool results (Gemini combines multiple in one message)
-                tool_results_count = len(msg.tool_calls) if msg.tool_calls else 1
-                self.stats["tool_results_compressed"] = (
-                    self.stats.get("tool_results_compressed", 0) + tool_results_count
-                )
-                self.stats["original_size"] = self.stats.get("original_size", 0) + original_len
-                self.stats["compressed_size"] = self.stats.get("compressed_size", 0) + len(compressed)
-            else:
-                log_warning(f"Compression failed for {msg.tool_name}")
+        for (_, tool_msgs), compressed in zip(to_compress, results):
+            self._apply_compression(tool_msgs, compressed)
@@ -1,10 +1,13 @@
 from abc import ABC, abstractmethod
 from datetime import date, datetime
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Set, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, NamedTuple, Optional, Set, Tuple, Union, cast
 from uuid import uuid4
 
 if TYPE_CHECKING:
+    from agno.run.agent import RunOutput
+    from agno.run.team import TeamRunOutput
+    from agno.run.workflow import WorkflowRunOutput
     from agno.tracing.schemas import Span, Trace
 
 from agno.db.schemas import UserMemory
@@ -27,6 +30,16 @@ class ComponentType(str, Enum):
     WORKFLOW = "workflow"
 
 
+class SessionSummaryPage(NamedTuple):
+    """A page of session summaries."""
+
+    sessions: List[Dict[str, Any]]
+    # Cursor of the next page, or None when this is the last page
+    next_cursor: Optional[str]
+    # Total number of matching sessions, only counted when requested
+    total_count: Optional[int] = None
+
+
 class BaseDb(ABC):
     """Base abstract class for all our Database implementations."""
 
@@ -58,6 +71,7 @@ class BaseDb(ABC):
         mcp_oauth_codes_table: Optional[str] = None,
         mcp_oauth_refresh_tokens_table: Optional[str] = None,
         mcp_oauth_keys_table: Optional[str] = None,
+        runs_table: Optional[str] = None,
         id: Optional[str] = None,
     ):
         self.id = id or str(uuid4())
@@ -85,6 +99,8 @@ class BaseDb(ABC):
         self.mcp_oauth_codes_table_name = mcp_oauth_codes_table or "agno_mcp_oauth_codes"
         self.mcp_oauth_refresh_tokens_table_name = mcp_oauth_refresh_tokens_table or "agno_mcp_oauth_refresh_tokens"
         self.mcp_oauth_keys_table_name = mcp_oauth_keys_table or "agno_mcp_oauth_keys"
+        # Only used by databases storing each run in its own row (store_runs_in_table=True)
+        self.runs_table_name = runs_table or "agno_runs"
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -115,6 +131,7 @@ class BaseDb(ABC):
             "mcp_oauth_codes_table": self.mcp_oauth_codes_table_name,
             "mcp_oauth_refresh_tokens_table": self.mcp_oauth_refresh_tokens_table_name,
             "mcp_oauth_keys_table": self.mcp_oauth_keys_table_name,
+            "runs_table": self.runs_table_name,
         }
 
     @classmethod
@@ -146,6 +163,7 @@ class BaseDb(ABC):
             mcp_oauth_codes_table=data.get("mcp_oauth_codes_table"),
             mcp_oauth_refresh_tokens_table=data.get("mcp_oauth_refresh_tokens_table"),
             mcp_oauth_keys_table=data.get("mcp_oauth_keys_table"),
+            runs_table=data.get("runs_table"),
             id=data.get("id"),
         )
 
@@ -238,6 +256,114 @@ class BaseDb(ABC):
         """Bulk upsert multiple sessions for improved performance on large datasets."""
         raise NotImplementedError
 
+    # --- Runs (Optional) ---
+    # These methods are optional. Override in subclasses storing each run in its own row.
+
+    def upsert_run(
+        self,
+        session_id: str,
+        run: Union["RunOutput", "TeamRunOutput", "WorkflowRunOutput"],
+        user_id: Optional[str] = None,
+    ) -> None:
+        """Insert or update a single run of the given session, without rewriting the session."""
+        raise NotImplementedError
+
+    def get_runs(
+        self,
+        session_id: str,
+        user_id: Optional[str] = None,
+        last_n_runs: Optional[int] = None,
+        deserialize: Optional[bool] = True,
+    ) -> List[Union["RunOutput", "TeamRunOutput", "WorkflowRunOutput", Dict[str, Any]]]:
+        """Get the runs of the given session, oldest first.
+
+        Args:
+            session_id: The session to get the runs for.
+            user_id: User ID to filter by.
+            last_n_runs: Only return the last N top-level runs, together with their member runs.
+            deserialize: Whether to deserialize the runs.
+        """
+        raise NotImplementedError
+
+    def get_session_with_last_runs(
+        self,
+        session_id: str,
+        session_type: SessionType,
+        user_id: Optional[str] = None,
+        last_n_runs: Optional[int] = None,
+    ) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """Get a session dictionary holding only its last N top-level runs, together with their member runs.
+
+        Databases storing runs in the sessions table return all runs.
+
+        Returns:
+            The session dictionary, and whether the session has older runs that were not loaded.
+        """
+        session = self.get_session(session_id=session_id, session_type=session_type, user_id=user_id, deserialize=False)
+        return cast(Optional[Dict[str, Any]], session), False
+
+    def get_session_summaries(
+        self,
+        session_type: Optional[SessionType] = None,
+        user_id: Optional[str] = None,
+        component_id: Optional[str] = None,
+        session_name: Optional[str] = None,
+        start_timestamp: Optional[int] = None,
+        end_timestamp: Optional[int] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        sort_order: Optional[str] = "desc",
+        with_total_count: bool = False,
+    ) -> SessionSummaryPage:
+        """Get a page of session summaries, sorted by (created_at, session_id).
+
+        Summaries only hold the session columns shown in session listings, with a session_data limited to
+        the session name, state and metrics. The runs of a summary only hold the run an unnamed session is
+        named after. Pages are read by key instead of by offset: pass the next_cursor of a page to get the
+        next one.
+
+        SQL databases override this to read the summary columns only. This default reads the full sessions.
+
+        Args:
+            session_type: The type of sessions to get.
+            user_id: The ID of the user to filter by.
+            component_id: The ID of the agent / team / workflow to filter by.
+            session_name: The name of the sessions to filter by.
+            start_timestamp: The start timestamp to filter by.
+            end_timestamp: The end timestamp to filter by.
+            limit: The maximum number of sessions to return.
+            cursor: The next_cursor of the previous page, or None for the first page.
+            sort_order: "asc" or "desc".
+            with_total_count: Whether to count the sessions matching the filters.
+
+        Raises:
+            ValueError: If the cursor is invalid.
+        """
+        from agno.db.utils import decode_session_cursor, paginate_session_summaries
+
+        if cursor is not None and not with_total_count:
+            # Skip the sessions before the cursor
+            cursor_created_at, _ = decode_session_cursor(cursor)
+            if sort_order == "asc":
+                start_timestamp = max(start_timestamp or cursor_created_at, cursor_created_at)
+            else:
+                end_timestamp = min(end_timestamp or cursor_created_at, cursor_created_at)
+
+        sessions, total_count = cast(
+            Tuple[List[Dict[str, Any]], int],
+            self.get_sessions(
+                session_type=session_type,
+                user_id=user_id,
+                component_id=component_id,
+                session_name=session_name,
+                start_timestamp=start_timestamp,
+                end_timestamp=end_timestamp,
+                deserialize=False,
+            ),
+        )
+        page, next_cursor = paginate_session_summaries(sessions, limit=limit, cursor=cursor, sort_order=sort_order)
+        return SessionSummaryPage(page, next_cursor, total_count if with_total_count else None)
+
     # --- Memory ---
     @abstractmethod
     def clear_memories(self) -> None:
@@ -557,6 +683,21 @@ class BaseDb(ABC):
         """
         raise NotImplementedError
 
+    def upsert_traces_and_spans(self, traces: List["Trace"], spans: List) -> None:
+        """Upsert the traces and create the spans of several traces at once.
+
+        Databases supporting it write everything in a single transaction. The default implementation
+        upserts the traces one by one, then creates the spans as a batch.
+
+        Args:
+            traces: The Trace objects to store (one per trace_id).
+            spans: The Span objects of those traces.
+        """
+        for trace in traces:
+            self.upsert_trace(trace)
+        if spans:
+            self.create_spans(spans)
+
     @abstractmethod
     def get_span(self, span_id: str):
         """Get a single span by its span_id.
@@ -1107,7 +1248,8 @@ class BaseDb(ABC):
 
         The query is matched case-insensitively against the stored content, in
         both its space and underscore forms ("sarah chen" finds "sarah_chen").
-        Results are ordered by updated_at descending.
+        Backends with a full-text index order results by relevance, then by
+        updated_at descending; the others order them by updated_at descending.
 
         Backends without a server-side search implementation keep this default,
         which raises NotImplementedError - callers fall back to their
@@ -1260,6 +1402,37 @@ class BaseDb(ABC):
         """Release a claimed schedule and optionally update next_run_at."""
         raise NotImplementedError
 
+    def claim_due_schedules(
+        self, worker_id: str, limit: int = 10, lock_grace_seconds: int = 300
+    ) -> List[Dict[str, Any]]:
+        """Atomically claim up to ``limit`` due schedules for execution.
+
+        Claims one schedule at a time by default. Override to claim them with a single statement.
+        """
+        schedules: List[Dict[str, Any]] = []
+        while len(schedules) < limit:
+            schedule = self.claim_due_schedule(worker_id, lock_grace_seconds=lock_grace_seconds)
+            if schedule is None:
+                break
+            schedules.append(schedule)
+        return schedules
+
+    def get_schedule_next_runs(self, updated_since: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get the id, enabled, next_run_at and updated_at of schedules, optionally only those updated since a time.
+
+        Lists all schedules by default. Override to only read these columns.
+        """
+        next_runs: List[Dict[str, Any]] = []
+        page = 1
+        while True:
+            schedules, total_count = self.get_schedules(limit=1000, page=page)
+            for schedule in schedules:
+                if updated_since is None or (schedule.get("updated_at") or 0) >= updated_since:
+                    next_runs.append({k: schedule.get(k) for k in ("id", "enabled", "next_run_at", "updated_at")})
+            if not schedules or page * 1000 >= total_count:
+                return next_runs
+            page += 1
+
     # --- Schedule Runs (Optional) ---
 
     def create_schedule_run(self, run_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -1611,6 +1784,45 @@ class AsyncBaseDb(ABC):
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         raise NotImplementedError
 
+    async def get_session_summaries(
+        self,
+        session_type: Optional[SessionType] = None,
+        user_id: Optional[str] = None,
+        component_id: Optional[str] = None,
+        session_name: Optional[str] = None,
+        start_timestamp: Optional[int] = None,
+        end_timestamp: Optional[int] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        sort_order: Optional[str] = "desc",
+        with_total_count: bool = False,
+    ) -> SessionSummaryPage:
+        """Get a page of session summaries, sorted by (created_at, session_id). See BaseDb.get_session_summaries."""
+        from agno.db.utils import decode_session_cursor, paginate_session_summaries
+
+        if cursor is not None and not with_total_count:
+            # Skip the sessions before the cursor
+            cursor_created_at, _ = decode_session_cursor(cursor)
+            if sort_order == "asc":
+                start_timestamp = max(start_timestamp or cursor_created_at, cursor_created_at)
+            else:
+                end_timestamp = min(end_timestamp or cursor_created_at, cursor_created_at)
+
+        sessions, total_count = cast(
+            Tuple[List[Dict[str, Any]], int],
+            await self.get_sessions(
+                session_type=session_type,
+                user_id=user_id,
+                component_id=component_id,
+                session_name=session_name,
+                start_timestamp=start_timestamp,
+                end_timestamp=end_timestamp,
+                deserialize=False,
+            ),
+        )
+        page, next_cursor = paginate_session_summaries(sessions, limit=limit, cursor=cursor, sort_order=sort_order)
+        return SessionSummaryPage(page, next_cursor, total_count if with_total_count else None)
+
     # --- Memory ---
     @abstractmethod
     async def clear_memories(self) -> None:
@@ -2179,7 +2391,8 @@ class AsyncBaseDb(ABC):
 
         The query is matched case-insensitively against the stored content, in
         both its space and underscore forms ("sarah chen" finds "sarah_chen").
-        Results are ordered by updated_at descending.
+        Backends with a full-text index order results by relevance, then by
+        updated_at descending; the others order them by updated_at descending.
 
         Backends without a server-side search implementation keep this default,
         which raises NotImplementedError - callers fall back to their
@@ -2332,6 +2545,37 @@ class AsyncBaseDb(ABC):
         """Release a claimed schedule and optionally update next_run_at."""
         raise NotImplementedError
 
+    async def claim_due_schedules(
+        self, worker_id: str, limit: int = 10, lock_grace_seconds: int = 300
+    ) -> List[Dict[str, Any]]:
+        """Atomically claim up to ``limit`` due schedules for execution.
+
+        Claims one schedule at a time by default. Override to claim them with a single statement.
+        """
+        schedules: List[Dict[str, Any]] = []
+        while len(schedules) < limit:
+            schedule = await self.claim_due_schedule(worker_id, lock_grace_seconds=lock_grace_seconds)
+            if schedule is None:
+                break
+            schedules.append(schedule)
+        return schedules
+
+    async def get_schedule_next_runs(self, updated_since: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get the id, enabled, next_run_at and updated_at of schedules, optionally only those updated since a time.
+
+        Lists all schedules by default. Override to only read these columns.
+        """
+        next_runs: List[Dict[str, Any]] = []
+        page = 1
+        while True:
+            schedules, total_count = await self.get_schedules(limit=1000, page=page)
+            for schedule in schedules:
+                if updated_since is None or (schedule.get("updated_at") or 0) >= updated_since:
+                    next_runs.append({k: schedule.get(k) for k in ("id", "enabled", "next_run_at", "updated_at")})
+            if not schedules or page * 1000 >= total_count:
+                return next_runs
+            page += 1
+
     # --- Schedule Runs (Optional) ---
 
     async def create_schedule_run(self, run_data: Dict[str, Any]) -> Dict[str, Any]:
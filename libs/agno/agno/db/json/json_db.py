@@ -10,6 +10,7 @@ if TYPE_CHECKING:
     from agno.tracing.schemas import Span, Trace
 
 from agno.db.base import BaseDb, SessionType
+from agno.db.json.record_store import JsonRecordStore
 from agno.db.json.utils import (
     apply_sorting,
     calculate_date_metrics,
@@ -41,6 +42,7 @@ class JsonDb(BaseDb):
         traces_table: Optional[str] = None,
         spans_table: Optional[str] = None,
         id: Optional[str] = None,
+        store_records_in_files: bool = False,
     ):
         """
         Interface for interacting with JSON files as database.
@@ -56,6 +58,9 @@ class JsonDb(BaseDb):
             traces_table (Optional[str]): Name of the JSON file to store run traces.
             spans_table (Optional[str]): Name of the JSON file to store span events.
             id (Optional[str]): ID of the database.
+            store_records_in_files (bool): Store each session and memory in its own file, in a directory named
+                after the table, instead of one JSON file per table. Reading, writing or deleting a single
+                session or memory then doesn't depend on the number of records in the table.
         """
         if id is None:
             seed = db_path or "agno_json_db"
@@ -76,6 +81,20 @@ class JsonDb(BaseDb):
         # Create the directory where the JSON files will be stored, if it doesn't exist
         self.db_path = Path(db_path or os.path.join(os.getcwd(), "agno_json_db"))
 
+        self.store_records_in_files = store_records_in_files
+        self._record_stores: Dict[str, JsonRecordStore] = {}
+        if store_records_in_files:
+            self._record_stores[self.session_table_name] = JsonRecordStore(
+                path=self.db_path / self.session_table_name,
+                key_fields=self._session_record_key,
+                index_fields=["session_id", "user_id"],
+            )
+            self._record_stores[self.memory_table_name] = JsonRecordStore(
+                path=self.db_path / self.memory_table_name,
+                key_fields=["memory_id"],
+                index_fields=["memory_id", "user_id"],
+            )
+
     def table_exists(self, table_name: str) -> bool:
         """JSON implementation, always returns True."""
         return True
@@ -92,6 +111,10 @@ class JsonDb(BaseDb):
         Raises:
             json.JSONDecodeError: If the JSON file is not valid.
         """
+        record_store = self._record_stores.get(filename)
+        if record_store is not None:
+            return record_store.all()
+
         file_path = self.db_path / f"{filename}.json"
 
         # Create directory if it doesn't exist
@@ -121,6 +144,11 @@ class JsonDb(BaseDb):
         Raises:
             Exception: If an error occurs while writing to the JSON file.
         """
+        record_store = self._record_stores.get(filename)
+        if record_store is not None:
+            record_store.replace_all(data)
+            return
+
         file_path = self.db_path / f"{filename}.json"
 
         # Create directory if it doesn't exist
@@ -158,6 +186,20 @@ class JsonDb(BaseDb):
             Exception: If an error occurs during deletion.
         """
         try:
+            record_store = self._record_stores.get(self.session_table_name)
+            if record_store is not None:
+                filters: Dict[str, Any] = {"session_id": session_id}
+                if user_id is not None:
+                    filters["user_id"] = user_id
+                sessions_to_delete = record_store.find(**filters)
+                for session in sessions_to_delete:
+                    record_store.delete(session)
+                if sessions_to_delete:
+                    log_debug(f"Successfully deleted session with session_id: {session_id}")
+                    return True
+                log_debug(f"No session found to delete with session_id: {session_id}")
+                return False
+
             sessions = self._read_json_file(self.session_table_name)
             original_count = len(sessions)
             sessions = [
@@ -227,7 +269,7 @@ class JsonDb(BaseDb):
             Exception: If an error occurs while reading the session.
         """
         try:
-            sessions = self._read_json_file(self.session_table_name)
+            sessions = self._find_sessions(session_id)
 
             for session_data in sessions:
                 if session_data.get("session_id") == session_id:
@@ -284,7 +326,11 @@ class JsonDb(BaseDb):
             Exception: If an error occurs while reading the sessions.
         """
         try:
-            sessions_raw = self._read_json_file(self.session_table_name)
+            record_store = self._record_stores.get(self.session_table_name)
+            if record_store is not None and user_id is not None:
+                sessions_raw = record_store.find(user_id=user_id)
+            else:
+                sessions_raw = self._read_json_file(self.session_table_name)
 
             # Apply filters
             filtered_sessions = []
@@ -351,7 +397,7 @@ class JsonDb(BaseDb):
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         """Rename a session in the JSON file."""
         try:
-            sessions = self._read_json_file(self.session_table_name)
+            sessions = self._find_sessions(session_id)
 
             for i, session in enumerate(sessions):
                 if session.get("session_id") != session_id:
@@ -366,7 +412,7 @@ class JsonDb(BaseDb):
                 session["session_data"]["session_name"] = session_name
 
                 sessions[i] = session
-                self._write_json_file(self.session_table_name, sessions)
+                self._write_session(session, sessions)
 
                 log_debug(f"Renamed session with id '{session_id}' to '{session_name}'")
 
@@ -386,7 +432,7 @@ class JsonDb(BaseDb):
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         """Insert or update a session in the JSON file."""
         try:
-            sessions = self._read_json_file(self.session_table_name, create_table_if_not_found=True)
+            sessions = self._find_sessions(session.session_id)
             session_dict = session.to_dict()
 
             # Add session_type based on session instance type
@@ -418,7 +464,7 @@ class JsonDb(BaseDb):
                 session_dict["updated_at"] = session_dict.get("created_at")
                 sessions.append(session_dict)
 
-            self._write_json_file(self.session_table_name, sessions)
+            self._write_session(session_dict, sessions)
 
             if not deserialize:
                 return session_dict
@@ -466,6 +512,36 @@ class JsonDb(BaseDb):
             log_error(f"Exception during bulk session upsert: {str(e)}")
             return []
 
+    def _find_sessions(self, session_id: Optional[str]) -> List[Dict[str, Any]]:
+        """Get the sessions to look up a session in.
+
+        With per-record files, only the sessions with the given session_id are returned.
+        Otherwise, all sessions are returned, so they can be written back with _write_session.
+        """
+        record_store = self._record_stores.get(self.session_table_name)
+        if record_store is not None:
+            return record_store.find(session_id=session_id)
+        return self._read_json_file(self.session_table_name, create_table_if_not_found=True)
+
+    def _write_session(self, session: Dict[str, Any], sessions: List[Dict[str, Any]]) -> None:
+        """Persist a changed session, given the sessions returned by _find_sessions with the change applied."""
+        record_store = self._record_stores.get(self.session_table_name)
+        if record_store is not None:
+            record_store.put(session)
+        else:
+            self._write_json_file(self.session_table_name, sessions)
+
+    @staticmethod
+    def _session_record_key(session: Dict[str, Any]) -> List[Any]:
+        """Values that identify a session record: the same as _matches_session_key, so an update replaces its file."""
+        component_field = {
+            SessionType.AGENT.value: "agent_id",
+            SessionType.TEAM.value: "team_id",
+            SessionType.WORKFLOW.value: "workflow_id",
+        }.get(session.get("session_type"))  # type: ignore[arg-type]
+        component_id = session.get(component_field) if component_field else None
+        return [session.get("session_id"), session.get("session_type"), component_id]
+
     def _matches_session_key(self, existing_session: Dict[str, Any], session: Session) -> bool:
         """Check if existing session matches the key for the session type."""
         if isinstance(session, AgentSession):
@@ -485,7 +561,7 @@ class JsonDb(BaseDb):
             user_id (Optional[str]): The ID of the user (optional, for filtering).
         """
         try:
-            memories = self._read_json_file(self.memory_table_name)
+            memories = self._find_memories(memory_id)
             original_count = len(memories)
 
             # If user_id is provided, verify the memory belongs to the user before deleting
@@ -503,7 +579,11 @@ class JsonDb(BaseDb):
             memories = [m for m in memories if m.get("memory_id") != memory_id]
 
             if len(memories) < original_count:
-                self._write_json_file(self.memory_table_name, memories)
+                record_store = self._record_stores.get(self.memory_table_name)
+                if record_store is not None:
+                    record_store.delete({"memory_id": memory_id})
+                else:
+                    self._write_json_file(self.memory_table_name, memories)
                 log_debug(f"Successfully deleted user memory id: {memory_id}")
             else:
                 log_debug(f"No memory found with id: {memory_id}")
@@ -581,7 +661,7 @@ class JsonDb(BaseDb):
             Optional[Union[UserMemory, Dict[str, Any]]]: The user memory data if found, None otherwise.
         """
         try:
-            memories = self._read_json_file(self.memory_table_name)
+            memories = self._find_memories(memory_id)
 
             for memory_data in memories:
                 if memory_data.get("memory_id") == memory_id:
@@ -614,7 +694,11 @@ class JsonDb(BaseDb):
     ) -> Union[List[UserMemory], Tuple[List[Dict[str, Any]], int]]:
         """Get all memories from the JSON file with filtering and pagination."""
         try:
-            memories = self._read_json_file(self.memory_table_name)
+            record_store = self._record_stores.get(self.memory_table_name)
+            if record_store is not None and user_id is not None:
+                memories = record_store.find(user_id=user_id)
+            else:
+                memories = self._read_json_file(self.memory_table_name)
 
             # Apply filters
             filtered_memories = []
@@ -714,11 +798,11 @@ class JsonDb(BaseDb):
     ) -> Optional[Union[UserMemory, Dict[str, Any]]]:
         """Upsert a user memory in the JSON file."""
         try:
-            memories = self._read_json_file(self.memory_table_name, create_table_if_not_found=True)
-
             if memory.memory_id is None:
                 memory.memory_id = str(uuid4())
 
+            memories = self._find_memories(memory.memory_id)
+
             memory_dict = memory.to_dict() if hasattr(memory, "to_dict") else memory.__dict__
             memory_dict["updated_at"] = int(time.time())
 
@@ -733,7 +817,11 @@ class JsonDb(BaseDb):
             if not memory_updated:
                 memories.append(memory_dict)
 
-            self._write_json_file(self.memory_table_name, memories)
+            record_store = self._record_stores.get(self.memory_table_name)
+            if record_store is not None:
+                record_store.put(memory_dict)
+            else:
+                self._write_json_file(self.memory_table_name, memories)
 
             if not deserialize:
                 return memory_dict
@@ -793,6 +881,17 @@ class JsonDb(BaseDb):
             log_warning(f"Exception deleting all memories: {str(e)}")
             raise e
 
+    def _find_memories(self, memory_id: str) -> List[Dict[str, Any]]:
+        """Get the memories to look up a memory in.
+
+        With per-record files, only the memory with the given memory_id is returned.
+        Otherwise, all memories are returned, so they can be written back as a whole.
+        """
+        record_store = self._record_stores.get(self.memory_table_name)
+        if record_store is not None:
+            return record_store.find(memory_id=memory_id)
+        return self._read_json_file(self.memory_table_name, create_table_if_not_found=True)
+
     # -- Metrics methods --
     def calculate_metrics(self) -> Optional[list[dict]]:
         """Calculate metrics for all dates without complete metrics."""
@@ -0,0 +1,208 @@
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from hashlib import md5
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Set, Union
+
+from agno.utils.log import log_error, log_warning
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+
+
+class JsonRecordStore:
+    """Store for a JSON table that keeps each record in its own file.
+
+    Records are kept in memory as serialized JSON, with an index on the given fields, so single-record reads
+    and writes don't depend on the size of the table. Every write replaces only the file of the changed record,
+    atomically. Records are reloaded when the modification time of the directory changes, so writes made by
+    other stores or processes on the same directory are picked up.
+
+    Writes hold a lock on the directory (where the platform supports file locks), so the modification time seen
+    after a write only reflects that write. Without file locks, the records are reloaded after every write.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        key_fields: Union[Sequence[str], Callable[[Dict[str, Any]], List[Any]]],
+        index_fields: Sequence[str],
+    ):
+        """
+        Args:
+            path (Path): Directory holding the record files.
+            key_fields (Union[Sequence[str], Callable]): Fields that identify a record, or a function returning the
+                values that identify it. These values name the record file.
+            index_fields (Sequence[str]): Fields to keep an index on, for lookups by value.
+        """
+        self.path = path
+        self.key_fields = key_fields if callable(key_fields) else list(key_fields)
+        self.index_fields = list(index_fields)
+
+        # Record key -> serialized record. Records are deserialized on read, so callers can modify them freely.
+        self._records: Optional[Dict[str, str]] = None
+        # Modification time of the directory when the records were loaded or last written by this store
+        self._mtime_ns: Optional[int] = None
+        self._index: Dict[str, Dict[Any, Set[str]]] = {f: {} for f in self.index_fields}
+        self._lock = threading.RLock()
+
+    def record_key(self, record: Dict[str, Any]) -> str:
+        """Build the file name of a record from its key fields."""
+        if callable(self.key_fields):
+            key_values = self.key_fields(record)
+        else:
+            key_values = [record.get(f) for f in self.key_fields]
+        return md5(json.dumps(key_values, default=str).encode()).hexdigest()
+
+    @staticmethod
+    def _serialize(record: Dict[str, Any]) -> str:
+        return json.dumps(record, default=str)
+
+    def _dir_mtime_ns(self) -> int:
+        self.path.mkdir(parents=True, exist_ok=True)
+        return self.path.stat().st_mtime_ns
+
+    @contextmanager
+    def _write_lock(self) -> Iterator[None]:
+        """Hold the lock of the directory, so no other store writes to it in the meantime."""
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            self.path.mkdir(parents=True, exist_ok=True)
+            with open(self.path / ".lock", "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _mark_written(self) -> None:
+        """Record the modification time of the directory after a write of this store."""
+        if fcntl is None:
+            # Another process may have written since the records were loaded, reload them on next access
+            self._mtime_ns = None
+        else:
+            # The records were loaded under the write lock, so only this store wrote since
+            self._mtime_ns = self._dir_mtime_ns()
+
+    def _load(self) -> Dict[str, str]:
+        # Adding, replacing or removing a record file updates the directory, so its mtime tells if records changed
+        mtime_ns = self._dir_mtime_ns()
+        if self._records is not None and mtime_ns == self._mtime_ns:
+            return self._records
+
+        self._index = {f: {} for f in self.index_fields}
+        records: Dict[str, str] = {}
+        # Load records in the order they were last written
+        files = sorted(self.path.glob("*.json"), key=lambda p: p.stat().st_mtime_ns)
+        for file_path in files:
+            try:
+                with open(file_path, "r", encoding="utf-8") as f:
+                    serialized = f.read()
+                self._add_to_index(file_path.stem, json.loads(serialized))
+                records[file_path.stem] = serialized
+            except json.JSONDecodeError as e:
+                log_warning(f"Skipping invalid JSON record file {file_path}: {str(e)}")
+
+        self._records = records
+        self._mtime_ns = mtime_ns
+        return records
+
+    def _add_to_index(self, key: str, record: Dict[str, Any]) -> None:
+        for f in self.index_fields:
+            self._index[f].setdefault(record.get(f), set()).add(key)
+
+    def _remove_from_index(self, key: str, record: Dict[str, Any]) -> None:
+        for f in self.index_fields:
+            keys = self._index[f].get(record.get(f))
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._index[f][record.get(f)]
+
+    def _write_file(self, key: str, serialized: str) -> None:
+        file_path = self.path / f"{key}.json"
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, prefix=f".{key}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(serialized)
+            # Replace the file in a single step, so readers never see a partially written record
+            os.replace(tmp_path, file_path)
+        except Exception as e:
+            log_error(f"Error writing the {file_path} JSON record file: {str(e)}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise e
+
+    def _delete_file(self, key: str) -> None:
+        try:
+            os.remove(self.path / f"{key}.json")
+        except FileNotFoundError:
+            pass
+
+    def all(self) -> List[Dict[str, Any]]:
+        """Return all records."""
+        with self._lock:
+            return [json.loads(r) for r in self._load().values()]
+
+    def find(self, **filters: Any) -> List[Dict[str, Any]]:
+        """Return the records whose fields are equal to the given values, using the index where possible."""
+        with self._lock:
+            records = self._load()
+            indexed = [f for f in filters if f in self._index]
+            if indexed:
+                keys = set(self._index[indexed[0]].get(filters[indexed[0]], set()))
+                for f in indexed[1:]:
+                    keys &= self._index[f].get(filters[f], set())
+                # Keep the insertion order when more than one record matches
+                ordered_keys = [k for k in records if k in keys] if len(keys) > 1 else list(keys)
+                candidates = [json.loads(records[k]) for k in ordered_keys]
+            else:
+                candidates = [json.loads(r) for r in records.values()]
+            return [r for r in candidates if all(r.get(f) == v for f, v in filters.items())]
+
+    def _put(self, records: Dict[str, str], record: Dict[str, Any]) -> None:
+        key = self.record_key(record)
+        serialized = self._serialize(record)
+        self._write_file(key, serialized)
+        existing = records.get(key)
+        if existing is not None:
+            self._remove_from_index(key, json.loads(existing))
+        records[key] = serialized
+        self._add_to_index(key, record)
+
+    def put(self, record: Dict[str, Any]) -> None:
+        """Insert or replace a record."""
+        with self._write_lock():
+            self._put(self._load(), record)
+            self._mark_written()
+
+    def delete(self, record: Dict[str, Any]) -> None:
+        """Delete a record, if it exists."""
+        with self._write_lock():
+            records = self._load()
+            key = self.record_key(record)
+            existing = records.pop(key, None)
+            if existing is not None:
+                self._remove_from_index(key, json.loads(existing))
+                self._delete_file(key)
+                self._mark_written()
+
+    def replace_all(self, records: List[Dict[str, Any]]) -> None:
+        """Make the store hold exactly the given records, only writing the files that changed."""
+        with self._write_lock():
+            current = self._load()
+            new_records = {self.record_key(r): r for r in records}
+            for key in [k for k in current if k not in new_records]:
+                self._remove_from_index(key, json.loads(current.pop(key)))
+                self._delete_file(key)
+            for key, record in new_records.items():
+                if current.get(key) != self._serialize(record):
+                    self._put(current, record)
+            self._mark_written()
@@ -0,0 +1,160 @@
+"""Migration v2.9.0: Add the full-text search index to learnings tables
+
+Changes:
+- Add a GIN index on the text search vector of the content of agno_learnings, on PostgreSQL.
+  The index is built concurrently, so writes to the table are not blocked while it is built.
+"""
+
+from agno.db.base import AsyncBaseDb, BaseDb
+from agno.utils.log import log_error, log_info
+
+
+def up(db: BaseDb, table_type: str, table_name: str) -> bool:
+    """
+    Add the full-text search index to the learnings table.
+
+    Returns:
+        bool: True if any migration was applied, False otherwise.
+    """
+    db_type = type(db).__name__
+
+    try:
+        if table_type != "learnings":
+            return False
+
+        if db_type == "PostgresDb":
+            return _migrate_postgres(db, table_name)
+        else:
+            log_info(f"{db_type} does not require schema migrations")
+        return False
+    except Exception as e:
+        log_error(f"Error running migration v2.9.0 for {db_type} on table {table_name}: {str(e)}")
+        raise
+
+
+async def async_up(db: AsyncBaseDb, table_type: str, table_name: str) -> bool:
+    """
+    Add the full-text search index to the learnings table.
+
+    Returns:
+        bool: True if any migration was applied, False otherwise.
+    """
+    db_type = type(db).__name__
+
+    try:
+        if table_type != "learnings":
+            return False
+
+        if db_type == "AsyncPostgresDb":
+            return await _migrate_async_postgres(db, table_name)
+        else:
+            log_info(f"{db_type} does not require schema migrations")
+        return False
+    except Exception as e:
+        log_error(f"Error running migration v2.9.0 for {db_type} on table {table_name} asynchronously: {str(e)}")
+        raise
+
+
+def down(db: BaseDb, table_type: str, table_name: str) -> bool:
+    """
+    Revert: drop the full-text search index of the learnings table.
+
+    Returns:
+        bool: True if any migration was reverted, False otherwise.
+    """
+    db_type = type(db).__name__
+
+    try:
+        if table_type != "learnings":
+            return False
+
+        if db_type == "PostgresDb":
+            return _revert_postgres(db, table_name)
+        else:
+            log_info(f"Revert not implemented for {db_type}")
+        return False
+    except Exception as e:
+        log_error(f"Error reverting migration v2.9.0 for {db_type} on table {table_name}: {str(e)}")
+        raise
+
+
+async def async_down(db: AsyncBaseDb, table_type: str, table_name: str) -> bool:
+    """
+    Revert: drop the full-text search index of the learnings table.
+
+    Returns:
+        bool: True if any migration was reverted, False otherwise.
+    """
+    db_type = type(db).__name__
+
+    try:
+        if table_type != "learnings":
+            return False
+
+        if db_type == "AsyncPostgresDb":
+            return await _revert_async_postgres(db, table_name)
+        else:
+            log_info(f"Revert not implemented for {db_type}")
+        return False
+    except Exception as e:
+        log_error(f"Error reverting migration v2.9.0 for {db_type} on table {table_name} asynchronously: {str(e)}")
+        raise
+
+
+# ---------------------------------------------------------------------------
+# PostgreSQL
+# ---------------------------------------------------------------------------
+
+
+def _migrate_postgres(db: BaseDb, table_name: str) -> bool:
+    """Add the full-text search index to the learnings table for PostgreSQL."""
+    from agno.db.postgres.utils import create_learnings_search_index, is_table_available
+
+    db_schema = db.db_schema or "public"  # type: ignore
+
+    with db.Session() as sess, sess.begin():  # type: ignore
+        if not is_table_available(session=sess, table_name=table_name, db_schema=db_schema):
+            log_info(f"Table {table_name} does not exist, skipping migration")
+            return False
+
+    log_info(f"-- Adding the full-text search index to {table_name}")
+    return create_learnings_search_index(db_engine=db.db_engine, table_name=table_name, db_schema=db_schema)  # type: ignore
+
+
+async def _migrate_async_postgres(db: AsyncBaseDb, table_name: str) -> bool:
+    """Add the full-text search index to the learnings table for async PostgreSQL."""
+    from agno.db.postgres.utils import acreate_learnings_search_index, ais_table_available
+
+    db_schema = db.db_schema or "public"  # type: ignore
+
+    async with db.async_session_factory() as sess, sess.begin():  # type: ignore
+        if not await ais_table_available(session=sess, table_name=table_name, db_schema=db_schema):
+            log_info(f"Table {table_name} does not exist, skipping migration")
+            return False
+
+    log_info(f"-- Adding the full-text search index to {table_name}")
+    return await acreate_learnings_search_index(
+        db_engine=db.db_engine,  # type: ignore
+        table_name=table_name,
+        db_schema=db_schema,
+    )
+
+
+def _revert_postgres(db: BaseDb, table_name: str) -> bool:
+    """Drop the full-text search index of the learnings table for PostgreSQL."""
+    from agno.db.postgres.utils import drop_learnings_search_index
+
+    db_schema = db.db_schema or "public"  # type: ignore
+    log_info(f"-- Dropping the full-text search index of {table_name}")
+    drop_learnings_search_index(db_engine=db.db_engine, table_name=table_name, db_schema=db_schema)  # type: ignore
+    return True
+
+
+async def _revert_async_postgres(db: AsyncBaseDb, table_name: str) -> bool:
+    """Drop the full-text search index of the learnings table for async PostgreSQL."""
+    from agno.db.postgres.utils import adrop_learnings_search_index
+
+    db_schema = db.db_schema or "public"  # type: ignore
+    log_info(f"-- Dropping the full-text search index of {table_name}")
+    await adrop_learnings_search_index(db_engine=db.db_engine, table_name=table_name, db_schema=db_schema)  # type: ignore
+    return True
@@ -6,19 +6,27 @@ from uuid import uuid4
 if TYPE_CHECKING:
     from agno.tracing.schemas import Span, Trace
 
-from agno.db.base import AsyncBaseDb, ComponentType, SessionType
+from agno.db.base import AsyncBaseDb, ComponentType, SessionSummaryPage, SessionType
 from agno.db.migrations.manager import MigrationManager
 from agno.db.postgres.schemas import get_table_schema_definition
 from agno.db.postgres.utils import (
+    LEARNINGS_SEARCH_VECTOR,
     abulk_upsert_metrics,
+    acreate_learnings_search_index,
     acreate_schema,
+    ais_learnings_search_index_valid,
     ais_table_available,
     ais_valid_table,
+    apply_session_keyset,
     apply_sorting,
     calculate_date_metrics,
     deserialize_cultural_knowledge,
     fetch_all_sessions_data,
     get_dates_to_calculate_metrics_for,
+    get_learnings_search_query,
+    get_metrics_session_columns,
+    get_session_filters,
+    get_session_summary_columns,
     serialize_cultural_knowledge,
 )
 from agno.db.schemas.culture import CulturalKnowledge
@@ -29,7 +37,14 @@ from agno.db.schemas.service_accounts import (
     resolve_service_account_sort_column,
     validate_service_account_update,
 )
-from agno.db.utils import deserialize_session, deserialize_sessions, json_serializer, learning_search_patterns
+from agno.db.utils import (
+    build_session_summary_page,
+    deserialize_session,
+    deserialize_sessions,
+    json_serializer,
+    learning_search_patterns,
+    learning_search_terms,
+)
 from agno.run.base import RunStatus
 from agno.session import AgentSession, Session, TeamSession, WorkflowSession
 from agno.utils.log import log_debug, log_error, log_info, log_warning
@@ -42,7 +57,7 @@ try:
     from sqlalchemy.exc import ProgrammingError
     from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
     from sqlalchemy.schema import Column, MetaData
-    from sqlalchemy.sql.expression import select, text
+    from sqlalchemy.sql.expression import ColumnElement, literal_column, select, text
 except ImportError:
     raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy`")
 
@@ -155,6 +170,9 @@ class AsyncPostgresDb(AsyncBaseDb):
         )
         # Zero means never refreshed; get_metrics uses this to refresh lazily, at most once per minute
         self._metrics_refreshed_at: float = 0.0
+        # Whether the full-text search index of the learnings table is valid, and when it was last found not to be
+        self._learnings_search_index: bool = False
+        self._learnings_search_index_checked_at: float = 0.0
 
     async def close(self) -> None:
         """Close database connections and dispose of the connection pool.
@@ -294,6 +312,18 @@ class AsyncPostgresDb(AsyncBaseDb):
                     await conn.run_sync(table.create, checkfirst=True)
                 log_debug(f"Successfully created table '{table_name}'")
                 table_created = True
+
+                if table_type == "learnings":
+                    # The full-text search index is built on an expression, and is quick to build on the new table
+                    try:
+                        await acreate_learnings_search_index(
+                            db_engine=self.db_engine,
+                            table_name=table_name,
+                            db_schema=self.db_schema,
+                            concurrently=False,
+                        )
+                    except Exception as e:
+                        log_error(f"Error creating the full-text search index of {table_name}: {str(e)}")
             else:
                 log_debug(f"Table '{self.db_schema}.{table_name}' already exists, skipping creation")
 
@@ -762,6 +792,78 @@ class AsyncPostgresDb(AsyncBaseDb):
             log_error(f"Exception reading from session table: {str(e)}")
             return [] if deserialize else ([], 0)
 
+    async def get_session_summaries(
+        self,
+        session_type: Optional[SessionType] = None,
+        user_id: Optional[str] = None,
+        component_id: Optional[str] = None,
+        session_name: Optional[str] = None,
+        start_timestamp: Optional[int] = None,
+        end_timestamp: Optional[int] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        sort_order: Optional[str] = "desc",
+        with_total_count: bool = False,
+    ) -> SessionSummaryPage:
+        """
+        Get a page of session summaries, reading only the summary columns of the sessions table.
+        Pages are read by (created_at, session_id) instead of by offset, see BaseDb.get_session_summaries.
+
+        Args:
+            session_type (Optional[SessionType]): The type of sessions to get.
+            user_id (Optional[str]): The ID of the user to filter by.
+            component_id (Optional[str]): The ID of the agent / team / workflow to filter by.
+            session_name (Optional[str]): The name of the sessions to filter by.
+            start_timestamp (Optional[int]): The start timestamp to filter by.
+            end_timestamp (Optional[int]): The end timestamp to filter by.
+            limit (int): The maximum number of sessions to return. Defaults to 20.
+            cursor (Optional[str]): The next_cursor of the previous page, or None for the first page.
+            sort_order (Optional[str]): The sort order. Defaults to "desc".
+            with_total_count (bool): Whether to count the sessions matching the filters. Defaults to False.
+
+        Returns:
+            SessionSummaryPage: The session summaries, the cursor of the next page and the total count.
+
+        Raises:
+            ValueError: If the cursor is invalid.
+            Exception: If an error occurs during retrieval.
+        """
+        try:
+            table = await self._get_table(table_type="sessions")
+            if table is None:
+                return SessionSummaryPage([], None, 0 if with_total_count else None)
+
+            filters = get_session_filters(
+                table,
+                session_type=session_type,
+                user_id=user_id,
+                component_id=component_id,
+                session_name=session_name,
+                start_timestamp=start_timestamp,
+                end_timestamp=end_timestamp,
+            )
+            stmt = apply_session_keyset(
+                select(*get_session_summary_columns(table)).where(*filters),
+                table,
+                limit=limit,
+                cursor=cursor,
+                sort_order=sort_order,
+            )
+
+            async with self.async_session_factory() as sess, sess.begin():
+                total_count = None
+                if with_total_count:
+                    count_stmt = select(func.count()).select_from(table).where(*filters)
+                    total_count = (await sess.execute(count_stmt)).scalar() or 0
+
+                rows = [dict(record._mapping) for record in (await sess.execute(stmt)).fetchall()]
+            sessions, next_cursor = build_session_summary_page(rows, limit)
+            return SessionSummaryPage(sessions, next_cursor, total_count)
+
+        except Exception as e:
+            log_error(f"Exception reading session summaries: {str(e)}")
+            raise e
+
     async def rename_session(
         self,
         session_id: str,
@@ -1677,13 +1779,8 @@ class AsyncPostgresDb(AsyncBaseDb):
             if table is None:
                 return []
 
-            stmt = select(
-                table.c.user_id,
-                table.c.session_data,
-                table.c.runs,
-                table.c.created_at,
-                table.c.session_type,
-            )
+            # Only select what the metrics need, so the run contents never leave the database
+            stmt = select(*get_metrics_session_columns(table))
 
             if start_timestamp is not None:
                 stmt = stmt.where(table.c.created_at >= start_timestamp)
@@ -3427,7 +3524,10 @@ class AsyncPostgresDb(AsyncBaseDb):
         The content column is JSONB, which has no ILIKE operator - it is cast
         to TEXT first (the same shape get_user_memories uses for
         search_content). The query matches in both its space and underscore
-        forms. Errors are raised, never swallowed.
+        forms. A GIN full-text index on the content finds the candidate rows,
+        ranked by relevance; queries it cannot serve (non-ASCII, or the index
+        could not be created) scan the table and are ordered by recency.
+        Errors are raised, never swallowed.
         """
         try:
             table = await self._get_table(table_type="learnings")
@@ -3438,6 +3538,9 @@ class AsyncPostgresDb(AsyncBaseDb):
             if not patterns:
                 return []
 
+            terms = learning_search_terms(query)
+            use_search_index = bool(terms) and await self._has_learnings_search_index()
+
             async with self.async_session_factory() as sess:
                 stmt = select(table)
 
@@ -3463,7 +3566,16 @@ class AsyncPostgresDb(AsyncBaseDb):
                 content_text = func.cast(table.c.content, postgresql.TEXT)
                 stmt = stmt.where(or_(*[content_text.ilike(pattern, escape="\\") for pattern in patterns]))
 
-                stmt = stmt.order_by(table.c.updated_at.desc().nulls_last())
+                if use_search_index:
+                    # Same expression as the index, so Postgres uses it
+                    search_vector: ColumnElement[Any] = literal_column(LEARNINGS_SEARCH_VECTOR)
+                    search_query = func.to_tsquery(literal_column("'simple'"), get_learnings_search_query(terms))
+                    stmt = stmt.where(search_vector.op("@@")(search_query))
+                    stmt = stmt.order_by(
+                        func.ts_rank(search_vector, search_query).desc(), table.c.updated_at.desc().nulls_last()
+                    )
+                else:
+                    stmt = stmt.order_by(table.c.updated_at.desc().nulls_last())
                 if limit is not None:
                     stmt = stmt.limit(limit)
 
@@ -3475,6 +3587,27 @@ class AsyncPostgresDb(AsyncBaseDb):
             log_error(f"Error searching learnings: {e}")
             raise e
 
+    async def _has_learnings_search_index(self) -> bool:
+        """Tell if the full-text search index of the learnings table can serve searches.
+
+        The index is created with the learnings table, or by the migrations for existing tables. Until it is valid,
+        e.g. while it is being built, searches scan the table and the index is checked again at most once a minute.
+        """
+        if self._learnings_search_index or time.time() - self._learnings_search_index_checked_at < 60:
+            return self._learnings_search_index
+
+        self._learnings_search_index_checked_at = time.time()
+        try:
+            self._learnings_search_index = await ais_learnings_search_index_valid(
+                db_engine=self.db_engine, table_name=self.learnings_table_name, db_schema=self.db_schema
+            )
+        except Exception as e:
+            log_warning(f"Could not check the full-text search index of the learnings table: {e}")
+            self._learnings_search_index = False
+        if not self._learnings_search_index:
+            log_debug("The learnings table has no valid full-text search index, searches scan the table")
+        return self._learnings_search_index
+
     async def get_learning_by_id(self, id: str) -> Optional[Dict[str, Any]]:
         try:
             table = await self._get_table(table_type="learnings")
@@ -3859,6 +3992,61 @@ class AsyncPostgresDb(AsyncBaseDb):
             log_debug(f"Error claiming schedule: {e}")
             return None
 
+    async def claim_due_schedules(
+        self, worker_id: str, limit: int = 10, lock_grace_seconds: int = 300
+    ) -> List[Dict[str, Any]]:
+        try:
+            table = await self._get_table(table_type="schedules")
+            if table is None:
+                return []
+            now = int(time.time())
+            stale_lock_threshold = now - lock_grace_seconds
+
+            async with self.async_session_factory() as sess:
+                async with sess.begin():
+                    # Lock up to `limit` due rows, skipping rows other workers hold, and claim them in one statement
+                    subq = (
+                        select(table.c.id)
+                        .where(
+                            table.c.enabled == True,  # noqa: E712
+                            table.c.next_run_at <= now,
+                            or_(
+                                table.c.locked_by.is_(None),
+                                table.c.locked_at <= stale_lock_threshold,
+                            ),
+                        )
+                        .order_by(table.c.next_run_at.asc())
+                        .limit(limit)
+                        .with_for_update(skip_locked=True)
+                    )
+                    stmt = (
+                        update(table)
+                        .where(table.c.id.in_(subq))
+                        .values(locked_by=worker_id, locked_at=now)
+                        .returning(*table.c)
+                    )
+                    result = await sess.execute(stmt)
+                    schedules = [dict(row._mapping) for row in result.fetchall()]
+                    return sorted(schedules, key=lambda s: s["next_run_at"] or 0)
+        except Exception as e:
+            log_debug(f"Error claiming schedules: {e}")
+            return []
+
+    async def get_schedule_next_runs(self, updated_since: Optional[int] = None) -> List[Dict[str, Any]]:
+        try:
+            table = await self._get_table(table_type="schedules")
+            if table is None:
+                return []
+            stmt = select(table.c.id, table.c.enabled, table.c.next_run_at, table.c.updated_at)
+            if updated_since is not None:
+                stmt = stmt.where(table.c.updated_at >= updated_since)
+            async with self.async_session_factory() as sess:
+                result = await sess.execute(stmt)
+                return [dict(row._mapping) for row in result.fetchall()]
+        except Exception as e:
+            log_debug(f"Error getting schedule next runs: {e}")
+            return []
+
     async def release_schedule(self, schedule_id: str, next_run_at: Optional[int] = None) -> bool:
         try:
             table = await self._get_table(table_type="schedules")
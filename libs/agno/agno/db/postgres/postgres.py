@@ -1,23 +1,35 @@
+import json
 import time
 from datetime import date, datetime, timedelta, timezone
 from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Sequence, Set, Tuple, Union, cast
 from uuid import uuid4
 
 if TYPE_CHECKING:
+    from agno.run.agent import RunOutput
+    from agno.run.team import TeamRunOutput
+    from agno.run.workflow import WorkflowRunOutput
     from agno.tracing.schemas import Span, Trace
 
 from agno.db import mcp_oauth_store
-from agno.db.base import BaseDb, ComponentType, SessionType
+from agno.db.base import BaseDb, ComponentType, SessionSummaryPage, SessionType
 from agno.db.migrations.manager import MigrationManager
 from agno.db.postgres.schemas import get_table_schema_definition
 from agno.db.postgres.utils import (
+    LEARNINGS_SEARCH_VECTOR,
+    apply_session_keyset,
     apply_sorting,
     bulk_upsert_metrics,
     calculate_date_metrics,
+    create_learnings_search_index,
     create_schema,
     deserialize_cultural_knowledge,
     fetch_all_sessions_data,
     get_dates_to_calculate_metrics_for,
+    get_learnings_search_query,
+    get_metrics_session_columns,
+    get_session_filters,
+    get_session_summary_columns,
+    is_learnings_search_index_valid,
     is_table_available,
     is_valid_table,
     serialize_cultural_knowledge,
@@ -38,7 +50,23 @@ from agno.db.schemas.service_accounts import (
     resolve_service_account_sort_column,
     validate_service_account_update,
 )
-from agno.db.utils import deserialize_session, deserialize_sessions, json_serializer, learning_search_patterns
+from agno.db.utils import (
+    RunFingerprintCache,
+    build_session_summary_page,
+    build_upserted_session,
+    deserialize_run,
+    deserialize_session,
+    deserialize_sessions,
+    get_session_runs_to_save,
+    has_all_session_runs,
+    json_serializer,
+    learning_search_patterns,
+    learning_search_terms,
+    serialize_run_row,
+    serialize_session_run_rows,
+    serialize_session_without_runs,
+    trim_to_last_runs,
+)
 from agno.run.base import RunStatus
 from agno.session import AgentSession, Session, TeamSession, WorkflowSession
 from agno.utils.log import log_debug, log_error, log_info, log_warning
@@ -66,7 +94,7 @@ try:
     from sqlalchemy.exc import ProgrammingError
     from sqlalchemy.orm import scoped_session, sessionmaker
     from sqlalchemy.schema import Column, MetaData, Table
-    from sqlalchemy.sql.expression import text
+    from sqlalchemy.sql.expression import ColumnElement, literal_column, text
 except ImportError:
     raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy`")
 
@@ -100,6 +128,8 @@ class PostgresDb(BaseDb):
         mcp_oauth_codes_table: Optional[str] = None,
         mcp_oauth_refresh_tokens_table: Optional[str] = None,
         mcp_oauth_keys_table: Optional[str] = None,
+        runs_table: Optional[str] = None,
+        store_runs_in_table: bool = False,
         id: Optional[str] = None,
         create_schema: bool = True,
     ):
@@ -135,6 +165,10 @@ class PostgresDb(BaseDb):
             mcp_oauth_codes_table (Optional[str]): Name of the table to store MCP OAuth authorization codes.
             mcp_oauth_refresh_tokens_table (Optional[str]): Name of the table to store MCP OAuth refresh tokens.
             mcp_oauth_keys_table (Optional[str]): Name of the table to store MCP OAuth signing keys.
+            runs_table (Optional[str]): Name of the table to store session runs, when store_runs_in_table is enabled.
+            store_runs_in_table (bool): Store each run in its own row of the runs table, keyed by (session_id, run_id),
+                instead of in the runs column of the sessions table. Saving a session then only writes the runs
+                that changed. Defaults to False.
             id (Optional[str]): ID of the database.
             create_schema (bool): Whether to automatically create the database schema if it doesn't exist.
                 Set to False if schema is managed externally (e.g., via migrations). Defaults to True.
@@ -188,16 +222,23 @@ class PostgresDb(BaseDb):
             mcp_oauth_codes_table=mcp_oauth_codes_table,
             mcp_oauth_refresh_tokens_table=mcp_oauth_refresh_tokens_table,
             mcp_oauth_keys_table=mcp_oauth_keys_table,
+            runs_table=runs_table,
         )
 
         self.db_schema: str = db_schema if db_schema is not None else "ai"
         self.metadata: MetaData = MetaData(schema=self.db_schema)
         self.create_schema: bool = create_schema
+        self.store_runs_in_table: bool = store_runs_in_table
+        # Content hashes of the runs this instance wrote, used to only write runs that changed
+        self._run_fingerprints = RunFingerprintCache()
 
         # Initialize database session
         self.Session: scoped_session = scoped_session(sessionmaker(bind=self.db_engine, expire_on_commit=False))
         # Zero means never refreshed; get_metrics uses this to refresh lazily, at most once per minute
         self._metrics_refreshed_at: float = 0.0
+        # Whether the full-text search index of the learnings table is valid, and when it was last found not to be
+        self._learnings_search_index: bool = False
+        self._learnings_search_index_checked_at: float = 0.0
 
     # -- Serialization methods --
     def to_dict(self):
@@ -206,6 +247,7 @@ class PostgresDb(BaseDb):
             {
                 "db_url": self.db_url,
                 "db_schema": self.db_schema,
+                "store_runs_in_table": self.store_runs_in_table,
                 "type": "postgres",
             }
         )
@@ -233,6 +275,8 @@ class PostgresDb(BaseDb):
             schedule_runs_table=data.get("schedule_runs_table"),
             approvals_table=data.get("approvals_table"),
             service_accounts_table=data.get("service_accounts_table"),
+            runs_table=data.get("runs_table"),
+            store_runs_in_table=data.get("store_runs_in_table", False),
             id=data.get("id"),
         )
 
@@ -276,6 +320,8 @@ class PostgresDb(BaseDb):
             (self.approvals_table_name, "approvals"),
             (self.service_accounts_table_name, "service_accounts"),
         ]
+        if self.store_runs_in_table:
+            tables_to_create.append((self.runs_table_name, "runs"))
 
         for table_name, table_type in tables_to_create:
             self._get_or_create_table(table_name=table_name, table_type=table_type, create_table_if_not_found=True)
@@ -431,6 +477,18 @@ class PostgresDb(BaseDb):
                 table.create(self.db_engine, checkfirst=True)
                 log_debug(f"Successfully created table '{self.db_schema}.{table_name}'")
                 table_created = True
+
+                if table_type == "learnings":
+                    # The full-text search index is built on an expression, and is quick to build on the new table
+                    try:
+                        create_learnings_search_index(
+                            db_engine=self.db_engine,
+                            table_name=table_name,
+                            db_schema=self.db_schema,
+                            concurrently=False,
+                        )
+                    except Exception as e:
+                        log_error(f"Error creating the full-text search index of {table_name}: {str(e)}")
             else:
                 log_debug(f"Table {self.db_schema}.{table_name} already exists, skipping creation")
 
@@ -491,6 +549,7 @@ class PostgresDb(BaseDb):
             "traces": self.trace_table_name,
             "spans": self.span_table_name,
             "sessions": self.session_table_name,
+            "runs": self.runs_table_name,
             "memories": self.memory_table_name,
             "metrics": self.metrics_table_name,
             "evals": self.eval_table_name,
@@ -511,6 +570,14 @@ class PostgresDb(BaseDb):
             )
             return self.session_table
 
+        if table_type == "runs":
+            self.runs_table = self._get_or_create_table(
+                table_name=self.runs_table_name,
+                table_type="runs",
+                create_table_if_not_found=create_table_if_not_found,
+            )
+            return self.runs_table
+
         if table_type == "memories":
             self.memory_table = self._get_or_create_table(
                 table_name=self.memory_table_name,
@@ -753,19 +820,23 @@ class PostgresDb(BaseDb):
             if table is None:
                 return False
 
+            runs_table = self._get_table(table_type="runs") if self.store_runs_in_table else None
             with self.Session() as sess, sess.begin():
                 delete_stmt = table.delete().where(table.c.session_id == session_id)
                 if user_id is not None:
                     delete_stmt = delete_stmt.where(table.c.user_id == user_id)
                 result = sess.execute(delete_stmt)
+                if result.rowcount > 0:
+                    self._delete_session_runs(sess, runs_table, [session_id])
 
-                if result.rowcount == 0:
-                    log_debug(f"No session found to delete with session_id: {session_id} in table {table.name}")
-                    return False
+            if result.rowcount == 0:
+                log_debug(f"No session found to delete with session_id: {session_id} in table {table.name}")
+                return False
 
-                else:
-                    log_debug(f"Successfully deleted session with session_id: {session_id} in table {table.name}")
-                    return True
+            else:
+                self._run_fingerprints.forget([session_id])
+                log_debug(f"Successfully deleted session with session_id: {session_id} in table {table.name}")
+                return True
 
         except Exception as e:
             log_error(f"Error deleting session: {str(e)}")
@@ -787,12 +858,23 @@ class PostgresDb(BaseDb):
             if table is None:
                 return
 
+            runs_table = self._get_table(table_type="runs") if self.store_runs_in_table else None
             with self.Session() as sess, sess.begin():
+                deleted_session_ids = session_ids
+                if runs_table is not None and user_id is not None:
+                    # Only the runs of the sessions owned by the user are deleted
+                    owned_stmt = select(table.c.session_id).where(
+                        table.c.session_id.in_(session_ids), table.c.user_id == user_id
+                    )
+                    deleted_session_ids = [row[0] for row in sess.execute(owned_stmt)]
+
                 delete_stmt = table.delete().where(table.c.session_id.in_(session_ids))
                 if user_id is not None:
                     delete_stmt = delete_stmt.where(table.c.user_id == user_id)
                 result = sess.execute(delete_stmt)
+                self._delete_session_runs(sess, runs_table, deleted_session_ids)
 
+            self._run_fingerprints.forget(deleted_session_ids)
             log_debug(f"Successfully deleted {result.rowcount} sessions")
 
         except Exception as e:
@@ -840,6 +922,7 @@ class PostgresDb(BaseDb):
 
                 session = dict(result._mapping)
 
+            self._hydrate_session_runs([session])
             if not deserialize:
                 return session
 
@@ -849,6 +932,63 @@ class PostgresDb(BaseDb):
             log_error(f"Exception reading from session table: {str(e)}")
             raise e
 
+    def get_session_with_last_runs(
+        self,
+        session_id: str,
+        session_type: SessionType,
+        user_id: Optional[str] = None,
+        last_n_runs: Optional[int] = None,
+    ) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """
+        Get a session dictionary holding only its last N top-level runs, together with their member runs.
+
+        Args:
+            session_id (str): ID of the session to read.
+            session_type (SessionType): Type of session to get.
+            user_id (Optional[str]): User ID to filter by. Defaults to None.
+            last_n_runs (Optional[int]): The number of top-level runs to load. Defaults to all runs.
+
+        Returns:
+            Tuple[Optional[Dict[str, Any]], bool]: The session dictionary, and whether the session has older runs
+                that were not loaded.
+
+        Raises:
+            Exception: If an error occurs during retrieval.
+        """
+        if not self.store_runs_in_table or last_n_runs is None:
+            return super().get_session_with_last_runs(session_id, session_type, user_id, last_n_runs)
+
+        try:
+            table = self._get_table(table_type="sessions")
+            if table is None:
+                return None, False
+
+            with self.Session() as sess:
+                stmt = select(table).where(table.c.session_id == session_id)
+                if user_id is not None:
+                    stmt = stmt.where(table.c.user_id == user_id)
+                result = sess.execute(stmt).fetchone()
+                if result is None:
+                    return None, False
+
+                session_raw = dict(result._mapping)
+
+            # One extra top-level run tells whether there are older runs
+            runs = cast(
+                List[Dict[str, Any]],
+                self.get_runs(session_id, user_id=user_id, last_n_runs=last_n_runs + 1, deserialize=False),
+            )
+            if not runs:
+                # Sessions saved before runs were stored in their own table keep them in the sessions table
+                return session_raw, False
+
+            session_raw["runs"], has_older_runs = trim_to_last_runs(runs, last_n_runs)
+            return session_raw, has_older_runs
+
+        except Exception as e:
+            log_error(f"Exception reading from sessions table: {str(e)}")
+            raise e
+
     def get_sessions(
         self,
         session_type: Optional[SessionType] = None,
@@ -940,8 +1080,10 @@ class PostgresDb(BaseDb):
                     return [], 0
 
                 session = [dict(record._mapping) for record in records]
-                if not deserialize:
-                    return session, total_count
+
+            self._hydrate_session_runs(session)
+            if not deserialize:
+                return session, total_count
 
             return deserialize_sessions(session_type, session)
 
@@ -949,6 +1091,79 @@ class PostgresDb(BaseDb):
             log_error(f"Exception reading from session table: {str(e)}")
             raise e
 
+    def get_session_summaries(
+        self,
+        session_type: Optional[SessionType] = None,
+        user_id: Optional[str] = None,
+        component_id: Optional[str] = None,
+        session_name: Optional[str] = None,
+        start_timestamp: Optional[int] = None,
+        end_timestamp: Optional[int] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        sort_order: Optional[str] = "desc",
+        with_total_count: bool = False,
+    ) -> SessionSummaryPage:
+        """
+        Get a page of session summaries, reading only the summary columns of the sessions table.
+        Pages are read by (created_at, session_id) instead of by offset, see BaseDb.get_session_summaries.
+
+        Args:
+            session_type (Optional[SessionType]): The type of sessions to get.
+            user_id (Optional[str]): The ID of the user to filter by.
+            component_id (Optional[str]): The ID of the agent / team / workflow to filter by.
+            session_name (Optional[str]): The name of the sessions to filter by.
+            start_timestamp (Optional[int]): The start timestamp to filter by.
+            end_timestamp (Optional[int]): The end timestamp to filter by.
+            limit (int): The maximum number of sessions to return. Defaults to 20.
+            cursor (Optional[str]): The next_cursor of the previous page, or None for the first page.
+            sort_order (Optional[str]): The sort order. Defaults to "desc".
+            with_total_count (bool): Whether to count the sessions matching the filters. Defaults to False.
+
+        Returns:
+            SessionSummaryPage: The session summaries, the cursor of the next page and the total count.
+
+        Raises:
+            ValueError: If the cursor is invalid.
+            Exception: If an error occurs during retrieval.
+        """
+        try:
+            table = self._get_table(table_type="sessions")
+            if table is None:
+                return SessionSummaryPage([], None, 0 if with_total_count else None)
+
+            filters = get_session_filters(
+                table,
+                session_type=session_type,
+                user_id=user_id,
+                component_id=component_id,
+                session_name=session_name,
+                start_timestamp=start_timestamp,
+                end_timestamp=end_timestamp,
+            )
+            stmt = apply_session_keyset(
+                select(*get_session_summary_columns(table)).where(*filters),
+                table,
+                limit=limit,
+                cursor=cursor,
+                sort_order=sort_order,
+            )
+
+            with self.Session() as sess, sess.begin():
+                total_count = None
+                if with_total_count:
+                    count_stmt = select(func.count()).select_from(table).where(*filters)
+                    total_count = sess.execute(count_stmt).scalar() or 0
+
+                rows = [dict(record._mapping) for record in sess.execute(stmt).fetchall()]
+            self._hydrate_first_runs(rows[:limit])
+            sessions, next_cursor = build_session_summary_page(rows, limit)
+            return SessionSummaryPage(sessions, next_cursor, total_count)
+
+        except Exception as e:
+            log_error(f"Exception reading session summaries: {str(e)}")
+            raise e
+
     def rename_session(
         self,
         session_id: str,
@@ -1010,6 +1225,7 @@ class PostgresDb(BaseDb):
             log_debug(f"Renamed session with id '{session_id}' to '{session_name}'")
 
             session = dict(row._mapping)
+            self._hydrate_session_runs([session])
             if not deserialize:
                 return session
 
@@ -1042,7 +1258,22 @@ class PostgresDb(BaseDb):
             if table is None:
                 return None
 
-            session_dict = session.to_dict()
+            runs_table: Optional[Table] = None
+            run_rows: List[Dict[str, Any]] = []
+            prune_removed_runs = False
+            if self.store_runs_in_table:
+                # Runs are stored in their own table, the runs column is left empty
+                runs_table = self._get_table(table_type="runs", create_table_if_not_found=True)
+                # Only the runs upserted since the session was loaded or last saved are written
+                run_ids_to_save = get_session_runs_to_save(session)
+                if run_ids_to_save is not None and self._has_runs_in_sessions_table(table, session.session_id):
+                    # Sessions saved before runs were stored in their own table move all their runs to it
+                    run_ids_to_save = None
+                run_rows = serialize_session_run_rows(session, run_ids=run_ids_to_save)
+                prune_removed_runs = run_ids_to_save is None and has_all_session_runs(session)
+                session_dict = serialize_session_without_runs(session)
+            else:
+                session_dict = session.to_dict()
             # Sanitize JSON/dict fields to remove null bytes from nested strings
             if session_dict.get("agent_data"):
                 session_dict["agent_data"] = sanitize_postgres_strings(session_dict["agent_data"])
@@ -1092,11 +1323,10 @@ class PostgresDb(BaseDb):
                     row = result.fetchone()
                     if row is None:
                         return None
-                    session_dict = dict(row._mapping)
+                    written_run_rows = self._write_session_runs(sess, runs_table, row, run_rows, prune_removed_runs)
 
-                    if session_dict is None or not deserialize:
-                        return session_dict
-                    return AgentSession.from_dict(session_dict)
+                self._run_fingerprints.record(written_run_rows)
+                return self._get_upserted_session(session, session_dict, row, deserialize)
 
             elif isinstance(session, TeamSession):
                 with self.Session() as sess, sess.begin():
@@ -1131,11 +1361,10 @@ class PostgresDb(BaseDb):
                     row = result.fetchone()
                     if row is None:
                         return None
-                    session_dict = dict(row._mapping)
+                    written_run_rows = self._write_session_runs(sess, runs_table, row, run_rows, prune_removed_runs)
 
-                    if session_dict is None or not deserialize:
-                        return session_dict
-                    return TeamSession.from_dict(session_dict)
+                self._run_fingerprints.record(written_run_rows)
+                return self._get_upserted_session(session, session_dict, row, deserialize)
 
             elif isinstance(session, WorkflowSession):
                 with self.Session() as sess, sess.begin():
@@ -1170,11 +1399,10 @@ class PostgresDb(BaseDb):
                     row = result.fetchone()
                     if row is None:
                         return None
-                    session_dict = dict(row._mapping)
+                    written_run_rows = self._write_session_runs(sess, runs_table, row, run_rows, prune_removed_runs)
 
-                    if session_dict is None or not deserialize:
-                        return session_dict
-                    return WorkflowSession.from_dict(session_dict)
+                self._run_fingerprints.record(written_run_rows)
+                return self._get_upserted_session(session, session_dict, row, deserialize)
 
             else:
                 raise ValueError(f"Invalid session type: {session.session_type}")
@@ -1208,6 +1436,16 @@ class PostgresDb(BaseDb):
             if table is None:
                 return []
 
+            if self.store_runs_in_table:
+                # With runs stored in their own table, each session only writes its changed runs
+                return [
+                    result
+                    for session in sessions
+                    if session is not None
+                    for result in [self.upsert_session(session, deserialize=deserialize)]
+                    if result is not None
+                ]
+
             # Group sessions by type for better handling
             agent_sessions = [s for s in sessions if isinstance(s, AgentSession)]
             team_sessions = [s for s in sessions if isinstance(s, TeamSession)]
@@ -1398,6 +1636,250 @@ class PostgresDb(BaseDb):
             log_error(f"Exception bulk upserting sessions: {str(e)}")
             return []
 
+    # -- Runs methods --
+
+    def _upsert_run_rows(self, sess: Any, table: Table, rows: List[Dict[str, Any]]) -> None:
+        """Upsert the given rows into the runs table. Existing rows keep their position in the session."""
+        if not rows:
+            return
+
+        # Rows written together keep their relative order, and are placed after all runs written before
+        base_order = time.time_ns()
+        stmt = postgresql.insert(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["session_id", "run_id"],
+            set_=dict(
+                run_type=stmt.excluded.run_type,
+                parent_run_id=stmt.excluded.parent_run_id,
+                agent_id=stmt.excluded.agent_id,
+                team_id=stmt.excluded.team_id,
+                workflow_id=stmt.excluded.workflow_id,
+                user_id=stmt.excluded.user_id,
+                status=stmt.excluded.status,
+                run_data=stmt.excluded.run_data,
+                updated_at=stmt.excluded.updated_at,
+            ),
+            where=(table.c.user_id == stmt.excluded.user_id) | (table.c.user_id.is_(None)),
+        )
+        sess.execute(
+            stmt,
+            [
+                # Sanitize the run to remove null bytes from nested strings
+                {**row, "run_data": sanitize_postgres_strings(json.loads(row["run_data"])), "run_order": base_order + i}
+                for i, row in enumerate(rows)
+            ],
+        )
+
+    def _write_session_runs(
+        self,
+        sess: Any,
+        runs_table: Optional[Table],
+        session_row: Any,
+        run_rows: List[Dict[str, Any]],
+        prune_removed_runs: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Write the runs of a session that changed since they were last written.
+
+        With prune_removed_runs, the session's runs not in run_rows are deleted, as they were removed from the session.
+
+        Returns:
+            List[Dict[str, Any]]: The written rows, to be recorded once the transaction is committed.
+        """
+        # Nothing to write if runs are stored in the sessions table, or the session upsert was rejected
+        if runs_table is None or session_row is None:
+            return []
+
+        if prune_removed_runs:
+            delete_stmt = runs_table.delete().where(runs_table.c.session_id == session_row.session_id)
+            if run_rows:
+                delete_stmt = delete_stmt.where(runs_table.c.run_id.not_in([row["run_id"] for row in run_rows]))
+            if sess.execute(delete_stmt).rowcount > 0:
+                # Removed runs may be added back later, so their fingerprints must not skip that write
+                self._run_fingerprints.forget([session_row.session_id])
+
+        changed_rows = self._run_fingerprints.changed(run_rows)
+        if changed_rows:
+            self._upsert_run_rows(sess, runs_table, changed_rows)
+            log_debug(f"Wrote {len(changed_rows)} of {len(run_rows)} runs to the runs table")
+        return changed_rows
+
+    def _get_upserted_session(
+        self, session: Session, session_dict: Dict[str, Any], session_row: Any, deserialize: Optional[bool] = True
+    ) -> Optional[Union[Session, Dict[str, Any]]]:
+        """Build the session returned by upsert_session, recording the runs of the written session as saved."""
+        session_raw = dict(session_row._mapping)
+        if not self.store_runs_in_table:
+            return type(session).from_dict(session_dict) if deserialize else session_raw
+
+        if session.get_unsaved_run_ids() is not None:
+            session.mark_runs_saved()
+        return build_upserted_session(session, session_raw, deserialize)
+
+    def _has_runs_in_sessions_table(self, table: Table, session_id: str) -> bool:
+        """Whether the session row still holds runs saved before runs were stored in their own table."""
+        with self.Session() as sess:
+            runs = sess.execute(select(table.c.runs).where(table.c.session_id == session_id)).scalar()
+        return bool(runs)
+
+    def _hydrate_session_runs(self, sessions_raw: List[Dict[str, Any]], metrics_only: bool = False) -> None:
+        """Fill the runs of the given session dictionaries from the runs table.
+
+        Sessions without rows in the runs table keep the runs stored in the sessions table.
+        With metrics_only, each run only holds its model and model_provider.
+        """
+        if not self.store_runs_in_table or not sessions_raw:
+            return
+
+        table = self._get_table(table_type="runs")
+        if table is None:
+            return
+
+        runs_by_session: Dict[str, List[Dict[str, Any]]] = {}
+        session_ids = [session_raw["session_id"] for session_raw in sessions_raw]
+        with self.Session() as sess:
+            run_data_column: ColumnElement[Any] = table.c.run_data
+            if metrics_only:
+                run_data_column = func.jsonb_strip_nulls(
+                    func.jsonb_build_object(
+                        literal_column("'model'"),
+                        table.c.run_data.op("->")(literal_column("'model'")),
+                        literal_column("'model_provider'"),
+                        table.c.run_data.op("->")(literal_column("'model_provider'")),
+                    )
+                )
+            # Chunked to keep the IN lists of large session scans bounded
+            for i in range(0, len(session_ids), 500):
+                stmt = (
+                    select(table.c.session_id, run_data_column)
+                    .where(table.c.session_id.in_(session_ids[i : i + 500]))
+                    .order_by(table.c.session_id, table.c.run_order)
+                )
+                for session_id, run_data in sess.execute(stmt.execution_options(yield_per=1000)):
+                    runs_by_session.setdefault(session_id, []).append(run_data)
+
+        for session_raw in sessions_raw:
+            runs = runs_by_session.get(session_raw["session_id"])
+            if runs is not None:
+                session_raw["runs"] = runs
+
+    def _hydrate_first_runs(self, rows: List[Dict[str, Any]]) -> None:
+        """Fill the first run of the given unnamed session summary rows from the runs table."""
+        if not self.store_runs_in_table:
+            return
+        missing = [row for row in rows if row.get("session_name") is None and row.get("first_run") is None]
+        if not missing:
+            return
+
+        table = self._get_table(table_type="runs")
+        if table is None:
+            return
+
+        # Team sessions are named after their first team run, which has no agent_id
+        team_session_ids = [row["session_id"] for row in missing if row.get("session_type") == SessionType.TEAM.value]
+        with self.Session() as sess:
+            stmt = (
+                select(table.c.session_id, table.c.run_data)
+                .where(table.c.session_id.in_([row["session_id"] for row in missing]))
+                .where(or_(table.c.session_id.not_in(team_session_ids), table.c.agent_id.is_(None)))
+                .distinct(table.c.session_id)
+                .order_by(table.c.session_id, table.c.run_order)
+            )
+            first_runs = {session_id: run_data for session_id, run_data in sess.execute(stmt).fetchall()}
+
+        for row in missing:
+            row["first_run"] = first_runs.get(row["session_id"])
+
+    def _delete_session_runs(self, sess: Any, runs_table: Optional[Table], session_ids: List[str]) -> None:
+        """Delete the runs of the given sessions from the runs table, in the transaction deleting the sessions."""
+        if runs_table is None or not session_ids:
+            return
+        sess.execute(runs_table.delete().where(runs_table.c.session_id.in_(session_ids)))
+
+    def upsert_run(
+        self,
+        session_id: str,
+        run: Union["RunOutput", "TeamRunOutput", "WorkflowRunOutput"],
+        user_id: Optional[str] = None,
+    ) -> None:
+        """
+        Insert or update a single run of the given session, without rewriting the session.
+
+        Args:
+            session_id (str): The ID of the session the run belongs to.
+            run (Union[RunOutput, TeamRunOutput, WorkflowRunOutput]): The run to upsert.
+            user_id (Optional[str]): The ID of the user owning the session.
+
+        Raises:
+            Exception: If an error occurs during upserting.
+        """
+        try:
+            table = self._get_table(table_type="runs", create_table_if_not_found=True)
+            if table is None:
+                return
+
+            row = serialize_run_row(session_id, run, user_id=user_id)
+            if not self._run_fingerprints.changed([row]):
+                return
+
+            with self.Session() as sess, sess.begin():
+                self._upsert_run_rows(sess, table, [row])
+            self._run_fingerprints.record([row])
+
+        except Exception as e:
+            log_error(f"Exception upserting run: {str(e)}")
+            raise e
+
+    def get_runs(
+        self,
+        session_id: str,
+        user_id: Optional[str] = None,
+        last_n_runs: Optional[int] = None,
+        deserialize: Optional[bool] = True,
+    ) -> List[Union["RunOutput", "TeamRunOutput", "WorkflowRunOutput", Dict[str, Any]]]:
+        """
+        Get the runs of the given session from the runs table, oldest first.
+
+        Args:
+            session_id (str): The ID of the session to get the runs for.
+            user_id (Optional[str]): User ID to filter by. Defaults to None.
+            last_n_runs (Optional[int]): Only return the last N top-level runs, together with their member runs.
+            deserialize (Optional[bool]): Whether to deserialize the runs. Defaults to True.
+
+        Returns:
+            List[Union[RunOutput, TeamRunOutput, WorkflowRunOutput, Dict[str, Any]]]:
+                - When deserialize=True: List of run objects
+                - When deserialize=False: List of run dictionaries
+
+        Raises:
+            Exception: If an error occurs during retrieval.
+        """
+        try:
+            table = self._get_table(table_type="runs")
+            if table is None:
+                return []
+
+            with self.Session() as sess:
+                stmt = select(table.c.run_type, table.c.run_data).where(table.c.session_id == session_id)
+                if user_id is not None:
+                    stmt = stmt.where(table.c.user_id == user_id)
+                if last_n_runs is not None:
+                    last_run_ids = (
+                        select(table.c.run_id)
+                        .where(table.c.session_id == session_id, table.c.parent_run_id.is_(None))
+                        .order_by(table.c.run_order.desc())
+                        .limit(last_n_runs)
+                    )
+                    stmt = stmt.where(table.c.run_id.in_(last_run_ids) | table.c.parent_run_id.in_(last_run_ids))
+                records = sess.execute(stmt.order_by(table.c.run_order)).fetchall()
+
+            if not deserialize:
+                return [run_data for _, run_data in records]
+            return [deserialize_run(run_type, run_data) for run_type, run_data in records]
+
+        except Exception as e:
+            log_error(f"Exception reading from runs table: {str(e)}")
+            raise e
+
     # -- Memory methods --
     def delete_user_memory(self, memory_id: str, user_id: Optional[str] = None):
         """Delete a user memory from the database.
@@ -1916,13 +2398,8 @@ class PostgresDb(BaseDb):
             if table is None:
                 return []
 
-            stmt = select(
-                table.c.user_id,
-                table.c.session_data,
-                table.c.runs,
-                table.c.created_at,
-                table.c.session_type,
-            )
+            # Only select what the metrics need, and stream the rows instead of buffering them client-side
+            stmt = select(*get_metrics_session_columns(table))
 
             if start_timestamp is not None:
                 stmt = stmt.where(table.c.created_at >= start_timestamp)
@@ -1930,9 +2407,11 @@ class PostgresDb(BaseDb):
                 stmt = stmt.where(table.c.created_at <= end_timestamp)
 
             with self.Session() as sess:
-                result = sess.execute(stmt).fetchall()
+                result = sess.execute(stmt.execution_options(yield_per=1000))
+                sessions = [dict(record._mapping) for record in result]
 
-                return [record._mapping for record in result]
+            self._hydrate_session_runs(sessions, metrics_only=True)
+            return sessions
 
         except Exception as e:
             log_error(f"Exception reading from sessions table: {str(e)}")
@@ -2929,83 +3408,133 @@ class PostgresDb(BaseDb):
             if table is None:
                 return
 
-            trace_dict = trace.to_dict()
-            trace_dict.pop("total_spans", None)
-            trace_dict.pop("error_count", None)
-            # Sanitize string fields and nested JSON structures
-            if trace_dict.get("name"):
-                trace_dict["name"] = sanitize_postgres_string(trace_dict["name"])
-            if trace_dict.get("status"):
-                trace_dict["status"] = sanitize_postgres_string(trace_dict["status"])
-            # Sanitize any nested dict/JSON fields
-            trace_dict = cast(Dict[str, Any], sanitize_postgres_strings(trace_dict))
-
             with self.Session() as sess, sess.begin():
-                # Use upsert to handle concurrent inserts atomically
-                # On conflict, update fields while preserving existing non-null context values
-                # and keeping the earliest start_time
-                insert_stmt = postgresql.insert(table).values(trace_dict)
-
-                # Build component level expressions for comparing trace priority
-                new_level = self._get_trace_component_level_expr(
-                    insert_stmt.excluded.workflow_id,
-                    insert_stmt.excluded.team_id,
-                    insert_stmt.excluded.agent_id,
-                    insert_stmt.excluded.name,
-                )
-                existing_level = self._get_trace_component_level_expr(
-                    table.c.workflow_id,
-                    table.c.team_id,
-                    table.c.agent_id,
-                    table.c.name,
-                )
-
-                # Build the ON CONFLICT DO UPDATE clause
-                # Use LEAST for start_time, GREATEST for end_time to capture full trace duration
-                # Use COALESCE to preserve existing non-null context values
-                upsert_stmt = insert_stmt.on_conflict_do_update(
-                    index_elements=["trace_id"],
-                    set_={
-                        "end_time": func.greatest(table.c.end_time, insert_stmt.excluded.end_time),
-                        "start_time": func.least(table.c.start_time, insert_stmt.excluded.start_time),
-                        "duration_ms": func.extract(
-                            "epoch",
-                            func.cast(
-                                func.greatest(table.c.end_time, insert_stmt.excluded.end_time),
-                                TIMESTAMP(timezone=True),
-                            )
-                            - func.cast(
-                                func.least(table.c.start_time, insert_stmt.excluded.start_time),
-                                TIMESTAMP(timezone=True),
-                            ),
-                        )
-                        * 1000,
-                        "status": insert_stmt.excluded.status,
-                        # Update name only if new trace is from a higher-level component
-                        # Priority: workflow (3) > team (2) > agent (1) > child spans (0)
-                        "name": case(
-                            (new_level > existing_level, insert_stmt.excluded.name),
-                            else_=table.c.name,
-                        ),
-                        # Preserve existing non-null context values: COALESCE returns
-                        # the first non-null arg, so put the existing column first.
-                        # Otherwise a later upsert from a child span (e.g. a post-hook
-                        # agent's run with a different session_id) would overwrite
-                        # the trace's already-correct context.
-                        "run_id": func.coalesce(table.c.run_id, insert_stmt.excluded.run_id),
-                        "session_id": func.coalesce(table.c.session_id, insert_stmt.excluded.session_id),
-                        "user_id": func.coalesce(table.c.user_id, insert_stmt.excluded.user_id),
-                        "agent_id": func.coalesce(table.c.agent_id, insert_stmt.excluded.agent_id),
-                        "team_id": func.coalesce(table.c.team_id, insert_stmt.excluded.team_id),
-                        "workflow_id": func.coalesce(table.c.workflow_id, insert_stmt.excluded.workflow_id),
-                    },
-                )
-                sess.execute(upsert_stmt)
+                sess.execute(self._get_trace_upsert_stmt(table, [self._get_trace_record(trace)]))
 
         except Exception as e:
             log_error(f"Error creating trace: {str(e)}")
             # Don't raise - tracing should not break the main application flow
 
+    def upsert_traces_and_spans(self, traces: List["Trace"], spans: List) -> None:
+        """Upsert the traces and create the spans of several traces in a single transaction.
+
+        Args:
+            traces: The Trace objects to store (one per trace_id).
+            spans: The Span objects of those traces.
+
+        Raises:
+            Exception: If the write fails, so the exporter can count the spans as failed.
+        """
+        if not traces and not spans:
+            return
+
+        try:
+            traces_table = self._get_table(table_type="traces", create_table_if_not_found=True)
+            spans_table = self._get_table(table_type="spans", create_table_if_not_found=True)
+            if traces_table is None or spans_table is None:
+                return
+
+            # Sort by trace_id so concurrent writers lock the rows in the same order
+            trace_records = sorted((self._get_trace_record(trace) for trace in traces), key=lambda t: t["trace_id"])
+            span_records = [self._get_span_record(span) for span in spans]
+
+            with self.Session() as sess, sess.begin():
+                if trace_records:
+                    sess.execute(self._get_trace_upsert_stmt(traces_table, trace_records))
+                if span_records:
+                    sess.execute(postgresql.insert(spans_table), span_records)
+
+        except Exception as e:
+            log_error(f"Error creating traces and spans: {str(e)}")
+            raise e
+
+    def _get_trace_record(self, trace: "Trace") -> Dict[str, Any]:
+        """Get the sanitized row of a trace."""
+        trace_dict = trace.to_dict()
+        trace_dict.pop("total_spans", None)
+        trace_dict.pop("error_count", None)
+        # Sanitize string fields and nested JSON structures
+        if trace_dict.get("name"):
+            trace_dict["name"] = sanitize_postgres_string(trace_dict["name"])
+        if trace_dict.get("status"):
+            trace_dict["status"] = sanitize_postgres_string(trace_dict["status"])
+        # Sanitize any nested dict/JSON fields
+        return cast(Dict[str, Any], sanitize_postgres_strings(trace_dict))
+
+    def _get_span_record(self, span: "Span") -> Dict[str, Any]:
+        """Get the sanitized row of a span."""
+        span_dict = span.to_dict()
+        # Sanitize string fields and nested JSON structures
+        if span_dict.get("name"):
+            span_dict["name"] = sanitize_postgres_string(span_dict["name"])
+        if span_dict.get("status_code"):
+            span_dict["status_code"] = sanitize_postgres_string(span_dict["status_code"])
+        # Sanitize any nested dict/JSON fields
+        return cast(Dict[str, Any], sanitize_postgres_strings(span_dict))
+
+    def _get_trace_upsert_stmt(self, table: Table, trace_records: List[Dict[str, Any]]):
+        """Build the upsert statement of the given trace rows, which must have distinct trace_ids."""
+        # Use upsert to handle concurrent inserts atomically
+        # On conflict, update fields while preserving existing non-null context values
+        # and keeping the earliest start_time
+        insert_stmt = postgresql.insert(table).values(trace_records)
+
+        # Build component level expressions for comparing trace priority
+        new_level = self._get_trace_component_level_expr(
+            insert_stmt.excluded.workflow_id,
+            insert_stmt.excluded.team_id,
+            insert_stmt.excluded.agent_id,
+            insert_stmt.excluded.name,
+        )
+        existing_level = self._get_trace_component_level_expr(
+            table.c.workflow_id,
+            table.c.team_id,
+            table.c.agent_id,
+            table.c.name,
+        )
+
+        # Build the ON CONFLICT DO UPDATE clause
+        # Use LEAST for start_time, GREATEST for end_time to capture full trace duration
+        # Use COALESCE to preserve existing non-null context values
+        upsert_stmt = insert_stmt.on_conflict_do_update(
+            index_elements=["trace_id"],
+            set_={
+                "end_time": func.greatest(table.c.end_time, insert_stmt.excluded.end_time),
+                "start_time": func.least(table.c.start_time, insert_stmt.excluded.start_time),
+                "duration_ms": func.extract(
+                    "epoch",
+                    func.cast(
+                        func.greatest(table.c.end_time, insert_stmt.excluded.end_time),
+                        TIMESTAMP(timezone=True),
+                    )
+                    - func.cast(
+                        func.least(table.c.start_time, insert_stmt.excluded.start_time),
+                        TIMESTAMP(timezone=True),
+                    ),
+                )
+                * 1000,
+                "status": insert_stmt.excluded.status,
+                # Update name only if new trace is from a higher-level component
+                # Priority: workflow (3) > team (2) > agent (1) > child spans (0)
+                "name": case(
+                    (new_level > existing_level, insert_stmt.excluded.name),
+                    else_=table.c.name,
+                ),
+                # Preserve existing non-null context values: COALESCE returns
+                # the first non-null arg, so put the existing column first.
+                # Otherwise a later upsert from a child span (e.g. a post-hook
+                # agent's run with a different session_id) would overwrite
+                # the trace's already-correct context.
+                "run_id": func.coalesce(table.c.run_id, insert_stmt.excluded.run_id),
+                "session_id": func.coalesce(table.c.session_id, insert_stmt.excluded.session_id),
+                "user_id": func.coalesce(table.c.user_id, insert_stmt.excluded.user_id),
+                "agent_id": func.coalesce(table.c.agent_id, insert_stmt.excluded.agent_id),
+                "team_id": func.coalesce(table.c.team_id, insert_stmt.excluded.team_id),
+                "workflow_id": func.coalesce(table.c.workflow_id, insert_stmt.excluded.workflow_id),
+            },
+        )
+        return upsert_stmt
+
     def get_trace(
         self,
         trace_id: Optional[str] = None,
@@ -3394,17 +3923,7 @@ class PostgresDb(BaseDb):
                 return
 
             with self.Session() as sess, sess.begin():
-                for span in spans:
-                    span_dict = span.to_dict()
-                    # Sanitize string fields and nested JSON structures
-                    if span_dict.get("name"):
-                        span_dict["name"] = sanitize_postgres_string(span_dict["name"])
-                    if span_dict.get("status_code"):
-                        span_dict["status_code"] = sanitize_postgres_string(span_dict["status_code"])
-                    # Sanitize any nested dict/JSON fields
-                    span_dict = sanitize_postgres_strings(span_dict)
-                    stmt = postgresql.insert(table).values(span_dict)
-                    sess.execute(stmt)
+                sess.execute(postgresql.insert(table), [self._get_span_record(span) for span in spans])
 
         except Exception as e:
             log_error(f"Error creating spans batch: {str(e)}")
@@ -4952,7 +5471,10 @@ class PostgresDb(BaseDb):
         The content column is JSONB, which has no ILIKE operator - it is cast
         to TEXT first (the same shape get_user_memories uses for
         search_content). The query matches in both its space and underscore
-        forms. Errors are raised, never swallowed.
+        forms. A GIN full-text index on the content finds the candidate rows,
+        ranked by relevance; queries it cannot serve (non-ASCII, or the index
+        could not be created) scan the table and are ordered by recency.
+        Errors are raised, never swallowed.
         """
         try:
             table = self._get_table(table_type="learnings")
@@ -4963,6 +5485,9 @@ class PostgresDb(BaseDb):
             if not patterns:
                 return []
 
+            terms = learning_search_terms(query)
+            use_search_index = bool(terms) and self._has_learnings_search_index()
+
             with self.Session() as sess:
                 stmt = select(table)
 
@@ -4988,7 +5513,16 @@ class PostgresDb(BaseDb):
                 content_text = func.cast(table.c.content, postgresql.TEXT)
                 stmt = stmt.where(or_(*[content_text.ilike(pattern, escape="\\") for pattern in patterns]))
 
-                stmt = stmt.order_by(table.c.updated_at.desc().nulls_last())
+                if use_search_index:
+                    # Same expression as the index, so Postgres uses it
+                    search_vector: ColumnElement[Any] = literal_column(LEARNINGS_SEARCH_VECTOR)
+                    search_query = func.to_tsquery(literal_column("'simple'"), get_learnings_search_query(terms))
+                    stmt = stmt.where(search_vector.op("@@")(search_query))
+                    stmt = stmt.order_by(
+                        func.ts_rank(search_vector, search_query).desc(), table.c.updated_at.desc().nulls_last()
+                    )
+                else:
+                    stmt = stmt.order_by(table.c.updated_at.desc().nulls_last())
                 if limit is not None:
                     stmt = stmt.limit(limit)
 
@@ -4999,6 +5533,27 @@ class PostgresDb(BaseDb):
             log_error(f"Error searching learnings: {e}")
             raise e
 
+    def _has_learnings_search_index(self) -> bool:
+        """Tell if the full-text search index of the learnings table can serve searches.
+
+        The index is created with the learnings table, or by the migrations for existing tables. Until it is valid,
+        e.g. while it is being built, searches scan the table and the index is checked again at most once a minute.
+        """
+        if self._learnings_search_index or time.time() - self._learnings_search_index_checked_at < 60:
+            return self._learnings_search_index
+
+        self._learnings_search_index_checked_at = time.time()
+        try:
+            self._learnings_search_index = is_learnings_search_index_valid(
+                db_engine=self.db_engine, table_name=self.learnings_table_name, db_schema=self.db_schema
+            )
+        except Exception as e:
+            log_warning(f"Could not check the full-text search index of the learnings table: {e}")
+            self._learnings_search_index = False
+        if not self._learnings_search_index:
+            log_debug("The learnings table has no valid full-text search index, searches scan the table")
+        return self._learnings_search_index
+
     def get_learning_by_id(self, id: str) -> Optional[Dict[str, Any]]:
         try:
             table = self._get_table(table_type="learnings")
@@ -5257,6 +5812,58 @@ class PostgresDb(BaseDb):
             log_debug(f"Error claiming schedule: {e}")
             return None
 
+    def claim_due_schedules(
+        self, worker_id: str, limit: int = 10, lock_grace_seconds: int = 300
+    ) -> List[Dict[str, Any]]:
+        try:
+            table = self._get_table(table_type="schedules")
+            if table is None:
+                return []
+            now = int(time.time())
+            stale_lock_threshold = now - lock_grace_seconds
+
+            with self.Session() as sess, sess.begin():
+                # Lock up to `limit` due rows, skipping rows other workers hold, and claim them in one statement
+                subq = (
+                    select(table.c.id)
+                    .where(
+                        table.c.enabled == True,  # noqa: E712
+                        table.c.next_run_at <= now,
+                        or_(
+                            table.c.locked_by.is_(None),
+                            table.c.locked_at <= stale_lock_threshold,
+                        ),
+                    )
+                    .order_by(table.c.next_run_at.asc())
+                    .limit(limit)
+                    .with_for_update(skip_locked=True)
+                )
+                stmt = (
+                    update(table)
+                    .where(table.c.id.in_(subq))
+                    .values(locked_by=worker_id, locked_at=now)
+                    .returning(*table.c)
+                )
+                schedules = [dict(row._mapping) for row in sess.execute(stmt).fetchall()]
+                return sorted(schedules, key=lambda s: s["next_run_at"] or 0)
+        except Exception as e:
+            log_debug(f"Error claiming schedules: {e}")
+            return []
+
+    def get_schedule_next_runs(self, updated_since: Optional[int] = None) -> List[Dict[str, Any]]:
+        try:
+            table = self._get_table(table_type="schedules")
+            if table is None:
+                return []
+            stmt = select(table.c.id, table.c.enabled, table.c.next_run_at, table.c.updated_at)
+            if updated_since is not None:
+                stmt = stmt.where(table.c.updated_at >= updated_since)
+            with self.Session() as sess:
+                return [dict(row._mapping) for row in sess.execute(stmt).fetchall()]
+        except Exception as e:
+            log_debug(f"Error getting schedule next runs: {e}")
+            return []
+
     def release_schedule(self, schedule_id: str, next_run_at: Optional[int] = None) -> bool:
         try:
             table = self._get_table(table_type="schedules")
@@ -28,6 +28,27 @@ SESSION_TABLE_SCHEMA = {
     "updated_at": {"type": BigInteger, "nullable": True},
 }
 
+RUNS_TABLE_SCHEMA = {
+    "session_id": {"type": String, "nullable": False},
+    "run_id": {"type": String, "nullable": False},
+    "run_type": {"type": String, "nullable": False},
+    "parent_run_id": {"type": String, "nullable": True},
+    "agent_id": {"type": String, "nullable": True},
+    "team_id": {"type": String, "nullable": True},
+    "workflow_id": {"type": String, "nullable": True},
+    "user_id": {"type": String, "nullable": True},
+    "status": {"type": String, "nullable": True},
+    "run_data": {"type": JSONB, "nullable": False},
+    # Position of the run in the session. Set on first insert and never updated.
+    "run_order": {"type": BigInteger, "nullable": False},
+    "created_at": {"type": BigInteger, "nullable": False},
+    "updated_at": {"type": BigInteger, "nullable": True},
+    "__primary_key__": ["session_id", "run_id"],
+    "__composite_indexes__": [
+        {"name": "session_id_run_order", "columns": ["session_id", "run_order"]},
+    ],
+}
+
 MEMORY_TABLE_SCHEMA = {
     "memory_id": {"type": String, "primary_key": True, "nullable": False},
     "memory": {"type": JSONB, "nullable": False},
@@ -369,6 +390,7 @@ def get_table_schema_definition(
 
     schemas = {
         "sessions": SESSION_TABLE_SCHEMA,
+        "runs": RUNS_TABLE_SCHEMA,
         "evals": EVAL_TABLE_SCHEMA,
         "metrics": METRICS_TABLE_SCHEMA,
         "memories": MEMORY_TABLE_SCHEMA,
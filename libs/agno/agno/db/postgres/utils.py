@@ -8,17 +8,20 @@ from uuid import uuid4
 from sqlalchemy import Engine
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
+from agno.db.base import SessionType
 from agno.db.postgres.schemas import get_table_schema_definition
 from agno.db.schemas.culture import CulturalKnowledge
-from agno.utils.log import log_debug, log_error, log_warning
+from agno.db.utils import SESSION_SUMMARY_COLUMNS, decode_session_cursor
+from agno.utils.log import log_debug, log_error, log_info, log_warning
 
 try:
-    from sqlalchemy import Table, func
+    from sqlalchemy import Table, case, func, null, select, tuple_
     from sqlalchemy.dialects import postgresql
+    from sqlalchemy.dialects.postgresql import JSONB
     from sqlalchemy.exc import NoSuchTableError
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import Session
-    from sqlalchemy.sql.expression import text
+    from sqlalchemy.sql.expression import literal_column, text
 except ImportError:
     raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy`")
 
@@ -61,6 +64,89 @@ def apply_sorting(stmt, table: Table, sort_by: Optional[str] = None, sort_order:
         return stmt.order_by(sort_column.desc())
 
 
+def get_session_filters(
+    table: Table,
+    session_type: Optional[SessionType] = None,
+    user_id: Optional[str] = None,
+    component_id: Optional[str] = None,
+    session_name: Optional[str] = None,
+    start_timestamp: Optional[int] = None,
+    end_timestamp: Optional[int] = None,
+) -> List[Any]:
+    """Get the conditions selecting the sessions matching the given filters."""
+    filters: List[Any] = []
+    if user_id is not None:
+        filters.append(table.c.user_id == user_id)
+    if component_id is not None:
+        if session_type == SessionType.AGENT:
+            filters.append(table.c.agent_id == component_id)
+        elif session_type == SessionType.TEAM:
+            filters.append(table.c.team_id == component_id)
+        elif session_type == SessionType.WORKFLOW:
+            filters.append(table.c.workflow_id == component_id)
+        elif session_type is None:
+            filters.append(
+                (table.c.agent_id == component_id)
+                | (table.c.team_id == component_id)
+                | (table.c.workflow_id == component_id)
+            )
+    if start_timestamp is not None:
+        filters.append(table.c.created_at >= start_timestamp)
+    if end_timestamp is not None:
+        filters.append(table.c.created_at <= end_timestamp)
+    if session_name is not None:
+        filters.append(func.coalesce(table.c.session_data["session_name"].astext, "").ilike(f"%{session_name}%"))
+    if session_type is not None:
+        session_type_value = session_type.value if isinstance(session_type, SessionType) else session_type
+        filters.append(table.c.session_type == session_type_value)
+    return filters
+
+
+def get_session_summary_columns(table: Table) -> List[Any]:
+    """Get the columns read for session summaries, see BaseDb.get_session_summaries.
+
+    Only unnamed sessions read a run: the first team run of team sessions, the first run of other sessions.
+    """
+    session_name = table.c.session_data["session_name"].astext
+    first_team_run = func.jsonb_path_query_first(
+        table.c.runs, literal_column("'$[*] ? (!exists(@.agent_id) || @.agent_id == null)'::jsonpath"), type_=JSONB
+    )
+    first_run = case(
+        (session_name.isnot(None), null()),
+        (table.c.session_type == SessionType.TEAM.value, first_team_run),
+        else_=table.c.runs.op("->", return_type=JSONB)(literal_column("0")),
+    )
+    return [
+        *(table.c[column] for column in SESSION_SUMMARY_COLUMNS),
+        session_name.label("session_name"),
+        table.c.session_data["session_state"].label("session_state"),
+        table.c.session_data["session_metrics"].label("session_metrics"),
+        first_run.label("first_run"),
+    ]
+
+
+def apply_session_keyset(
+    stmt, table: Table, limit: int, cursor: Optional[str] = None, sort_order: Optional[str] = None
+):
+    """Sort sessions by (created_at, session_id), starting after the given cursor.
+
+    One session more than the limit is read, to know whether there is a next page.
+
+    Raises:
+        ValueError: If the cursor is invalid.
+    """
+    key = tuple_(table.c.created_at, table.c.session_id)
+    if sort_order == "asc":
+        if cursor is not None:
+            stmt = stmt.where(key > tuple_(*decode_session_cursor(cursor)))
+        stmt = stmt.order_by(table.c.created_at.asc(), table.c.session_id.asc())
+    else:
+        if cursor is not None:
+            stmt = stmt.where(key < tuple_(*decode_session_cursor(cursor)))
+        stmt = stmt.order_by(table.c.created_at.desc(), table.c.session_id.desc())
+    return stmt.limit(limit + 1)
+
+
 def create_schema(session: Session, db_schema: str) -> None:
     """Create the database schema if it doesn't exist.
 
@@ -347,6 +433,53 @@ def calculate_date_metrics(date_to_process: date, sessions_data: dict) -> dict:
     }
 
 
+def get_metrics_session_columns(table: Table) -> list:
+    """Return the columns of the sessions table needed to calculate metrics.
+
+    Instead of the full runs and session_data, only the model of each run and the session metrics are selected,
+    so the run contents never leave the database. The returned rows have the shape expected by
+    calculate_date_metrics.
+
+    Args:
+        table (Table): The sessions table.
+
+    Returns:
+        list: The columns to select.
+    """
+    runs = case((func.jsonb_typeof(table.c.runs) == "array", table.c.runs), else_=literal_column("'[]'::jsonb"))
+    run = func.jsonb_array_elements(runs).table_valued("value").alias("run")
+    run_models = (
+        select(
+            func.coalesce(
+                func.jsonb_agg(
+                    func.jsonb_strip_nulls(
+                        func.jsonb_build_object(
+                            literal_column("'model'"),
+                            run.c.value.op("->")(literal_column("'model'")),
+                            literal_column("'model_provider'"),
+                            run.c.value.op("->")(literal_column("'model_provider'")),
+                        )
+                    )
+                ),
+                literal_column("'[]'::jsonb"),
+            )
+        )
+        .select_from(run)
+        .scalar_subquery()
+    )
+    session_metrics = func.jsonb_build_object(
+        literal_column("'session_metrics'"), table.c.session_data.op("->")(literal_column("'session_metrics'"))
+    )
+    return [
+        table.c.session_id,
+        table.c.user_id,
+        session_metrics.label("session_data"),
+        run_models.label("runs"),
+        table.c.created_at,
+        table.c.session_type,
+    ]
+
+
 def fetch_all_sessions_data(
     sessions: List[Dict[str, Any]], dates_to_process: list[date], start_timestamp: int
 ) -> Optional[dict]:
@@ -455,3 +588,123 @@ def deserialize_cultural_knowledge(db_row: Dict[str, Any]) -> CulturalKnowledge:
             "team_id": db_row.get("team_id"),
         }
     )
+
+
+# -- Learnings full-text search --
+
+# Text search vector of a learnings content. JSON escapes and anything that is not a letter or a digit separate
+# words, like in learning_search_terms. The GIN index is built on this expression, so queries must use it verbatim.
+LEARNINGS_SEARCH_VECTOR = (
+    "to_tsvector('simple', regexp_replace(content::text, '\\\\(u[0-9a-fA-F]{4}|.)|[^[:alnum:]\\\\]+', ' ', 'g'))"
+)
+
+_LEARNINGS_SEARCH_INDEX_VALID_QUERY = text(
+    "SELECT i.indisvalid FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+    "JOIN pg_namespace n ON n.oid = c.relnamespace WHERE n.nspname = :schema AND c.relname = :index_name"
+)
+
+
+def _get_learnings_search_index_name(table_name: str) -> str:
+    return f"idx_{table_name}_content_search"
+
+
+def _get_learnings_search_index_ddl(table_name: str, db_schema: str, concurrently: bool) -> str:
+    return (
+        f"CREATE INDEX {'CONCURRENTLY ' if concurrently else ''}IF NOT EXISTS "
+        f'"{_get_learnings_search_index_name(table_name)}" '
+        f'ON "{db_schema}"."{table_name}" USING GIN ({LEARNINGS_SEARCH_VECTOR})'
+    )
+
+
+def _get_drop_learnings_search_index_ddl(table_name: str, db_schema: str, concurrently: bool) -> str:
+    return (
+        f"DROP INDEX {'CONCURRENTLY ' if concurrently else ''}IF EXISTS "
+        f'"{db_schema}"."{_get_learnings_search_index_name(table_name)}"'
+    )
+
+
+def is_learnings_search_index_valid(db_engine: Engine, table_name: str, db_schema: str) -> bool:
+    """Tell if the full-text index of a learnings table can serve searches.
+
+    An index still being built concurrently, or left INVALID by a failed concurrent build, is not valid.
+    """
+    params = {"schema": db_schema, "index_name": _get_learnings_search_index_name(table_name)}
+    with db_engine.connect() as conn:
+        return bool(conn.execute(_LEARNINGS_SEARCH_INDEX_VALID_QUERY, params).scalar())
+
+
+async def ais_learnings_search_index_valid(db_engine: AsyncEngine, table_name: str, db_schema: str) -> bool:
+    """Tell if the full-text index of a learnings table can serve searches."""
+    params = {"schema": db_schema, "index_name": _get_learnings_search_index_name(table_name)}
+    async with db_engine.connect() as conn:
+        return bool((await conn.execute(_LEARNINGS_SEARCH_INDEX_VALID_QUERY, params)).scalar())
+
+
+def create_learnings_search_index(
+    db_engine: Engine, table_name: str, db_schema: str, concurrently: bool = True
+) -> bool:
+    """Create the GIN full-text index on the content of a learnings table, if missing.
+
+    Called when the learnings table is created, and by the migrations for existing tables, never on the query
+    path. Built concurrently, the index doesn't block writes to the table meanwhile. An INVALID index left by a
+    failed concurrent build is dropped and built again. Postgres keeps an expression index in sync with every
+    insert, update and delete.
+
+    Returns:
+        bool: True if the index is valid and can serve searches.
+    """
+    params = {"schema": db_schema, "index_name": _get_learnings_search_index_name(table_name)}
+    with db_engine.connect() as conn:
+        # CREATE INDEX CONCURRENTLY can't run in a transaction
+        conn = conn.execution_options(isolation_level="AUTOCOMMIT")
+        valid = conn.execute(_LEARNINGS_SEARCH_INDEX_VALID_QUERY, params).scalar()
+        if valid is False:
+            log_info(f"Rebuilding the invalid full-text search index of {db_schema}.{table_name}")
+            conn.execute(text(_get_drop_learnings_search_index_ddl(table_name, db_schema, concurrently)))
+        if not valid:
+            log_debug(f"Creating the full-text search index of {db_schema}.{table_name}")
+            conn.execute(text(_get_learnings_search_index_ddl(table_name, db_schema, concurrently)))
+            valid = conn.execute(_LEARNINGS_SEARCH_INDEX_VALID_QUERY, params).scalar()
+    return bool(valid)
+
+
+async def acreate_learnings_search_index(
+    db_engine: AsyncEngine, table_name: str, db_schema: str, concurrently: bool = True
+) -> bool:
+    """Create the GIN full-text index on the content of a learnings table, if missing.
+
+    Returns:
+        bool: True if the index is valid and can serve searches.
+    """
+    params = {"schema": db_schema, "index_name": _get_learnings_search_index_name(table_name)}
+    async with db_engine.connect() as conn:
+        # CREATE INDEX CONCURRENTLY can't run in a transaction
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        valid = (await conn.execute(_LEARNINGS_SEARCH_INDEX_VALID_QUERY, params)).scalar()
+        if valid is False:
+            log_info(f"Rebuilding the invalid full-text search index of {db_schema}.{table_name}")
+            await conn.execute(text(_get_drop_learnings_search_index_ddl(table_name, db_schema, concurrently)))
+        if not valid:
+            log_debug(f"Creating the full-text search index of {db_schema}.{table_name}")
+            await conn.execute(text(_get_learnings_search_index_ddl(table_name, db_schema, concurrently)))
+            valid = (await conn.execute(_LEARNINGS_SEARCH_INDEX_VALID_QUERY, params)).scalar()
+    return bool(valid)
+
+
+def drop_learnings_search_index(db_engine: Engine, table_name: str, db_schema: str) -> None:
+    """Drop the full-text index of a learnings table, if present."""
+    with db_engine.connect() as conn:
+        conn = conn.execution_options(isolation_level="AUTOCOMMIT")
+        conn.execute(text(_get_drop_learnings_search_index_ddl(table_name, db_schema, concurrently=True)))
+
+
+async def adrop_learnings_search_index(db_engine: AsyncEngine, table_name: str, db_schema: str) -> None:
+    """Drop the full-text index of a learnings table, if present."""
+    async with db_engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text(_get_drop_learnings_search_index_ddl(table_name, db_schema, concurrently=True)))
+
+
+def get_learnings_search_query(terms: List[str]) -> str:
+    """Build the to_tsquery expression requiring every term, each matched as a prefix."""
+    return " & ".join(f"{term}:*" for term in terms)
@@ -1,6 +1,6 @@
 import time
 from datetime import date, datetime, timedelta, timezone
-from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Literal, Optional, Set, Tuple, Union, cast
 from uuid import uuid4
 
 if TYPE_CHECKING:
@@ -8,18 +8,25 @@ if TYPE_CHECKING:
 
 from agno.db.base import BaseDb, SessionType
 from agno.db.redis.utils import (
-    apply_filters,
+    SORTED_INDEX_FIELDS,
+    TABLE_INDEX_FIELDS,
     apply_pagination,
     apply_sorting,
     calculate_date_metrics,
     create_index_entries,
+    create_sorted_index_entries,
+    decode_record_id,
     deserialize_cultural_knowledge_from_db,
     deserialize_data,
     fetch_all_sessions_data,
     generate_redis_key,
+    generate_sorted_index_key,
     get_all_keys_for_table,
     get_dates_to_calculate_metrics_for,
+    get_index_keys_for_table,
+    get_indexed_record_ids,
     remove_index_entries,
+    remove_sorted_index_entries,
     serialize_cultural_knowledge_for_db,
     serialize_data,
 )
@@ -102,6 +109,8 @@ class RedisDb(BaseDb):
 
         self.db_prefix = db_prefix
         self.expire = expire
+        # Table types whose existing records were checked to be in the sorted indexes
+        self._indexed_tables: Set[str] = set()
 
         if redis_client is not None:
             self.redis_client = redis_client
@@ -150,6 +159,9 @@ class RedisDb(BaseDb):
     ) -> bool:
         """Generic method to store a record in Redis, considering optional indexing.
 
+        Records of the tables in TABLE_INDEX_FIELDS are always indexed by all of their index fields, and
+        their previous index entries are replaced.
+
         Args:
             table_type (str): The type of table to store the record in.
             record_id (str): The ID of the record to store.
@@ -163,18 +175,47 @@ class RedisDb(BaseDb):
             key = generate_redis_key(prefix=self.db_prefix, table_type=table_type, key_id=record_id)
             serialized_data = serialize_data(data)
 
-            self.redis_client.set(key, serialized_data, ex=self.expire)
+            previous_data = None
+            is_indexed_table = table_type in TABLE_INDEX_FIELDS
+            if is_indexed_table:
+                self._ensure_indexes(table_type)
+                index_fields = TABLE_INDEX_FIELDS[table_type]
+                previous_data = self._get_record(table_type, record_id)
+
+            pipeline = self.redis_client.pipeline()
+            if previous_data and index_fields:
+                remove_index_entries(
+                    redis_client=pipeline,
+                    prefix=self.db_prefix,
+                    table_type=table_type,
+                    record_id=record_id,
+                    record_data=previous_data,
+                    index_fields=index_fields,
+                )
+
+            pipeline.set(key, serialized_data, ex=self.expire)
 
             if index_fields:
                 create_index_entries(
-                    redis_client=self.redis_client,
+                    redis_client=pipeline,
                     prefix=self.db_prefix,
                     table_type=table_type,
                     record_id=record_id,
                     record_data=data,
                     index_fields=index_fields,
+                    expire=self.expire,
+                )
+            if is_indexed_table:
+                create_sorted_index_entries(
+                    redis_client=pipeline,
+                    prefix=self.db_prefix,
+                    table_type=table_type,
+                    record_id=record_id,
+                    record_data=data,
+                    expire=self.expire,
                 )
 
+            pipeline.execute()
             return True
 
         except Exception as e:
@@ -204,6 +245,37 @@ class RedisDb(BaseDb):
             log_error(f"Error getting record {record_id}: {str(e)}")
             return None
 
+    def _get_records(self, table_type: str, record_ids: List[str]) -> List[Dict[str, Any]]:
+        """Get the records with the given IDs in one round trip, keeping their order.
+
+        Records that expired are skipped, and removed from the sorted indexes of their table.
+
+        Args:
+            table_type (str): The type of table to get the records from.
+            record_ids (List[str]): The IDs of the records to get.
+
+        Returns:
+            List[Dict[str, Any]]: The records found.
+        """
+        if not record_ids:
+            return []
+
+        pipeline = self.redis_client.pipeline(transaction=False)
+        for record_id in record_ids:
+            pipeline.get(generate_redis_key(prefix=self.db_prefix, table_type=table_type, key_id=record_id))
+
+        records, missing_ids = [], []
+        for record_id, data in zip(record_ids, pipeline.execute()):
+            if data is None:
+                missing_ids.append(record_id)
+            else:
+                records.append(deserialize_data(data))
+
+        if missing_ids and table_type in TABLE_INDEX_FIELDS:
+            remove_sorted_index_entries(self.redis_client, self.db_prefix, table_type, missing_ids)
+
+        return records
+
     def _delete_record(self, table_type: str, record_id: str, index_fields: Optional[List[str]] = None) -> bool:
         """Generic method to delete a record from Redis.
 
@@ -219,21 +291,30 @@ class RedisDb(BaseDb):
             Exception: If any error occurs while deleting the record.
         """
         try:
+            is_indexed_table = table_type in TABLE_INDEX_FIELDS
+            if is_indexed_table:
+                index_fields = TABLE_INDEX_FIELDS[table_type]
+
+            pipeline = self.redis_client.pipeline()
+
             # Handle index deletion first
             if index_fields:
                 record_data = self._get_record(table_type, record_id)
                 if record_data:
                     remove_index_entries(
-                        redis_client=self.redis_client,
+                        redis_client=pipeline,
                         prefix=self.db_prefix,
                         table_type=table_type,
                         record_id=record_id,
                         record_data=record_data,
                         index_fields=index_fields,
                     )
+            if is_indexed_table:
+                remove_sorted_index_entries(pipeline, self.db_prefix, table_type, [record_id])
 
             key = generate_redis_key(prefix=self.db_prefix, table_type=table_type, key_id=record_id)
-            result = self.redis_client.delete(key)
+            pipeline.delete(key)
+            result = pipeline.execute()[-1]
             if result is None or result == 0:
                 return False
 
@@ -270,6 +351,142 @@ class RedisDb(BaseDb):
             log_error(f"Error getting all records for {table_type}: {str(e)}")
             return []
 
+    def _ensure_indexes(self, table_type: str) -> None:
+        """Index the records of a table stored before it had sorted indexes. Checked once per table.
+
+        Args:
+            table_type (str): The type of table to index.
+        """
+        if table_type in self._indexed_tables:
+            return
+
+        sorted_index_key = generate_sorted_index_key(self.db_prefix, table_type, "created_at")
+        if not self.redis_client.exists(sorted_index_key):
+            keys = get_all_keys_for_table(redis_client=self.redis_client, prefix=self.db_prefix, table_type=table_type)
+            if keys:
+                log_info(f"Indexing {len(keys)} existing Redis records for table type: {table_type}")
+                key_prefix = f"{self.db_prefix}:{table_type}:"
+                record_ids = [decode_record_id(key)[len(key_prefix) :] for key in keys]
+
+                pipeline = self.redis_client.pipeline()
+                for record_id, record_data in zip(record_ids, self._get_records(table_type, record_ids)):
+                    create_index_entries(
+                        redis_client=pipeline,
+                        prefix=self.db_prefix,
+                        table_type=table_type,
+                        record_id=record_id,
+                        record_data=record_data,
+                        index_fields=TABLE_INDEX_FIELDS[table_type],
+                    )
+                    create_sorted_index_entries(
+                        redis_client=pipeline,
+                        prefix=self.db_prefix,
+                        table_type=table_type,
+                        record_id=record_id,
+                        record_data=record_data,
+                    )
+                pipeline.execute()
+
+        self._indexed_tables.add(table_type)
+
+    def _get_indexed_records(
+        self,
+        table_type: str,
+        filters: Optional[Dict[str, Any]] = None,
+        record_ids: Optional[Set[str]] = None,
+        start_timestamp: Optional[int] = None,
+        end_timestamp: Optional[int] = None,
+        record_filter: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        sort_order: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Get a page of the records of an indexed table, and the total count of matching records.
+
+        Only the records matching the indexed filters are read. When the records are sorted by created_at or
+        updated_at and need no record_filter, only the records of the requested page are read.
+
+        Args:
+            table_type (str): The type of table to get the records from.
+            filters (Optional[Dict[str, Any]]): Indexed field -> value, or list of values, the records must have.
+            record_ids (Optional[Set[str]]): Only consider the records with these IDs.
+            start_timestamp (Optional[int]): Only get records created at or after this timestamp.
+            end_timestamp (Optional[int]): Only get records created at or before this timestamp.
+            record_filter (Optional[Callable]): Filter for the fields without index, applied to the read records.
+            limit (Optional[int]): The maximum number of records to return.
+            page (Optional[int]): The page number to return.
+            sort_by (Optional[str]): The field to sort by. Records are ordered by created_at when not given.
+            sort_order (Optional[str]): The order to sort by.
+
+        Returns:
+            Tuple[List[Dict[str, Any]], int]: The records of the page and the total count of matching records.
+        """
+        self._ensure_indexes(table_type)
+
+        matching_ids = get_indexed_record_ids(
+            redis_client=self.redis_client,
+            prefix=self.db_prefix,
+            table_type=table_type,
+            filters=filters,
+            start_timestamp=start_timestamp,
+            end_timestamp=end_timestamp,
+        )
+        if record_ids is not None:
+            matching_ids = record_ids if matching_ids is None else matching_ids & record_ids
+        if matching_ids is not None and not matching_ids:
+            return [], 0
+
+        descending = sort_order == "desc"
+        start, end = 0, -1
+        if limit is not None:
+            start = (page - 1) * limit if page is not None and page > 0 else 0
+            end = start + limit - 1
+
+        if record_filter is None and (sort_by is None or sort_by in SORTED_INDEX_FIELDS):
+            sorted_index_key = generate_sorted_index_key(self.db_prefix, table_type, sort_by or "created_at")
+            if matching_ids is None:
+                # Read the page straight from the sorted index
+                total_count = self.redis_client.zcard(sorted_index_key)
+                if descending:
+                    members = self.redis_client.zrevrange(sorted_index_key, start, end)
+                else:
+                    members = self.redis_client.zrange(sorted_index_key, start, end)
+                page_ids: List[str] = [
+                    decode_record_id(record_id) for record_id in cast(List[Union[str, bytes]], members)
+                ]
+            else:
+                # Sort the matching IDs by their score, dropping the IDs no longer in the table
+                candidate_ids = list(matching_ids)
+                pipeline = self.redis_client.pipeline(transaction=False)
+                for record_id in candidate_ids:
+                    pipeline.zscore(sorted_index_key, record_id)
+                scored_ids = [
+                    (score, record_id)
+                    for record_id, score in zip(candidate_ids, pipeline.execute())
+                    if score is not None
+                ]
+                scored_ids.sort(reverse=descending)
+                total_count = len(scored_ids)
+                page_ids = [record_id for _, record_id in scored_ids[start : end + 1 if end >= 0 else None]]
+
+            return self._get_records(table_type, page_ids), total_count  # type: ignore
+
+        if matching_ids is None:
+            all_ids = self.redis_client.zrange(
+                generate_sorted_index_key(self.db_prefix, table_type, "created_at"), 0, -1
+            )
+            candidate_ids = [decode_record_id(record_id) for record_id in all_ids]  # type: ignore
+        else:
+            candidate_ids = sorted(matching_ids)
+
+        records = self._get_records(table_type, candidate_ids)
+        if record_filter is not None:
+            records = [record for record in records if record_filter(record)]
+
+        sorted_records = apply_sorting(records=records, sort_by=sort_by, sort_order=sort_order)
+        return apply_pagination(records=sorted_records, limit=limit, page=page), len(records)
+
     def get_latest_schema_version(self):
         """Get the latest version of the database schema."""
         pass
@@ -299,7 +516,6 @@ class RedisDb(BaseDb):
             if self._delete_record(
                 table_type="sessions",
                 record_id=session_id,
-                index_fields=["user_id", "agent_id", "team_id", "workflow_id", "session_type"],
             ):
                 log_debug(f"Successfully deleted session: {session_id}")
                 return True
@@ -331,7 +547,6 @@ class RedisDb(BaseDb):
                 if self._delete_record(
                     "sessions",
                     session_id,
-                    index_fields=["user_id", "agent_id", "team_id", "workflow_id", "session_type"],
                 ):
                     deleted_count += 1
             log_debug(f"Successfully deleted {deleted_count} sessions")
@@ -378,7 +593,6 @@ class RedisDb(BaseDb):
             log_error(f"Exception reading session: {str(e)}")
             raise e
 
-    # TODO: optimizable
     def get_sessions(
         self,
         session_type: Optional[SessionType] = None,
@@ -410,49 +624,53 @@ class RedisDb(BaseDb):
             List[Union[AgentSession, TeamSession, WorkflowSession]]: The list of sessions.
         """
         try:
-            all_sessions = self._get_all_records("sessions")
-
-            conditions: Dict[str, Any] = {}
+            filters: Dict[str, Any] = {}
+            record_ids = None
             if session_type is not None:
-                conditions["session_type"] = session_type
+                filters["session_type"] = session_type
             if user_id is not None:
-                conditions["user_id"] = user_id
-
-            filtered_sessions = apply_filters(records=all_sessions, conditions=conditions)
-
+                filters["user_id"] = user_id
             if component_id is not None:
                 if session_type == SessionType.AGENT:
-                    filtered_sessions = [s for s in filtered_sessions if s.get("agent_id") == component_id]
+                    filters["agent_id"] = component_id
                 elif session_type == SessionType.TEAM:
-                    filtered_sessions = [s for s in filtered_sessions if s.get("team_id") == component_id]
+                    filters["team_id"] = component_id
                 elif session_type == SessionType.WORKFLOW:
-                    filtered_sessions = [s for s in filtered_sessions if s.get("workflow_id") == component_id]
+                    filters["workflow_id"] = component_id
                 elif session_type is None:
-                    filtered_sessions = [
-                        s
-                        for s in filtered_sessions
-                        if s.get("agent_id") == component_id
-                        or s.get("team_id") == component_id
-                        or s.get("workflow_id") == component_id
-                    ]
-            if start_timestamp is not None:
-                filtered_sessions = [s for s in filtered_sessions if s.get("created_at", 0) >= start_timestamp]
-            if end_timestamp is not None:
-                filtered_sessions = [s for s in filtered_sessions if s.get("created_at", 0) <= end_timestamp]
-
-            if session_name is not None:
-                filtered_sessions = [
-                    s
-                    for s in filtered_sessions
-                    if session_name.lower() in ((s.get("session_data") or {}).get("session_name") or "").lower()
-                ]
-
-            sorted_sessions = apply_sorting(records=filtered_sessions, sort_by=sort_by, sort_order=sort_order)
-            sessions = apply_pagination(records=sorted_sessions, limit=limit, page=page)
-            sessions = [record for record in sessions]
+                    record_ids = set()
+                    for component_field in ("agent_id", "team_id", "workflow_id"):
+                        record_ids |= (
+                            get_indexed_record_ids(
+                                redis_client=self.redis_client,
+                                prefix=self.db_prefix,
+                                table_type="sessions",
+                                filters={component_field: component_id},
+                            )
+                            or set()
+                        )
+
+            def matches_session_name(s: Dict[str, Any]) -> bool:
+                return session_name.lower() in ((s.get("session_data") or {}).get("session_name") or "").lower()  # type: ignore[union-attr]
+
+            # Session names are not indexed, so they are matched on the sessions read through the indexes
+            record_filter = matches_session_name if session_name is not None else None
+
+            sessions, total_count = self._get_indexed_records(
+                "sessions",
+                filters=filters,
+                record_ids=record_ids,
+                start_timestamp=start_timestamp,
+                end_timestamp=end_timestamp,
+                record_filter=record_filter,
+                limit=limit,
+                page=page,
+                sort_by=sort_by,
+                sort_order=sort_order,
+            )
 
             if not deserialize:
-                return sessions, len(filtered_sessions)
+                return sessions, total_count
 
             return deserialize_sessions(session_type, sessions)
 
@@ -563,7 +781,6 @@ class RedisDb(BaseDb):
                     table_type="sessions",
                     record_id=session.session_id,
                     data=data,
-                    index_fields=["user_id", "agent_id", "session_type"],
                 )
                 if not success:
                     return None
@@ -596,7 +813,6 @@ class RedisDb(BaseDb):
                     table_type="sessions",
                     record_id=session.session_id,
                     data=data,
-                    index_fields=["user_id", "team_id", "session_type"],
                 )
                 if not success:
                     return None
@@ -629,7 +845,6 @@ class RedisDb(BaseDb):
                     table_type="sessions",
                     record_id=session.session_id,
                     data=data,
-                    index_fields=["user_id", "workflow_id", "session_type"],
                 )
                 if not success:
                     return None
@@ -706,9 +921,7 @@ class RedisDb(BaseDb):
                     log_debug(f"Memory {memory_id} does not belong to user {user_id}")
                     return
 
-            if self._delete_record(
-                "memories", memory_id, index_fields=["user_id", "agent_id", "team_id", "workflow_id"]
-            ):
+            if self._delete_record("memories", memory_id):
                 log_debug(f"Successfully deleted user memory id: {memory_id}")
             else:
                 log_debug(f"No user memory found with id: {memory_id}")
@@ -739,7 +952,6 @@ class RedisDb(BaseDb):
                 self._delete_record(
                     "memories",
                     memory_id,
-                    index_fields=["user_id", "agent_id", "team_id", "workflow_id"],
                 )
 
         except Exception as e:
@@ -756,12 +968,12 @@ class RedisDb(BaseDb):
             List[str]: The list of memory topics.
         """
         try:
-            all_memories = self._get_all_records("memories")
+            all_memories, _ = self._get_indexed_records(
+                "memories", filters={"user_id": user_id} if user_id is not None else None
+            )
 
             topics = set()
             for memory in all_memories:
-                if user_id is not None and memory.get("user_id") != user_id:
-                    continue
                 memory_topics = memory.get("topics", [])
                 if isinstance(memory_topics, list):
                     topics.update(memory_topics)
@@ -839,36 +1051,36 @@ class RedisDb(BaseDb):
             Exception: If any error occurs while reading the memories.
         """
         try:
-            all_memories = self._get_all_records("memories")
-
-            # Apply filters
-            conditions = {}
+            filters: Dict[str, Any] = {}
             if user_id is not None:
-                conditions["user_id"] = user_id
+                filters["user_id"] = user_id
             if agent_id is not None:
-                conditions["agent_id"] = agent_id
+                filters["agent_id"] = agent_id
             if team_id is not None:
-                conditions["team_id"] = team_id
+                filters["team_id"] = team_id
 
-            filtered_memories = apply_filters(records=all_memories, conditions=conditions)
-
-            # Apply topic filter
-            if topics is not None:
-                filtered_memories = [
-                    m for m in filtered_memories if any(topic in m.get("topics", []) for topic in topics)
-                ]
+            # Topics and content are not indexed, so they are matched on the memories read through the indexes
+            def matches_topics_and_content(m: Dict[str, Any]) -> bool:
+                if topics is not None and not any(topic in (m.get("topics") or []) for topic in topics):
+                    return False
+                if search_content is not None and search_content.lower() not in str(m.get("memory", "")).lower():
+                    return False
+                return True
 
-            # Apply content search
-            if search_content is not None:
-                filtered_memories = [
-                    m for m in filtered_memories if search_content.lower() in str(m.get("memory", "")).lower()
-                ]
+            record_filter = matches_topics_and_content if topics is not None or search_content is not None else None
 
-            sorted_memories = apply_sorting(records=filtered_memories, sort_by=sort_by, sort_order=sort_order)
-            paginated_memories = apply_pagination(records=sorted_memories, limit=limit, page=page)
+            paginated_memories, total_count = self._get_indexed_records(
+                "memories",
+                filters=filters,
+                record_filter=record_filter,
+                limit=limit,
+                page=page,
+                sort_by=sort_by,
+                sort_order=sort_order,
+            )
 
             if not deserialize:
-                return paginated_memories, len(filtered_memories)
+                return paginated_memories, total_count
 
             return [UserMemory.from_dict(record) for record in paginated_memories]
 
@@ -896,15 +1108,14 @@ class RedisDb(BaseDb):
             Exception: If any error occurs while getting the user memory stats.
         """
         try:
-            all_memories = self._get_all_records("memories")
+            all_memories, _ = self._get_indexed_records(
+                "memories", filters={"user_id": user_id} if user_id is not None else None
+            )
 
             # Group by user_id
             user_stats = {}
             for memory in all_memories:
                 memory_user_id = memory.get("user_id")
-                # filter by user_id if provided
-                if user_id is not None and memory_user_id != user_id:
-                    continue
                 if memory_user_id is None:
                     continue
 
@@ -963,9 +1174,7 @@ class RedisDb(BaseDb):
                 "updated_at": int(time.time()),
             }
 
-            success = self._store_record(
-                "memories", memory.memory_id, data, index_fields=["user_id", "agent_id", "team_id", "workflow_id"]
-            )
+            success = self._store_record("memories", memory.memory_id, data)
 
             if not success:
                 return None
@@ -1023,8 +1232,11 @@ class RedisDb(BaseDb):
             Exception: If an error occurs during deletion.
         """
         try:
-            # Get all keys for memories table
+            # Get all keys for memories table, and the keys of its indexes
             keys = get_all_keys_for_table(redis_client=self.redis_client, prefix=self.db_prefix, table_type="memories")
+            keys += get_index_keys_for_table(
+                redis_client=self.redis_client, prefix=self.db_prefix, table_type="memories"
+            )
 
             if keys:
                 # Delete all memory keys in a single batch operation
@@ -1052,21 +1264,10 @@ class RedisDb(BaseDb):
             Exception: If any error occurs while getting the sessions.
         """
         try:
-            all_sessions = self._get_all_records("sessions")
-
-            # Filter by timestamp if provided
-            if start_timestamp is not None or end_timestamp is not None:
-                filtered_sessions = []
-                for session in all_sessions:
-                    created_at = session.get("created_at", 0)
-                    if start_timestamp is not None and created_at < start_timestamp:
-                        continue
-                    if end_timestamp is not None and created_at > end_timestamp:
-                        continue
-                    filtered_sessions.append(session)
-                return filtered_sessions
-
-            return all_sessions
+            sessions, _ = self._get_indexed_records(
+                "sessions", start_timestamp=start_timestamp, end_timestamp=end_timestamp
+            )
+            return sessions
 
         except Exception as e:
             log_error(f"Error reading sessions for metrics: {str(e)}")
@@ -1281,21 +1482,14 @@ class RedisDb(BaseDb):
             Exception: If any error occurs while getting the knowledge contents.
         """
         try:
-            all_documents = self._get_all_records("knowledge")
-            if len(all_documents) == 0:
-                return [], 0
-
-            # Apply linked_to filter if provided
-            if linked_to is not None:
-                all_documents = [doc for doc in all_documents if doc.get("linked_to") == linked_to]
-
-            total_count = len(all_documents)
-
-            # Apply sorting
-            sorted_documents = apply_sorting(records=all_documents, sort_by=sort_by, sort_order=sort_order)
-
-            # Apply pagination
-            paginated_documents = apply_pagination(records=sorted_documents, limit=limit, page=page)
+            paginated_documents, total_count = self._get_indexed_records(
+                "knowledge",
+                filters={"linked_to": linked_to} if linked_to is not None else None,
+                limit=limit,
+                page=page,
+                sort_by=sort_by,
+                sort_order=sort_order,
+            )
 
             return [KnowledgeRow.model_validate(doc) for doc in paginated_documents], total_count
 
@@ -1347,7 +1541,6 @@ class RedisDb(BaseDb):
                 "evals",
                 eval_run.run_id,
                 data,
-                index_fields=["agent_id", "team_id", "workflow_id", "model_id", "eval_type"],
             )
 
             log_debug(f"Created eval run with id '{eval_run.run_id}'")
@@ -1368,9 +1561,7 @@ class RedisDb(BaseDb):
             Exception: If any error occurs while deleting the eval run.
         """
         try:
-            if self._delete_record(
-                "evals", eval_run_id, index_fields=["agent_id", "team_id", "workflow_id", "model_id", "eval_type"]
-            ):
+            if self._delete_record("evals", eval_run_id):
                 log_debug(f"Deleted eval run with ID: {eval_run_id}")
             else:
                 log_debug(f"No eval run found with ID: {eval_run_id}")
@@ -1391,9 +1582,7 @@ class RedisDb(BaseDb):
         try:
             deleted_count = 0
             for eval_run_id in eval_run_ids:
-                if self._delete_record(
-                    "evals", eval_run_id, index_fields=["agent_id", "team_id", "workflow_id", "model_id", "eval_type"]
-                ):
+                if self._delete_record("evals", eval_run_id):
                     deleted_count += 1
 
             if deleted_count == 0:
@@ -1462,46 +1651,47 @@ class RedisDb(BaseDb):
             Exception: If any error occurs while getting the eval runs.
         """
         try:
-            all_eval_runs = self._get_all_records("evals")
-
-            # Apply filters
-            filtered_runs = []
-            for run in all_eval_runs:
-                # Agent/team/workflow filters
-                if agent_id is not None and run.get("agent_id") != agent_id:
-                    continue
-                if team_id is not None and run.get("team_id") != team_id:
-                    continue
-                if workflow_id is not None and run.get("workflow_id") != workflow_id:
-                    continue
-                if model_id is not None and run.get("model_id") != model_id:
-                    continue
-
-                # Eval type filter
-                if eval_type is not None and len(eval_type) > 0:
-                    if run.get("eval_type") not in eval_type:
-                        continue
-
-                # Filter type
-                if filter_type is not None:
-                    if filter_type == EvalFilterType.AGENT and run.get("agent_id") is None:
-                        continue
-                    elif filter_type == EvalFilterType.TEAM and run.get("team_id") is None:
-                        continue
-                    elif filter_type == EvalFilterType.WORKFLOW and run.get("workflow_id") is None:
-                        continue
-
-                filtered_runs.append(run)
+            filters: Dict[str, Any] = {}
+            if agent_id is not None:
+                filters["agent_id"] = agent_id
+            if team_id is not None:
+                filters["team_id"] = team_id
+            if workflow_id is not None:
+                filters["workflow_id"] = workflow_id
+            if model_id is not None:
+                filters["model_id"] = model_id
+            if eval_type is not None and len(eval_type) > 0:
+                filters["eval_type"] = list(eval_type)
+
+            component_field = None
+            if filter_type == EvalFilterType.AGENT:
+                component_field = "agent_id"
+            elif filter_type == EvalFilterType.TEAM:
+                component_field = "team_id"
+            elif filter_type == EvalFilterType.WORKFLOW:
+                component_field = "workflow_id"
+
+            def has_component(run: Dict[str, Any]) -> bool:
+                return run.get(component_field) is not None  # type: ignore[arg-type]
+
+            record_filter = has_component if component_field is not None else None
 
             if sort_by is None:
                 sort_by = "created_at"
                 sort_order = "desc"
 
-            sorted_runs = apply_sorting(records=filtered_runs, sort_by=sort_by, sort_order=sort_order)
-            paginated_runs = apply_pagination(records=sorted_runs, limit=limit, page=page)
+            paginated_runs, total_count = self._get_indexed_records(
+                "evals",
+                filters=filters,
+                record_filter=record_filter,
+                limit=limit,
+                page=page,
+                sort_by=sort_by,
+                sort_order=sort_order,
+            )
 
             if not deserialize:
-                return paginated_runs, len(filtered_runs)
+                return paginated_runs, total_count
 
             return [EvalRunRecord.model_validate(row) for row in paginated_runs]
 
@@ -3,7 +3,8 @@
 import json
 import time
 from datetime import date, datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Union
+from enum import Enum
+from typing import Any, Dict, List, Optional, Set, Union, cast
 from uuid import UUID
 
 from agno.db.schemas.culture import CulturalKnowledge
@@ -12,9 +13,21 @@ from agno.utils.log import log_warning
 
 try:
     from redis import Redis, RedisCluster
+    from redis.client import Pipeline
 except ImportError:
     raise ImportError("`redis` not installed. Please install it using `pip install redis`")
 
+# Set indexes kept for the tables listed and filtered through their indexes, instead of scanning every record
+TABLE_INDEX_FIELDS: Dict[str, List[str]] = {
+    "sessions": ["user_id", "agent_id", "team_id", "workflow_id", "session_type"],
+    "memories": ["user_id", "agent_id", "team_id", "workflow_id"],
+    "evals": ["agent_id", "team_id", "workflow_id", "model_id", "eval_type"],
+    "knowledge": ["linked_to"],
+}
+
+# Every record of the tables above is also kept in a sorted set per field, scored by the field value
+SORTED_INDEX_FIELDS = ["created_at", "updated_at"]
+
 
 # -- Serialization and deserialization --
 
@@ -52,6 +65,16 @@ def generate_index_key(prefix: str, table_type: str, index_field: str, index_val
     return f"{prefix}:{table_type}:index:{index_field}:{index_value}"
 
 
+def get_index_value(value: Any) -> str:
+    """Get the value a record is indexed by, using the value of enums so they match the stored records."""
+    return str(value.value if isinstance(value, Enum) else value)
+
+
+def generate_sorted_index_key(prefix: str, table_type: str, sort_field: str) -> str:
+    """Generate Redis key for the sorted set ordering all records of a table by the given field."""
+    return f"{prefix}:{table_type}:index:sorted:{sort_field}"
+
+
 def get_all_keys_for_table(redis_client: Union[Redis, RedisCluster], prefix: str, table_type: str) -> List[str]:
     """Get all relevant keys for the given table type.
 
@@ -75,6 +98,11 @@ def get_all_keys_for_table(redis_client: Union[Redis, RedisCluster], prefix: str
     return relevant_keys
 
 
+def get_index_keys_for_table(redis_client: Union[Redis, RedisCluster], prefix: str, table_type: str) -> List[str]:
+    """Get the keys of all the indexes of the given table type."""
+    return list(redis_client.scan_iter(match=f"{prefix}:{table_type}:index:*"))
+
+
 # -- DB util methods --
 
 
@@ -146,21 +174,24 @@ def apply_filters(records: List[Dict[str, Any]], conditions: Dict[str, Any]) ->
 
 
 def create_index_entries(
-    redis_client: Union[Redis, RedisCluster],
+    redis_client: Union[Redis, RedisCluster, Pipeline],
     prefix: str,
     table_type: str,
     record_id: str,
     record_data: Dict[str, Any],
     index_fields: List[str],
+    expire: Optional[int] = None,
 ) -> None:
     for field in index_fields:
         if field in record_data and record_data[field] is not None:
-            index_key = generate_index_key(prefix, table_type, field, str(record_data[field]))
+            index_key = generate_index_key(prefix, table_type, field, get_index_value(record_data[field]))
             redis_client.sadd(index_key, record_id)
+            if expire is not None:
+                redis_client.expire(index_key, expire)
 
 
 def remove_index_entries(
-    redis_client: Union[Redis, RedisCluster],
+    redis_client: Union[Redis, RedisCluster, Pipeline],
     prefix: str,
     table_type: str,
     record_id: str,
@@ -169,10 +200,97 @@ def remove_index_entries(
 ) -> None:
     for field in index_fields:
         if field in record_data and record_data[field] is not None:
-            index_key = generate_index_key(prefix, table_type, field, str(record_data[field]))
+            index_key = generate_index_key(prefix, table_type, field, get_index_value(record_data[field]))
             redis_client.srem(index_key, record_id)
 
 
+def get_sort_score(record_data: Dict[str, Any], sort_field: str) -> float:
+    """Get the score of a record in the sorted index of the given field. Missing values score 0."""
+    value = get_sort_value(record_data, sort_field)
+    try:
+        return float(value) if value is not None else 0.0
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def create_sorted_index_entries(
+    redis_client: Union[Redis, RedisCluster, Pipeline],
+    prefix: str,
+    table_type: str,
+    record_id: str,
+    record_data: Dict[str, Any],
+    expire: Optional[int] = None,
+) -> None:
+    for sort_field in SORTED_INDEX_FIELDS:
+        index_key = generate_sorted_index_key(prefix, table_type, sort_field)
+        redis_client.zadd(index_key, {record_id: get_sort_score(record_data, sort_field)})
+        if expire is not None:
+            redis_client.expire(index_key, expire)
+
+
+def remove_sorted_index_entries(
+    redis_client: Union[Redis, RedisCluster, Pipeline], prefix: str, table_type: str, record_ids: List[str]
+) -> None:
+    if not record_ids:
+        return
+    for sort_field in SORTED_INDEX_FIELDS:
+        redis_client.zrem(generate_sorted_index_key(prefix, table_type, sort_field), *record_ids)
+
+
+def decode_record_id(record_id: Union[str, bytes]) -> str:
+    """Index members are bytes when the client was not created with decode_responses=True."""
+    return record_id.decode("utf-8") if isinstance(record_id, bytes) else record_id
+
+
+def get_indexed_record_ids(
+    redis_client: Union[Redis, RedisCluster],
+    prefix: str,
+    table_type: str,
+    filters: Optional[Dict[str, Union[str, List[str]]]] = None,
+    start_timestamp: Optional[int] = None,
+    end_timestamp: Optional[int] = None,
+) -> Optional[Set[str]]:
+    """Get the IDs of the records matching the given filters, reading only the index keys.
+
+    Args:
+        redis_client: The Redis client.
+        prefix: The prefix for the keys.
+        table_type: The table type.
+        filters: Indexed field -> value the records must have. A list of values matches any of them.
+        start_timestamp: Only match records created at or after this timestamp.
+        end_timestamp: Only match records created at or before this timestamp.
+
+    Returns:
+        The matching record IDs, or None if no filter was given.
+
+    Note:
+        The sets are intersected client-side, as their keys can live in different Redis Cluster slots.
+        Set indexes can keep the IDs of expired records, so the result can hold IDs no longer in the table.
+    """
+    record_ids: Optional[Set[str]] = None
+
+    for field, value in (filters or {}).items():
+        values = value if isinstance(value, list) else [value]
+        matches: Set[str] = set()
+        for index_value in values:
+            index_key = generate_index_key(prefix, table_type, field, get_index_value(index_value))
+            matches.update(decode_record_id(member) for member in redis_client.smembers(index_key))  # type: ignore
+        record_ids = matches if record_ids is None else record_ids & matches
+        if not record_ids:
+            return record_ids
+
+    if start_timestamp is not None or end_timestamp is not None:
+        members = redis_client.zrangebyscore(
+            generate_sorted_index_key(prefix, table_type, "created_at"),
+            start_timestamp if start_timestamp is not None else "-inf",
+            end_timestamp if end_timestamp is not None else "+inf",
+        )
+        matches = {decode_record_id(member) for member in cast(List[Union[str, bytes]], members)}
+        record_ids = matches if record_ids is None else record_ids & matches
+
+    return record_ids
+
+
 # -- Metrics utils --
 
 
@@ -10,7 +10,7 @@ from sqlalchemy import or_
 if TYPE_CHECKING:
     from agno.tracing.schemas import Span, Trace
 
-from agno.db.base import AsyncBaseDb, ComponentType, SessionType
+from agno.db.base import AsyncBaseDb, ComponentType, SessionSummaryPage, SessionType
 from agno.db.migrations.manager import MigrationManager
 from agno.db.schemas.culture import CulturalKnowledge
 from agno.db.schemas.evals import EvalFilterType, EvalRunRecord, EvalType
@@ -25,14 +25,18 @@ from agno.db.sqlite.utils import (
     abulk_upsert_metrics,
     ais_table_available,
     ais_valid_table,
+    apply_session_keyset,
     apply_sorting,
     calculate_date_metrics,
     deserialize_cultural_knowledge_from_db,
     fetch_all_sessions_data,
     get_dates_to_calculate_metrics_for,
+    get_session_filters,
+    get_session_summary_columns,
     serialize_cultural_knowledge_for_db,
 )
 from agno.db.utils import (
+    build_session_summary_page,
     deserialize_session,
     deserialize_session_json_fields,
     deserialize_sessions,
@@ -745,6 +749,78 @@ class AsyncSqliteDb(AsyncBaseDb):
             log_debug(f"Exception reading from sessions table: {e}")
             raise e
 
+    async def get_session_summaries(
+        self,
+        session_type: Optional[SessionType] = None,
+        user_id: Optional[str] = None,
+        component_id: Optional[str] = None,
+        session_name: Optional[str] = None,
+        start_timestamp: Optional[int] = None,
+        end_timestamp: Optional[int] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        sort_order: Optional[str] = "desc",
+        with_total_count: bool = False,
+    ) -> SessionSummaryPage:
+        """
+        Get a page of session summaries, reading only the summary columns of the sessions table.
+        Pages are read by (created_at, session_id) instead of by offset, see BaseDb.get_session_summaries.
+
+        Args:
+            session_type (Optional[SessionType]): The type of sessions to get.
+            user_id (Optional[str]): The ID of the user to filter by.
+            component_id (Optional[str]): The ID of the agent / team / workflow to filter by.
+            session_name (Optional[str]): The name of the sessions to filter by.
+            start_timestamp (Optional[int]): The start timestamp to filter by.
+            end_timestamp (Optional[int]): The end timestamp to filter by.
+            limit (int): The maximum number of sessions to return. Defaults to 20.
+            cursor (Optional[str]): The next_cursor of the previous page, or None for the first page.
+            sort_order (Optional[str]): The sort order. Defaults to "desc".
+            with_total_count (bool): Whether to count the sessions matching the filters. Defaults to False.
+
+        Returns:
+            SessionSummaryPage: The session summaries, the cursor of the next page and the total count.
+
+        Raises:
+            ValueError: If the cursor is invalid.
+            Exception: If an error occurs during retrieval.
+        """
+        try:
+            table = await self._get_table(table_type="sessions")
+            if table is None:
+                return SessionSummaryPage([], None, 0 if with_total_count else None)
+
+            filters = get_session_filters(
+                table,
+                session_type=session_type,
+                user_id=user_id,
+                component_id=component_id,
+                session_name=session_name,
+                start_timestamp=start_timestamp,
+                end_timestamp=end_timestamp,
+            )
+            stmt = apply_session_keyset(
+                select(*get_session_summary_columns(table)).where(*filters),
+                table,
+                limit=limit,
+                cursor=cursor,
+                sort_order=sort_order,
+            )
+
+            async with self.async_session_factory() as sess, sess.begin():
+                total_count = None
+                if with_total_count:
+                    count_stmt = select(func.count()).select_from(table).where(*filters)
+                    total_count = (await sess.execute(count_stmt)).scalar() or 0
+
+                rows = [dict(record._mapping) for record in (await sess.execute(stmt)).fetchall()]
+            sessions, next_cursor = build_session_summary_page(rows, limit)
+            return SessionSummaryPage(sessions, next_cursor, total_count)
+
+        except Exception as e:
+            log_debug(f"Exception reading session summaries: {str(e)}")
+            raise e
+
     async def rename_session(
         self,
         session_id: str,
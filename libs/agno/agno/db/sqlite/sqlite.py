@@ -6,10 +6,13 @@ from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Sequence,
 from uuid import uuid4
 
 if TYPE_CHECKING:
+    from agno.run.agent import RunOutput
+    from agno.run.team import TeamRunOutput
+    from agno.run.workflow import WorkflowRunOutput
     from agno.tracing.schemas import Span, Trace
 
 from agno.db import mcp_oauth_store
-from agno.db.base import BaseDb, ComponentType, SessionType
+from agno.db.base import BaseDb, ComponentType, SessionSummaryPage, SessionType
 from agno.db.migrations.manager import MigrationManager
 from agno.db.schemas.culture import CulturalKnowledge
 from agno.db.schemas.evals import EvalFilterType, EvalRunRecord, EvalType
@@ -29,22 +32,39 @@ from agno.db.schemas.service_accounts import (
 )
 from agno.db.sqlite.schemas import get_table_schema_definition
 from agno.db.sqlite.utils import (
+    apply_session_keyset,
     apply_sorting,
     bulk_upsert_metrics,
     calculate_date_metrics,
+    create_learnings_search_index,
     deserialize_cultural_knowledge_from_db,
     fetch_all_sessions_data,
     get_dates_to_calculate_metrics_for,
+    get_learnings_search_query,
+    get_learnings_search_tables,
+    get_session_filters,
+    get_session_summary_columns,
     is_table_available,
     is_valid_table,
     serialize_cultural_knowledge_for_db,
 )
 from agno.db.utils import (
+    RunFingerprintCache,
+    build_session_summary_page,
+    build_upserted_session,
+    deserialize_run,
     deserialize_session,
     deserialize_session_json_fields,
     deserialize_sessions,
+    get_session_runs_to_save,
+    has_all_session_runs,
     learning_search_patterns,
+    learning_search_terms,
+    serialize_run_row,
     serialize_session_json_fields,
+    serialize_session_run_rows,
+    serialize_session_without_runs,
+    trim_to_last_runs,
 )
 from agno.run.base import RunStatus
 from agno.session import AgentSession, Session, TeamSession, WorkflowSession
@@ -52,7 +72,7 @@ from agno.utils.log import log_debug, log_error, log_info, log_warning
 from agno.utils.string import generate_id
 
 try:
-    from sqlalchemy import Column, MetaData, String, Table, func, or_, select, text
+    from sqlalchemy import Column, Float, MetaData, String, Table, func, or_, select, text
     from sqlalchemy.dialects import sqlite
     from sqlalchemy.engine import Engine, create_engine
     from sqlalchemy.orm import scoped_session, sessionmaker
@@ -90,6 +110,8 @@ class SqliteDb(BaseDb):
         mcp_oauth_codes_table: Optional[str] = None,
         mcp_oauth_refresh_tokens_table: Optional[str] = None,
         mcp_oauth_keys_table: Optional[str] = None,
+        runs_table: Optional[str] = None,
+        store_runs_in_table: bool = False,
         id: Optional[str] = None,
     ):
         """
@@ -125,6 +147,10 @@ class SqliteDb(BaseDb):
             mcp_oauth_codes_table (Optional[str]): Name of the table to store MCP OAuth authorization codes.
             mcp_oauth_refresh_tokens_table (Optional[str]): Name of the table to store MCP OAuth refresh tokens.
             mcp_oauth_keys_table (Optional[str]): Name of the table to store MCP OAuth signing keys.
+            runs_table (Optional[str]): Name of the table to store session runs, when store_runs_in_table is enabled.
+            store_runs_in_table (bool): Store each run in its own row of the runs table, keyed by (session_id, run_id),
+                instead of in the runs column of the sessions table. Saving a session then only writes the runs
+                that changed. Defaults to False.
             id (Optional[str]): ID of the database.
 
         Raises:
@@ -159,6 +185,7 @@ class SqliteDb(BaseDb):
             mcp_oauth_codes_table=mcp_oauth_codes_table,
             mcp_oauth_refresh_tokens_table=mcp_oauth_refresh_tokens_table,
             mcp_oauth_keys_table=mcp_oauth_keys_table,
+            runs_table=runs_table,
         )
 
         _engine: Optional[Engine] = db_engine
@@ -181,11 +208,16 @@ class SqliteDb(BaseDb):
         self.db_url: Optional[str] = db_url
         self.db_file: Optional[str] = db_file
         self.metadata: MetaData = MetaData()
+        self.store_runs_in_table: bool = store_runs_in_table
+        # Content hashes of the runs this instance wrote, used to only write runs that changed
+        self._run_fingerprints = RunFingerprintCache()
 
         # Initialize database session
         self.Session: scoped_session = scoped_session(sessionmaker(bind=self.db_engine))
         # Zero means never refreshed; get_metrics uses this to refresh lazily, at most once per minute
         self._metrics_refreshed_at: float = 0.0
+        # Whether the full-text search index of the learnings table is available, None until checked
+        self._learnings_search_index: Optional[bool] = None
 
     # -- Serialization methods --
     def to_dict(self) -> Dict[str, Any]:
@@ -194,6 +226,7 @@ class SqliteDb(BaseDb):
             {
                 "db_file": self.db_file,
                 "db_url": self.db_url,
+                "store_runs_in_table": self.store_runs_in_table,
                 "type": "sqlite",
             }
         )
@@ -221,6 +254,8 @@ class SqliteDb(BaseDb):
             schedule_runs_table=data.get("schedule_runs_table"),
             approvals_table=data.get("approvals_table"),
             service_accounts_table=data.get("service_accounts_table"),
+            runs_table=data.get("runs_table"),
+            store_runs_in_table=data.get("store_runs_in_table", False),
             id=data.get("id"),
         )
 
@@ -264,6 +299,8 @@ class SqliteDb(BaseDb):
             (self.approvals_table_name, "approvals"),
             (self.service_accounts_table_name, "service_accounts"),
         ]
+        if self.store_runs_in_table:
+            tables_to_create.append((self.runs_table_name, "runs"))
 
         for table_name, table_type in tables_to_create:
             self._get_or_create_table(table_name=table_name, table_type=table_type, create_table_if_not_found=True)
@@ -475,6 +512,7 @@ class SqliteDb(BaseDb):
             "traces": self.trace_table_name,
             "spans": self.span_table_name,
             "sessions": self.session_table_name,
+            "runs": self.runs_table_name,
             "memories": self.memory_table_name,
             "metrics": self.metrics_table_name,
             "evals": self.eval_table_name,
@@ -493,6 +531,14 @@ class SqliteDb(BaseDb):
             )
             return self.session_table
 
+        elif table_type == "runs":
+            self.runs_table = self._get_or_create_table(
+                table_name=self.runs_table_name,
+                table_type="runs",
+                create_table_if_not_found=create_table_if_not_found,
+            )
+            return self.runs_table
+
         elif table_type == "memories":
             self.memory_table = self._get_or_create_table(
                 table_name=self.memory_table_name,
@@ -742,17 +788,22 @@ class SqliteDb(BaseDb):
             if table is None:
                 return False
 
+            runs_table = self._get_table(table_type="runs") if self.store_runs_in_table else None
             with self.Session() as sess, sess.begin():
                 delete_stmt = table.delete().where(table.c.session_id == session_id)
                 if user_id is not None:
                     delete_stmt = delete_stmt.where(table.c.user_id == user_id)
                 result = sess.execute(delete_stmt)
-                if result.rowcount == 0:
-                    log_debug(f"No session found to delete with session_id: {session_id}")
-                    return False
-                else:
-                    log_debug(f"Successfully deleted session with session_id: {session_id}")
-                    return True
+                if result.rowcount > 0:
+                    self._delete_session_runs(sess, runs_table, [session_id])
+
+            if result.rowcount == 0:
+                log_debug(f"No session found to delete with session_id: {session_id}")
+                return False
+            else:
+                self._run_fingerprints.forget([session_id])
+                log_debug(f"Successfully deleted session with session_id: {session_id}")
+                return True
 
         except Exception as e:
             log_error(f"Error deleting session: {str(e)}")
@@ -774,12 +825,23 @@ class SqliteDb(BaseDb):
             if table is None:
                 return
 
+            runs_table = self._get_table(table_type="runs") if self.store_runs_in_table else None
             with self.Session() as sess, sess.begin():
+                deleted_session_ids = session_ids
+                if runs_table is not None and user_id is not None:
+                    # Only the runs of the sessions owned by the user are deleted
+                    owned_stmt = select(table.c.session_id).where(
+                        table.c.session_id.in_(session_ids), table.c.user_id == user_id
+                    )
+                    deleted_session_ids = [row[0] for row in sess.execute(owned_stmt)]
+
                 delete_stmt = table.delete().where(table.c.session_id.in_(session_ids))
                 if user_id is not None:
                     delete_stmt = delete_stmt.where(table.c.user_id == user_id)
                 result = sess.execute(delete_stmt)
+                self._delete_session_runs(sess, runs_table, deleted_session_ids)
 
+            self._run_fingerprints.forget(deleted_session_ids)
             log_debug(f"Successfully deleted {result.rowcount} sessions")
 
         except Exception as e:
@@ -827,8 +889,10 @@ class SqliteDb(BaseDb):
                     return None
 
                 session_raw = deserialize_session_json_fields(dict(result._mapping))
-                if not session_raw or not deserialize:
-                    return session_raw
+
+            self._hydrate_session_runs([session_raw])
+            if not session_raw or not deserialize:
+                return session_raw
 
             return deserialize_session(session_type, session_raw)
 
@@ -836,6 +900,63 @@ class SqliteDb(BaseDb):
             log_debug(f"Exception reading from sessions table: {e}")
             raise e
 
+    def get_session_with_last_runs(
+        self,
+        session_id: str,
+        session_type: SessionType,
+        user_id: Optional[str] = None,
+        last_n_runs: Optional[int] = None,
+    ) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """
+        Get a session dictionary holding only its last N top-level runs, together with their member runs.
+
+        Args:
+            session_id (str): ID of the session to read.
+            session_type (SessionType): Type of session to get.
+            user_id (Optional[str]): User ID to filter by. Defaults to None.
+            last_n_runs (Optional[int]): The number of top-level runs to load. Defaults to all runs.
+
+        Returns:
+            Tuple[Optional[Dict[str, Any]], bool]: The session dictionary, and whether the session has older runs
+                that were not loaded.
+
+        Raises:
+            Exception: If an error occurs during retrieval.
+        """
+        if not self.store_runs_in_table or last_n_runs is None:
+            return super().get_session_with_last_runs(session_id, session_type, user_id, last_n_runs)
+
+        try:
+            table = self._get_table(table_type="sessions")
+            if table is None:
+                return None, False
+
+            with self.Session() as sess:
+                stmt = select(table).where(table.c.session_id == session_id)
+                if user_id is not None:
+                    stmt = stmt.where(table.c.user_id == user_id)
+                result = sess.execute(stmt).fetchone()
+                if result is None:
+                    return None, False
+
+                session_raw = deserialize_session_json_fields(dict(result._mapping))
+
+            # One extra top-level run tells whether there are older runs
+            runs = cast(
+                List[Dict[str, Any]],
+                self.get_runs(session_id, user_id=user_id, last_n_runs=last_n_runs + 1, deserialize=False),
+            )
+            if not runs:
+                # Sessions saved before runs were stored in their own table keep them in the sessions table
+                return session_raw, False
+
+            session_raw["runs"], has_older_runs = trim_to_last_runs(runs, last_n_runs)
+            return session_raw, has_older_runs
+
+        except Exception as e:
+            log_error(f"Exception reading from sessions table: {str(e)}")
+            raise e
+
     def get_sessions(
         self,
         session_type: Optional[SessionType] = None,
@@ -925,10 +1046,12 @@ class SqliteDb(BaseDb):
                     return [] if deserialize else ([], 0)
 
                 sessions_raw = [deserialize_session_json_fields(dict(record._mapping)) for record in records]
-                if not deserialize:
-                    return sessions_raw, total_count
-                if not sessions_raw:
-                    return []
+
+            self._hydrate_session_runs(sessions_raw)
+            if not deserialize:
+                return sessions_raw, total_count
+            if not sessions_raw:
+                return []
 
             return deserialize_sessions(session_type, sessions_raw)
 
@@ -936,6 +1059,79 @@ class SqliteDb(BaseDb):
             log_debug(f"Exception reading from sessions table: {e}")
             raise e
 
+    def get_session_summaries(
+        self,
+        session_type: Optional[SessionType] = None,
+        user_id: Optional[str] = None,
+        component_id: Optional[str] = None,
+        session_name: Optional[str] = None,
+        start_timestamp: Optional[int] = None,
+        end_timestamp: Optional[int] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        sort_order: Optional[str] = "desc",
+        with_total_count: bool = False,
+    ) -> SessionSummaryPage:
+        """
+        Get a page of session summaries, reading only the summary columns of the sessions table.
+        Pages are read by (created_at, session_id) instead of by offset, see BaseDb.get_session_summaries.
+
+        Args:
+            session_type (Optional[SessionType]): The type of sessions to get.
+            user_id (Optional[str]): The ID of the user to filter by.
+            component_id (Optional[str]): The ID of the agent / team / workflow to filter by.
+            session_name (Optional[str]): The name of the sessions to filter by.
+            start_timestamp (Optional[int]): The start timestamp to filter by.
+            end_timestamp (Optional[int]): The end timestamp to filter by.
+            limit (int): The maximum number of sessions to return. Defaults to 20.
+            cursor (Optional[str]): The next_cursor of the previous page, or None for the first page.
+            sort_order (Optional[str]): The sort order. Defaults to "desc".
+            with_total_count (bool): Whether to count the sessions matching the filters. Defaults to False.
+
+        Returns:
+            SessionSummaryPage: The session summaries, the cursor of the next page and the total count.
+
+        Raises:
+            ValueError: If the cursor is invalid.
+            Exception: If an error occurs during retrieval.
+        """
+        try:
+            table = self._get_table(table_type="sessions")
+            if table is None:
+                return SessionSummaryPage([], None, 0 if with_total_count else None)
+
+            filters = get_session_filters(
+                table,
+                session_type=session_type,
+                user_id=user_id,
+                component_id=component_id,
+                session_name=session_name,
+                start_timestamp=start_timestamp,
+                end_timestamp=end_timestamp,
+            )
+            stmt = apply_session_keyset(
+                select(*get_session_summary_columns(table)).where(*filters),
+                table,
+                limit=limit,
+                cursor=cursor,
+                sort_order=sort_order,
+            )
+
+            with self.Session() as sess, sess.begin():
+                total_count = None
+                if with_total_count:
+                    count_stmt = select(func.count()).select_from(table).where(*filters)
+                    total_count = sess.execute(count_stmt).scalar() or 0
+
+                rows = [dict(record._mapping) for record in sess.execute(stmt).fetchall()]
+            self._hydrate_first_runs(rows[:limit])
+            sessions, next_cursor = build_session_summary_page(rows, limit)
+            return SessionSummaryPage(sessions, next_cursor, total_count)
+
+        except Exception as e:
+            log_debug(f"Exception reading session summaries: {str(e)}")
+            raise e
+
     def rename_session(
         self,
         session_id: str,
@@ -1005,7 +1201,23 @@ class SqliteDb(BaseDb):
             if table is None:
                 return None
 
-            serialized_session = serialize_session_json_fields(session.to_dict())
+            runs_table: Optional[Table] = None
+            run_rows: List[Dict[str, Any]] = []
+            prune_removed_runs = False
+            if self.store_runs_in_table:
+                # Runs are stored in their own table, the runs column is left empty
+                runs_table = self._get_table(table_type="runs", create_table_if_not_found=True)
+                # Only the runs upserted since the session was loaded or last saved are written
+                run_ids_to_save = get_session_runs_to_save(session)
+                if run_ids_to_save is not None and self._has_runs_in_sessions_table(table, session.session_id):
+                    # Sessions saved before runs were stored in their own table move all their runs to it
+                    run_ids_to_save = None
+                run_rows = serialize_session_run_rows(session, run_ids=run_ids_to_save)
+                prune_removed_runs = run_ids_to_save is None and has_all_session_runs(session)
+                session_dict = serialize_session_without_runs(session)
+            else:
+                session_dict = session.to_dict()
+            serialized_session = serialize_session_json_fields(session_dict)
 
             if isinstance(session, AgentSession):
                 with self.Session() as sess, sess.begin():
@@ -1039,11 +1251,10 @@ class SqliteDb(BaseDb):
                     stmt = stmt.returning(*table.columns)  # type: ignore
                     result = sess.execute(stmt)
                     row = result.fetchone()
+                    written_run_rows = self._write_session_runs(sess, runs_table, row, run_rows, prune_removed_runs)
 
-                    session_raw = deserialize_session_json_fields(dict(row._mapping)) if row else None
-                    if session_raw is None or not deserialize:
-                        return session_raw
-                    return AgentSession.from_dict(session_raw)
+                self._run_fingerprints.record(written_run_rows)
+                return self._get_upserted_session(session, row, deserialize)
 
             elif isinstance(session, TeamSession):
                 with self.Session() as sess, sess.begin():
@@ -1078,11 +1289,10 @@ class SqliteDb(BaseDb):
                     stmt = stmt.returning(*table.columns)  # type: ignore
                     result = sess.execute(stmt)
                     row = result.fetchone()
+                    written_run_rows = self._write_session_runs(sess, runs_table, row, run_rows, prune_removed_runs)
 
-                    session_raw = deserialize_session_json_fields(dict(row._mapping)) if row else None
-                    if session_raw is None or not deserialize:
-                        return session_raw
-                    return TeamSession.from_dict(session_raw)
+                self._run_fingerprints.record(written_run_rows)
+                return self._get_upserted_session(session, row, deserialize)
 
             else:
                 with self.Session() as sess, sess.begin():
@@ -1116,11 +1326,10 @@ class SqliteDb(BaseDb):
                     stmt = stmt.returning(*table.columns)  # type: ignore
                     result = sess.execute(stmt)
                     row = result.fetchone()
+                    written_run_rows = self._write_session_runs(sess, runs_table, row, run_rows, prune_removed_runs)
 
-                    session_raw = deserialize_session_json_fields(dict(row._mapping)) if row else None
-                    if session_raw is None or not deserialize:
-                        return session_raw
-                    return WorkflowSession.from_dict(session_raw)
+                self._run_fingerprints.record(written_run_rows)
+                return self._get_upserted_session(session, row, deserialize)
 
         except Exception as e:
             log_warning(f"Exception upserting into table: {str(e)}")
@@ -1151,8 +1360,10 @@ class SqliteDb(BaseDb):
 
         try:
             table = self._get_table(table_type="sessions", create_table_if_not_found=True)
-            if table is None:
-                log_info("Sessions table not available, falling back to individual upserts")
+            if table is None or self.store_runs_in_table:
+                # With runs stored in their own table, each session only writes its changed runs
+                if table is None:
+                    log_info("Sessions table not available, falling back to individual upserts")
                 return [
                     result
                     for session in sessions
@@ -1355,6 +1566,240 @@ class SqliteDb(BaseDb):
                 if result is not None
             ]
 
+    # -- Runs methods --
+
+    def _upsert_run_rows(self, sess: Any, table: Table, rows: List[Dict[str, Any]]) -> None:
+        """Upsert the given rows into the runs table. Existing rows keep their position in the session."""
+        if not rows:
+            return
+
+        # Rows written together keep their relative order, and are placed after all runs written before
+        base_order = time.time_ns()
+        stmt = sqlite.insert(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["session_id", "run_id"],
+            set_=dict(
+                run_type=stmt.excluded.run_type,
+                parent_run_id=stmt.excluded.parent_run_id,
+                agent_id=stmt.excluded.agent_id,
+                team_id=stmt.excluded.team_id,
+                workflow_id=stmt.excluded.workflow_id,
+                user_id=stmt.excluded.user_id,
+                status=stmt.excluded.status,
+                run_data=stmt.excluded.run_data,
+                updated_at=stmt.excluded.updated_at,
+            ),
+            where=(table.c.user_id == stmt.excluded.user_id) | (table.c.user_id.is_(None)),
+        )
+        sess.execute(stmt, [{**row, "run_order": base_order + i} for i, row in enumerate(rows)])
+
+    def _write_session_runs(
+        self,
+        sess: Any,
+        runs_table: Optional[Table],
+        session_row: Any,
+        run_rows: List[Dict[str, Any]],
+        prune_removed_runs: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Write the runs of a session that changed since they were last written.
+
+        With prune_removed_runs, the session's runs not in run_rows are deleted, as they were removed from the session.
+
+        Returns:
+            List[Dict[str, Any]]: The written rows, to be recorded once the transaction is committed.
+        """
+        # Nothing to write if runs are stored in the sessions table, or the session upsert was rejected
+        if runs_table is None or session_row is None:
+            return []
+
+        if prune_removed_runs:
+            delete_stmt = runs_table.delete().where(runs_table.c.session_id == session_row.session_id)
+            if run_rows:
+                delete_stmt = delete_stmt.where(runs_table.c.run_id.not_in([row["run_id"] for row in run_rows]))
+            if sess.execute(delete_stmt).rowcount > 0:
+                # Removed runs may be added back later, so their fingerprints must not skip that write
+                self._run_fingerprints.forget([session_row.session_id])
+
+        changed_rows = self._run_fingerprints.changed(run_rows)
+        if changed_rows:
+            self._upsert_run_rows(sess, runs_table, changed_rows)
+            log_debug(f"Wrote {len(changed_rows)} of {len(run_rows)} runs to the runs table")
+        return changed_rows
+
+    def _get_upserted_session(
+        self, session: Session, session_row: Any, deserialize: Optional[bool] = True
+    ) -> Optional[Union[Session, Dict[str, Any]]]:
+        """Build the session returned by upsert_session. The unsaved runs of a session tracking them are now saved."""
+        session_raw = deserialize_session_json_fields(dict(session_row._mapping)) if session_row else None
+        if not self.store_runs_in_table:
+            if session_raw is None or not deserialize:
+                return session_raw
+            return type(session).from_dict(session_raw)
+
+        if session_raw is not None and session.get_unsaved_run_ids() is not None:
+            session.mark_runs_saved()
+        return build_upserted_session(session, session_raw, deserialize)
+
+    def _has_runs_in_sessions_table(self, table: Table, session_id: str) -> bool:
+        """Whether the session row still holds runs saved before runs were stored in their own table."""
+        with self.Session() as sess:
+            runs = sess.execute(select(table.c.runs).where(table.c.session_id == session_id)).scalar()
+        if isinstance(runs, str):
+            runs = json.loads(runs)
+        return bool(runs)
+
+    def _hydrate_session_runs(self, sessions_raw: List[Dict[str, Any]]) -> None:
+        """Fill the runs of the given session dictionaries from the runs table.
+
+        Sessions without rows in the runs table keep the runs stored in the sessions table.
+        """
+        if not self.store_runs_in_table or not sessions_raw:
+            return
+
+        table = self._get_table(table_type="runs")
+        if table is None:
+            return
+
+        runs_by_session: Dict[str, List[Dict[str, Any]]] = {}
+        session_ids = [session_raw["session_id"] for session_raw in sessions_raw]
+        with self.Session() as sess:
+            # Chunked to stay below the SQLite bound parameters limit
+            for i in range(0, len(session_ids), 500):
+                stmt = (
+                    select(table.c.session_id, table.c.run_data)
+                    .where(table.c.session_id.in_(session_ids[i : i + 500]))
+                    .order_by(table.c.session_id, table.c.run_order)
+                )
+                for session_id, run_data in sess.execute(stmt).fetchall():
+                    runs_by_session.setdefault(session_id, []).append(
+                        json.loads(run_data) if isinstance(run_data, str) else run_data
+                    )
+
+        for session_raw in sessions_raw:
+            runs = runs_by_session.get(session_raw["session_id"])
+            if runs is not None:
+                session_raw["runs"] = runs
+
+    def _hydrate_first_runs(self, rows: List[Dict[str, Any]]) -> None:
+        """Fill the first run of the given unnamed session summary rows from the runs table."""
+        if not self.store_runs_in_table:
+            return
+        missing = [row for row in rows if row.get("session_name") is None and row.get("first_run") is None]
+        if not missing:
+            return
+
+        table = self._get_table(table_type="runs")
+        if table is None:
+            return
+
+        # Team sessions are named after their first team run, which has no agent_id
+        team_session_ids = [row["session_id"] for row in missing if row.get("session_type") == SessionType.TEAM.value]
+        with self.Session() as sess:
+            # SQLite returns the run_data of the row with the lowest run_order of each session
+            stmt = (
+                select(table.c.session_id, table.c.run_data, func.min(table.c.run_order))
+                .where(table.c.session_id.in_([row["session_id"] for row in missing]))
+                .where(or_(table.c.session_id.not_in(team_session_ids), table.c.agent_id.is_(None)))
+                .group_by(table.c.session_id)
+            )
+            first_runs = {session_id: run_data for session_id, run_data, _ in sess.execute(stmt).fetchall()}
+
+        for row in missing:
+            row["first_run"] = first_runs.get(row["session_id"])
+
+    def _delete_session_runs(self, sess: Any, runs_table: Optional[Table], session_ids: List[str]) -> None:
+        """Delete the runs of the given sessions from the runs table, in the transaction deleting the sessions."""
+        if runs_table is None or not session_ids:
+            return
+        sess.execute(runs_table.delete().where(runs_table.c.session_id.in_(session_ids)))
+
+    def upsert_run(
+        self,
+        session_id: str,
+        run: Union["RunOutput", "TeamRunOutput", "WorkflowRunOutput"],
+        user_id: Optional[str] = None,
+    ) -> None:
+        """
+        Insert or update a single run of the given session, without rewriting the session.
+
+        Args:
+            session_id (str): The ID of the session the run belongs to.
+            run (Union[RunOutput, TeamRunOutput, WorkflowRunOutput]): The run to upsert.
+            user_id (Optional[str]): The ID of the user owning the session.
+
+        Raises:
+            Exception: If an error occurs during upserting.
+        """
+        try:
+            table = self._get_table(table_type="runs", create_table_if_not_found=True)
+            if table is None:
+                return
+
+            row = serialize_run_row(session_id, run, user_id=user_id)
+            if not self._run_fingerprints.changed([row]):
+                return
+
+            with self.Session() as sess, sess.begin():
+                self._upsert_run_rows(sess, table, [row])
+            self._run_fingerprints.record([row])
+
+        except Exception as e:
+            log_error(f"Exception upserting run: {str(e)}")
+            raise e
+
+    def get_runs(
+        self,
+        session_id: str,
+        user_id: Optional[str] = None,
+        last_n_runs: Optional[int] = None,
+        deserialize: Optional[bool] = True,
+    ) -> List[Union["RunOutput", "TeamRunOutput", "WorkflowRunOutput", Dict[str, Any]]]:
+        """
+        Get the runs of the given session from the runs table, oldest first.
+
+        Args:
+            session_id (str): The ID of the session to get the runs for.
+            user_id (Optional[str]): User ID to filter by. Defaults to None.
+            last_n_runs (Optional[int]): Only return the last N top-level runs, together with their member runs.
+            deserialize (Optional[bool]): Whether to deserialize the runs. Defaults to True.
+
+        Returns:
+            List[Union[RunOutput, TeamRunOutput, WorkflowRunOutput, Dict[str, Any]]]:
+                - When deserialize=True: List of run objects
+                - When deserialize=False: List of run dictionaries
+
+        Raises:
+            Exception: If an error occurs during retrieval.
+        """
+        try:
+            table = self._get_table(table_type="runs")
+            if table is None:
+                return []
+
+            with self.Session() as sess:
+                stmt = select(table.c.run_type, table.c.run_data).where(table.c.session_id == session_id)
+                if user_id is not None:
+                    stmt = stmt.where(table.c.user_id == user_id)
+                if last_n_runs is not None:
+                    last_run_ids = (
+                        select(table.c.run_id)
+                        .where(table.c.session_id == session_id, table.c.parent_run_id.is_(None))
+                        .order_by(table.c.run_order.desc())
+                        .limit(last_n_runs)
+                    )
+                    stmt = stmt.where(table.c.run_id.in_(last_run_ids) | table.c.parent_run_id.in_(last_run_ids))
+                records = sess.execute(stmt.order_by(table.c.run_order)).fetchall()
+
+            runs: List[Any] = []
+            for run_type, run_data in records:
+                run_dict = json.loads(run_data) if isinstance(run_data, str) else run_data
+                runs.append(deserialize_run(run_type, run_dict) if deserialize else run_dict)
+            return runs
+
+        except Exception as e:
+            log_debug(f"Exception reading from runs table: {e}")
+            raise e
+
     # -- Memory methods --
 
     def delete_user_memory(self, memory_id: str, user_id: Optional[str] = None):
@@ -1877,6 +2322,7 @@ class SqliteDb(BaseDb):
                 return []
 
             stmt = select(
+                table.c.session_id,
                 table.c.user_id,
                 table.c.session_data,
                 table.c.runs,
@@ -1891,7 +2337,12 @@ class SqliteDb(BaseDb):
 
             with self.Session() as sess:
                 result = sess.execute(stmt).fetchall()
-                return [record._mapping for record in result]
+                if not self.store_runs_in_table:
+                    return [record._mapping for record in result]
+                sessions = [dict(record._mapping) for record in result]
+
+            self._hydrate_session_runs(sessions)
+            return sessions
 
         except Exception as e:
             log_error(f"Error reading from sessions table: {str(e)}")
@@ -4799,7 +5250,10 @@ class SqliteDb(BaseDb):
         """Search learning records by text query. See BaseDb.search_learnings.
 
         The query matches the content column case-insensitively in both its
-        space and underscore forms. Errors are raised, never swallowed.
+        space and underscore forms. An FTS5 index on the content finds the
+        candidate rows, ranked by BM25 relevance; queries it cannot serve
+        (non-ASCII, or FTS5 missing from the SQLite build) scan the table and
+        are ordered by recency. Errors are raised, never swallowed.
         """
         try:
             table = self._get_table(table_type="learnings")
@@ -4810,6 +5264,9 @@ class SqliteDb(BaseDb):
             if not patterns:
                 return []
 
+            terms = learning_search_terms(query)
+            use_search_index = bool(terms) and self._has_learnings_search_index()
+
             with self.Session() as sess:
                 stmt = select(table)
 
@@ -4834,7 +5291,23 @@ class SqliteDb(BaseDb):
 
                 stmt = stmt.where(or_(*[table.c.content.ilike(pattern, escape="\\") for pattern in patterns]))
 
-                stmt = stmt.order_by(table.c.updated_at.desc().nulls_last())
+                if use_search_index:
+                    fts_table, ids_table = get_learnings_search_tables(table.name)
+                    matches = (
+                        text(
+                            f'SELECT i.learning_id AS learning_id, "{fts_table}".rank AS fts_rank '
+                            f'FROM "{fts_table}" JOIN "{ids_table}" AS i ON i.id = "{fts_table}".rowid '
+                            f'WHERE "{fts_table}" MATCH :fts_query'
+                        )
+                        .bindparams(fts_query=get_learnings_search_query(terms))
+                        .columns(learning_id=String, fts_rank=Float)
+                        .subquery("fts_matches")
+                    )
+                    # The BM25 rank is lower for more relevant rows
+                    stmt = stmt.join(matches, matches.c.learning_id == table.c.learning_id)
+                    stmt = stmt.order_by(matches.c.fts_rank, table.c.updated_at.desc().nulls_last())
+                else:
+                    stmt = stmt.order_by(table.c.updated_at.desc().nulls_last())
                 if limit is not None:
                     stmt = stmt.limit(limit)
 
@@ -4845,6 +5318,18 @@ class SqliteDb(BaseDb):
             log_error(f"Error searching learnings: {e}")
             raise e
 
+    def _has_learnings_search_index(self) -> bool:
+        """Create the full-text search index of the learnings table on first use, and tell if it is available."""
+        if self._learnings_search_index is None:
+            try:
+                with self.Session() as sess, sess.begin():
+                    create_learnings_search_index(session=sess, table_name=self.learnings_table_name)
+                self._learnings_search_index = True
+            except Exception as e:
+                log_warning(f"Could not create the full-text search index of the learnings table: {e}")
+                self._learnings_search_index = False
+        return self._learnings_search_index
+
     def get_learning_by_id(self, id: str) -> Optional[Dict[str, Any]]:
         try:
             table = self._get_table(table_type="learnings")
@@ -1,17 +1,19 @@
 import json
 import time
 from datetime import date, datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import uuid4
 
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
+from agno.db.base import SessionType
 from agno.db.schemas.culture import CulturalKnowledge
 from agno.db.sqlite.schemas import get_table_schema_definition
+from agno.db.utils import SESSION_SUMMARY_COLUMNS, decode_session_cursor
 from agno.utils.log import log_debug, log_error, log_warning
 
 try:
-    from sqlalchemy import Table, func
+    from sqlalchemy import Table, case, func, null, select, tuple_
     from sqlalchemy.dialects import sqlite
     from sqlalchemy.engine import Engine
     from sqlalchemy.inspection import inspect
@@ -60,6 +62,95 @@ def apply_sorting(stmt, table: Table, sort_by: Optional[str] = None, sort_order:
         return stmt.order_by(sort_column.desc())
 
 
+def get_session_filters(
+    table: Table,
+    session_type: Optional[SessionType] = None,
+    user_id: Optional[str] = None,
+    component_id: Optional[str] = None,
+    session_name: Optional[str] = None,
+    start_timestamp: Optional[int] = None,
+    end_timestamp: Optional[int] = None,
+) -> List[Any]:
+    """Get the conditions selecting the sessions matching the given filters."""
+    filters: List[Any] = []
+    if user_id is not None:
+        filters.append(table.c.user_id == user_id)
+    if component_id is not None:
+        if session_type == SessionType.AGENT:
+            filters.append(table.c.agent_id == component_id)
+        elif session_type == SessionType.TEAM:
+            filters.append(table.c.team_id == component_id)
+        elif session_type == SessionType.WORKFLOW:
+            filters.append(table.c.workflow_id == component_id)
+        elif session_type is None:
+            filters.append(
+                (table.c.agent_id == component_id)
+                | (table.c.team_id == component_id)
+                | (table.c.workflow_id == component_id)
+            )
+    if start_timestamp is not None:
+        filters.append(table.c.created_at >= start_timestamp)
+    if end_timestamp is not None:
+        filters.append(table.c.created_at <= end_timestamp)
+    if session_name is not None:
+        filters.append(table.c.session_data.like(f"%{session_name}%"))
+    if session_type is not None:
+        session_type_value = session_type.value if isinstance(session_type, SessionType) else session_type
+        filters.append(table.c.session_type == session_type_value)
+    return filters
+
+
+def get_session_summary_columns(table: Table) -> List[Any]:
+    """Get the columns read for session summaries, see BaseDb.get_session_summaries.
+
+    Only unnamed sessions read a run: the first team run of team sessions, the first run of other sessions.
+    JSON objects are read as JSON text.
+    """
+    # JSON columns hold their value encoded as a JSON string, json_extract(column, '$') decodes it
+    session_data = func.json_extract(table.c.session_data, "$")
+    session_runs = func.json_extract(table.c.runs, "$")
+
+    session_name = func.json_extract(session_data, "$.session_name")
+    runs = func.json_each(session_runs).table_valued("value")
+    first_team_run = (
+        select(runs.c.value).where(func.json_extract(runs.c.value, "$.agent_id").is_(None)).limit(1).scalar_subquery()
+    )
+    first_run = case(
+        (session_name.isnot(None), null()),
+        (table.c.session_type == SessionType.TEAM.value, first_team_run),
+        else_=func.json_extract(session_runs, "$[0]"),
+    )
+    return [
+        *(table.c[column] for column in SESSION_SUMMARY_COLUMNS),
+        session_name.label("session_name"),
+        func.json_extract(session_data, "$.session_state").label("session_state"),
+        func.json_extract(session_data, "$.session_metrics").label("session_metrics"),
+        first_run.label("first_run"),
+    ]
+
+
+def apply_session_keyset(
+    stmt, table: Table, limit: int, cursor: Optional[str] = None, sort_order: Optional[str] = None
+):
+    """Sort sessions by (created_at, session_id), starting after the given cursor.
+
+    One session more than the limit is read, to know whether there is a next page.
+
+    Raises:
+        ValueError: If the cursor is invalid.
+    """
+    key = tuple_(table.c.created_at, table.c.session_id)
+    if sort_order == "asc":
+        if cursor is not None:
+            stmt = stmt.where(key > tuple_(*decode_session_cursor(cursor)))
+        stmt = stmt.order_by(table.c.created_at.asc(), table.c.session_id.asc())
+    else:
+        if cursor is not None:
+            stmt = stmt.where(key < tuple_(*decode_session_cursor(cursor)))
+        stmt = stmt.order_by(table.c.created_at.desc(), table.c.session_id.desc())
+    return stmt.limit(limit + 1)
+
+
 def is_table_available(session: Session, table_name: str, db_schema: Optional[str] = None) -> bool:
     """
     Check if a table with the given name exists.
@@ -439,3 +530,92 @@ def deserialize_cultural_knowledge_from_db(db_row: Dict[str, Any]) -> CulturalKn
             "team_id": db_row.get("team_id"),
         }
     )
+
+
+# -- Learnings full-text search --
+
+
+def _flatten_json_sql(column: str) -> str:
+    """SQL giving the keys and the scalar values of a JSON column as plain text, without JSON escapes."""
+    return (
+        f"CASE WHEN json_valid({column}) THEN ("
+        "SELECT group_concat(ifnull(j.key, '') || ' ' || "
+        "ifnull(CASE WHEN j.type IN ('text', 'integer', 'real') THEN j.value END, ''), ' ') "
+        f"FROM json_tree({column}) AS j) ELSE {column} END"
+    )
+
+
+def get_learnings_search_tables(table_name: str) -> Tuple[str, str]:
+    """Get the names of the FTS5 table of a learnings table, and of the table mapping its rowids to learning ids."""
+    return f"{table_name}_fts", f"{table_name}_fts_ids"
+
+
+def create_learnings_search_index(session: Session, table_name: str) -> None:
+    """Create the FTS5 index on the content of a learnings table, if missing.
+
+    The index is a FTS5 table holding the keys and values of each learning content. Triggers on the learnings
+    table keep it in sync with every insert, update and delete. The FTS5 rowids are mapped to learning ids by a
+    separate table with an INTEGER PRIMARY KEY, because the rowids of the learnings table can change on VACUUM.
+    When the triggers are missing, the index is rebuilt from the rows already in the table.
+
+    Args:
+        session (Session): The SQLAlchemy session, in a transaction.
+        table_name (str): The name of the learnings table.
+    """
+    fts_table, ids_table = get_learnings_search_tables(table_name)
+
+    session.execute(text(f'CREATE VIRTUAL TABLE IF NOT EXISTS "{fts_table}" USING fts5(content)'))
+    session.execute(
+        text(f'CREATE TABLE IF NOT EXISTS "{ids_table}" (id INTEGER PRIMARY KEY, learning_id TEXT NOT NULL UNIQUE)')
+    )
+
+    triggers_exist = session.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = :name AND tbl_name = :table_name"),
+        {"name": f"{fts_table}_insert", "table_name": table_name},
+    ).scalar()
+    if triggers_exist:
+        return
+
+    log_debug(f"Building the full-text search index of {table_name}")
+    session.execute(
+        text(
+            f'CREATE TRIGGER IF NOT EXISTS "{fts_table}_insert" AFTER INSERT ON "{table_name}" BEGIN '
+            f'INSERT OR IGNORE INTO "{ids_table}" (learning_id) VALUES (new.learning_id); '
+            f'INSERT OR REPLACE INTO "{fts_table}" (rowid, content) '
+            f'SELECT id, {_flatten_json_sql("new.content")} FROM "{ids_table}" WHERE learning_id = new.learning_id; '
+            "END"
+        )
+    )
+    session.execute(
+        text(
+            f'CREATE TRIGGER IF NOT EXISTS "{fts_table}_update" AFTER UPDATE OF content ON "{table_name}" BEGIN '
+            f'UPDATE "{fts_table}" SET content = {_flatten_json_sql("new.content")} '
+            f'WHERE rowid = (SELECT id FROM "{ids_table}" WHERE learning_id = new.learning_id); '
+            "END"
+        )
+    )
+    session.execute(
+        text(
+            f'CREATE TRIGGER IF NOT EXISTS "{fts_table}_delete" AFTER DELETE ON "{table_name}" BEGIN '
+            f'DELETE FROM "{fts_table}" '
+            f'WHERE rowid = (SELECT id FROM "{ids_table}" WHERE learning_id = old.learning_id); '
+            f'DELETE FROM "{ids_table}" WHERE learning_id = old.learning_id; '
+            "END"
+        )
+    )
+
+    # Index the rows written before the triggers existed
+    session.execute(text(f'DELETE FROM "{fts_table}"'))
+    session.execute(text(f'DELETE FROM "{ids_table}"'))
+    session.execute(text(f'INSERT INTO "{ids_table}" (learning_id) SELECT learning_id FROM "{table_name}"'))
+    session.execute(
+        text(
+            f'INSERT INTO "{fts_table}" (rowid, content) SELECT i.id, {_flatten_json_sql("t.content")} '
+            f'FROM "{table_name}" AS t JOIN "{ids_table}" AS i ON i.learning_id = t.learning_id'
+        )
+    )
+
+
+def get_learnings_search_query(terms: List[str]) -> str:
+    """Build the FTS5 MATCH expression requiring every term, each matched as a prefix."""
+    return " AND ".join(f'"{term}"*' for term in terms)
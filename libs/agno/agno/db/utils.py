@@ -1,8 +1,14 @@
 """Logic shared across different database implementations"""
 
+import base64
 import json
+import time
+from collections import OrderedDict
+from dataclasses import replace
 from datetime import date, datetime
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+from hashlib import md5
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 from uuid import UUID
 
 from agno.metrics import ModelMetrics, RunMetrics, SessionMetrics
@@ -12,6 +18,9 @@ from agno.utils.log import log_error, log_warning
 if TYPE_CHECKING:
     from agno.db.base import AsyncBaseDb, BaseDb, SessionType
     from agno.registry.registry import Registry
+    from agno.run.agent import RunOutput
+    from agno.run.team import TeamRunOutput
+    from agno.run.workflow import WorkflowRunOutput
     from agno.session import Session
 
 
@@ -42,6 +51,7 @@ DB_TABLE_NAME_KEYS: frozenset = frozenset(
         "mcp_oauth_refresh_tokens_table",
         "mcp_oauth_transactions_table",
         "mcp_oauth_keys_table",
+        "runs_table",
     }
 )
 
@@ -251,6 +261,31 @@ def learning_search_patterns(query: str) -> List[str]:
     return patterns
 
 
+def learning_search_terms(query: str) -> List[str]:
+    """Split a learnings text search into the words looked up in the full-text indexes.
+
+    The indexes tokenize the content on anything that is not a letter or a digit,
+    so "sarah_chen", "sarah-chen" and "Sarah Chen" all index the words "sarah"
+    and "chen". The query is split the same way, and each word is matched as a
+    prefix. Full-text matching is a prefilter: the ILIKE patterns from
+    learning_search_patterns still have to match.
+
+    Non-ASCII queries yield no words: how the indexes split non-ASCII text
+    depends on the database locale, so those searches only use the patterns.
+
+    Args:
+        query: The text to search for.
+
+    Returns:
+        The lowercased, deduplicated words of the query. Empty if it has none.
+    """
+    import re
+
+    if not query.isascii():
+        return []
+    return list(dict.fromkeys(word.lower() for word in re.findall(r"[^\W_]+", query)))
+
+
 class CustomJSONEncoder(json.JSONEncoder):
     """Custom encoder to handle non JSON serializable types."""
 
@@ -380,6 +415,340 @@ def deserialize_session_json_fields(session: dict) -> dict:
     return session
 
 
+# -- Session summary util methods --
+
+# Columns of the sessions table included in session summaries
+SESSION_SUMMARY_COLUMNS = (
+    "session_id",
+    "session_type",
+    "agent_id",
+    "team_id",
+    "workflow_id",
+    "user_id",
+    "summary",
+    "metadata",
+    "created_at",
+    "updated_at",
+)
+
+# Keys of session_data included in session summaries
+SESSION_SUMMARY_DATA_KEYS = ("session_name", "session_state", "session_metrics")
+
+
+def encode_session_cursor(created_at: int, session_id: str) -> str:
+    """Encode the position of a session in a listing sorted by (created_at, session_id)."""
+    raw = json.dumps([created_at, session_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_session_cursor(cursor: str) -> Tuple[int, str]:
+    """Decode a cursor returned with a page of session summaries.
+
+    Raises:
+        ValueError: If the cursor is invalid.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, session_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except Exception:
+        raise ValueError(f"Invalid session cursor: {cursor}")
+    if not isinstance(created_at, int) or not isinstance(session_id, str):
+        raise ValueError(f"Invalid session cursor: {cursor}")
+    return created_at, session_id
+
+
+def get_first_top_level_run(runs: Optional[List[Dict[str, Any]]], session_type: Optional[str]) -> Optional[Dict]:
+    """Get the run a session is named after when it has no name: the first team run of team sessions,
+    or the first run of other sessions."""
+    if not runs:
+        return None
+    if session_type == "team":
+        return next((run for run in runs if isinstance(run, dict) and not run.get("agent_id")), None)
+    return runs[0] if isinstance(runs[0], dict) else None
+
+
+def build_session_summary(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a session summary from a row of projected session columns.
+
+    The row holds the SESSION_SUMMARY_COLUMNS, the SESSION_SUMMARY_DATA_KEYS extracted from session_data, and
+    first_run: the run an unnamed session is named after. The summary has the shape of a session dictionary,
+    with a session_data holding only the summary keys and runs holding only that first run.
+    """
+    summary = deserialize_session_json_fields({column: row.get(column) for column in SESSION_SUMMARY_COLUMNS})
+
+    session_data: Dict[str, Any] = {}
+    for key in SESSION_SUMMARY_DATA_KEYS:
+        value = row.get(key)
+        # SQLite returns the objects extracted from JSON columns as JSON text
+        if key != "session_name" and isinstance(value, str):
+            try:
+                value = json.loads(value)
+            except (json.JSONDecodeError, TypeError):
+                pass
+        if value is not None:
+            session_data[key] = value
+    summary["session_data"] = session_data
+
+    first_run = row.get("first_run")
+    if isinstance(first_run, str):
+        try:
+            first_run = json.loads(first_run)
+        except (json.JSONDecodeError, TypeError):
+            first_run = None
+    summary["runs"] = [first_run] if isinstance(first_run, dict) else []
+    return summary
+
+
+def summarize_session(session: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a session summary from a full session dictionary."""
+    session_data = session.get("session_data") or {}
+    row = {column: session.get(column) for column in SESSION_SUMMARY_COLUMNS}
+    row.update({key: session_data.get(key) for key in SESSION_SUMMARY_DATA_KEYS})
+    if session_data.get("session_name") is None:
+        row["first_run"] = get_first_top_level_run(session.get("runs"), session.get("session_type"))
+    return build_session_summary(row)
+
+
+def build_session_summary_page(rows: List[Dict[str, Any]], limit: int) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Build the summaries of a page from rows read with one row more than the limit.
+
+    Returns:
+        The session summaries, and the cursor of the next page or None when this is the last page.
+    """
+    next_cursor = None
+    if len(rows) > limit > 0:
+        next_cursor = encode_session_cursor(rows[limit - 1]["created_at"], rows[limit - 1]["session_id"])
+    return [build_session_summary(row) for row in rows[:limit]], next_cursor
+
+
+def paginate_session_summaries(
+    sessions: List[Dict[str, Any]],
+    limit: int,
+    cursor: Optional[str] = None,
+    sort_order: Optional[str] = "desc",
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Get a page of summaries of the given session dictionaries, sorted by (created_at, session_id).
+
+    Used by databases that can't page sessions by key in the query itself.
+
+    Returns:
+        The session summaries, and the cursor of the next page or None when this is the last page.
+    """
+    descending = sort_order != "asc"
+    keyed = sorted(((session.get("created_at") or 0, session.get("session_id") or ""), session) for session in sessions)
+    if descending:
+        keyed.reverse()
+    if cursor is not None:
+        position = decode_session_cursor(cursor)
+        keyed = [(key, session) for key, session in keyed if (key < position if descending else key > position)]
+
+    page = keyed[:limit]
+    next_cursor = encode_session_cursor(*page[-1][0]) if len(keyed) > limit and page else None
+    return [summarize_session(session) for _, session in page], next_cursor
+
+
+# -- Runs table util methods --
+
+
+def get_run_type(run: Union["RunOutput", "TeamRunOutput", "WorkflowRunOutput"]) -> str:
+    """Return the run type ("agent", "team" or "workflow") stored alongside a run in the runs table."""
+    from agno.run.team import TeamRunOutput
+    from agno.run.workflow import WorkflowRunOutput
+
+    if isinstance(run, WorkflowRunOutput):
+        return "workflow"
+    if isinstance(run, TeamRunOutput):
+        return "team"
+    return "agent"
+
+
+def serialize_run_row(
+    session_id: str,
+    run: Union["RunOutput", "TeamRunOutput", "WorkflowRunOutput", Dict[str, Any]],
+    user_id: Optional[str] = None,
+    run_type: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Build the runs table row for a single run.
+
+    ``run_data`` holds the serialized run already encoded as a JSON string, so the
+    same string can be fingerprinted and written without serializing the run twice.
+
+    Args:
+        session_id: The session the run belongs to.
+        run: The run to serialize. Already-serialized run dicts are accepted as well.
+        user_id: The user owning the session.
+        run_type: The run type for serialized run dicts. Inferred from the class for run objects.
+    """
+    if isinstance(run, dict):
+        run_data = run
+        if run_type is None:
+            run_type = "team" if "team_id" in run_data and "agent_id" not in run_data else "agent"
+    else:
+        run_data = run.to_dict()
+        run_type = get_run_type(run)
+    status: Any = run_data.get("status")
+    now = int(time.time())
+    return {
+        "session_id": session_id,
+        "run_id": run_data.get("run_id"),
+        "run_type": run_type or "agent",
+        "parent_run_id": run_data.get("parent_run_id"),
+        "agent_id": run_data.get("agent_id"),
+        "team_id": run_data.get("team_id"),
+        "workflow_id": run_data.get("workflow_id"),
+        "user_id": user_id,
+        "status": status.value if hasattr(status, "value") else status,
+        "run_data": json.dumps(run_data, cls=CustomJSONEncoder),
+        "created_at": run_data.get("created_at") or now,
+        "updated_at": now,
+    }
+
+
+def serialize_session_without_runs(session: "Session") -> Dict[str, Any]:
+    """Serialize a session, leaving out its runs."""
+    return replace(session, runs=None).to_dict()  # type: ignore
+
+
+def get_loaded_session_runs(session: "Session") -> List[Any]:
+    """Return the runs of the session without loading the older runs of a lazily loaded session.
+
+    Items are runs, or run dictionaries for lazily loaded runs that were never deserialized.
+    """
+    from agno.session.lazy import LazyRunList
+
+    return list(session.runs.iter_loaded()) if isinstance(session.runs, LazyRunList) else list(session.runs or [])
+
+
+def serialize_session_run_rows(session: "Session", run_ids: Optional[Set[str]] = None) -> List[Dict[str, Any]]:
+    """Build the runs table rows for the runs in the given session, in session order.
+
+    Runs of lazily loaded sessions that were never deserialized are written as read, and older
+    runs that were not loaded are left untouched.
+
+    Args:
+        session: The session to serialize the runs of.
+        run_ids: Only serialize the runs with these IDs. Defaults to all runs.
+    """
+    from agno.session import WorkflowSession
+    from agno.session.lazy import get_run_field
+
+    default_run_type = "workflow" if isinstance(session, WorkflowSession) else None
+    rows = []
+    for run in get_loaded_session_runs(session):
+        if run is None or (run_ids is not None and get_run_field(run, "run_id") not in run_ids):
+            continue
+        row = serialize_run_row(session.session_id, run, user_id=session.user_id, run_type=default_run_type)
+        if row["run_id"] is not None:
+            rows.append(row)
+    return rows
+
+
+def get_session_runs_to_save(session: "Session") -> Optional[Set[str]]:
+    """Return the IDs of the session runs that changed since they were last saved, or None if all runs must be saved."""
+    get_unsaved_run_ids = getattr(session, "get_unsaved_run_ids", None)
+    return get_unsaved_run_ids() if get_unsaved_run_ids is not None else None
+
+
+def build_upserted_session(
+    session: "Session", session_raw: Optional[Dict[str, Any]], deserialize: Optional[bool] = True
+) -> Optional[Union["Session", Dict[str, Any]]]:
+    """Build the session returned by upsert_session for databases storing runs in their own table.
+
+    The runs are taken from the upserted session instead of being read back, so saving a session does not
+    deserialize all of its runs again. A deserialized session shares its runs with the upserted session.
+    """
+    if session_raw is None:
+        return None
+    if not deserialize:
+        session_raw["runs"] = [
+            run if isinstance(run, dict) else run.to_dict() for run in get_loaded_session_runs(session)
+        ] or None
+        return session_raw
+
+    upserted_session = type(session).from_dict({**session_raw, "runs": None})
+    if upserted_session is not None:
+        upserted_session.runs = session.runs  # type: ignore[assignment]
+    return upserted_session
+
+
+def has_all_session_runs(session: "Session") -> bool:
+    """Whether the runs of the session were all loaded, so runs missing from them were removed from the session."""
+    from agno.session.lazy import LazyRunList
+
+    return not (isinstance(session.runs, LazyRunList) and session.runs.has_older_runs)
+
+
+def deserialize_run(run_type: Optional[str], run_data: Dict[str, Any]) -> Any:
+    """Deserialize a run read from the runs table into its RunOutput class."""
+    from agno.run.agent import RunOutput
+    from agno.run.team import TeamRunOutput
+    from agno.run.workflow import WorkflowRunOutput
+
+    if run_type == "workflow":
+        return WorkflowRunOutput.from_dict(run_data)
+    if run_type == "team":
+        return TeamRunOutput.from_dict(run_data)
+    return RunOutput.from_dict(run_data)
+
+
+def trim_to_last_runs(runs: List[Dict[str, Any]], last_n_runs: int) -> Tuple[List[Dict[str, Any]], bool]:
+    """Keep the last N top-level runs of a runs list, together with their member runs.
+
+    Returns:
+        The trimmed runs, and whether runs were dropped.
+    """
+    top_level_run_ids = [run.get("run_id") for run in runs if run.get("parent_run_id") is None]
+    if len(top_level_run_ids) <= last_n_runs:
+        return runs, False
+
+    kept_run_ids = set(top_level_run_ids[-last_n_runs:]) if last_n_runs > 0 else set()
+    return [run for run in runs if run.get("run_id") in kept_run_ids or run.get("parent_run_id") in kept_run_ids], True
+
+
+class RunFingerprintCache:
+    """Bounded LRU of content hashes for runs already written to a runs table.
+
+    Used by databases storing runs in their own table to skip rows that have not
+    changed since this process last wrote them, so saving a session only writes the
+    runs that were added or modified instead of the whole runs list.
+    """
+
+    def __init__(self, max_size: int = 10_000):
+        self.max_size = max_size
+        self._fingerprints: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        self._lock = Lock()
+
+    @staticmethod
+    def _fingerprint(row: Dict[str, Any]) -> str:
+        return md5(row["run_data"].encode("utf-8")).hexdigest()
+
+    def changed(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Return the rows whose content differs from what was last recorded."""
+        with self._lock:
+            return [
+                row
+                for row in rows
+                if self._fingerprints.get((row["session_id"], row["run_id"])) != self._fingerprint(row)
+            ]
+
+    def record(self, rows: List[Dict[str, Any]]) -> None:
+        """Record the rows as written. Call only once the write has been committed."""
+        with self._lock:
+            for row in rows:
+                key = (row["session_id"], row["run_id"])
+                self._fingerprints[key] = self._fingerprint(row)
+                self._fingerprints.move_to_end(key)
+            while len(self._fingerprints) > self.max_size:
+                self._fingerprints.popitem(last=False)
+
+    def forget(self, session_ids: Iterable[str]) -> None:
+        """Drop all fingerprints for the given sessions, e.g. after they were deleted."""
+        session_ids = set(session_ids)
+        with self._lock:
+            for key in [key for key in self._fingerprints if key[0] in session_ids]:
+                del self._fingerprints[key]
+
+
 def db_from_dict(db_data: Dict[str, Any]) -> Optional[Union["BaseDb"]]:
     """
     Create a database instance from a dictionary.
@@ -452,6 +821,7 @@ def _clone_db_with_table_overrides(
                 db_schema=source_db.db_schema,
                 id=source_db.id,
                 create_schema=source_db.create_schema,
+                store_runs_in_table=source_db.store_runs_in_table,
                 **overrides,
             )
     except Exception as e:
@@ -467,6 +837,7 @@ def _clone_db_with_table_overrides(
                 db_url=source_db.db_url,
                 db_engine=source_db.db_engine,
                 id=source_db.id,
+                store_runs_in_table=source_db.store_runs_in_table,
                 **overrides,
             )
     except Exception as e:
@@ -893,6 +893,9 @@ def _isolate_attempt(agent: Any, model_override: Optional[Model] = None, _seen:
     compression_manager = getattr(agent, "compression_manager", None)
     if compression_manager is not None:
         agent.compression_manager = _isolated_manager_copy(compression_manager, reset_stats=True)
+        # Compressions cached by earlier attempts (or the caller) must not leak into this one
+        if hasattr(agent.compression_manager, "cache_compressed_results"):
+            agent.compression_manager.cache_compressed_results = False
 
     # A manager this block has never seen is nulled loudly, BEFORE resolution
     # can bind anything onto it: managers bind db and model by pattern, and
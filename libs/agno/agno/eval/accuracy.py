@@ -1,3 +1,6 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from dataclasses import asdict, dataclass, field
 from os import getenv
 from textwrap import dedent
@@ -194,6 +197,9 @@ class AccuracyEval:
     # This helps us improve our Evals and provide better support
     telemetry: bool = True
 
+    # Maximum number of iterations running at the same time, evaluation included. 1 runs them sequentially.
+    max_concurrency: int = 1
+
     def get_evaluator_agent(self) -> Agent:
         """Return the evaluator agent. If not provided, build it based on the evaluator fields and default instructions."""
         if self.evaluator_agent is not None:
@@ -349,6 +355,85 @@ Remember: You must only compare the agent_output to the expected_output. The exp
             logger.exception("Failed to evaluate accuracy asynchronously")
             return None
 
+    def _get_evaluation_input(self, eval_input: str, eval_expected_output: str, output: str) -> str:
+        return dedent(f"""\
+            <agent_input>
+            {eval_input}
+            </agent_input>
+
+            <expected_output>
+            {eval_expected_output}
+            </expected_output>
+
+            <agent_output>
+            {output}
+            </agent_output>\
+            """)
+
+    def _run_iteration(
+        self, iteration: int, evaluator_agent: Agent, eval_input: str, eval_expected_output: str
+    ) -> Optional[AccuracyEvaluation]:
+        """Generate an answer with the Agent or Team and evaluate it."""
+        agent_session_id = f"eval_{self.eval_id}_{iteration}"
+
+        run_response: Optional[Any] = None
+        output = None
+        if self.agent is not None:
+            run_response = self.agent.run(input=eval_input, session_id=agent_session_id, stream=False)
+            output = run_response.content
+        elif self.team is not None:
+            run_response = self.team.run(input=eval_input, session_id=agent_session_id, stream=False)
+            output = run_response.content
+
+        if not output:
+            log_error(f"Failed to generate a valid answer on iteration {iteration}: {output}")
+            return None
+
+        logger.debug(f"Agent output #{iteration}: {output}")
+        result = self.evaluate_answer(
+            input=eval_input,
+            evaluator_agent=evaluator_agent,
+            evaluation_input=self._get_evaluation_input(eval_input, eval_expected_output, output),
+            evaluator_expected_output=eval_expected_output,
+            agent_output=output,
+            run_metrics=run_response.metrics if run_response is not None else None,
+        )
+        if result is None:
+            log_error(f"Failed to evaluate accuracy on iteration {iteration}")
+        return result
+
+    async def _arun_iteration(
+        self, iteration: int, evaluator_agent: Agent, eval_input: str, eval_expected_output: str
+    ) -> Optional[AccuracyEvaluation]:
+        """Generate an answer with the Agent or Team and evaluate it, asynchronously."""
+        agent_session_id = f"eval_{self.eval_id}_{iteration}"
+
+        run_response: Optional[Any] = None
+        output = None
+        if self.agent is not None:
+            run_response = await self.agent.arun(input=eval_input, session_id=agent_session_id, stream=False)  # type: ignore[misc]
+            output = run_response.content
+        elif self.team is not None:
+            run_response = await self.team.arun(input=eval_input, session_id=agent_session_id, stream=False)  # type: ignore[misc]
+            output = run_response.content
+
+        if not output:
+            log_error(f"Failed to generate a valid answer on iteration {iteration}: {output}")
+            return None
+
+        logger.debug(f"Agent output #{iteration}: {output}")
+        result = await self.aevaluate_answer(
+            input=eval_input,
+            evaluator_agent=evaluator_agent,
+            evaluation_input=self._get_evaluation_input(eval_input, eval_expected_output, output),
+            evaluator_expected_output=eval_expected_output,
+            agent_output=output,
+            run_metrics=run_response.metrics if run_response is not None else None,
+        )
+        if result is None:
+            log_error(f"Failed to evaluate accuracy on iteration {iteration}")
+        return result
+
     def run(
         self,
         *,
@@ -382,53 +467,42 @@ Remember: You must only compare the agent_output to the expected_output. The exp
             eval_input = self.get_eval_input()
             eval_expected_output = self.get_eval_expected_output()
 
-            for i in range(self.num_iterations):
-                status = Status(f"Running evaluation {i + 1}...", spinner="dots", speed=1.0, refresh_per_second=10)
-                live_log.update(status)
-
-                agent_session_id = f"eval_{self.eval_id}_{i + 1}"
-
-                run_response: Optional[Any] = None
-                if self.agent is not None:
-                    run_response = self.agent.run(input=eval_input, session_id=agent_session_id, stream=False)
-                    output = run_response.content
-                elif self.team is not None:
-                    run_response = self.team.run(input=eval_input, session_id=agent_session_id, stream=False)
-                    output = run_response.content
-
-                if not output:
-                    log_error(f"Failed to generate a valid answer on iteration {i + 1}: {output}")
-                    continue
-
-                evaluation_input = dedent(f"""\
-                    <agent_input>
-                    {eval_input}
-                    </agent_input>
-
-                    <expected_output>
-                    {eval_expected_output}
-                    </expected_output>
-
-                    <agent_output>
-                    {output}
-                    </agent_output>\
-                    """)
-                logger.debug(f"Agent output #{i + 1}: {output}")
-                result = self.evaluate_answer(
-                    input=eval_input,
-                    evaluator_agent=evaluator_agent,
-                    evaluation_input=evaluation_input,
-                    evaluator_expected_output=eval_expected_output,
-                    agent_output=output,
-                    run_metrics=run_response.metrics if run_response is not None else None,
+            if self.max_concurrency > 1 and self.num_iterations > 1:
+                status = Status(
+                    f"Running {self.num_iterations} evaluations...", spinner="dots", speed=1.0, refresh_per_second=10
                 )
-                if result is None:
-                    log_error(f"Failed to evaluate accuracy on iteration {i + 1}")
-                    continue
-
-                self.result.results.append(result)
+                live_log.update(status)
+                with ThreadPoolExecutor(max_workers=min(self.max_concurrency, self.num_iterations)) as executor:
+                    # Use copy_context().run to propagate context variables to the worker threads
+                    futures = [
+                        executor.submit(
+                            copy_context().run,
+                            self._run_iteration,
+                            iteration,
+                            evaluator_agent,
+                            eval_input,
+                            eval_expected_output,
+                        )
+                        for iteration in range(1, self.num_iterations + 1)
+                    ]
+                    # Keep the results in iteration order
+                    for future in futures:
+                        result = future.result()
+                        if result is not None:
+                            self.result.results.append(result)
                 self.result.compute_stats()
-                status.update(f"Eval iteration {i + 1} finished")
+            else:
+                for iteration in range(1, self.num_iterations + 1):
+                    status = Status(
+                        f"Running evaluation {iteration}...", spinner="dots", speed=1.0, refresh_per_second=10
+                    )
+                    live_log.update(status)
+                    result = self._run_iteration(iteration, evaluator_agent, eval_input, eval_expected_output)
+                    if result is None:
+                        continue
+                    self.result.results.append(result)
+                    self.result.compute_stats()
+                    status.update(f"Eval iteration {iteration} finished")
 
             status.stop()
 
@@ -528,53 +602,35 @@ Remember: You must only compare the agent_output to the expected_output. The exp
             eval_input = self.get_eval_input()
             eval_expected_output = self.get_eval_expected_output()
 
-            for i in range(self.num_iterations):
-                status = Status(f"Running evaluation {i + 1}...", spinner="dots", speed=1.0, refresh_per_second=10)
+            if self.max_concurrency > 1 and self.num_iterations > 1:
+                status = Status(
+                    f"Running {self.num_iterations} evaluations...", spinner="dots", speed=1.0, refresh_per_second=10
+                )
                 live_log.update(status)
+                semaphore = asyncio.Semaphore(self.max_concurrency)
 
-                agent_session_id = f"eval_{self.eval_id}_{i + 1}"
+                async def run_iteration(iteration: int) -> Optional[AccuracyEvaluation]:
+                    async with semaphore:
+                        return await self._arun_iteration(iteration, evaluator_agent, eval_input, eval_expected_output)
 
-                run_response: Optional[Any] = None
-                if self.agent is not None:
-                    run_response = await self.agent.arun(input=eval_input, session_id=agent_session_id, stream=False)  # type: ignore[misc]
-                    output = run_response.content
-                elif self.team is not None:
-                    run_response = await self.team.arun(input=eval_input, session_id=agent_session_id, stream=False)  # type: ignore[misc]
-                    output = run_response.content
-
-                if not output:
-                    log_error(f"Failed to generate a valid answer on iteration {i + 1}: {output}")
-                    continue
-
-                evaluation_input = dedent(f"""\
-                    <agent_input>
-                    {eval_input}
-                    </agent_input>
-
-                    <expected_output>
-                    {eval_expected_output}
-                    </expected_output>
-
-                    <agent_output>
-                    {output}
-                    </agent_output>\
-                    """)
-                logger.debug(f"Agent output #{i + 1}: {output}")
-                result = await self.aevaluate_answer(
-                    input=eval_input,
-                    evaluator_agent=evaluator_agent,
-                    evaluation_input=evaluation_input,
-                    evaluator_expected_output=eval_expected_output,
-                    agent_output=output,
-                    run_metrics=run_response.metrics if run_response is not None else None,
+                # gather keeps the results in iteration order
+                iteration_results = await asyncio.gather(
+                    *[run_iteration(iteration) for iteration in range(1, self.num_iterations + 1)]
                 )
-                if result is None:
-                    log_error(f"Failed to evaluate accuracy on iteration {i + 1}")
-                    continue
-
-                self.result.results.append(result)
+                self.result.results.extend(result for result in iteration_results if result is not None)
                 self.result.compute_stats()
-                status.update(f"Eval iteration {i + 1} finished")
+            else:
+                for iteration in range(1, self.num_iterations + 1):
+                    status = Status(
+                        f"Running evaluation {iteration}...", spinner="dots", speed=1.0, refresh_per_second=10
+                    )
+                    live_log.update(status)
+                    result = await self._arun_iteration(iteration, evaluator_agent, eval_input, eval_expected_output)
+                    if result is None:
+                        continue
+                    self.result.results.append(result)
+                    self.result.compute_stats()
+                    status.update(f"Eval iteration {iteration} finished")
 
             status.stop()
 
@@ -2,8 +2,10 @@
 
 A `Case` is one input to one agent or team plus optional checks (`AgentAsJudgeEval` via
 `criteria`, `ReliabilityEval` via `expected_tool_calls`). The runner executes the
-selected cases sequentially on a single event loop and returns a `SuiteResult`
-whose `to_dict()` payload is a stable contract for CI consumers.
+selected cases on a single event loop, up to `max_concurrency` at a time (sequentially by
+default), and returns a `SuiteResult` whose `to_dict()` payload is a stable contract for CI
+consumers. With a `cache`, passed cases whose agent or team config and checks are unchanged
+are not run again.
 
 The runner performs no console I/O: presentation flows through the
 `on_case_start` / `on_run_event` / `on_case_end` hooks. `cli()` (and its async
@@ -15,6 +17,7 @@ import json
 import time
 from dataclasses import dataclass, field
 from enum import Enum
+from hashlib import sha256
 from inspect import isawaitable, iscoroutine, iscoroutinefunction
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Literal, Optional, Sequence, Tuple, Union, cast
@@ -25,6 +28,7 @@ from agno.db.base import AsyncBaseDb, BaseDb
 from agno.eval.agent_as_judge import AgentAsJudgeEval
 from agno.eval.reliability import ReliabilityEval
 from agno.models.base import Model
+from agno.models.cache import ResponseCacheStore
 from agno.run.agent import RunErrorEvent, RunOutput, RunOutputEvent
 from agno.run.base import RunStatus
 from agno.run.team import RunErrorEvent as TeamRunErrorEvent
@@ -154,9 +158,12 @@ class CaseResult:
     # Raw run output - full programmatic access to content, tool calls, metrics.
     # Excluded from to_dict(). A team case stores its TeamRunOutput.
     response: Optional[Union[RunOutput, TeamRunOutput]] = None
-    # Scorer verdict; None = check not configured. Must stay the last field: not
-    # kw_only, so positional construction depends on field order.
+    # Scorer verdict; None = check not configured.
     score: Optional[Score] = None
+    # True when the result was read from the runner's cache instead of running the case.
+    # Excluded from to_dict(). Must stay the last field: not kw_only, so positional
+    # construction depends on field order.
+    cached: bool = False
 
     @property
     def passed(self) -> bool:
@@ -314,6 +321,71 @@ def _call_presentation_hook(hook: Callable[..., Any], *args: Any) -> None:
         raise TypeError("presentation hooks must be sync callables; use setup/teardown for async work")
 
 
+def _case_cache_key(case: Case, judge_model: Optional[Model]) -> Optional[str]:
+    """Key of a case in the result cache: its input and checks, the config of its agent or team and
+    the judge model. None when the config can't be serialized, so the case is never cached.
+
+    Setup/teardown and tool implementations are not part of the key: clear the cache after changing
+    them.
+    """
+    component: Any = case.agent if case.agent is not None else case.team
+    model = case.judge_model or judge_model
+    try:
+        payload = {
+            "component": "agent" if case.agent is not None else "team",
+            "config": component.to_dict(),
+            "input": case.input,
+            "criteria": case.criteria,
+            "judge_model": model.to_dict() if model is not None else None,
+            "judge_mode": JudgeMode(case.judge_mode).value,
+            "judge_threshold": case.judge_threshold,
+            "expected_tool_calls": list(case.expected_tool_calls) if case.expected_tool_calls is not None else None,
+            "allow_additional_tool_calls": case.allow_additional_tool_calls,
+            "scorer": f"{type(case.scorer).__module__}.{type(case.scorer).__qualname__}" if case.scorer else None,
+            "expected": case.expected,
+        }
+        serialized = json.dumps(payload, sort_keys=True, default=repr)
+    except Exception:
+        return None
+    return sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def _cached_result_data(result: CaseResult) -> Dict[str, Any]:
+    """The fields of a passed case kept in the result cache."""
+    return {
+        "session_id": result.session_id,
+        "judge_passed": result.judge_passed,
+        "judge_reason": result.judge_reason,
+        "judge_score": result.judge_score,
+        "reliability_passed": result.reliability_passed,
+        "output": result.output,
+        "tools_called": list(result.tools_called),
+        "score": {"value": result.score.value, "passed": result.score.passed, "reason": result.score.reason}
+        if result.score is not None
+        else None,
+    }
+
+
+def _result_from_cache(case: Case, data: Dict[str, Any]) -> CaseResult:
+    score = data.get("score")
+    return CaseResult(
+        name=case.name,
+        tags=case.tags,
+        agent_id=_component_id(case) if case.agent is not None else None,
+        team_id=_component_id(case) if case.team is not None else None,
+        # The session of the run that produced the cached result
+        session_id=data.get("session_id") or "",
+        judge_passed=data.get("judge_passed"),
+        judge_reason=data.get("judge_reason"),
+        judge_score=data.get("judge_score"),
+        reliability_passed=data.get("reliability_passed"),
+        output=data.get("output"),
+        tools_called=tuple(data.get("tools_called") or ()),
+        score=Score(value=score["value"], passed=score["passed"], reason=score.get("reason")) if score else None,
+        cached=True,
+    )
+
+
 async def _run_case_body(
     case: Case,
     result: CaseResult,
@@ -510,6 +582,48 @@ async def _arun_case(
     return result
 
 
+async def _arun_case_with_cache(
+    case: Case,
+    *,
+    start_hook_error: Optional[str],
+    cache: Optional[ResponseCacheStore],
+    default_timeout: int,
+    judge_model: Optional[Model],
+    db: Optional[Union[BaseDb, AsyncBaseDb]],
+    on_run_event: Optional[Callable[[Case, RunOutputEvent], None]],
+) -> CaseResult:
+    """Run a case, or read its result from the cache. Only passed results are cached, so failures are retried."""
+    cache_key = _case_cache_key(case, judge_model) if cache is not None else None
+    result: Optional[CaseResult] = None
+    if cache is not None and cache_key is not None:
+        try:
+            entry = await asyncio.to_thread(cache.get, cache_key)
+            if entry is not None:
+                result = _result_from_cache(case, entry["result"])
+        except Exception:
+            # An unreadable entry only costs a run
+            result = None
+
+    if result is None:
+        result = await _arun_case(
+            case,
+            default_timeout=default_timeout,
+            judge_model=judge_model,
+            db=db,
+            on_run_event=on_run_event,
+        )
+        if cache is not None and cache_key is not None and result.passed and not start_hook_error:
+            try:
+                entry = {"timestamp": int(time.time()), "result": _cached_result_data(result)}
+                await asyncio.to_thread(cache.set, cache_key, entry)
+            except Exception as exc:
+                _append_error(result, f"cache: {type(exc).__name__}: {exc}")
+
+    if start_hook_error:
+        _append_error(result, start_hook_error)
+    return result
+
+
 async def arun_cases(
     cases: Sequence[Case],
     *,
@@ -521,8 +635,10 @@ async def arun_cases(
     on_case_start: Optional[Callable[[Case], None]] = None,
     on_case_end: Optional[Callable[[Case, CaseResult], None]] = None,
     on_run_event: Optional[Callable[[Case, RunOutputEvent], None]] = None,
+    max_concurrency: int = 1,
+    cache: Optional[ResponseCacheStore] = None,
 ) -> SuiteResult:
-    """Run the selected cases sequentially and return a SuiteResult.
+    """Run the selected cases and return a SuiteResult.
 
     Args:
         cases: The cases to select from.
@@ -535,37 +651,40 @@ async def arun_cases(
         on_case_end: Presentation hook, called with each case and its CaseResult -
             including the skipped cases appended after an abort (result.skipped=True),
             so hook-driven reporters and to_dict() agree on the case count.
-        on_run_event: Presentation hook, called with every streamed run event.
+        on_run_event: Presentation hook, called with every streamed run event. With
+            max_concurrency above 1, the events of the running cases interleave.
+        max_concurrency: Maximum number of cases running at the same time, judge and
+            reliability checks included. 1 runs the cases sequentially.
+        cache: Store for the results of passed cases, e.g. a DirectoryResponseCache kept
+            between CI runs. A case whose input, checks, judge model and agent or team config
+            are unchanged is not run again: its cached result is returned with cached=True.
+
+    Cases start in selection order, and on_case_end fires in selection order too: a case
+    finishing before an earlier one is reported once the earlier one is.
 
     Performs no console I/O - all presentation flows through the hooks. Hooks are
     plain sync callables invoked on the event loop; keep them fast. A hook that
     raises (or an async hook, which is rejected) is recorded on the case
     ("hook: ..." error) without aborting the suite.
 
-    A cancelled run aborts the suite: the unrun cases are recorded as failed with a
-    "skipped: ..." error so the payload still accounts for every selected case. This
-    fires on a cancelled RunOutput - a server-side cancel_run, or a KeyboardInterrupt
-    agno converts into one.
+    A cancelled run aborts the suite: no more cases start, and the unrun cases are
+    recorded as failed with a "skipped: ..." error so the payload still accounts for
+    every selected case. Cases already running when the cancelled run ends are recorded
+    as usual. This fires on a cancelled RunOutput - a server-side cancel_run, or a
+    KeyboardInterrupt agno converts into one.
     """
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
     selected = [case for case in cases if _case_matches(case, tag=tag, name=name)]
 
     results: List[CaseResult] = []
-    for case in selected:
-        start_hook_error: Optional[str] = None
-        if on_case_start is not None:
-            try:
-                _call_presentation_hook(on_case_start, case)
-            except Exception as exc:
-                start_hook_error = f"hook: on_case_start {type(exc).__name__}: {exc}"
-        result = await _arun_case(
-            case,
-            default_timeout=default_timeout,
-            judge_model=judge_model,
-            db=db,
-            on_run_event=on_run_event,
-        )
-        if start_hook_error:
-            _append_error(result, start_hook_error)
+    tasks: List["asyncio.Task[CaseResult]"] = []
+    aborted = False
+
+    def end_case(result: CaseResult) -> None:
+        """Record the result of the next case in selection order; abort the suite on a cancelled run."""
+        nonlocal aborted
+        case = selected[len(results)]
         results.append(result)
         if on_case_end is not None:
             try:
@@ -574,15 +693,60 @@ async def arun_cases(
                 _append_error(result, f"hook: on_case_end {type(exc).__name__}: {exc}")
         if result.response is not None and result.response.status == RunStatus.cancelled:
             # A server-side cancel_run (and a KeyboardInterrupt agno converts into a cancelled
-            # RunOutput) surfaces as status=cancelled - stop here rather than marching through
-            # the remaining cases. A terminal Ctrl-C under asyncio.run instead propagates
-            # CancelledError, which unwinds the suite before reaching this branch.
-            break
-
-    # The unrun remainder (non-empty only after a cancelled-run abort; the cancelled
-    # case's own result was appended before the break) stays visible everywhere a run
-    # case would be: in the payload AND through on_case_end, so hook-driven reporters
-    # cannot silently disagree with to_dict() about the case count.
+            # RunOutput) surfaces as status=cancelled - stop starting cases rather than marching
+            # through the remaining ones. A terminal Ctrl-C under asyncio.run instead propagates
+            # CancelledError, which unwinds the suite (and cancels the running cases).
+            aborted = True
+
+    def end_finished_cases() -> None:
+        # Only the finished cases with no unfinished case before them, to keep the selection order
+        while len(results) < len(tasks) and tasks[len(results)].done():
+            end_case(tasks[len(results)].result())
+
+    try:
+        for case in selected:
+            end_finished_cases()
+            # Wait for a free slot
+            while not aborted:
+                running = [task for task in tasks[len(results) :] if not task.done()]
+                if len(running) < max_concurrency:
+                    break
+                await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                end_finished_cases()
+            if aborted:
+                break
+
+            start_hook_error: Optional[str] = None
+            if on_case_start is not None:
+                try:
+                    _call_presentation_hook(on_case_start, case)
+                except Exception as exc:
+                    start_hook_error = f"hook: on_case_start {type(exc).__name__}: {exc}"
+            tasks.append(
+                asyncio.create_task(
+                    _arun_case_with_cache(
+                        case,
+                        start_hook_error=start_hook_error,
+                        cache=cache,
+                        default_timeout=default_timeout,
+                        judge_model=judge_model,
+                        db=db,
+                        on_run_event=on_run_event,
+                    )
+                )
+            )
+
+        # The cases still running are recorded even after an abort: they already started
+        while len(results) < len(tasks):
+            end_case(await tasks[len(results)])
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+    # The unrun remainder (non-empty only after a cancelled-run abort) stays visible
+    # everywhere a run case would be: in the payload AND through on_case_end, so
+    # hook-driven reporters cannot silently disagree with to_dict() about the case count.
     for case in selected[len(results) :]:
         result = CaseResult(
             name=case.name,
@@ -616,6 +780,8 @@ def run_cases(
     on_case_start: Optional[Callable[[Case], None]] = None,
     on_case_end: Optional[Callable[[Case, CaseResult], None]] = None,
     on_run_event: Optional[Callable[[Case, RunOutputEvent], None]] = None,
+    max_concurrency: int = 1,
+    cache: Optional[ResponseCacheStore] = None,
 ) -> SuiteResult:
     """Sync wrapper over arun_cases. The whole suite runs on a single event loop."""
     return asyncio.run(
@@ -629,6 +795,8 @@ def run_cases(
             on_case_start=on_case_start,
             on_case_end=on_case_end,
             on_run_event=on_run_event,
+            max_concurrency=max_concurrency,
+            cache=cache,
         )
     )
 
@@ -641,22 +809,31 @@ class _CliRenderer:
     must not crash or restyle the console.
     """
 
-    def __init__(self, console: "Console", total: int, verbose: bool) -> None:
+    def __init__(self, console: "Console", total: int, verbose: bool, concurrent: bool = False) -> None:
         self._console = console
         self._total = total
         self._verbose = verbose
+        # With concurrent cases, each case is rendered in one go when it ends, without a spinner
+        self._concurrent = concurrent
         self._index = 0
         self._status: Optional["Status"] = None
         self._base_label = ""
 
-    def on_case_start(self, case: Case) -> None:
+    def _print_rule(self, case: Case) -> None:
         from rich.markup import escape
-        from rich.status import Status
 
         self._index += 1
         self._console.rule(
             f"[bold]{escape(case.name)}[/bold]  [dim]{escape(_component_id(case))} · {self._index}/{self._total}[/dim]"
         )
+
+    def on_case_start(self, case: Case) -> None:
+        from rich.markup import escape
+        from rich.status import Status
+
+        if self._concurrent:
+            return
+        self._print_rule(case)
         self._base_label = f"[bold]running[/bold] {escape(_component_id(case))}…"
         self._status = Status(self._base_label, console=self._console, spinner="dots")
         self._status.start()
@@ -692,6 +869,10 @@ class _CliRenderer:
             # to render - one compact line each keeps the abort visible.
             self._console.print(f"[dim]skipped:[/dim] {escape(result.name)}")
             return
+        if self._concurrent:
+            self._print_rule(case)
+        if result.cached:
+            self._console.print("[dim]cached result, not run again[/dim]")
         if self._verbose and result.response is not None:
             from agno.utils.pprint import pprint_run_response
 
@@ -811,6 +992,7 @@ async def acli(
     judge_model: Optional[Model] = None,
     default_timeout: int = 120,
     argv: Optional[Sequence[str]] = None,
+    cache: Optional[ResponseCacheStore] = None,
 ) -> int:
     """Async variant of cli() for callers already inside an event loop."""
     import argparse
@@ -823,6 +1005,10 @@ async def acli(
     parser.add_argument("--tag", default=None, help="Run only cases with this tag")
     parser.add_argument("--timeout", type=int, default=default_timeout, help="Default per-case timeout in seconds")
     parser.add_argument("--json-output", type=Path, default=None, help="Write machine-readable JSON results")
+    parser.add_argument("--concurrency", type=int, default=1, help="Number of cases to run at the same time")
+    parser.add_argument(
+        "--cache-dir", type=Path, default=None, help="Reuse the results of passed, unchanged cases stored here"
+    )
     parser.add_argument(
         "--list", action="store_true", dest="list_cases", help="List selected cases without running them"
     )
@@ -840,6 +1026,9 @@ async def acli(
         return exc.code if isinstance(exc.code, int) else 2
 
     console = Console()
+    if args.concurrency < 1:
+        console.print(f"[red]error:[/red] --concurrency must be at least 1, got {args.concurrency}")
+        return 2
     selected = [case for case in cases if _case_matches(case, tag=args.tag, name=args.name)]
     if not selected:
         console.print(f"[red]no cases selected[/red] {escape(f'(name={args.name!r}, tag={args.tag!r})')}")
@@ -865,7 +1054,13 @@ async def acli(
                 return 1
         return 0
 
-    renderer = _CliRenderer(console=console, total=len(selected), verbose=args.verbose)
+    if args.cache_dir is not None:
+        from agno.models.cache import DirectoryResponseCache
+
+        cache = DirectoryResponseCache(cache_dir=args.cache_dir)
+
+    concurrent = args.concurrency > 1
+    renderer = _CliRenderer(console=console, total=len(selected), verbose=args.verbose, concurrent=concurrent)
     try:
         suite = await arun_cases(
             selected,
@@ -874,7 +1069,10 @@ async def acli(
             db=db,
             on_case_start=renderer.on_case_start,
             on_case_end=renderer.on_case_end,
-            on_run_event=renderer.on_run_event,
+            # The spinner follows the tool calls of a single running case
+            on_run_event=None if concurrent else renderer.on_run_event,
+            max_concurrency=args.concurrency,
+            cache=cache,
         )
     finally:
         # Restore the terminal (stop the spinner) even on error or Ctrl-C.
@@ -895,6 +1093,7 @@ def cli(
     judge_model: Optional[Model] = None,
     default_timeout: int = 120,
     argv: Optional[Sequence[str]] = None,
+    cache: Optional[ResponseCacheStore] = None,
 ) -> int:
     """Run an argparse CLI over the given cases and return the exit code.
 
@@ -903,5 +1102,10 @@ def cli(
     public runner API - call it from a template's __main__.py with
     `sys.exit(cli(CASES, db=my_db))`. Inside an already-running event loop, use
     `await acli(...)` instead.
+
+    --concurrency runs several cases at the same time; --cache-dir (or cache=) skips the
+    passed cases whose config is unchanged since they were cached.
     """
-    return asyncio.run(acli(cases, db=db, judge_model=judge_model, default_timeout=default_timeout, argv=argv))
+    return asyncio.run(
+        acli(cases, db=db, judge_model=judge_model, default_timeout=default_timeout, argv=argv, cache=cache)
+    )
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Iterator, List
 
 from agno.knowledge.chunking.strategy import ChunkingStrategy
 from agno.knowledge.document.base import Document
@@ -17,9 +17,12 @@ class FixedSizeChunking(ChunkingStrategy):
 
     def chunk(self, document: Document) -> List[Document]:
         """Split document into fixed-size chunks with optional overlap"""
+        return list(self.chunk_iter(document))
+
+    def chunk_iter(self, document: Document) -> Iterator[Document]:
+        """Yield the fixed-size chunks of a document one at a time"""
         content = self.clean_text(document.content)
         content_length = len(content)
-        chunked_documents: List[Document] = []
         chunk_number = 1
         chunk_meta_data = document.meta_data
         start = 0
@@ -40,13 +43,11 @@ class FixedSizeChunking(ChunkingStrategy):
             meta_data["chunk"] = chunk_number
             chunk_id = self._generate_chunk_id(document, chunk_number, chunk)
             meta_data["chunk_size"] = len(chunk)
-            chunked_documents.append(
-                Document(
-                    id=chunk_id,
-                    name=document.name,
-                    meta_data=meta_data,
-                    content=chunk,
-                )
+            yield Document(
+                id=chunk_id,
+                name=document.name,
+                meta_data=meta_data,
+                content=chunk,
             )
             chunk_number += 1
             # Stop once a chunk reaches the end of the content
@@ -56,4 +57,3 @@ class FixedSizeChunking(ChunkingStrategy):
             # when overlap is large relative to chunk_size
             new_start = max(start + 1, end - self.overlap)
             start = new_start
-        return chunked_documents
@@ -1,30 +1,38 @@
-from typing import List
+from typing import Iterator, List
 
 from agno.knowledge.chunking.strategy import ChunkingStrategy
 from agno.knowledge.document.base import Document
 
 
 class RowChunking(ChunkingStrategy):
+    """Chunk a table, one chunk per row.
+
+    A document that holds part of a table (e.g. a page of a CSV file) sets meta_data["start_row"]
+    to the number of its first row, so row numbers continue across parts and only the first part
+    has a header to skip.
+    """
+
     def __init__(self, skip_header: bool = False, clean_rows: bool = True):
         self.skip_header = skip_header
         self.clean_rows = clean_rows
 
     def chunk(self, document: Document) -> List[Document]:
+        return list(self.chunk_iter(document))
+
+    def chunk_iter(self, document: Document) -> Iterator[Document]:
         if not document or not document.content:
-            return []
+            return
 
         if not isinstance(document.content, str):
             raise ValueError("Document content must be a string")
 
         rows = document.content.splitlines()
+        start_index = document.meta_data.get("start_row", 1)
 
-        if self.skip_header and rows:
+        if self.skip_header and rows and start_index == 1:
             rows = rows[1:]
             start_index = 2
-        else:
-            start_index = 1
 
-        chunks = []
         for i, row in enumerate(rows):
             if self.clean_rows:
                 chunk_content = " ".join(row.split())  # Normalize internal whitespace
@@ -36,5 +44,4 @@ class RowChunking(ChunkingStrategy):
                 row_number = start_index + i
                 meta_data["row_number"] = row_number  # Preserve logical row numbering
                 chunk_id = self._generate_chunk_id(document, row_number, chunk_content, prefix="row")
-                chunks.append(Document(id=chunk_id, name=document.name, meta_data=meta_data, content=chunk_content))
-        return chunks
+                yield Document(id=chunk_id, name=document.name, meta_data=meta_data, content=chunk_content)
@@ -1,7 +1,7 @@
 import hashlib
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import List, Optional
+from typing import AsyncIterator, Iterator, List, Optional
 
 from agno.knowledge.document.base import Document
 
@@ -35,6 +35,15 @@ class ChunkingStrategy(ABC):
         """Async version of chunk. Override for truly async implementations."""
         return self.chunk(document)
 
+    def chunk_iter(self, document: Document) -> Iterator[Document]:
+        """Yield the chunks of a document one at a time. Override for strategies that can chunk lazily."""
+        yield from self.chunk(document)
+
+    async def achunk_iter(self, document: Document) -> AsyncIterator[Document]:
+        """Async version of chunk_iter."""
+        for chunk in await self.achunk(document):
+            yield chunk
+
     def clean_text(self, text: str) -> str:
         """Clean the text by replacing multiple newlines with a single newline"""
         import re
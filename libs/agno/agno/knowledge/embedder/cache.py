@@ -0,0 +1,320 @@
+import sqlite3
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from hashlib import sha256
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from agno.knowledge.embedder.base import Embedder
+from agno.utils.log import log_debug
+
+
+class EmbeddingCache:
+    """Base class for embedding cache backends.
+
+    Keys are content hashes built by CachedEmbedder. Backends must be safe to use from multiple threads.
+    """
+
+    def get(self, key: str) -> Optional[List[float]]:
+        raise NotImplementedError
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, List[float]]:
+        found = {}
+        for key in keys:
+            embedding = self.get(key)
+            if embedding is not None:
+                found[key] = embedding
+        return found
+
+    def set(self, key: str, embedding: List[float]) -> None:
+        raise NotImplementedError
+
+    def set_many(self, items: Dict[str, List[float]]) -> None:
+        for key, embedding in items.items():
+            self.set(key, embedding)
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def __deepcopy__(self, memo):
+        # Copies of agents and knowledge bases share the same cache
+        return self
+
+
+class InMemoryEmbeddingCache(EmbeddingCache):
+    """In-memory cache that evicts the least recently used embeddings once max_entries is reached."""
+
+    def __init__(self, max_entries: int = 10_000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[List[float]]:
+        with self._lock:
+            embedding = self._entries.get(key)
+            if embedding is not None:
+                self._entries.move_to_end(key)
+            return embedding
+
+    def set(self, key: str, embedding: List[float]) -> None:
+        with self._lock:
+            self._entries[key] = embedding
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SqliteEmbeddingCache(EmbeddingCache):
+    """SQLite cache that persists embeddings across processes and runs.
+
+    Embeddings are stored as packed float arrays. When max_entries is set, the least recently used
+    embeddings are evicted once it is exceeded.
+    """
+
+    def __init__(
+        self,
+        db_file: Union[str, Path] = "tmp/embedding_cache.db",
+        table_name: str = "agno_embedding_cache",
+        max_entries: Optional[int] = None,
+    ):
+        self.db_file = Path(db_file)
+        self.table_name = table_name
+        self.max_entries = max_entries
+
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_file), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table_name} "
+            "(key TEXT PRIMARY KEY, embedding BLOB NOT NULL, last_used_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{self.table_name}_last_used_at ON {self.table_name} (last_used_at)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[List[float]]:
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, List[float]]:
+        if not keys:
+            return {}
+        found: Dict[str, List[float]] = {}
+        with self._lock:
+            # Stay below the SQLite limit on the number of query parameters
+            for i in range(0, len(keys), 500):
+                chunk = list(keys[i : i + 500])
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, embedding FROM {self.table_name} WHERE key IN ({placeholders})", chunk
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = array("d", blob).tolist()
+            if found and self.max_entries is not None:
+                now = time.time()
+                self._conn.executemany(
+                    f"UPDATE {self.table_name} SET last_used_at = ? WHERE key = ?", [(now, key) for key in found]
+                )
+                self._conn.commit()
+        return found
+
+    def set(self, key: str, embedding: List[float]) -> None:
+        self.set_many({key: embedding})
+
+    def set_many(self, items: Dict[str, List[float]]) -> None:
+        if not items:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO {self.table_name} (key, embedding, last_used_at) VALUES (?, ?, ?)",
+                [(key, array("d", embedding).tobytes(), now) for key, embedding in items.items()],
+            )
+            if self.max_entries is not None:
+                self._conn.execute(
+                    f"DELETE FROM {self.table_name} WHERE key IN ("
+                    f"SELECT key FROM {self.table_name} ORDER BY last_used_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute(f"DELETE FROM {self.table_name}")
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM {self.table_name}").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+@dataclass
+class CachedEmbedder(Embedder):
+    """Embedder that caches the embeddings of another embedder by content.
+
+    Embeddings are keyed by the embedder id, its dimensions and a hash of the text, so unchanged chunks are
+    not embedded again when content is re-ingested. Embeddings served from the cache have no usage.
+
+    Example:
+        embedder = CachedEmbedder(embedder=OpenAIEmbedder(), cache=SqliteEmbeddingCache("tmp/embeddings.db"))
+    """
+
+    embedder: Optional[Embedder] = None
+    cache: EmbeddingCache = field(default_factory=InMemoryEmbeddingCache)
+
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+
+    def __post_init__(self):
+        if self.embedder is None:
+            from agno.knowledge.embedder.openai import OpenAIEmbedder
+
+            self.embedder = OpenAIEmbedder()
+        self.dimensions = self.embedder.dimensions
+        self.enable_batch = self.embedder.enable_batch
+        self.batch_size = self.embedder.batch_size
+        self._stats_lock = threading.Lock()
+
+    def __deepcopy__(self, memo):
+        # Copies share the cache and its statistics
+        return self
+
+    @property
+    def _embedder(self) -> Embedder:
+        assert self.embedder is not None
+        return self.embedder
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def get_stats(self) -> Dict[str, Union[int, float]]:
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hit_rate, "entries": len(self.cache)}
+
+    def reset_stats(self) -> None:
+        with self._stats_lock:
+            self.hits = 0
+            self.misses = 0
+
+    def cache_key(self, text: str) -> str:
+        embedder_id = getattr(self._embedder, "id", None) or type(self._embedder).__name__
+        return sha256(f"{embedder_id}:{self.dimensions}:{text}".encode()).hexdigest()
+
+    def _record(self, hits: int, misses: int) -> None:
+        with self._stats_lock:
+            self.hits += hits
+            self.misses += misses
+
+    def _lookup(self, text: str) -> Tuple[str, Optional[List[float]]]:
+        key = self.cache_key(text)
+        embedding = self.cache.get(key)
+        self._record(hits=int(embedding is not None), misses=int(embedding is None))
+        return key, embedding
+
+    def _store(self, key: str, embedding: List[float]) -> None:
+        # Don't cache failed embeddings
+        if embedding:
+            self.cache.set(key, embedding)
+
+    def get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding_and_usage(text)[0]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        key, embedding = self._lookup(text)
+        if embedding is not None:
+            return embedding, None
+        embedding, usage = self._embedder.get_embedding_and_usage(text)
+        self._store(key, embedding)
+        return embedding, usage
+
+    async def async_get_embedding(self, text: str) -> List[float]:
+        return (await self.async_get_embedding_and_usage(text))[0]
+
+    async def async_get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        key, embedding = self._lookup(text)
+        if embedding is not None:
+            return embedding, None
+        embedding, usage = await self._embedder.async_get_embedding_and_usage(text)
+        self._store(key, embedding)
+        return embedding, usage
+
+    def _split_batch(self, texts: List[str]) -> Tuple[List[str], Dict[str, List[float]], List[int]]:
+        """Return the cache keys of the texts, the cached embeddings and the indexes of the texts to embed."""
+        keys = [self.cache_key(text) for text in texts]
+        cached = self.cache.get_many(keys)
+        missing = [i for i, key in enumerate(keys) if key not in cached]
+        self._record(hits=len(texts) - len(missing), misses=len(missing))
+        log_debug(f"Embedding cache: {len(texts) - len(missing)} hits, {len(missing)} misses")
+        return keys, cached, missing
+
+    def _merge_batch(
+        self,
+        keys: List[str],
+        cached: Dict[str, List[float]],
+        missing: List[int],
+        embeddings: List[List[float]],
+        usages: List[Optional[Dict]],
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        all_embeddings: List[List[float]] = [cached.get(key, []) for key in keys]
+        all_usage: List[Optional[Dict]] = [None] * len(keys)
+        new_entries: Dict[str, List[float]] = {}
+        for i, embedding, usage in zip(missing, embeddings, usages):
+            all_embeddings[i] = embedding
+            all_usage[i] = usage
+            if embedding:
+                new_entries[keys[i]] = embedding
+        self.cache.set_many(new_entries)
+        return all_embeddings, all_usage
+
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        keys, cached, missing = self._split_batch(texts)
+        embeddings: List[List[float]] = []
+        usages: List[Optional[Dict]] = []
+        if missing:
+            missing_texts = [texts[i] for i in missing]
+            if hasattr(self._embedder, "get_embeddings_batch_and_usage"):
+                embeddings, usages = self._embedder.get_embeddings_batch_and_usage(missing_texts)  # type: ignore
+            else:
+                for text in missing_texts:
+                    embedding, usage = self._embedder.get_embedding_and_usage(text)
+                    embeddings.append(embedding)
+                    usages.append(usage)
+        return self._merge_batch(keys, cached, missing, embeddings, usages)
+
+    async def async_get_embeddings_batch_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        keys, cached, missing = self._split_batch(texts)
+        embeddings: List[List[float]] = []
+        usages: List[Optional[Dict]] = []
+        if missing:
+            missing_texts = [texts[i] for i in missing]
+            if hasattr(self._embedder, "async_get_embeddings_batch_and_usage"):
+                embeddings, usages = await self._embedder.async_get_embeddings_batch_and_usage(  # type: ignore
+                    missing_texts
+                )
+            else:
+                for text in missing_texts:
+                    embedding, usage = await self._embedder.async_get_embedding_and_usage(text)
+                    embeddings.append(embedding)
+                    usages.append(usage)
+        return self._merge_batch(keys, cached, missing, embeddings, usages)
@@ -94,6 +94,82 @@ class CohereEmbedder(Embedder):
         log_debug(f"Rate limited, waiting {delay:.2f} seconds before retry (attempt {attempt + 1})")
         time.sleep(delay)
 
+    def _rate_limit_backoff_sleep(self, attempt: int) -> None:
+        """Rate-limit-aware backoff for APIs with per-minute limits."""
+        # For 40 req/min APIs like Cohere Trial, we need longer waits
+        if attempt == 0:
+            delay = 15.0  # Wait 15 seconds (1/4 of minute window)
+        elif attempt == 1:
+            delay = 30.0  # Wait 30 seconds (1/2 of minute window)
+        else:
+            delay = 60.0  # Wait full minute for window reset
+
+        # Add small jitter
+        delay += time.time() % 3
+
+        log_debug(
+            f"Rate limit backoff, waiting {delay:.1f} seconds for rate limit window reset (attempt {attempt + 1})"
+        )
+        time.sleep(delay)
+
+    def _get_batch_embeddings_and_usage(
+        self, response: Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Get the embeddings of a batch response, each with the usage of the batch."""
+        if isinstance(response, EmbeddingsFloatsEmbedResponse):
+            batch_embeddings = response.embeddings
+        elif isinstance(response, EmbeddingsByTypeEmbedResponse):
+            batch_embeddings = response.embeddings.float_ if response.embeddings.float_ else []
+        else:
+            log_warning("No embeddings found in response")
+            batch_embeddings = []
+
+        usage = response.meta.billed_units if response.meta else None
+        usage_dict = usage.model_dump() if usage else None
+        return batch_embeddings, [usage_dict] * len(batch_embeddings)
+
+    def _batch_with_retry(
+        self, texts: List[str], max_retries: int = 3
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Execute batch embedding with rate-limit-aware backoff for rate limiting."""
+
+        log_debug(f"Starting batch retry for {len(texts)} texts with max_retries={max_retries}")
+
+        for attempt in range(max_retries + 1):
+            try:
+                request_params = self._get_batch_request_params()
+                response: Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse] = self.client.embed(
+                    texts=texts, **request_params
+                )
+                batch_embeddings, all_usage = self._get_batch_embeddings_and_usage(response)
+
+                log_debug(f"Batch embedding succeeded on attempt {attempt + 1}")
+                return batch_embeddings, all_usage
+
+            except Exception as e:
+                if self._is_rate_limit_error(e):
+                    if not self.exponential_backoff:
+                        log_warning(
+                            f"Rate limit detected. To enable automatic backoff retry, set enable_backoff=True when creating the embedder.: {e}",
+                        )
+
+                        raise e
+
+                    log_info(f"Rate limit detected on attempt {attempt + 1}")
+                    if attempt < max_retries:
+                        self._rate_limit_backoff_sleep(attempt)
+                        continue
+                    else:
+                        log_warning(f"Max retries ({max_retries}) reached for rate limiting: {str(e)}")
+                        raise e
+                else:
+                    log_debug(f"Non-rate-limit error on attempt {attempt + 1}: {e}")
+                    raise e
+
+        # This should never be reached, but just in case
+        log_error("Could not create embeddings. End of retry loop reached.")
+        return [], []
+
     async def _async_rate_limit_backoff_sleep(self, attempt: int) -> None:
         """Async version of rate-limit-aware backoff for APIs with per-minute limits."""
         import asyncio
@@ -127,20 +203,7 @@ class CohereEmbedder(Embedder):
                 response: Union[
                     EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse
                 ] = await self.aclient.embed(texts=texts, **request_params)
-
-                # Extract embeddings from response
-                if isinstance(response, EmbeddingsFloatsEmbedResponse):
-                    batch_embeddings = response.embeddings
-                elif isinstance(response, EmbeddingsByTypeEmbedResponse):
-                    batch_embeddings = response.embeddings.float_ if response.embeddings.float_ else []
-                else:
-                    log_warning("No embeddings found in response")
-                    batch_embeddings = []
-
-                # Extract usage information
-                usage = response.meta.billed_units if response.meta else None
-                usage_dict = usage.model_dump() if usage else None
-                all_usage = [usage_dict] * len(batch_embeddings)
+                batch_embeddings, all_usage = self._get_batch_embeddings_and_usage(response)
 
                 log_debug(f"Async batch embedding succeeded on attempt {attempt + 1}")
                 return batch_embeddings, all_usage
@@ -197,6 +260,79 @@ class CohereEmbedder(Embedder):
             return embedding, usage.model_dump()
         return embedding, None
 
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """
+        Get embeddings and usage for multiple texts in batches.
+
+        Args:
+            texts: List of text strings to embed
+
+        Returns:
+            Tuple of (List of embedding vectors, List of usage dictionaries)
+        """
+        all_embeddings = []
+        all_usage = []
+        log_info(f"Getting embeddings and usage for {len(texts)} texts in batches of {self.batch_size}")
+
+        for i in range(0, len(texts), self.batch_size):
+            batch_texts = texts[i : i + self.batch_size]
+
+            try:
+                # Use retry logic for batch processing
+                batch_embeddings, batch_usage = self._batch_with_retry(batch_texts)
+                all_embeddings.extend(batch_embeddings)
+                all_usage.extend(batch_usage)
+
+            except Exception as e:
+                log_warning(f"Batch embedding failed after retries: {str(e)}")
+
+                # Check if this is a rate limit error and backoff is disabled
+                if self._is_rate_limit_error(e) and not self.exponential_backoff:
+                    log_warning(f"Rate limit hit and backoff is disabled. Failing immediately.: {str(e)}")
+                    raise e
+
+                # Only fall back to individual calls for non-rate-limit errors
+                # For rate limit errors, we should reduce batch size instead
+                if self._is_rate_limit_error(e):
+                    log_warning(
+                        f"Rate limit hit even after retries. Consider reducing batch_size or upgrading API key.: {e}",
+                    )
+
+                    # Try with smaller batch size
+                    if len(batch_texts) > 1:
+                        smaller_batch_size = max(1, len(batch_texts) // 2)
+                        log_info(f"Retrying with smaller batch size: {smaller_batch_size}")
+                        for j in range(0, len(batch_texts), smaller_batch_size):
+                            small_batch = batch_texts[j : j + smaller_batch_size]
+                            try:
+                                small_embeddings, small_usage = self._batch_with_retry(small_batch)
+                                all_embeddings.extend(small_embeddings)
+                                all_usage.extend(small_usage)
+                            except Exception as e3:
+                                log_error(f"Failed even with reduced batch size: {e3}")
+                                # Fall back to empty results for this batch
+                                all_embeddings.extend([[] for _ in small_batch])
+                                all_usage.extend([None for _ in small_batch])
+                    else:
+                        # Single item already failed, add empty result
+                        log_debug("Single item failed, adding empty result")
+                        all_embeddings.append([])
+                        all_usage.append(None)
+                else:
+                    # For non-rate-limit errors, fall back to individual calls
+                    log_debug("Non-rate-limit error, falling back to individual calls")
+                    for text in batch_texts:
+                        try:
+                            embedding, usage = self.get_embedding_and_usage(text)
+                            all_embeddings.append(embedding)
+                            all_usage.append(usage)
+                        except Exception as e2:
+                            log_warning(f"Error in individual embedding fallback: {e2}")
+                            all_embeddings.append([])
+                            all_usage.append(None)
+
+        return all_embeddings, all_usage
+
     async def async_get_embedding(self, text: str) -> List[float]:
         request_params: Dict[str, Any] = {}
 
@@ -114,6 +114,78 @@ class GeminiEmbedder(Embedder):
             log_error(f"Error extracting embeddings: {str(e)}")
             return [], usage
 
+    def get_embeddings_batch_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict[str, Any]]]]:
+        """
+        Get embeddings and usage for multiple texts in batches.
+
+        Args:
+            texts: List of text strings to embed
+
+        Returns:
+            Tuple of (List of embedding vectors, List of usage dictionaries)
+        """
+        all_embeddings: List[List[float]] = []
+        all_usage: List[Optional[Dict[str, Any]]] = []
+        log_info(f"Getting embeddings and usage for {len(texts)} texts in batches of {self.batch_size}")
+
+        for i in range(0, len(texts), self.batch_size):
+            batch_texts = texts[i : i + self.batch_size]
+
+            # If a user provides a model id with the `models/` prefix, we need to remove it
+            _id = self.id
+            if _id.startswith("models/"):
+                _id = _id.split("/")[-1]
+
+            _request_params: Dict[str, Any] = {"contents": batch_texts, "model": _id, "config": {}}
+            if self.dimensions:
+                _request_params["config"]["output_dimensionality"] = self.dimensions
+            if self.task_type:
+                _request_params["config"]["task_type"] = self.task_type
+            if self.title:
+                _request_params["config"]["title"] = self.title
+            if not _request_params["config"]:
+                del _request_params["config"]
+
+            if self.request_params:
+                _request_params.update(self.request_params)
+
+            try:
+                response = self.client.models.embed_content(**_request_params)
+
+                # Extract embeddings from batch response
+                if response.embeddings:
+                    all_embeddings.extend(
+                        [embedding.values if embedding.values is not None else [] for embedding in response.embeddings]
+                    )
+                else:
+                    # If no embeddings, add empty lists for each text in batch
+                    all_embeddings.extend([[] for _ in batch_texts])
+
+                # Extract usage information
+                usage_dict = None
+                if response.metadata and hasattr(response.metadata, "billable_character_count"):
+                    usage_dict = {"billable_character_count": response.metadata.billable_character_count}
+
+                # Add same usage info for each embedding in the batch
+                all_usage.extend([usage_dict] * len(batch_texts))
+
+            except Exception as e:
+                log_warning(f"Error in batch embedding: {str(e)}")
+                # Fallback to individual calls for this batch
+                for text in batch_texts:
+                    try:
+                        text_embedding, text_usage = self.get_embedding_and_usage(text)
+                        all_embeddings.append(text_embedding)
+                        all_usage.append(text_usage)
+                    except Exception as e2:
+                        log_warning(f"Error in individual embedding fallback: {e2}")
+                        all_embeddings.append([])
+                        all_usage.append(None)
+
+        return all_embeddings, all_usage
+
     async def async_get_embedding(self, text: str) -> List[float]:
         """Async version of get_embedding using client.aio."""
         # If a user provides a model id with the `models/` prefix, we need to remove it
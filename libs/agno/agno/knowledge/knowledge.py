@@ -1,14 +1,17 @@
 import asyncio
+import functools
 import hashlib
 import io
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from dataclasses import dataclass
 from enum import Enum
 from io import BytesIO
 from os.path import basename
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple, Union, cast, overload
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union, cast, overload
 
 from httpx import AsyncClient
 
@@ -55,6 +58,13 @@ class Knowledge(RemoteKnowledge):
     # Requires re-indexing existing data to add linked_to metadata.
     # Default is False for backwards compatibility with existing data.
     isolate_vector_search: bool = False
+    # Number of content items insert_many() and ainsert_many() load at the same time.
+    # insert_many() loads them in threads, so its readers, embedder and vector db must be thread-safe above 1.
+    max_concurrent_inserts: int = 1
+    # Number of documents embedded and written to the vector db at a time when loading a file from a path
+    # with a reader that reads incrementally (overrides Reader.read_iter, like CSVReader). Only one batch of
+    # documents is then held in memory, however large the file is.
+    ingest_batch_size: int = 500
 
     def __post_init__(self):
         from agno.vectordb import VectorDb
@@ -226,7 +236,7 @@ class Knowledge(RemoteKnowledge):
 
     # --- Insert Many ---
     @overload
-    async def ainsert_many(self, contents: List[ContentDict]) -> None: ...
+    async def ainsert_many(self, contents: List[ContentDict], *, max_concurrency: Optional[int] = None) -> None: ...
 
     @overload
     async def ainsert_many(
@@ -243,118 +253,60 @@ class Knowledge(RemoteKnowledge):
         upsert: bool = True,
         skip_if_exists: bool = False,
         remote_content: Optional[RemoteContent] = None,
+        max_concurrency: Optional[int] = None,
     ) -> None: ...
 
     async def ainsert_many(self, *args, **kwargs) -> None:
-        if args and isinstance(args[0], list):
-            arguments = args[0]
-            upsert = kwargs.get("upsert", True)
-            skip_if_exists = kwargs.get("skip_if_exists", False)
-            for argument in arguments:
-                await self.ainsert(
-                    name=argument.get("name"),
-                    description=argument.get("description"),
-                    path=argument.get("path"),
-                    url=argument.get("url"),
-                    metadata=argument.get("metadata"),
-                    topics=argument.get("topics"),
-                    text_content=argument.get("text_content"),
-                    reader=argument.get("reader"),
-                    include=argument.get("include"),
-                    exclude=argument.get("exclude"),
-                    upsert=argument.get("upsert", upsert),
-                    skip_if_exists=argument.get("skip_if_exists", skip_if_exists),
-                    remote_content=argument.get("remote_content", None),
-                    auth=argument.get("auth"),
-                )
+        """
+        Asynchronously insert multiple content items into the knowledge base.
 
-        elif kwargs:
-            name = kwargs.get("name", [])
-            metadata = kwargs.get("metadata", {})
-            description = kwargs.get("description", [])
-            topics = kwargs.get("topics", [])
-            reader = kwargs.get("reader", None)
-            paths = kwargs.get("paths", [])
-            urls = kwargs.get("urls", [])
-            text_contents = kwargs.get("text_contents", [])
-            include = kwargs.get("include")
-            exclude = kwargs.get("exclude")
-            upsert = kwargs.get("upsert", True)
-            skip_if_exists = kwargs.get("skip_if_exists", False)
-            remote_content = kwargs.get("remote_content", None)
-            auth = kwargs.get("auth")
-            for path in paths:
-                await self.ainsert(
-                    name=name,
-                    description=description,
-                    path=path,
-                    metadata=metadata,
-                    include=include,
-                    exclude=exclude,
-                    upsert=upsert,
-                    skip_if_exists=skip_if_exists,
-                    reader=reader,
-                    auth=auth,
-                )
-            for url in urls:
-                await self.ainsert(
-                    name=name,
-                    description=description,
-                    url=url,
-                    metadata=metadata,
-                    include=include,
-                    exclude=exclude,
-                    upsert=upsert,
-                    skip_if_exists=skip_if_exists,
-                    reader=reader,
-                    auth=auth,
-                )
-            for i, text_content in enumerate(text_contents):
-                content_name = f"{name}_{i}" if name else f"text_content_{i}"
-                log_debug(f"Adding text content: {content_name}")
-                await self.ainsert(
-                    name=content_name,
-                    description=description,
-                    text_content=text_content,
-                    metadata=metadata,
-                    include=include,
-                    exclude=exclude,
-                    upsert=upsert,
-                    skip_if_exists=skip_if_exists,
-                    reader=reader,
-                    auth=auth,
-                )
-            if topics:
-                await self.ainsert(
-                    name=name,
-                    description=description,
-                    topics=topics,
-                    metadata=metadata,
-                    include=include,
-                    exclude=exclude,
-                    upsert=upsert,
-                    skip_if_exists=skip_if_exists,
-                    reader=reader,
-                    auth=auth,
-                )
+        Supports two usage patterns:
+        1. Pass a list of content dictionaries as first argument
+        2. Pass keyword arguments with paths, urls, metadata, etc.
 
-            if remote_content:
-                await self.ainsert(
-                    name=name,
-                    metadata=metadata,
-                    description=description,
-                    remote_content=remote_content,
-                    upsert=upsert,
-                    skip_if_exists=skip_if_exists,
-                    reader=reader,
-                    auth=auth,
-                )
+        Args:
+            contents: List of content dictionaries (when used as first overload)
+            paths: Optional list of file paths to load content from
+            urls: Optional list of URLs to load content from
+            metadata: Optional metadata dictionary to apply to all content
+            topics: Optional list of topics to insert
+            text_contents: Optional list of text content strings to insert
+            reader: Optional reader to use for processing content
+            include: Optional list of file patterns to include
+            exclude: Optional list of file patterns to exclude
+            upsert: Whether to update existing content if it already exists (only used when skip_if_exists=False)
+            skip_if_exists: Whether to skip inserting content if it already exists (default: True)
+            remote_content: Optional remote content (S3, GCS, etc.) to insert
+            max_concurrency: Number of content items loaded concurrently.
+                Defaults to the knowledge base's max_concurrent_inserts.
+        """
+        max_concurrency = kwargs.pop("max_concurrency", None) or self.max_concurrent_inserts
+        insert_arguments = self._get_insert_many_arguments(args, kwargs)
 
-        else:
-            raise ValueError("Invalid usage of insert_many.")
+        if max_concurrency <= 1 or len(insert_arguments) <= 1:
+            for arguments in insert_arguments:
+                await self.ainsert(**arguments)
+            return
+
+        # A fixed number of workers take the next item when they are done with the previous one, so at most
+        # max_concurrency items are read, embedded and written at a time.
+        pending = iter(insert_arguments)
+        errors: List[BaseException] = []
+
+        async def worker() -> None:
+            for arguments in pending:
+                try:
+                    await self.ainsert(**arguments)
+                except Exception as e:
+                    log_error(f"Error inserting content {arguments.get('name') or ''}: {e}")
+                    errors.append(e)
+
+        await asyncio.gather(*(worker() for _ in range(min(max_concurrency, len(insert_arguments)))))
+        if errors:
+            raise errors[0]
 
     @overload
-    def insert_many(self, contents: List[ContentDict]) -> None: ...
+    def insert_many(self, contents: List[ContentDict], *, max_concurrency: Optional[int] = None) -> None: ...
 
     @overload
     def insert_many(
@@ -371,6 +323,7 @@ class Knowledge(RemoteKnowledge):
         upsert: bool = True,
         skip_if_exists: bool = False,
         remote_content: Optional[RemoteContent] = None,
+        max_concurrency: Optional[int] = None,
     ) -> None: ...
 
     def insert_many(self, *args, **kwargs) -> None:
@@ -394,27 +347,56 @@ class Knowledge(RemoteKnowledge):
             upsert: Whether to update existing content if it already exists (only used when skip_if_exists=False)
             skip_if_exists: Whether to skip inserting content if it already exists (default: True)
             remote_content: Optional remote content (S3, GCS, etc.) to insert
+            max_concurrency: Number of content items loaded at the same time.
+                Defaults to the knowledge base's max_concurrent_inserts.
         """
+        max_concurrency = kwargs.pop("max_concurrency", None) or self.max_concurrent_inserts
+        insert_arguments = self._get_insert_many_arguments(args, kwargs)
+
+        if max_concurrency <= 1 or len(insert_arguments) <= 1:
+            for arguments in insert_arguments:
+                self.insert(**arguments)
+            return
+
+        errors: List[BaseException] = []
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(insert_arguments))) as executor:
+            futures = [
+                executor.submit(copy_context().run, functools.partial(self.insert, **arguments))
+                for arguments in insert_arguments
+            ]
+            for arguments, future in zip(insert_arguments, futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    log_error(f"Error inserting content {arguments.get('name') or ''}: {e}")
+                    errors.append(e)
+        if errors:
+            raise errors[0]
+
+    def _get_insert_many_arguments(self, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Build the insert() arguments of each content item passed to insert_many() or ainsert_many()."""
+        insert_arguments: List[Dict[str, Any]] = []
         if args and isinstance(args[0], list):
-            arguments = args[0]
             upsert = kwargs.get("upsert", True)
             skip_if_exists = kwargs.get("skip_if_exists", False)
-            for argument in arguments:
-                self.insert(
-                    name=argument.get("name"),
-                    description=argument.get("description"),
-                    path=argument.get("path"),
-                    url=argument.get("url"),
-                    metadata=argument.get("metadata"),
-                    topics=argument.get("topics"),
-                    text_content=argument.get("text_content"),
-                    reader=argument.get("reader"),
-                    include=argument.get("include"),
-                    exclude=argument.get("exclude"),
-                    upsert=argument.get("upsert", upsert),
-                    skip_if_exists=argument.get("skip_if_exists", skip_if_exists),
-                    remote_content=argument.get("remote_content", None),
-                    auth=argument.get("auth"),
+            for argument in args[0]:
+                insert_arguments.append(
+                    dict(
+                        name=argument.get("name"),
+                        description=argument.get("description"),
+                        path=argument.get("path"),
+                        url=argument.get("url"),
+                        metadata=argument.get("metadata"),
+                        topics=argument.get("topics"),
+                        text_content=argument.get("text_content"),
+                        reader=argument.get("reader"),
+                        include=argument.get("include"),
+                        exclude=argument.get("exclude"),
+                        upsert=argument.get("upsert", upsert),
+                        skip_if_exists=argument.get("skip_if_exists", skip_if_exists),
+                        remote_content=argument.get("remote_content", None),
+                        auth=argument.get("auth"),
+                    )
                 )
 
         elif kwargs:
@@ -432,76 +414,35 @@ class Knowledge(RemoteKnowledge):
             skip_if_exists = kwargs.get("skip_if_exists", False)
             remote_content = kwargs.get("remote_content", None)
             auth = kwargs.get("auth")
+            common = dict(
+                description=description,
+                metadata=metadata,
+                upsert=upsert,
+                skip_if_exists=skip_if_exists,
+                reader=reader,
+                auth=auth,
+            )
             for path in paths:
-                self.insert(
-                    name=name,
-                    description=description,
-                    path=path,
-                    metadata=metadata,
-                    include=include,
-                    exclude=exclude,
-                    upsert=upsert,
-                    skip_if_exists=skip_if_exists,
-                    reader=reader,
-                    auth=auth,
-                )
+                insert_arguments.append(dict(name=name, path=path, include=include, exclude=exclude, **common))
             for url in urls:
-                self.insert(
-                    name=name,
-                    description=description,
-                    url=url,
-                    metadata=metadata,
-                    include=include,
-                    exclude=exclude,
-                    upsert=upsert,
-                    skip_if_exists=skip_if_exists,
-                    reader=reader,
-                    auth=auth,
-                )
+                insert_arguments.append(dict(name=name, url=url, include=include, exclude=exclude, **common))
             for i, text_content in enumerate(text_contents):
                 content_name = f"{name}_{i}" if name else f"text_content_{i}"
                 log_debug(f"Adding text content: {content_name}")
-                self.insert(
-                    name=content_name,
-                    description=description,
-                    text_content=text_content,
-                    metadata=metadata,
-                    include=include,
-                    exclude=exclude,
-                    upsert=upsert,
-                    skip_if_exists=skip_if_exists,
-                    reader=reader,
-                    auth=auth,
+                insert_arguments.append(
+                    dict(name=content_name, text_content=text_content, include=include, exclude=exclude, **common)
                 )
             if topics:
-                self.insert(
-                    name=name,
-                    description=description,
-                    topics=topics,
-                    metadata=metadata,
-                    include=include,
-                    exclude=exclude,
-                    upsert=upsert,
-                    skip_if_exists=skip_if_exists,
-                    reader=reader,
-                    auth=auth,
-                )
+                insert_arguments.append(dict(name=name, topics=topics, include=include, exclude=exclude, **common))
 
             if remote_content:
-                self.insert(
-                    name=name,
-                    metadata=metadata,
-                    description=description,
-                    remote_content=remote_content,
-                    upsert=upsert,
-                    skip_if_exists=skip_if_exists,
-                    reader=reader,
-                    auth=auth,
-                )
+                insert_arguments.append(dict(name=name, remote_content=remote_content, **common))
 
         else:
             raise ValueError("Invalid usage of insert_many.")
 
+        return insert_arguments
+
     # ==========================================
     # PUBLIC API - SEARCH METHODS
     # ==========================================
@@ -1291,6 +1232,84 @@ class Knowledge(RemoteKnowledge):
             else:
                 return await reader.async_read(source, name=name)
 
+    def _reads_incrementally(self, reader: Reader) -> bool:
+        """Whether the reader overrides read_iter, so its documents can be loaded one batch at a time."""
+        return getattr(type(reader), "read_iter", Reader.read_iter) is not Reader.read_iter
+
+    def _read_iter(
+        self,
+        reader: Reader,
+        source: Union[Path, str, BytesIO],
+        name: Optional[str] = None,
+        password: Optional[str] = None,
+    ) -> Iterator[Document]:
+        """
+        Read content lazily using a reader's read_iter method, with optional password handling.
+
+        Args:
+            reader: Reader to use
+            source: Source to read from (Path, URL string, or BytesIO)
+            name: Optional name for the document
+            password: Optional password for protected files
+
+        Returns:
+            Iterator over the documents read
+        """
+        import inspect
+
+        read_signature = inspect.signature(reader.read_iter)
+        if password is not None and "password" in read_signature.parameters:
+            return reader.read_iter(source, name=name, password=password)
+        return reader.read_iter(source, name=name)
+
+    def _aread_iter(
+        self,
+        reader: Reader,
+        source: Union[Path, str, BytesIO],
+        name: Optional[str] = None,
+        password: Optional[str] = None,
+    ) -> AsyncIterator[Document]:
+        """
+        Read content lazily using a reader's async_read_iter method, with optional password handling.
+
+        Args:
+            reader: Reader to use
+            source: Source to read from (Path, URL string, or BytesIO)
+            name: Optional name for the document
+            password: Optional password for protected files
+
+        Returns:
+            Async iterator over the documents read
+        """
+        import inspect
+
+        read_signature = inspect.signature(reader.async_read_iter)
+        if password is not None and "password" in read_signature.parameters:
+            return reader.async_read_iter(source, name=name, password=password)
+        return reader.async_read_iter(source, name=name)
+
+    def _iter_batches(self, documents: Iterable[Document]) -> Iterator[List[Document]]:
+        """Group documents into batches of ingest_batch_size documents."""
+        batch: List[Document] = []
+        for document in documents:
+            batch.append(document)
+            if len(batch) >= self.ingest_batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    async def _aiter_batches(self, documents: AsyncIterator[Document]) -> AsyncIterator[List[Document]]:
+        """Async version of _iter_batches."""
+        batch: List[Document] = []
+        async for document in documents:
+            batch.append(document)
+            if len(batch) >= self.ingest_batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
     def _prepare_documents_for_insert(
         self,
         documents: List[Document],
@@ -1378,12 +1397,6 @@ class Knowledge(RemoteKnowledge):
                     reader = ReaderFactory.get_reader_for_extension(path.suffix)
                     log_debug(f"Using Reader: {reader.__class__.__name__}")
 
-                if reader:
-                    password = content.auth.password if content.auth and content.auth.password is not None else None
-                    read_documents = await self._aread(reader, path, name=content.name or path.name, password=password)
-                else:
-                    read_documents = []
-
                 if not content.file_type:
                     content.file_type = path.suffix
 
@@ -1398,6 +1411,17 @@ class Knowledge(RemoteKnowledge):
 
                 if not content.id:
                     content.id = generate_id(content.content_hash or "")
+
+                password = content.auth.password if content.auth and content.auth.password is not None else None
+                if reader and self._reads_incrementally(reader):
+                    documents = self._aread_iter(reader, path, name=content.name or path.name, password=password)
+                    await self._ahandle_vector_db_insert_batches(content, self._aiter_batches(documents), upsert)
+                    return
+
+                if reader:
+                    read_documents = await self._aread(reader, path, name=content.name or path.name, password=password)
+                else:
+                    read_documents = []
                 self._prepare_documents_for_insert(read_documents, content.id, metadata=content.metadata)
 
                 await self._ahandle_vector_db_insert(content, read_documents, upsert)
@@ -1463,12 +1487,6 @@ class Knowledge(RemoteKnowledge):
                     reader = ReaderFactory.get_reader_for_extension(path.suffix)
                     log_debug(f"Using Reader: {reader.__class__.__name__}")
 
-                if reader:
-                    password = content.auth.password if content.auth and content.auth.password is not None else None
-                    read_documents = self._read(reader, path, name=content.name or path.name, password=password)
-                else:
-                    read_documents = []
-
                 if not content.file_type:
                     content.file_type = path.suffix
 
@@ -1483,6 +1501,17 @@ class Knowledge(RemoteKnowledge):
 
                 if not content.id:
                     content.id = generate_id(content.content_hash or "")
+
+                password = content.auth.password if content.auth and content.auth.password is not None else None
+                if reader and self._reads_incrementally(reader):
+                    documents = self._read_iter(reader, path, name=content.name or path.name, password=password)
+                    self._handle_vector_db_insert_batches(content, self._iter_batches(documents), upsert)
+                    return
+
+                if reader:
+                    read_documents = self._read(reader, path, name=content.name or path.name, password=password)
+                else:
+                    read_documents = []
                 self._prepare_documents_for_insert(read_documents, content.id, metadata=content.metadata)
 
                 self._handle_vector_db_insert(content, read_documents, upsert)
@@ -2518,6 +2547,137 @@ class Knowledge(RemoteKnowledge):
         content.status = ContentStatus.COMPLETED
         self._update_content(content)
 
+    async def _ahandle_vector_db_insert_batches(
+        self, content: Content, document_batches: AsyncIterator[List[Document]], upsert: bool
+    ):
+        """Async version of _handle_vector_db_insert_batches."""
+        from agno.vectordb import VectorDb
+
+        self.vector_db = cast(VectorDb, self.vector_db)
+
+        if not self.vector_db:
+            log_error("No vector database configured")
+            content.status = ContentStatus.FAILED
+            content.status_message = "No vector database configured"
+            await self._aupdate_content(content)
+            return
+
+        inserted_batches = 0
+        batches = document_batches.__aiter__()
+        while True:
+            try:
+                batch = await batches.__anext__()
+            except StopAsyncIteration:
+                break
+            except Exception as e:
+                log_error(f"Error reading documents: {str(e)}")
+                self._remove_partially_inserted_content(content, inserted_batches)
+                content.status = ContentStatus.FAILED
+                content.status_message = f"Could not read content: {str(e)}"
+                await self._aupdate_content(content)
+                return
+
+            try:
+                self._prepare_documents_for_insert(batch, content.id, metadata=content.metadata)  # type: ignore[arg-type]
+                if inserted_batches == 0 and upsert and self.vector_db.upsert_available():
+                    await self.vector_db.async_upsert(content.content_hash, batch, content.metadata)  # type: ignore[arg-type]
+                else:
+                    await self.vector_db.async_insert(
+                        content.content_hash,  # type: ignore[arg-type]
+                        documents=batch,
+                        filters=content.metadata,  # type: ignore[arg-type]
+                    )
+            except Exception as e:
+                log_error(f"Error inserting documents: {str(e)}")
+                self._remove_partially_inserted_content(content, inserted_batches)
+                content.status = ContentStatus.FAILED
+                content.status_message = "Could not insert embedding"
+                await self._aupdate_content(content)
+                return
+            inserted_batches += 1
+
+        if inserted_batches == 0:
+            # Nothing was read, handle it like an empty document list
+            await self._ahandle_vector_db_insert(content, [], upsert)
+            return
+
+        log_debug(f"Inserted {inserted_batches} batches of documents for content {content.id}")
+        content.status = ContentStatus.COMPLETED
+        await self._aupdate_content(content)
+
+    def _handle_vector_db_insert_batches(
+        self, content: Content, document_batches: Iterable[List[Document]], upsert: bool
+    ):
+        """Insert documents into the vector database one batch at a time, as they are read.
+
+        With upsert, the first batch replaces the documents already stored for the content,
+        and the next batches are added to it. If reading or inserting a batch fails, the batches
+        already inserted are removed, so the content is never left half loaded.
+        """
+        from agno.vectordb import VectorDb
+
+        self.vector_db = cast(VectorDb, self.vector_db)
+
+        if not self.vector_db:
+            log_error("No vector database configured")
+            content.status = ContentStatus.FAILED
+            content.status_message = "No vector database configured"
+            self._update_content(content)
+            return
+
+        inserted_batches = 0
+        batches = iter(document_batches)
+        while True:
+            # Reading and inserting fail separately, so the content reports which one went wrong
+            try:
+                batch = next(batches, None)
+            except Exception as e:
+                log_error(f"Error reading documents: {str(e)}")
+                self._remove_partially_inserted_content(content, inserted_batches)
+                content.status = ContentStatus.FAILED
+                content.status_message = f"Could not read content: {str(e)}"
+                self._update_content(content)
+                return
+            if batch is None:
+                break
+
+            try:
+                self._prepare_documents_for_insert(batch, content.id, metadata=content.metadata)  # type: ignore[arg-type]
+                if inserted_batches == 0 and upsert and self.vector_db.upsert_available():
+                    self.vector_db.upsert(content.content_hash, batch, content.metadata)  # type: ignore[arg-type]
+                else:
+                    self.vector_db.insert(
+                        content.content_hash,  # type: ignore[arg-type]
+                        documents=batch,
+                        filters=content.metadata,  # type: ignore[arg-type]
+                    )
+            except Exception as e:
+                log_error(f"Error inserting documents: {str(e)}")
+                self._remove_partially_inserted_content(content, inserted_batches)
+                content.status = ContentStatus.FAILED
+                content.status_message = "Could not insert embedding"
+                self._update_content(content)
+                return
+            inserted_batches += 1
+
+        if inserted_batches == 0:
+            # Nothing was read, handle it like an empty document list
+            self._handle_vector_db_insert(content, [], upsert)
+            return
+
+        log_debug(f"Inserted {inserted_batches} batches of documents for content {content.id}")
+        content.status = ContentStatus.COMPLETED
+        self._update_content(content)
+
+    def _remove_partially_inserted_content(self, content: Content, inserted_batches: int) -> None:
+        """Remove the batches of documents inserted for a content before its load failed."""
+        if inserted_batches == 0 or not content.id or self.vector_db is None:
+            return
+        try:
+            self.vector_db.delete_by_content_id(content.id)
+        except Exception as e:
+            log_warning(f"Could not remove the documents inserted for content {content.id}: {str(e)}")
+
     # --- Content Update ---
 
     def _update_content(self, content: Content) -> Optional[Dict[str, Any]]:
@@ -3569,6 +3729,7 @@ Make sure to pass the filters as [Dict[str: Any]] to the tool. FOLLOW THIS STRUC
         upsert: bool = True,
         skip_if_exists: bool = False,
         remote_content: Optional[RemoteContent] = None,
+        max_concurrency: Optional[int] = None,
     ) -> None: ...
 
     async def add_contents_async(self, *args, **kwargs) -> None:
@@ -1,6 +1,6 @@
 import asyncio
 from dataclasses import dataclass, field
-from typing import Any, List, Optional
+from typing import Any, AsyncIterator, Iterator, List, Optional
 
 from agno.knowledge.chunking.fixed import FixedSizeChunking
 from agno.knowledge.chunking.strategy import ChunkingStrategy, ChunkingStrategyFactory, ChunkingStrategyType
@@ -71,6 +71,31 @@ class Reader:
         """Async variant of :meth:`read`. Subclasses must honor ``self.chunk`` (see :meth:`read`)."""
         raise NotImplementedError
 
+    def read_iter(self, obj: Any, name: Optional[str] = None, password: Optional[str] = None) -> Iterator[Document]:
+        """Read ``obj`` and yield the resulting documents one at a time.
+
+        Honors ``self.chunk`` the same way as :meth:`read`. The default yields from :meth:`read`.
+        Readers that can produce documents incrementally override it, so large sources never need
+        to fit in memory at once; they may chunk each part of the source (e.g. a page) on its own,
+        so chunks can break where :meth:`read`'s would not. Overrides raise errors reading ``obj``
+        rather than logging them, since documents may already have been yielded.
+        """
+        if password is not None:
+            yield from self.read(obj, name=name, password=password)
+        else:
+            yield from self.read(obj, name=name)
+
+    async def async_read_iter(
+        self, obj: Any, name: Optional[str] = None, password: Optional[str] = None
+    ) -> AsyncIterator[Document]:
+        """Async variant of :meth:`read_iter`. The default yields from :meth:`async_read`."""
+        if password is not None:
+            documents = await self.async_read(obj, name=name, password=password)
+        else:
+            documents = await self.async_read(obj, name=name)
+        for document in documents:
+            yield document
+
     @classmethod
     def get_supported_chunking_strategies(cls) -> List[ChunkingStrategyType]:
         raise NotImplementedError
@@ -84,12 +109,24 @@ class Reader:
             self.chunking_strategy = FixedSizeChunking(chunk_size=self.chunk_size)
         return self.chunking_strategy.chunk(document)
 
+    def chunk_document_iter(self, document: Document) -> Iterator[Document]:
+        """Yield the chunks of a document one at a time."""
+        if self.chunking_strategy is None:
+            self.chunking_strategy = FixedSizeChunking(chunk_size=self.chunk_size)
+        return self.chunking_strategy.chunk_iter(document)
+
     async def achunk_document(self, document: Document) -> List[Document]:
         """Async version of chunk_document."""
         if self.chunking_strategy is None:
             self.chunking_strategy = FixedSizeChunking(chunk_size=self.chunk_size)
         return await self.chunking_strategy.achunk(document)
 
+    def achunk_document_iter(self, document: Document) -> AsyncIterator[Document]:
+        """Async version of chunk_document_iter."""
+        if self.chunking_strategy is None:
+            self.chunking_strategy = FixedSizeChunking(chunk_size=self.chunk_size)
+        return self.chunking_strategy.achunk_iter(document)
+
     async def chunk_documents_async(self, documents: List[Document]) -> List[Document]:
         """
         Asynchronously chunk a list of documents.
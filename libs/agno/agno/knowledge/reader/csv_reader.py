@@ -2,14 +2,9 @@ import asyncio
 import csv
 import io
 from pathlib import Path
-from typing import IO, Any, List, Optional, Union
+from typing import IO, Any, AsyncIterator, Iterator, List, Optional, Union
 from uuid import uuid4
 
-try:
-    import aiofiles
-except ImportError:
-    raise ImportError("`aiofiles` not installed. Please install it with `pip install aiofiles`")
-
 from agno.knowledge.chunking.row import RowChunking
 from agno.knowledge.chunking.strategy import ChunkingStrategy, ChunkingStrategyType
 from agno.knowledge.document.base import Document
@@ -127,6 +122,152 @@ class CSVReader(Reader):
             log_error(f"Error reading {file_desc}: {str(e)}")
             return []
 
+    def _get_csv_name(self, file: Union[Path, str, IO[Any]], name: Optional[str] = None) -> str:
+        if isinstance(file, (Path, str)):
+            return name or Path(file).stem
+        return name or getattr(file, "name", "csv_file").split(".")[0]
+
+    def _iter_pages(
+        self,
+        file: Union[Path, str, IO[Any]],
+        delimiter: str = ",",
+        quotechar: str = '"',
+        page_size: int = 1000,
+        name: Optional[str] = None,
+    ) -> Iterator[Document]:
+        """Yield a document per page of rows, reading the file one row at a time.
+
+        Raises:
+            FileNotFoundError: If the file path doesn't exist.
+        """
+        csv_name = self._get_csv_name(file, name)
+        if isinstance(file, (Path, str)):
+            file_path = Path(file)
+            if not file_path.exists():
+                raise FileNotFoundError(f"Could not find file: {file_path}")
+            log_debug(f"Reading pages: {file_path}")
+            file_content: IO[str] = file_path.open(newline="", mode="r", encoding=self.encoding or "utf-8")
+        else:
+            log_debug(f"Reading pages of retrieved file: {getattr(file, 'name', 'BytesIO')}")
+            file.seek(0)
+            file_content = io.TextIOWrapper(file, encoding=self.encoding or "utf-8", newline="")  # type: ignore[arg-type]
+
+        def _page(page_number: int, page_lines: List[str]) -> Document:
+            return Document(
+                name=csv_name,
+                id=str(uuid4()),
+                meta_data={
+                    "page": page_number,
+                    "start_row": (page_number - 1) * page_size + 1,
+                    "rows": len(page_lines),
+                },
+                content="\n".join(page_lines),
+            )
+
+        try:
+            page_lines: List[str] = []
+            page_number = 1
+            for row in csv.reader(file_content, delimiter=delimiter, quotechar=quotechar):
+                page_lines.append(", ".join(stringify_cell_value(cell) for cell in row))
+                if len(page_lines) == page_size:
+                    yield _page(page_number, page_lines)
+                    page_lines = []
+                    page_number += 1
+            if page_lines:
+                yield _page(page_number, page_lines)
+        finally:
+            if isinstance(file_content, io.TextIOWrapper) and not isinstance(file, (Path, str)):
+                # Leave the caller's file object open
+                file_content.detach()
+            else:
+                file_content.close()
+
+    async def _aiter_pages(
+        self,
+        file: Union[Path, str, IO[Any]],
+        delimiter: str = ",",
+        quotechar: str = '"',
+        page_size: int = 1000,
+        name: Optional[str] = None,
+    ) -> AsyncIterator[Document]:
+        """Async version of _iter_pages. Each page is read in a worker thread."""
+        pages = self._iter_pages(file, delimiter, quotechar, page_size, name)
+        while True:
+            page = await asyncio.to_thread(next, pages, None)
+            if page is None:
+                return
+            yield page
+
+    def read_iter(
+        self,
+        file: Union[Path, str, IO[Any]],
+        delimiter: str = ",",
+        quotechar: str = '"',
+        page_size: int = 1000,
+        name: Optional[str] = None,
+    ) -> Iterator[Document]:
+        """Read a CSV file one page of rows at a time, yielding the chunks of each page as it is read.
+
+        Only one page of rows is held in memory, so files of any size can be read. The pages share
+        one document id and keep their row numbers, so RowChunking yields the same chunks as read().
+        Without chunking, the file is a single document, as in read().
+
+        Args:
+            file: Path to CSV file, file path string, or file-like object.
+            delimiter: CSV field delimiter. Default is comma.
+            quotechar: CSV quote character. Default is double quote.
+            page_size: Number of rows per page.
+            name: Optional name override for the documents.
+
+        Raises:
+            FileNotFoundError: If the file path doesn't exist.
+            Exception: Any error reading the file, possibly after some documents were yielded.
+        """
+        if not self.chunk:
+            documents = self.read(file, delimiter=delimiter, quotechar=quotechar, name=name)
+            yield from documents
+            return
+
+        document_id = str(uuid4())
+        try:
+            for page in self._iter_pages(file, delimiter, quotechar, page_size, name):
+                page.id = document_id
+                yield from self.chunk_document_iter(page)
+        except FileNotFoundError:
+            raise
+        except Exception as e:
+            file_desc = getattr(file, "name", str(file)) if isinstance(file, IO) else file
+            log_error(f"Error reading {file_desc}: {str(e)}")
+            raise
+
+    async def async_read_iter(
+        self,
+        file: Union[Path, str, IO[Any]],
+        delimiter: str = ",",
+        quotechar: str = '"',
+        page_size: int = 1000,
+        name: Optional[str] = None,
+    ) -> AsyncIterator[Document]:
+        """Async version of read_iter."""
+        if not self.chunk:
+            documents = await asyncio.to_thread(self.read, file, delimiter, quotechar, name)
+            for document in documents:
+                yield document
+            return
+
+        document_id = str(uuid4())
+        try:
+            async for page in self._aiter_pages(file, delimiter, quotechar, page_size, name):
+                page.id = document_id
+                async for chunk in self.achunk_document_iter(page):
+                    yield chunk
+        except FileNotFoundError:
+            raise
+        except Exception as e:
+            file_desc = getattr(file, "name", str(file)) if isinstance(file, IO) else file
+            log_error(f"Error reading {file_desc}: {str(e)}")
+            raise
+
     async def async_read(
         self,
         file: Union[Path, str, IO[Any]],
@@ -135,7 +276,7 @@ class CSVReader(Reader):
         page_size: int = 1000,
         name: Optional[str] = None,
     ) -> List[Document]:
-        """Read a CSV file asynchronously, processing batches of rows concurrently.
+        """Read a CSV file asynchronously, one page of rows at a time.
 
         Args:
             file: Path to CSV file, file path string, or file-like object.
@@ -151,59 +292,24 @@ class CSVReader(Reader):
             FileNotFoundError: If the file path doesn't exist.
         """
         try:
-            if isinstance(file, (Path, str)):
-                file_path = Path(file)
-                if not file_path.exists():
-                    raise FileNotFoundError(f"Could not find file: {file_path}")
-                log_debug(f"Reading async: {file_path}")
-                async with aiofiles.open(
-                    file_path, mode="r", encoding=self.encoding or "utf-8", newline=""
-                ) as file_content:
-                    content = await file_content.read()
-                    file_content_io = io.StringIO(content)
-                csv_name = name or file_path.stem
-            else:
-                log_debug(f"Reading retrieved file async: {getattr(file, 'name', 'BytesIO')}")
-                file.seek(0)
-                file_content_io = io.StringIO(file.read().decode(self.encoding or "utf-8"))
-                csv_name = name or getattr(file, "name", "csv_file").split(".")[0]
-
-            file_content_io.seek(0)
-            csv_reader = csv.reader(file_content_io, delimiter=delimiter, quotechar=quotechar)
-            rows = list(csv_reader)
-            total_rows = len(rows)
+            pages: List[Document] = []
+            async for page in self._aiter_pages(file, delimiter, quotechar, page_size, name):
+                pages.append(page)
+            total_rows = sum(page.meta_data["rows"] for page in pages)
 
+            documents: List[Document]
             if total_rows <= 10:
                 # Small files: single document
-                csv_content = "\n".join(", ".join(stringify_cell_value(cell) for cell in row) for row in rows)
                 documents = [
                     Document(
-                        name=csv_name,
+                        name=pages[0].name if pages else self._get_csv_name(file, name),
                         id=str(uuid4()),
-                        content=csv_content,
+                        content="\n".join(page.content for page in pages),
                     )
                 ]
             else:
-                # Large files: paginate and process in parallel
-                pages = []
-                for i in range(0, total_rows, page_size):
-                    pages.append(rows[i : i + page_size])
-
-                async def _process_page(page_number: int, page_rows: List[List[str]]) -> Document:
-                    """Process a page of rows into a document."""
-                    start_row = (page_number - 1) * page_size + 1
-                    page_content = "\n".join(", ".join(stringify_cell_value(cell) for cell in row) for row in page_rows)
-
-                    return Document(
-                        name=csv_name,
-                        id=str(uuid4()),
-                        meta_data={"page": page_number, "start_row": start_row, "rows": len(page_rows)},
-                        content=page_content,
-                    )
-
-                documents = await asyncio.gather(
-                    *[_process_page(page_number, page) for page_number, page in enumerate(pages, start=1)]
-                )
+                # Large files: one document per page
+                documents = pages
 
             if self.chunk:
                 documents = await self.chunk_documents_async(documents)
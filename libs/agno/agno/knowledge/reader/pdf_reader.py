@@ -1,7 +1,14 @@
 import asyncio
+import math
+import multiprocessing
+import os
 import re
+import tempfile
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import IO, Any, List, Optional, Tuple, Union
+from typing import IO, Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
 from uuid import uuid4
 
 from agno.knowledge.chunking.document import DocumentChunking
@@ -21,6 +28,8 @@ except ImportError:
 PAGE_START_NUMBERING_FORMAT_DEFAULT = "<start page {page_nr}>"
 PAGE_END_NUMBERING_FORMAT_DEFAULT = "<end page {page_nr}>"
 PAGE_NUMBERING_CORRECTNESS_RATIO_FOR_REMOVAL = 0.4
+# Page ranges per worker process, so workers that get faster pages pick up more of the remaining ranges
+PAGE_RANGES_PER_WORKER = 4
 
 
 def _sanitize_pdf_text(text: str) -> str:
@@ -94,6 +103,61 @@ async def _async_ocr_reader(page: Any) -> str:
     return images_text
 
 
+# Worker process pools, shared by all reads with the same number of workers and start method
+_process_pools: Dict[Tuple[int, str], ProcessPoolExecutor] = {}
+_process_pools_lock = threading.Lock()
+
+# PDF opened by the current worker process, with the key of the read it was opened for
+_worker_pdf: Optional[Tuple[str, DocumentReader]] = None
+
+
+def _get_process_pool(max_workers: int, start_method: str) -> ProcessPoolExecutor:
+    """Get the shared pool of worker processes, creating it on first use."""
+    with _process_pools_lock:
+        pool = _process_pools.get((max_workers, start_method))
+        if pool is None:
+            pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context(start_method))
+            _process_pools[(max_workers, start_method)] = pool
+        return pool
+
+
+def _discard_process_pool(max_workers: int, start_method: str, pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool, so the next read starts new worker processes."""
+    with _process_pools_lock:
+        if _process_pools.get((max_workers, start_method)) is pool:
+            del _process_pools[(max_workers, start_method)]
+    pool.shutdown(wait=False)
+
+
+def _extract_page_range(
+    read_key: str,
+    pdf_path: str,
+    password: Optional[str],
+    start: int,
+    end: int,
+    read_images: bool,
+    sanitize_content: bool,
+) -> List[Tuple[str, str]]:
+    """Extract the text and the text of the images of pages [start, end), in a worker process.
+
+    The PDF is opened once per worker and read, not once per page range.
+    """
+    global _worker_pdf
+    if _worker_pdf is None or _worker_pdf[0] != read_key:
+        pdf_reader = DocumentReader(pdf_path)
+        if pdf_reader.is_encrypted:
+            pdf_reader.decrypt(password or "")
+        _worker_pdf = (read_key, pdf_reader)
+
+    pages = []
+    for page in _worker_pdf[1].pages[start:end]:
+        page_text = page.extract_text()
+        if sanitize_content:
+            page_text = _sanitize_pdf_text(page_text)
+        pages.append((page_text, _ocr_reader(page) if read_images else ""))
+    return pages
+
+
 def _clean_page_numbers(
     page_content_list: List[str],
     extra_content: List[str] = [],
@@ -208,8 +272,19 @@ class BasePDFReader(Reader):
         password: Optional[str] = None,
         sanitize_content: bool = True,
         chunking_strategy: Optional[ChunkingStrategy] = None,
+        max_workers: Optional[int] = None,
+        mp_start_method: str = "spawn",
         **kwargs,
     ):
+        """
+        Args:
+            max_workers: Number of processes extracting the pages of a PDF in parallel.
+                Pages are extracted in the calling process when not set or 1.
+            mp_start_method: How the worker processes are started, see multiprocessing.get_context.
+                With "spawn", scripts must start reading under an `if __name__ == "__main__":` guard.
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
         if chunking_strategy is None:
             chunk_size = kwargs.get("chunk_size", 5000)
             chunking_strategy = DocumentChunking(chunk_size=chunk_size)
@@ -224,6 +299,8 @@ class BasePDFReader(Reader):
         self.page_end_numbering_format = page_end_numbering_format
         self.password = password
         self.sanitize_content = sanitize_content
+        self.max_workers = max_workers
+        self.mp_start_method = mp_start_method
 
         super().__init__(chunking_strategy=chunking_strategy, **kwargs)
 
@@ -239,12 +316,6 @@ class BasePDFReader(Reader):
             ChunkingStrategyType.RECURSIVE_CHUNKER,
         ]
 
-    def _build_chunked_documents(self, documents: List[Document]) -> List[Document]:
-        chunked_documents: List[Document] = []
-        for document in documents:
-            chunked_documents.extend(self.chunk_document(document))
-        return chunked_documents
-
     def _get_doc_name(self, pdf_source: Union[str, Path, IO[Any]], name: Optional[str] = None) -> str:
         """Determines the document name from the source or a provided name."""
         if name:
@@ -289,18 +360,23 @@ class BasePDFReader(Reader):
             return False
 
     def _create_documents(self, pdf_content: List[str], doc_name: str, use_uuid_for_id: bool, page_number_shift):
+        return list(self._iter_documents(pdf_content, doc_name, use_uuid_for_id, page_number_shift))
+
+    def _iter_documents(
+        self, pdf_content: List[str], doc_name: str, use_uuid_for_id: bool, page_number_shift
+    ) -> Iterator[Document]:
+        """Yield the documents of the pages, chunking each page as it is reached when chunking is enabled."""
         if self.split_on_pages:
             shift = page_number_shift if page_number_shift is not None else 1
-            documents: List[Document] = []
-            for page_number, page_content in enumerate(pdf_content, start=shift):
-                documents.append(
-                    Document(
-                        name=doc_name,
-                        id=(str(uuid4()) if use_uuid_for_id else f"{doc_name}_{page_number}"),
-                        meta_data={"page": page_number},
-                        content=page_content,
-                    )
+            documents: Iterator[Document] = (
+                Document(
+                    name=doc_name,
+                    id=(str(uuid4()) if use_uuid_for_id else f"{doc_name}_{page_number}"),
+                    meta_data={"page": page_number},
+                    content=page_content,
                 )
+                for page_number, page_content in enumerate(pdf_content, start=shift)
+            )
         else:
             pdf_content_str = "\n".join(pdf_content)
             document = Document(
@@ -309,37 +385,139 @@ class BasePDFReader(Reader):
                 meta_data={},
                 content=pdf_content_str,
             )
-            documents = [document]
+            documents = iter([document])
 
-        if self.chunk:
-            return self._build_chunked_documents(documents)
-        return documents
+        for document in documents:
+            if self.chunk:
+                yield from self.chunk_document_iter(document)
+            else:
+                yield document
+
+    def _uses_process_pool(self, doc_reader: DocumentReader, pdf_source: Optional[Union[str, Path, IO[Any]]]) -> bool:
+        return (
+            self.max_workers is not None
+            and self.max_workers > 1
+            and pdf_source is not None
+            and len(doc_reader.pages) > 1
+        )
 
-    def _pdf_reader_to_documents(
+    def _extract_pages_in_processes(
         self,
         doc_reader: DocumentReader,
-        doc_name,
-        read_images=False,
-        use_uuid_for_id=False,
-    ):
-        pdf_content = []
-        pdf_images_text = []
-        for page in doc_reader.pages:
-            pdf_content.append(page.extract_text())
-            if read_images:
-                pdf_images_text.append(_ocr_reader(page))
+        pdf_source: Union[str, Path, IO[Any]],
+        read_images: bool = False,
+        password: Optional[str] = None,
+    ) -> Tuple[List[str], List[str]]:
+        """Extract the pages of a PDF in worker processes, each handling ranges of pages.
 
-        # Sanitize before page number cleaning so that _clean_page_numbers can insert
-        # its markers without the sanitizer later collapsing their newline delimiters.
-        if self.sanitize_content:
-            pdf_content = [_sanitize_pdf_text(page) for page in pdf_content]
+        The worker processes are shared by all reads, so they are only started by the first one.
+
+        Returns:
+            Tuple[List[str], List[str]]: The text and the text of the images of each page, in page order.
+        """
+        # The worker processes decrypt the PDF with the password that decrypted it here
+        pdf_password = self.password if password is None else password
+
+        num_pages = len(doc_reader.pages)
+        max_workers = min(self.max_workers or 1, num_pages)
+        range_size = max(1, math.ceil(num_pages / (max_workers * PAGE_RANGES_PER_WORKER)))
+        page_ranges = [(start, min(start + range_size, num_pages)) for start in range(0, num_pages, range_size)]
+        log_debug(f"Extracting {num_pages} pages in {len(page_ranges)} ranges with {max_workers} processes")
 
-        pdf_content, shift = _clean_page_numbers(
+        # Workers open the PDF from a path, file objects are written to a temporary file first
+        tmp_path = None
+        if isinstance(pdf_source, (str, Path)):
+            pdf_path = str(pdf_source)
+        else:
+            pdf_source.seek(0)
+            fd, tmp_path = tempfile.mkstemp(suffix=".pdf")
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(pdf_source.read())
+            pdf_path = tmp_path
+
+        pool = _get_process_pool(self.max_workers or 1, self.mp_start_method)
+        read_key = str(uuid4())
+        pages_by_start: Dict[int, List[Tuple[str, str]]] = {}
+        futures: Dict[Future, int] = {}
+        try:
+            futures = {
+                pool.submit(
+                    _extract_page_range,
+                    read_key,
+                    pdf_path,
+                    pdf_password,
+                    start,
+                    end,
+                    read_images,
+                    self.sanitize_content,
+                ): start
+                for start, end in page_ranges
+            }
+            for future in as_completed(futures):
+                pages_by_start[futures[future]] = future.result()
+        except BrokenProcessPool:
+            _discard_process_pool(self.max_workers or 1, self.mp_start_method, pool)
+            raise
+        finally:
+            # Don't extract the remaining ranges of a read that failed
+            for future in futures:
+                future.cancel()
+            if tmp_path is not None:
+                os.remove(tmp_path)
+
+        pages = [page for start, _ in page_ranges for page in pages_by_start[start]]
+        return [page[0] for page in pages], [page[1] for page in pages]
+
+    def _extract_clean_pages(
+        self,
+        doc_reader: DocumentReader,
+        read_images: bool = False,
+        pdf_source: Optional[Union[str, Path, IO[Any]]] = None,
+        password: Optional[str] = None,
+    ) -> Tuple[List[str], Optional[int]]:
+        """Extract the text of every page, then remove or reformat the page numbers found across all of them."""
+        if self._uses_process_pool(doc_reader, pdf_source):
+            pdf_content, pdf_images_text = self._extract_pages_in_processes(
+                doc_reader,
+                pdf_source,  # type: ignore[arg-type]
+                read_images=read_images,
+                password=password,
+            )
+        else:
+            pdf_content = []
+            pdf_images_text = []
+            for page in doc_reader.pages:
+                pdf_content.append(page.extract_text())
+                if read_images:
+                    pdf_images_text.append(_ocr_reader(page))
+
+            # Sanitize before page number cleaning so that _clean_page_numbers can insert
+            # its markers without the sanitizer later collapsing their newline delimiters.
+            if self.sanitize_content:
+                pdf_content = [_sanitize_pdf_text(page) for page in pdf_content]
+
+        if not read_images:
+            pdf_images_text = []
+
+        return _clean_page_numbers(
             page_content_list=pdf_content,
             extra_content=pdf_images_text,
             page_start_numbering_format=self.page_start_numbering_format,
             page_end_numbering_format=self.page_end_numbering_format,
         )
+
+    def _pdf_reader_to_documents(
+        self,
+        doc_reader: DocumentReader,
+        doc_name,
+        read_images=False,
+        use_uuid_for_id=False,
+        pdf_source: Optional[Union[str, Path, IO[Any]]] = None,
+        password: Optional[str] = None,
+    ):
+        pdf_content, shift = self._extract_clean_pages(
+            doc_reader, read_images=read_images, pdf_source=pdf_source, password=password
+        )
         return self._create_documents(pdf_content, doc_name, use_uuid_for_id, shift)
 
     async def _async_pdf_reader_to_documents(
@@ -348,7 +526,16 @@ class BasePDFReader(Reader):
         doc_name: str,
         read_images=False,
         use_uuid_for_id=False,
+        pdf_source: Optional[Union[str, Path, IO[Any]]] = None,
+        password: Optional[str] = None,
     ):
+        if self._uses_process_pool(doc_reader, pdf_source):
+            # Extraction is CPU bound, so the worker processes are waited on from a thread
+            pages, page_number_shift = await asyncio.to_thread(
+                self._extract_clean_pages, doc_reader, read_images, pdf_source, password
+            )
+            return self._create_documents(pages, doc_name, use_uuid_for_id, page_number_shift)
+
         async def _read_pdf_page(page, read_images) -> Tuple[str, str]:
             # We tried "asyncio.to_thread(page.extract_text)", but it maintains state internally, which leads to issues.
             page_text = page.extract_text()
@@ -386,15 +573,12 @@ class PDFReader(BasePDFReader):
     def get_supported_content_types(cls) -> List[ContentType]:
         return [ContentType.PDF]
 
-    def read(
-        self,
-        pdf: Optional[Union[str, Path, IO[Any]]] = None,
-        name: Optional[str] = None,
-        password: Optional[str] = None,
-    ) -> List[Document]:
+    def _open_pdf(
+        self, pdf: Optional[Union[str, Path, IO[Any]]], name: Optional[str], password: Optional[str]
+    ) -> Optional[Tuple[DocumentReader, str]]:
         if pdf is None:
             log_error("No pdf provided")
-            return []
+            return None
         doc_name = self._get_doc_name(pdf, name)
         log_debug(f"Reading: {doc_name}")
 
@@ -402,13 +586,27 @@ class PDFReader(BasePDFReader):
             pdf_reader = DocumentReader(pdf)
         except PdfStreamError as e:
             log_error(f"Error reading PDF: {str(e)}")
-            return []
+            return None
         # Handle PDF decryption
         if not self._decrypt_pdf(pdf_reader, doc_name, password):
+            return None
+        return pdf_reader, doc_name
+
+    def read(
+        self,
+        pdf: Optional[Union[str, Path, IO[Any]]] = None,
+        name: Optional[str] = None,
+        password: Optional[str] = None,
+    ) -> List[Document]:
+        opened = self._open_pdf(pdf, name, password)
+        if opened is None:
             return []
+        pdf_reader, doc_name = opened
 
         # Read and chunk
-        return self._pdf_reader_to_documents(pdf_reader, doc_name, use_uuid_for_id=True)
+        return self._pdf_reader_to_documents(
+            pdf_reader, doc_name, use_uuid_for_id=True, pdf_source=pdf, password=password
+        )
 
     async def async_read(
         self,
@@ -416,24 +614,49 @@ class PDFReader(BasePDFReader):
         name: Optional[str] = None,
         password: Optional[str] = None,
     ) -> List[Document]:
-        if pdf is None:
-            log_error("No pdf provided")
+        opened = self._open_pdf(pdf, name, password)
+        if opened is None:
             return []
-        doc_name = self._get_doc_name(pdf, name)
-        log_debug(f"Reading: {doc_name}")
+        pdf_reader, doc_name = opened
 
-        try:
-            pdf_reader = DocumentReader(pdf)
-        except PdfStreamError as e:
-            log_error(f"Error reading PDF: {str(e)}")
-            return []
+        # Read and chunk.
+        return await self._async_pdf_reader_to_documents(
+            pdf_reader, doc_name, use_uuid_for_id=True, pdf_source=pdf, password=password
+        )
 
-        # Handle PDF decryption
-        if not self._decrypt_pdf(pdf_reader, doc_name, password):
-            return []
+    def read_iter(
+        self,
+        pdf: Optional[Union[str, Path, IO[Any]]] = None,
+        name: Optional[str] = None,
+        password: Optional[str] = None,
+    ) -> Iterator[Document]:
+        """Read a PDF and yield its documents, chunking one page at a time.
 
-        # Read and chunk.
-        return await self._async_pdf_reader_to_documents(pdf_reader, doc_name, use_uuid_for_id=True)
+        Page numbers are reconciled across the whole PDF, so all pages are extracted before the first document.
+        """
+        opened = self._open_pdf(pdf, name, password)
+        if opened is None:
+            return
+        pdf_reader, doc_name = opened
+
+        pages, page_number_shift = self._extract_clean_pages(pdf_reader, pdf_source=pdf, password=password)
+        yield from self._iter_documents(pages, doc_name, True, page_number_shift)
+
+    async def async_read_iter(
+        self,
+        pdf: Optional[Union[str, Path, IO[Any]]] = None,
+        name: Optional[str] = None,
+        password: Optional[str] = None,
+    ) -> AsyncIterator[Document]:
+        """Async variant of read_iter. Pages are extracted in a thread."""
+        opened = self._open_pdf(pdf, name, password)
+        if opened is None:
+            return
+        pdf_reader, doc_name = opened
+
+        pages, page_number_shift = await asyncio.to_thread(self._extract_clean_pages, pdf_reader, False, pdf, password)
+        for document in self._iter_documents(pages, doc_name, True, page_number_shift):
+            yield document
 
 
 class PDFImageReader(BasePDFReader):
@@ -458,7 +681,9 @@ class PDFImageReader(BasePDFReader):
             return []
 
         # Read and chunk.
-        return self._pdf_reader_to_documents(pdf_reader, doc_name, read_images=True, use_uuid_for_id=True)
+        return self._pdf_reader_to_documents(
+            pdf_reader, doc_name, read_images=True, use_uuid_for_id=True, pdf_source=pdf, password=password
+        )
 
     async def async_read(
         self, pdf: Union[str, Path, IO[Any]], name: Optional[str] = None, password: Optional[str] = None
@@ -480,4 +705,6 @@ class PDFImageReader(BasePDFReader):
             return []
 
         # Read and chunk.
-        return await self._async_pdf_reader_to_documents(pdf_reader, doc_name, read_images=True, use_uuid_for_id=True)
+        return await self._async_pdf_reader_to_documents(
+            pdf_reader, doc_name, read_images=True, use_uuid_for_id=True, pdf_source=pdf, password=password
+        )
@@ -0,0 +1,265 @@
+"""In-memory embedding index of user memories, used by the "semantic" memory retrieval method."""
+
+import math
+import threading
+from array import array
+from collections import OrderedDict
+from hashlib import sha256
+from operator import mul
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+from agno.db.schemas import UserMemory
+from agno.utils.log import log_debug, log_warning
+
+if TYPE_CHECKING:
+    from agno.knowledge.embedder.base import Embedder
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore[assignment]
+
+
+class MemoryEmbeddingIndex:
+    """Keeps an embedding per user memory, to find the memories most similar to a query.
+
+    Embeddings are keyed by memory id and by a hash of the memory content, so syncing the index with
+    the memories read from the database only embeds the memories that were added or changed since.
+    Vectors are normalized and stored as float32, in numpy arrays when numpy is installed, so similarity
+    is a dot product. Only the embeddings of the max_users most recently searched users are kept.
+    """
+
+    def __init__(self, embedder: "Embedder", max_users: Optional[int] = 1000):
+        """
+        Args:
+            embedder: The embedder used for memories and queries
+            max_users: Maximum number of users whose embeddings are kept. None keeps all users.
+        """
+        self.embedder = embedder
+        self.max_users = max_users
+        # user_id -> memory_id -> (content hash, normalized float32 embedding), least recently used user first
+        self._entries: "OrderedDict[str, Dict[str, Tuple[str, Any]]]" = OrderedDict()
+        # user_id -> (memory ids, matrix of their embeddings), rebuilt after the memories of the user change
+        self._matrices: Dict[str, Tuple[List[str], Any]] = {}
+        # user_id -> version of the memories the index was last synced with
+        self._versions: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_memory_text(memory: UserMemory) -> str:
+        """The text embedded for a memory."""
+        if memory.topics:
+            return f"{memory.memory}\nTopics: {', '.join(memory.topics)}"
+        return memory.memory
+
+    @staticmethod
+    def _hash(text: str) -> str:
+        return sha256(text.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _normalize(vector: Optional[Sequence[float]]) -> Optional[Any]:
+        """Get the normalized float32 vector, or None if the embedding is empty or zero."""
+        if not vector:
+            return None
+        if np is not None:
+            np_vector = np.asarray(vector, dtype=np.float32)
+            np_norm = float(np.linalg.norm(np_vector))
+            return np_vector / np_norm if np_norm else None
+        norm = math.sqrt(sum(v * v for v in vector))
+        if norm == 0:
+            return None
+        return array("f", (v / norm for v in vector))
+
+    def _embed(self, texts: List[str]) -> List[Optional[Any]]:
+        batch_method = getattr(self.embedder, "get_embeddings_batch_and_usage", None)
+        if batch_method is not None and len(texts) > 1:
+            try:
+                embeddings, _ = batch_method(texts)
+                return [self._normalize(e) for e in embeddings]
+            except NotImplementedError:
+                pass
+            except Exception as e:
+                log_warning(f"Error embedding memories in batch, embedding them one by one: {e}")
+        return [self._embed_one(text) for text in texts]
+
+    def _embed_one(self, text: str) -> Optional[Any]:
+        try:
+            embedding = self.embedder.get_embedding(text)
+        except Exception as e:
+            log_warning(f"Error embedding memory: {e}")
+            return None
+        return self._normalize(embedding)
+
+    async def _aembed(self, texts: List[str]) -> List[Optional[Any]]:
+        batch_method = getattr(self.embedder, "async_get_embeddings_batch_and_usage", None)
+        if batch_method is not None and len(texts) > 1:
+            try:
+                embeddings, _ = await batch_method(texts)
+                return [self._normalize(e) for e in embeddings]
+            except NotImplementedError:
+                pass
+            except Exception as e:
+                log_warning(f"Error embedding memories in batch, embedding them one by one: {e}")
+        return [await self._aembed_one(text) for text in texts]
+
+    async def _aembed_one(self, text: str) -> Optional[Any]:
+        try:
+            embedding = await self.embedder.async_get_embedding(text)
+        except Exception as e:
+            log_warning(f"Error embedding memory: {e}")
+            return None
+        return self._normalize(embedding)
+
+    def _get_user_entries(self, user_id: str) -> Dict[str, Tuple[str, Any]]:
+        """Get the entries of a user, marking the user as most recently used. Must hold the lock."""
+        entries = self._entries.get(user_id)
+        if entries is None:
+            entries = self._entries[user_id] = {}
+            if self.max_users is not None:
+                while len(self._entries) > self.max_users:
+                    evicted_user_id, _ = self._entries.popitem(last=False)
+                    self._matrices.pop(evicted_user_id, None)
+                    self._versions.pop(evicted_user_id, None)
+        else:
+            self._entries.move_to_end(user_id)
+        return entries
+
+    def _get_stale(self, user_id: str, memories: List[UserMemory]) -> List[Tuple[UserMemory, str, str]]:
+        """Get the memories whose embedding is missing or outdated, with their text and its hash."""
+        stale = []
+        with self._lock:
+            entries = self._get_user_entries(user_id)
+            for memory in memories:
+                if memory.memory_id is None:
+                    continue
+                text = self.get_memory_text(memory)
+                text_hash = self._hash(text)
+                entry = entries.get(memory.memory_id)
+                if entry is None or entry[0] != text_hash:
+                    stale.append((memory, text, text_hash))
+        return stale
+
+    def _store(self, user_id: str, memory_id: str, text_hash: str, embedding: Optional[Any]) -> None:
+        with self._lock:
+            entries = self._get_user_entries(user_id)
+            if embedding is None:
+                entries.pop(memory_id, None)
+            else:
+                entries[memory_id] = (text_hash, embedding)
+            self._matrices.pop(user_id, None)
+
+    def _prune(self, user_id: str, memories: List[UserMemory]) -> None:
+        """Remove the embeddings of memories that no longer exist."""
+        memory_ids = {m.memory_id for m in memories}
+        with self._lock:
+            entries = self._entries.get(user_id)
+            if not entries:
+                return
+            removed = [memory_id for memory_id in entries if memory_id not in memory_ids]
+            for memory_id in removed:
+                del entries[memory_id]
+            if removed:
+                self._matrices.pop(user_id, None)
+
+    def _set_version(self, user_id: str, version: Any) -> None:
+        with self._lock:
+            if user_id in self._entries and version is not None:
+                self._versions[user_id] = version
+            else:
+                self._versions.pop(user_id, None)
+
+    def is_synced(self, user_id: str, version: Any) -> bool:
+        """Whether the index was last synced with the given version of the memories of a user."""
+        if version is None:
+            return False
+        with self._lock:
+            return user_id in self._entries and self._versions.get(user_id) == version
+
+    def upsert(self, memory: UserMemory) -> None:
+        """Add or update the embedding of a memory."""
+        if memory.memory_id is None or memory.user_id is None:
+            return
+        for _, text, text_hash in self._get_stale(memory.user_id, [memory]):
+            self._store(memory.user_id, memory.memory_id, text_hash, self._embed_one(text))
+
+    def remove(self, user_id: str, memory_id: str) -> None:
+        """Remove the embedding of a memory."""
+        with self._lock:
+            entries = self._entries.get(user_id)
+            if entries is not None and entries.pop(memory_id, None) is not None:
+                self._matrices.pop(user_id, None)
+
+    def clear(self, user_id: Optional[str] = None) -> None:
+        """Remove the embeddings of a user, or of all users."""
+        with self._lock:
+            if user_id is None:
+                self._entries.clear()
+                self._matrices.clear()
+                self._versions.clear()
+            else:
+                self._entries.pop(user_id, None)
+                self._matrices.pop(user_id, None)
+                self._versions.pop(user_id, None)
+
+    def sync(self, user_id: str, memories: List[UserMemory], version: Any = None) -> None:
+        """Make the index match the given memories of a user, only embedding new or changed memories.
+
+        Args:
+            user_id: The user the memories belong to
+            memories: All the memories of the user
+            version: Version of the memories, checked with is_synced before the next sync. Optional.
+        """
+        self._prune(user_id, memories)
+        stale = self._get_stale(user_id, memories)
+        if stale:
+            log_debug(f"Embedding {len(stale)} memories of user {user_id}")
+            embeddings = self._embed([text for _, text, _ in stale])
+            for (memory, _, text_hash), embedding in zip(stale, embeddings):
+                self._store(user_id, memory.memory_id, text_hash, embedding)  # type: ignore[arg-type]
+        self._set_version(user_id, version)
+
+    async def async_sync(self, user_id: str, memories: List[UserMemory], version: Any = None) -> None:
+        """Async version of sync."""
+        self._prune(user_id, memories)
+        stale = self._get_stale(user_id, memories)
+        if stale:
+            log_debug(f"Embedding {len(stale)} memories of user {user_id}")
+            embeddings = await self._aembed([text for _, text, _ in stale])
+            for (memory, _, text_hash), embedding in zip(stale, embeddings):
+                self._store(user_id, memory.memory_id, text_hash, embedding)  # type: ignore[arg-type]
+        self._set_version(user_id, version)
+
+    def _rank(self, user_id: str, query_embedding: Optional[Any], limit: Optional[int]) -> List[str]:
+        if query_embedding is None:
+            return []
+
+        with self._lock:
+            entries = self._entries.get(user_id)
+            if not entries:
+                return []
+            self._entries.move_to_end(user_id)
+
+            if np is not None:
+                matrix = self._matrices.get(user_id)
+                if matrix is None:
+                    memory_ids = list(entries)
+                    matrix = (memory_ids, np.stack([entries[m][1] for m in memory_ids]))
+                    self._matrices[user_id] = matrix
+                memory_ids, vectors = matrix
+                scores = (vectors @ query_embedding).tolist()
+            else:
+                memory_ids = list(entries)
+                scores = [sum(map(mul, entries[m][1], query_embedding)) for m in memory_ids]
+
+        ranked = sorted(zip(scores, memory_ids), key=lambda item: item[0], reverse=True)
+        if limit is not None and limit > 0:
+            ranked = ranked[:limit]
+        return [memory_id for _, memory_id in ranked]
+
+    def search(self, user_id: str, query: str, limit: Optional[int] = None) -> List[str]:
+        """Get the ids of the memories of a user most similar to the query, most similar first."""
+        return self._rank(user_id, self._embed_one(query), limit)
+
+    async def async_search(self, user_id: str, query: str, limit: Optional[int] = None) -> List[str]:
+        """Async version of search."""
+        return self._rank(user_id, await self._aembed_one(query), limit)
@@ -2,13 +2,14 @@ from copy import deepcopy
 from dataclasses import dataclass
 from os import getenv
 from textwrap import dedent
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Literal, Optional, Type, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Literal, Optional, Tuple, Type, Union
 from uuid import uuid4
 
 from pydantic import BaseModel, Field
 
 from agno.db.base import AsyncBaseDb, BaseDb
 from agno.db.schemas import UserMemory
+from agno.memory.index import MemoryEmbeddingIndex
 from agno.memory.strategies import MemoryOptimizationStrategy
 from agno.memory.strategies.types import (
     MemoryOptimizationStrategyFactory,
@@ -30,6 +31,7 @@ from agno.utils.prompts import get_json_output_prompt
 from agno.utils.string import parse_response_model_str
 
 if TYPE_CHECKING:
+    from agno.knowledge.embedder.base import Embedder
     from agno.metrics import RunMetrics
 
 
@@ -72,6 +74,9 @@ class MemoryManager:
     # The database to store memories
     db: Optional[Union[BaseDb, AsyncBaseDb]] = None
 
+    # Embedder used by the "semantic" retrieval method. Defaults to OpenAIEmbedder.
+    embedder: Optional["Embedder"] = None
+
     debug_mode: bool = False
 
     def __init__(
@@ -90,6 +95,7 @@ class MemoryManager:
         name: Optional[str] = None,
         owner_id: Optional[str] = None,
         owner_type: Optional[str] = None,
+        embedder: Optional["Embedder"] = None,
     ):
         self.id = id if id is not None else f"memory_manager_{uuid4().hex[:8]}"
         self.name = name
@@ -105,6 +111,9 @@ class MemoryManager:
         self.add_memories = add_memories
         self.clear_memories = clear_memories
         self.debug_mode = debug_mode
+        self.embedder = embedder
+        # Embeddings of the memories, created on the first semantic search
+        self._memory_index: Optional[MemoryEmbeddingIndex] = None
 
         if self.model is not None:
             self.model = get_model(self.model)
@@ -122,6 +131,16 @@ class MemoryManager:
             self.model = OpenAIChat(id="gpt-4o")
         return self.model
 
+    def get_memory_index(self) -> MemoryEmbeddingIndex:
+        """Get the embedding index used by the "semantic" retrieval method."""
+        if self._memory_index is None:
+            if self.embedder is None:
+                from agno.knowledge.embedder.openai import OpenAIEmbedder
+
+                self.embedder = OpenAIEmbedder()
+            self._memory_index = MemoryEmbeddingIndex(embedder=self.embedder)
+        return self._memory_index
+
     def read_from_db(self, user_id: Optional[str] = None):
         if self.db:
             # If no user_id is provided, read all memories
@@ -244,6 +263,8 @@ class MemoryManager:
                 memory.updated_at = now_epoch_s()
 
             self._upsert_db_memory(memory=memory)
+            if self._memory_index is not None:
+                self._memory_index.upsert(memory)
             return memory.memory_id
 
         else:
@@ -275,6 +296,8 @@ class MemoryManager:
             memory.user_id = user_id
 
             self._upsert_db_memory(memory=memory)
+            if self._memory_index is not None:
+                self._memory_index.upsert(memory)
 
             return memory.memory_id
         else:
@@ -285,6 +308,8 @@ class MemoryManager:
         """Clears the memory."""
         if self.db:
             self.db.clear_memories()
+        if self._memory_index is not None:
+            self._memory_index.clear()
 
     def delete_user_memory(
         self,
@@ -301,6 +326,8 @@ class MemoryManager:
 
         if self.db:
             self._delete_db_memory(memory_id=memory_id, user_id=user_id)
+            if self._memory_index is not None:
+                self._memory_index.remove(user_id, memory_id)
         else:
             log_warning("Memory DB not provided.")
             return None
@@ -339,6 +366,8 @@ class MemoryManager:
             # Delete all memories in a single batch operation
             self.db.delete_user_memories(memory_ids=memory_ids, user_id=user_id)
             log_debug(f"Cleared {len(memory_ids)} memories for user {user_id}")
+            if self._memory_index is not None:
+                self._memory_index.clear(user_id)
 
     async def aclear_user_memories(self, user_id: Optional[str] = None) -> None:
         """Clear all memories for a specific user (async).
@@ -372,6 +401,8 @@ class MemoryManager:
             else:
                 self.db.delete_user_memories(memory_ids=memory_ids, user_id=user_id)
             log_debug(f"Cleared {len(memory_ids)} memories for user {user_id}")
+            if self._memory_index is not None:
+                self._memory_index.clear(user_id)
 
     # -*- Agent Functions
     def create_user_memories(
@@ -598,18 +629,19 @@ class MemoryManager:
         self,
         query: Optional[str] = None,
         limit: Optional[int] = None,
-        retrieval_method: Optional[Literal["last_n", "first_n", "agentic"]] = None,
+        retrieval_method: Optional[Literal["last_n", "first_n", "agentic", "semantic"]] = None,
         user_id: Optional[str] = None,
     ) -> List[UserMemory]:
         """Search through user memories using the specified retrieval method.
 
         Args:
-            query: The search query for agentic search. Required if retrieval_method is "agentic".
+            query: The search query. Required if retrieval_method is "agentic" or "semantic".
             limit: Maximum number of memories to return. Defaults to self.retrieval_limit if not specified. Optional.
             retrieval_method: The method to use for retrieving memories. Defaults to self.retrieval if not specified.
                 - "last_n": Return the most recent memories
                 - "first_n": Return the oldest memories
                 - "agentic": Return memories most similar to the query, but using an agentic approach
+                - "semantic": Return memories most similar to the query, by embedding similarity
             user_id: The user to search for. Optional.
 
         Returns:
@@ -621,6 +653,13 @@ class MemoryManager:
 
         self.set_log_level()
 
+        # The semantic search only reads all the memories of the user when they changed since the last search
+        if retrieval_method == "semantic":
+            if not query:
+                raise ValueError("Query is required for semantic search")
+
+            return self._search_user_memories_semantic(user_id=user_id, query=query, limit=limit)
+
         memories = self.read_from_db(user_id=user_id)
         if memories is None:
             memories = {}
@@ -646,6 +685,52 @@ class MemoryManager:
         else:  # Default to last_n
             return self._get_last_n_memories(user_id=user_id, limit=limit)
 
+    async def asearch_user_memories(
+        self,
+        query: Optional[str] = None,
+        limit: Optional[int] = None,
+        retrieval_method: Optional[Literal["last_n", "first_n", "agentic", "semantic"]] = None,
+        user_id: Optional[str] = None,
+    ) -> List[UserMemory]:
+        """Search through user memories using the specified retrieval method (async version).
+
+        Args:
+            query: The search query. Required if retrieval_method is "agentic" or "semantic".
+            limit: Maximum number of memories to return. Optional.
+            retrieval_method: The method to use for retrieving memories, see search_user_memories.
+            user_id: The user to search for. Optional.
+
+        Returns:
+            A list of UserMemory objects matching the search criteria.
+        """
+        if user_id is None:
+            user_id = "default"
+
+        self.set_log_level()
+
+        if retrieval_method == "semantic":
+            if not query:
+                raise ValueError("Query is required for semantic search")
+
+            return await self._asearch_user_memories_semantic(user_id=user_id, query=query, limit=limit)
+
+        memories = await self.aread_from_db(user_id=user_id)
+        user_memories: List[UserMemory] = (memories or {}).get(user_id, [])
+        if not user_memories:
+            return []
+
+        if retrieval_method == "agentic":
+            if not query:
+                raise ValueError("Query is required for agentic search")
+
+            return await self._asearch_user_memories_agentic(user_memories=user_memories, query=query, limit=limit)
+
+        elif retrieval_method == "first_n":
+            return self._sort_first_n_memories(user_memories, limit=limit)
+
+        else:  # Default to last_n
+            return self._sort_last_n_memories(user_memories, limit=limit)
+
     def _get_response_format(self) -> Union[Dict[str, Any], Type[BaseModel]]:
         model = self.get_model()
         if model.supports_native_structured_outputs:
@@ -662,23 +747,10 @@ class MemoryManager:
         else:
             return {"type": "json_object"}
 
-    def _search_user_memories_agentic(self, user_id: str, query: str, limit: Optional[int] = None) -> List[UserMemory]:
-        """Search through user memories using agentic search."""
-        memories = self.read_from_db(user_id=user_id)
-        if memories is None:
-            memories = {}
-
-        if not memories:
-            return []
-
-        model = self.get_model()
-
-        response_format = self._get_response_format()
-
-        log_debug("Searching for memories", center=True)
-
-        # Get all memories as a list
-        user_memories: List[UserMemory] = memories[user_id]
+    def _get_agentic_search_messages(
+        self, user_memories: List[UserMemory], query: str, response_format: Union[Dict[str, Any], Type[BaseModel]]
+    ) -> List[Message]:
+        """Get the messages asking the model for the memories related to the query."""
         system_message_str = "Your task is to search through user memories and return the IDs of the memories that are related to the query.\n"
         system_message_str += "\n<user_memories>\n"
         for memory in user_memories:
@@ -694,7 +766,7 @@ class MemoryManager:
         if response_format == {"type": "json_object"}:
             system_message_str += "\n" + get_json_output_prompt(MemorySearchResponse)  # type: ignore
 
-        messages_for_model = [
+        return [
             Message(role="system", content=system_message_str),
             Message(
                 role="user",
@@ -702,10 +774,10 @@ class MemoryManager:
             ),
         ]
 
-        # Generate a response from the Model (includes running function calls)
-        response = model.response(messages=messages_for_model, response_format=response_format)
-        log_debug("Search for memories complete", center=True)
-
+    def _get_agentic_search_results(
+        self, model: Model, response: Any, user_memories: List[UserMemory], limit: Optional[int] = None
+    ) -> List[UserMemory]:
+        """Get the memories whose IDs the model returned."""
         memory_search: Optional[MemorySearchResponse] = None
         # If the model natively supports structured outputs, the parsed value is already in the structured format
         if (
@@ -736,6 +808,179 @@ class MemoryManager:
                         memories_to_return.append(memory)
         return memories_to_return[:limit]
 
+    def _search_user_memories_agentic(self, user_id: str, query: str, limit: Optional[int] = None) -> List[UserMemory]:
+        """Search through user memories using agentic search."""
+        memories = self.read_from_db(user_id=user_id)
+        if memories is None:
+            memories = {}
+
+        if not memories:
+            return []
+
+        model = self.get_model()
+
+        response_format = self._get_response_format()
+
+        log_debug("Searching for memories", center=True)
+
+        # Get all memories as a list
+        user_memories: List[UserMemory] = memories[user_id]
+        messages_for_model = self._get_agentic_search_messages(user_memories, query, response_format)
+
+        # Generate a response from the Model (includes running function calls)
+        response = model.response(messages=messages_for_model, response_format=response_format)
+        log_debug("Search for memories complete", center=True)
+
+        return self._get_agentic_search_results(model, response, user_memories, limit=limit)
+
+    async def _asearch_user_memories_agentic(
+        self, user_memories: List[UserMemory], query: str, limit: Optional[int] = None
+    ) -> List[UserMemory]:
+        """Search through the given user memories using agentic search (async version)."""
+        model = self.get_model()
+
+        response_format = self._get_response_format()
+
+        log_debug("Searching for memories", center=True)
+
+        messages_for_model = self._get_agentic_search_messages(user_memories, query, response_format)
+
+        # Generate a response from the Model (includes running function calls)
+        response = await model.aresponse(messages=messages_for_model, response_format=response_format)
+        log_debug("Search for memories complete", center=True)
+
+        return self._get_agentic_search_results(model, response, user_memories, limit=limit)
+
+    @staticmethod
+    def _get_memories_version(result: Any) -> Optional[Tuple[int, Any]]:
+        """Get the number of memories and the latest update time from the result of a get_user_memories call.
+
+        The semantic search only reads all the memories of a user again when this version changed.
+        """
+        if not isinstance(result, tuple) or len(result) != 2:
+            return None
+        rows, total_count = result
+        latest_updated_at = rows[0].get("updated_at") if rows and isinstance(rows[0], dict) else None
+        return total_count, latest_updated_at
+
+    def _get_user_memories_version(self, user_id: str) -> Optional[Tuple[int, Any]]:
+        """Get the version of the memories of a user, or None if the db can't provide it."""
+        try:
+            result = self.db.get_user_memories(  # type: ignore[union-attr]
+                user_id=user_id, limit=1, sort_by="updated_at", sort_order="desc", deserialize=False
+            )
+        except Exception as e:
+            log_debug(f"Could not get the version of the memories of user {user_id}: {e}")
+            return None
+        return self._get_memories_version(result)
+
+    async def _aget_user_memories_version(self, user_id: str) -> Optional[Tuple[int, Any]]:
+        """Get the version of the memories of a user, or None if the db can't provide it (async version)."""
+        try:
+            if isinstance(self.db, AsyncBaseDb):
+                result = await self.db.get_user_memories(
+                    user_id=user_id, limit=1, sort_by="updated_at", sort_order="desc", deserialize=False
+                )
+            else:
+                result = self.db.get_user_memories(  # type: ignore[union-attr]
+                    user_id=user_id, limit=1, sort_by="updated_at", sort_order="desc", deserialize=False
+                )
+        except Exception as e:
+            log_debug(f"Could not get the version of the memories of user {user_id}: {e}")
+            return None
+        return self._get_memories_version(result)
+
+    def _search_user_memories_semantic(self, user_id: str, query: str, limit: Optional[int] = None) -> List[UserMemory]:
+        """Search through user memories by embedding similarity with the query."""
+        if not self.db:
+            return []
+
+        memory_index = self.get_memory_index()
+        version = self._get_user_memories_version(user_id)
+        if limit is not None and limit > 0 and memory_index.is_synced(user_id, version):
+            # The memories didn't change since the last search, only read the ones to return
+            memory_ids = memory_index.search(user_id, query, limit=limit)
+            found = [
+                self.db.get_user_memory(memory_id=memory_id, user_id=user_id)  # type: ignore[union-attr]
+                for memory_id in memory_ids
+            ]
+            return [memory for memory in found if isinstance(memory, UserMemory)]
+
+        memories = self.read_from_db(user_id=user_id)
+        user_memories: List[UserMemory] = (memories or {}).get(user_id, [])
+        if not user_memories:
+            return []
+
+        # Only embeds the memories added or changed since the last search
+        memory_index.sync(user_id, user_memories, version=version)
+        memory_ids = memory_index.search(user_id, query, limit=limit)
+
+        memories_by_id = {memory.memory_id: memory for memory in user_memories}
+        return [memories_by_id[memory_id] for memory_id in memory_ids if memory_id in memories_by_id]
+
+    async def _asearch_user_memories_semantic(
+        self, user_id: str, query: str, limit: Optional[int] = None
+    ) -> List[UserMemory]:
+        """Search through user memories by embedding similarity with the query (async version)."""
+        if not self.db:
+            return []
+
+        memory_index = self.get_memory_index()
+        version = await self._aget_user_memories_version(user_id)
+        if limit is not None and limit > 0 and memory_index.is_synced(user_id, version):
+            # The memories didn't change since the last search, only read the ones to return
+            memory_ids = await memory_index.async_search(user_id, query, limit=limit)
+            found = []
+            for memory_id in memory_ids:
+                if isinstance(self.db, AsyncBaseDb):
+                    found.append(await self.db.get_user_memory(memory_id=memory_id, user_id=user_id))
+                else:
+                    found.append(self.db.get_user_memory(memory_id=memory_id, user_id=user_id))
+            return [memory for memory in found if isinstance(memory, UserMemory)]
+
+        memories = await self.aread_from_db(user_id=user_id)
+        user_memories: List[UserMemory] = (memories or {}).get(user_id, [])
+        if not user_memories:
+            return []
+
+        # Only embeds the memories added or changed since the last search
+        await memory_index.async_sync(user_id, user_memories, version=version)
+        memory_ids = await memory_index.async_search(user_id, query, limit=limit)
+
+        memories_by_id = {memory.memory_id: memory for memory in user_memories}
+        return [memories_by_id[memory_id] for memory_id in memory_ids if memory_id in memories_by_id]
+
+    @staticmethod
+    def _sort_last_n_memories(memories_list: List[UserMemory], limit: Optional[int] = None) -> List[UserMemory]:
+        """Sort memories oldest first and keep the most recent ones."""
+        # Sort memories by updated_at timestamp (newest first)
+        # If updated_at is None, place at the beginning of the list
+        sorted_memories_list = sorted(
+            memories_list,
+            key=lambda m: m.updated_at if m.updated_at is not None else 0,
+        )
+
+        if limit is not None and limit > 0:
+            sorted_memories_list = sorted_memories_list[-limit:]
+
+        return sorted_memories_list
+
+    @staticmethod
+    def _sort_first_n_memories(memories_list: List[UserMemory], limit: Optional[int] = None) -> List[UserMemory]:
+        """Sort memories oldest first and keep the oldest ones."""
+        MAX_UNIX_TS = 2**63 - 1
+        # Sort memories by updated_at timestamp (oldest first)
+        # If updated_at is None, place at the end of the list
+        sorted_memories_list = sorted(
+            memories_list,
+            key=lambda m: m.updated_at if m.updated_at is not None else MAX_UNIX_TS,
+        )
+
+        if limit is not None and limit > 0:
+            sorted_memories_list = sorted_memories_list[:limit]
+
+        return sorted_memories_list
+
     def _get_last_n_memories(self, user_id: str, limit: Optional[int] = None) -> List[UserMemory]:
         """Get the most recent user memories.
 
@@ -749,23 +994,7 @@ class MemoryManager:
         if memories is None:
             memories = {}
 
-        memories_list = memories.get(user_id, [])
-
-        # Sort memories by updated_at timestamp if available
-        if memories_list:
-            # Sort memories by updated_at timestamp (newest first)
-            # If updated_at is None, place at the beginning of the list
-            sorted_memories_list = sorted(
-                memories_list,
-                key=lambda m: m.updated_at if m.updated_at is not None else 0,
-            )
-        else:
-            sorted_memories_list = []
-
-        if limit is not None and limit > 0:
-            sorted_memories_list = sorted_memories_list[-limit:]
-
-        return sorted_memories_list
+        return self._sort_last_n_memories(memories.get(user_id, []), limit=limit)
 
     def _get_first_n_memories(self, user_id: str, limit: Optional[int] = None) -> List[UserMemory]:
         """Get the oldest user memories.
@@ -780,24 +1009,7 @@ class MemoryManager:
         if memories is None:
             memories = {}
 
-        MAX_UNIX_TS = 2**63 - 1
-        memories_list = memories.get(user_id, [])
-        # Sort memories by updated_at timestamp if available
-        if memories_list:
-            # Sort memories by updated_at timestamp (oldest first)
-            # If updated_at is None, place at the end of the list
-            sorted_memories_list = sorted(
-                memories_list,
-                key=lambda m: m.updated_at if m.updated_at is not None else MAX_UNIX_TS,
-            )
-
-        else:
-            sorted_memories_list = []
-
-        if limit is not None and limit > 0:
-            sorted_memories_list = sorted_memories_list[:limit]
-
-        return sorted_memories_list
+        return self._sort_first_n_memories(memories.get(user_id, []), limit=limit)
 
     def optimize_memories(
         self,
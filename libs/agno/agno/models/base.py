@@ -2,6 +2,8 @@ import asyncio
 import collections.abc
 import json
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextvars import copy_context
 from dataclasses import dataclass, field
 from hashlib import md5
 from pathlib import Path
@@ -40,6 +42,7 @@ from agno.exceptions import (
 )
 from agno.media import Audio, File, Image, Video
 from agno.metrics import MessageMetrics, ModelType, ToolCallMetrics
+from agno.models.cache import ResponseCacheStore, get_default_response_cache
 from agno.models.message import Citations, Message
 from agno.models.response import ModelResponse, ModelResponseEvent, ToolExecution
 from agno.run.agent import CustomEvent, RunContentEvent, RunOutput, RunOutputEvent
@@ -168,6 +171,8 @@ class Model(ABC):
     cache_response: bool = False
     cache_ttl: Optional[int] = None
     cache_dir: Optional[str] = None
+    # Store for the cached responses. Defaults to one JSON file per response in cache_dir.
+    cache_store: Optional[ResponseCacheStore] = None
 
     # Retry configuration for model provider errors
     # Number of retries to attempt when a ModelProviderError occurs
@@ -182,6 +187,11 @@ class Model(ABC):
     # Set the number of times to retry the model invocation with guidance.
     retry_with_guidance_limit: int = 1
 
+    # Number of threads used to run the tool calls of a model response in parallel in sync runs.
+    # None runs them one at a time. Async runs always run them concurrently.
+    # Tools run this way must be thread-safe, including any changes they make to the session state.
+    max_tool_call_workers: Optional[int] = None
+
     def __post_init__(self):
         if self.provider is None and self.name is not None:
             self.provider = f"{self.name} ({self.id})"
@@ -478,55 +488,44 @@ class Model(ABC):
         cache_str = json.dumps(cache_data, sort_keys=True, default=_cache_default)
         return md5(cache_str.encode()).hexdigest()
 
-    def _get_model_cache_file_path(self, cache_key: str) -> Path:
-        """Get the file path for a cache key."""
+    def _get_model_cache_dir(self) -> Path:
+        """Get the directory of the default response cache store."""
         if self.cache_dir:
-            cache_dir = Path(self.cache_dir)
-        else:
-            cache_dir = Path.home() / ".agno" / "cache" / "model_responses"
+            return Path(self.cache_dir)
+        return Path.home() / ".agno" / "cache" / "model_responses"
+
+    def _get_model_cache_file_path(self, cache_key: str) -> Path:
+        """Get the file path for a cache key in the default response cache store."""
+        return get_default_response_cache(self._get_model_cache_dir()).get_path(cache_key)
 
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        return cache_dir / f"{cache_key}.json"
+    def _get_model_cache_store(self) -> ResponseCacheStore:
+        """Get the response cache store, or the default store of the cache directory if none is set."""
+        if self.cache_store is not None:
+            return self.cache_store
+        return get_default_response_cache(self._get_model_cache_dir())
 
     def _get_cached_model_response(self, cache_key: str) -> Optional[Dict[str, Any]]:
         """Retrieve a cached response if it exists and is not expired."""
-        cache_file = self._get_model_cache_file_path(cache_key)
-
-        if not cache_file.exists():
-            return None
-
         try:
-            with open(cache_file, "r", encoding="utf-8") as f:
-                cached_data = json.load(f)
-
-            # Check TTL if set (None means no expiration)
-            if self.cache_ttl is not None:
-                if time() - cached_data["timestamp"] > self.cache_ttl:
-                    return None
-
-            return cached_data
-        except Exception:
+            return self._get_model_cache_store().get(cache_key, ttl=self.cache_ttl)
+        except Exception as e:
+            log_warning(f"Error reading model response cache: {e}")
             return None
 
     def _save_model_response_to_cache(self, cache_key: str, result: ModelResponse, is_streaming: bool = False) -> None:
         """Save a model response to cache."""
         try:
-            cache_file = self._get_model_cache_file_path(cache_key)
-
             cache_data = {
                 "timestamp": int(time()),
                 "is_streaming": is_streaming,
                 "result": result.to_dict(),
             }
-            with open(cache_file, "w", encoding="utf-8") as f:
-                json.dump(cache_data, f)
+            self._get_model_cache_store().set(cache_key, cache_data)
         except Exception:
             pass
 
     def _save_streaming_responses_to_cache(self, cache_key: str, responses: List[ModelResponse]) -> None:
         """Save streaming responses to cache."""
-        cache_file = self._get_model_cache_file_path(cache_key)
-
         cache_data = {
             "timestamp": int(time()),
             "is_streaming": True,
@@ -534,8 +533,7 @@ class Model(ABC):
         }
 
         try:
-            with open(cache_file, "w", encoding="utf-8") as f:
-                json.dump(cache_data, f)
+            self._get_model_cache_store().set(cache_key, cache_data)
         except Exception:
             pass
 
@@ -2130,17 +2128,8 @@ class Model(ABC):
             tool_call_error=True,
         )
 
-    def run_function_call(
-        self,
-        function_call: FunctionCall,
-        function_call_results: List[Message],
-        additional_input: Optional[List[Message]] = None,
-    ) -> Iterator[Union[ModelResponse, RunOutputEvent, TeamRunOutputEvent]]:
-        # Start function call
-        function_call_timer = Timer()
-        function_call_timer.start()
-        # Yield a tool_call_started event
-        yield ModelResponse(
+    def _get_tool_call_started_response(self, function_call: FunctionCall) -> ModelResponse:
+        return ModelResponse(
             content=function_call.get_call_str(),
             tool_executions=[
                 ToolExecution(
@@ -2152,6 +2141,20 @@ class Model(ABC):
             event=ModelResponseEvent.tool_call_started.value,
         )
 
+    def run_function_call(
+        self,
+        function_call: FunctionCall,
+        function_call_results: List[Message],
+        additional_input: Optional[List[Message]] = None,
+        yield_tool_call_started: bool = True,
+    ) -> Iterator[Union[ModelResponse, RunOutputEvent, TeamRunOutputEvent]]:
+        # Start function call
+        function_call_timer = Timer()
+        function_call_timer.start()
+        # Yield a tool_call_started event, unless the caller already did
+        if yield_tool_call_started:
+            yield self._get_tool_call_started_response(function_call)
+
         # Run function calls sequentially
         function_execution_result: FunctionExecutionResult = FunctionExecutionResult(status="failure")
         stop_after_tool_call_from_exception = False
@@ -2322,6 +2325,12 @@ class Model(ABC):
         if additional_input is None:
             additional_input = []
 
+        # When running in parallel, function calls are collected and run once all of them were checked
+        run_in_parallel = self.max_tool_call_workers is not None and self.max_tool_call_workers > 1
+        function_calls_to_run: List[FunctionCall] = []
+        # Calls over the limit always come after the calls that ran, so their results are added after them
+        limit_error_results: List[Message] = []
+
         for fc in function_calls:
             if function_call_limit is not None:
                 current_function_call_count += 1
@@ -2331,7 +2340,7 @@ class Model(ABC):
                         f"Tool call limit ({function_call_limit}) reached. "
                         f"Skipping: {fc.function.name} (call #{current_function_call_count})"
                     )
-                    function_call_results.append(self.create_tool_call_limit_error_result(fc))
+                    limit_error_results.append(self.create_tool_call_limit_error_result(fc))
                     continue
 
             paused_tool_executions = []
@@ -2457,14 +2466,81 @@ class Model(ABC):
                 # We don't execute the function calls here
                 continue
 
+            if run_in_parallel:
+                function_calls_to_run.append(fc)
+                continue
+
             yield from self.run_function_call(
                 function_call=fc, function_call_results=function_call_results, additional_input=additional_input
             )
 
+        if function_calls_to_run:
+            yield from self.run_function_calls_in_threads(
+                function_calls=function_calls_to_run,
+                function_call_results=function_call_results,
+                additional_input=additional_input,
+            )
+        function_call_results.extend(limit_error_results)
+
         # Add any additional messages at the end
         if additional_input:
             function_call_results.extend(additional_input)
 
+    def run_function_calls_in_threads(
+        self,
+        function_calls: List[FunctionCall],
+        function_call_results: List[Message],
+        additional_input: Optional[List[Message]] = None,
+    ) -> Iterator[Union[ModelResponse, RunOutputEvent, TeamRunOutputEvent]]:
+        """Run function calls in a thread pool of max_tool_call_workers threads.
+
+        The tool_call_started events of all function calls are yielded before they run. The other events of
+        each function call are yielded as soon as it completes, and the results are added in the original
+        order of the function calls.
+        """
+        if len(function_calls) == 1:
+            yield from self.run_function_call(
+                function_call=function_calls[0],
+                function_call_results=function_call_results,
+                additional_input=additional_input,
+            )
+            return
+
+        def _run_function_call(
+            function_call: FunctionCall,
+        ) -> Tuple[List[Union[ModelResponse, RunOutputEvent, TeamRunOutputEvent]], List[Message]]:
+            results: List[Message] = []
+            events = list(
+                self.run_function_call(
+                    function_call=function_call,
+                    function_call_results=results,
+                    additional_input=additional_input,
+                    yield_tool_call_started=False,
+                )
+            )
+            return events, results
+
+        for fc in function_calls:
+            yield self._get_tool_call_started_response(fc)
+
+        max_workers = min(self.max_tool_call_workers or 1, len(function_calls))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="agno-tools") as executor:
+            # Use copy_context().run to propagate context variables to the worker threads
+            futures = [executor.submit(copy_context().run, _run_function_call, fc) for fc in function_calls]
+            results_by_future: Dict[Future, List[Message]] = {}
+            try:
+                for future in as_completed(futures):
+                    events, results = future.result()
+                    yield from events
+                    results_by_future[future] = results
+            except BaseException:
+                # Don't start the function calls that are still queued
+                for future in futures:
+                    future.cancel()
+                raise
+            for future in futures:
+                function_call_results.extend(results_by_future[future])
+
     async def arun_function_call(
         self,
         function_call: FunctionCall,
@@ -0,0 +1,407 @@
+"""Stores for cached model responses.
+
+A store maps a cache key to a JSON-serializable dictionary holding a "timestamp" and the cached response(s).
+Entries older than the TTL are treated as missing and removed. All stores count hits, misses and bytes read and
+written. Use them with `Model(cache_response=True, cache_store=...)`.
+"""
+
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from time import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from agno.utils.log import log_debug, log_warning
+
+# Size bound of the default store, shared by all models using the same cache directory
+DEFAULT_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+
+_default_stores: Dict[Path, "DirectoryResponseCache"] = {}
+_default_stores_lock = threading.Lock()
+
+
+class ResponseCacheStore:
+    """Base class for model response cache stores.
+
+    Subclasses implement _read, _write, _delete and clear on serialized entries.
+    """
+
+    def __init__(self, ttl: Optional[int] = None):
+        """
+        Args:
+            ttl (Optional[int]): Default time to live of the entries, in seconds. None means entries don't expire.
+        """
+        self.ttl = ttl
+
+        self.hits = 0
+        self.misses = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self._stats_lock = threading.Lock()
+
+    def _read(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    def _write(self, key: str, value: bytes, timestamp: float) -> None:
+        raise NotImplementedError
+
+    def _delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def _is_expired(self, timestamp: float, ttl: Optional[int]) -> bool:
+        return ttl is not None and time() - timestamp > ttl
+
+    def get(self, key: str, ttl: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """Get the entry for the key, or None if it doesn't exist or is older than the TTL.
+
+        Args:
+            key (str): The cache key.
+            ttl (Optional[int]): Time to live to check the entry against. Defaults to the TTL of the store.
+        """
+        value = self._read(key)
+        data: Optional[Dict[str, Any]] = None
+        if value is not None:
+            try:
+                data = json.loads(value)
+            except ValueError:
+                log_warning(f"Removing unreadable model response cache entry: {key}")
+                self._delete(key)
+            else:
+                if self._is_expired(data.get("timestamp", 0), ttl if ttl is not None else self.ttl):  # type: ignore
+                    self._delete(key)
+                    data = None
+
+        with self._stats_lock:
+            if data is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.bytes_read += len(value)  # type: ignore
+        return data
+
+    def set(self, key: str, data: Dict[str, Any]) -> None:
+        """Store the entry for the key. The entry must have a "timestamp" key."""
+        value = json.dumps(data).encode("utf-8")
+        self._write(key, value, data.get("timestamp", time()))
+        with self._stats_lock:
+            self.bytes_written += len(value)
+
+    def get_stats(self) -> Dict[str, Union[int, float]]:
+        """Get the hit, miss and byte counters of this store."""
+        with self._stats_lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "bytes_read": self.bytes_read,
+                "bytes_written": self.bytes_written,
+            }
+
+    def __deepcopy__(self, memo):
+        # Copies of a model share its cache
+        return self
+
+
+class InMemoryResponseCache(ResponseCacheStore):
+    """Cache for the current process that evicts the least recently used entries."""
+
+    def __init__(self, max_entries: Optional[int] = 1000, max_bytes: Optional[int] = None, ttl: Optional[int] = None):
+        """
+        Args:
+            max_entries (Optional[int]): Maximum number of entries to keep.
+            max_bytes (Optional[int]): Maximum total size of the serialized entries to keep.
+            ttl (Optional[int]): Default time to live of the entries, in seconds.
+        """
+        super().__init__(ttl=ttl)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def _read(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def _write(self, key: str, value: bytes, timestamp: float) -> None:
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[key] = value
+            self._size += len(value)
+
+            while self._entries and (
+                (self.max_entries is not None and len(self._entries) > self.max_entries)
+                or (self.max_bytes is not None and self._size > self.max_bytes)
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def _delete(self, key: str) -> None:
+        with self._lock:
+            value = self._entries.pop(key, None)
+            if value is not None:
+                self._size -= len(value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+class SqliteResponseCache(ResponseCacheStore):
+    """Cache in a SQLite file, which can be shared by several processes.
+
+    Once the total size of the entries exceeds max_bytes, expired entries and then the least recently used
+    entries are removed.
+    """
+
+    def __init__(
+        self,
+        db_file: Union[str, Path],
+        table_name: str = "agno_model_responses",
+        max_bytes: Optional[int] = None,
+        ttl: Optional[int] = None,
+    ):
+        """
+        Args:
+            db_file (Union[str, Path]): Path to the SQLite file.
+            table_name (str): Name of the table holding the entries.
+            max_bytes (Optional[int]): Maximum total size of the entries to keep.
+            ttl (Optional[int]): Default time to live of the entries, in seconds.
+        """
+        super().__init__(ttl=ttl)
+        self.db_file = Path(db_file)
+        self.table_name = table_name
+        self.max_bytes = max_bytes
+
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # Other processes may hold the write lock, wait for it instead of failing
+        self._conn = sqlite3.connect(str(self.db_file), timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table_name} "
+            "(key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, "
+            "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{self.table_name}_accessed_at ON {self.table_name} (accessed_at)"
+        )
+
+    def _read(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._conn.execute(f"SELECT value FROM {self.table_name} WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            if self.max_bytes is not None:
+                self._conn.execute(f"UPDATE {self.table_name} SET accessed_at = ? WHERE key = ?", (time(), key))
+            return row[0]
+
+    def _write(self, key: str, value: bytes, timestamp: float) -> None:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    f"INSERT OR REPLACE INTO {self.table_name} (key, value, size, created_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, value, len(value), timestamp, time()),
+                )
+                if self.max_bytes is not None:
+                    self._evict()
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _evict(self) -> None:
+        total_size = self._conn.execute(f"SELECT COALESCE(SUM(size), 0) FROM {self.table_name}").fetchone()[0]
+        if total_size <= self.max_bytes:  # type: ignore
+            return
+
+        if self.ttl is not None:
+            self._conn.execute(f"DELETE FROM {self.table_name} WHERE created_at < ?", (time() - self.ttl,))
+            total_size = self._conn.execute(f"SELECT COALESCE(SUM(size), 0) FROM {self.table_name}").fetchone()[0]
+
+        excess = total_size - self.max_bytes  # type: ignore
+        if excess <= 0:
+            return
+        keys_to_delete: List[Tuple[str]] = []
+        for key, size in self._conn.execute(f"SELECT key, size FROM {self.table_name} ORDER BY accessed_at"):
+            if excess <= 0:
+                break
+            keys_to_delete.append((key,))
+            excess -= size
+        self._conn.executemany(f"DELETE FROM {self.table_name} WHERE key = ?", keys_to_delete)
+        log_debug(f"Evicted {len(keys_to_delete)} model response cache entries")
+
+    def _delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute(f"DELETE FROM {self.table_name} WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute(f"DELETE FROM {self.table_name}")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class DirectoryResponseCache(ResponseCacheStore):
+    """Cache with one JSON file per entry, spread over sharded subdirectories.
+
+    With shard_depth=2, the entry for key "abcdef..." is stored in "ab/cd/abcdef....json". Files are written
+    atomically, so several processes can share the directory. Once the total size of the files exceeds max_bytes,
+    expired files and then the least recently used files are removed.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path],
+        shard_depth: int = 2,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[int] = None,
+        prune_interval_bytes: int = 1024 * 1024,
+    ):
+        """
+        Args:
+            cache_dir (Union[str, Path]): Root directory of the cache.
+            shard_depth (int): Number of levels of subdirectories, each named after the next 2 characters of the key.
+            max_bytes (Optional[int]): Maximum total size of the files to keep.
+            ttl (Optional[int]): Default time to live of the entries, in seconds.
+            prune_interval_bytes (int): Number of bytes to write between two checks of the total size.
+        """
+        super().__init__(ttl=ttl)
+        self.cache_dir = Path(cache_dir)
+        self.shard_depth = shard_depth
+        self.max_bytes = max_bytes
+        self.prune_interval_bytes = prune_interval_bytes
+
+        # Start with a check, as other processes may have filled the directory
+        self._bytes_since_prune = prune_interval_bytes
+        self._lock = threading.Lock()
+
+    def get_path(self, key: str) -> Path:
+        """Get the path of the file holding the entry for the key."""
+        shards = [key[i * 2 : i * 2 + 2] for i in range(self.shard_depth)]
+        return self.cache_dir.joinpath(*shards, f"{key}.json")
+
+    def _read(self, key: str) -> Optional[bytes]:
+        path = self.get_path(key)
+        try:
+            value = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        if self.max_bytes is not None:
+            # The modification time orders the files for eviction
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+        return value
+
+    def _write(self, key: str, value: bytes, timestamp: float) -> None:
+        path = self.get_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{key}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(value)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        if self.max_bytes is not None:
+            with self._lock:
+                self._bytes_since_prune += len(value)
+                should_prune = self._bytes_since_prune >= self.prune_interval_bytes
+                if should_prune:
+                    self._bytes_since_prune = 0
+            if should_prune:
+                self.prune()
+
+    def _delete(self, key: str) -> None:
+        try:
+            os.remove(self.get_path(key))
+        except FileNotFoundError:
+            pass
+
+    def _iter_files(self) -> Iterator[os.DirEntry]:
+        dirs = [self.cache_dir]
+        while dirs:
+            try:
+                entries = list(os.scandir(dirs.pop()))
+            except FileNotFoundError:
+                continue
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    dirs.append(Path(entry.path))
+                elif entry.name.endswith(".json"):
+                    yield entry
+
+    def prune(self) -> None:
+        """Remove expired files, then the least recently used files until the cache is below max_bytes."""
+        files: List[Tuple[float, int, str]] = []
+        for entry in self._iter_files():
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total_size = sum(size for _, size, _ in files)
+        if self.max_bytes is None or total_size <= self.max_bytes:
+            return
+
+        # Files are touched when written or read, so a file not modified within the TTL is expired
+        files.sort()
+        expired_before = time() - self.ttl if self.ttl is not None else None
+        removed = 0
+        for mtime, size, path in files:
+            if total_size <= self.max_bytes and (expired_before is None or mtime >= expired_before):
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total_size -= size
+            removed += 1
+        log_debug(f"Evicted {removed} model response cache files")
+
+    def clear(self) -> None:
+        for entry in self._iter_files():
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                pass
+
+
+def get_default_response_cache(cache_dir: Union[str, Path]) -> DirectoryResponseCache:
+    """Get the default store for a cache directory, shared by all models using that directory.
+
+    The store keeps at most DEFAULT_CACHE_MAX_BYTES of responses. It is not sharded, so responses cached by
+    earlier versions are still found.
+    """
+    path = Path(os.path.abspath(Path(cache_dir).expanduser()))
+    with _default_stores_lock:
+        store = _default_stores.get(path)
+        if store is None:
+            store = DirectoryResponseCache(cache_dir=path, shard_depth=0, max_bytes=DEFAULT_CACHE_MAX_BYTES)
+            _default_stores[path] = store
+        return store
@@ -42,7 +42,9 @@ from agno.os.config import (
     TracesConfig,
     TracesDomainConfig,
 )
+from agno.os.event_log import EventLog
 from agno.os.interfaces.base import BaseInterface
+from agno.os.managers import event_buffer
 from agno.os.router import get_base_router, get_info_router, get_websocket_router
 from agno.os.routers.agents import get_agent_router
 from agno.os.routers.approvals import get_approval_router
@@ -148,7 +150,7 @@ async def db_lifespan(app: FastAPI, agent_os: "AgentOS"):
 @asynccontextmanager
 async def scheduler_lifespan(app: FastAPI, agent_os: "AgentOS"):
     """Start and stop the scheduler poller."""
-    from agno.scheduler import ScheduleExecutor, SchedulePoller
+    from agno.scheduler import InProcessScheduleExecutor, ScheduleExecutor, SchedulePoller
 
     if agent_os._scheduler_base_url is None:
         log_info(
@@ -160,14 +162,23 @@ async def scheduler_lifespan(app: FastAPI, agent_os: "AgentOS"):
     if internal_token is None:
         raise ValueError("internal_service_token must be set when scheduler is enabled")
 
-    executor = ScheduleExecutor(
-        base_url=base_url,
-        internal_service_token=internal_token,
-    )
+    executor: ScheduleExecutor
+    if agent_os._scheduler_in_process:
+        executor = InProcessScheduleExecutor(
+            agent_os=agent_os,
+            base_url=base_url,
+            internal_service_token=internal_token,
+        )
+    else:
+        executor = ScheduleExecutor(
+            base_url=base_url,
+            internal_service_token=internal_token,
+        )
     poller = SchedulePoller(
         db=agent_os.db,
         executor=executor,
         poll_interval=agent_os._scheduler_poll_interval,
+        event_driven=agent_os._scheduler_event_driven,
     )
 
     app.state.scheduler_executor = executor
@@ -254,10 +265,13 @@ class AgentOS:
         tracing: bool = False,
         auto_provision_dbs: bool = True,
         run_hooks_in_background: bool = False,
+        event_log: Optional[EventLog] = None,
         telemetry: bool = True,
         registry: Optional[Registry] = None,
         scheduler: bool = False,
         scheduler_poll_interval: int = 15,
+        scheduler_event_driven: bool = False,
+        scheduler_in_process: bool = False,
         scheduler_base_url: Optional[str] = None,
         internal_service_token: Optional[str] = None,
         # Deprecated aliases for mcp_server
@@ -309,10 +323,16 @@ class AgentOS:
             cors_allowed_origins: List of allowed CORS origins (will be merged with default Agno domains)
             tracing: If True, enables OpenTelemetry tracing for all agents and teams in the OS
             run_hooks_in_background: If True, run agent/team pre/post hooks as FastAPI background tasks (non-blocking)
+            event_log: Optional event log shared between worker processes, so clients can resume background
+                runs on any worker. Events are buffered in process memory by default.
             telemetry: Whether to enable telemetry
             registry: Optional registry to use for the AgentOS
             scheduler: Whether to enable the cron scheduler
             scheduler_poll_interval: Seconds between scheduler poll cycles (default: 15)
+            scheduler_event_driven: Whether the scheduler sleeps until the next schedule is due and claims due
+                schedules in batches, instead of polling every scheduler_poll_interval (default: False)
+            scheduler_in_process: Whether scheduled runs of this AgentOS's agents, teams and workflows are executed
+                in process instead of through its HTTP endpoints (default: False)
             scheduler_base_url: Base URL for scheduler HTTP calls (default: http://127.0.0.1:7777)
             internal_service_token: Token for scheduler-to-OS auth (auto-generated if not provided)
             enable_mcp_server: Deprecated alias for ``mcp_server``. Used when
@@ -411,10 +431,14 @@ class AgentOS:
 
         # If True, run agent/team hooks as FastAPI background tasks
         self.run_hooks_in_background = run_hooks_in_background
+        if event_log is not None:
+            event_buffer.set_event_log(event_log)
 
         # Scheduler configuration
         self._scheduler_enabled = scheduler
         self._scheduler_poll_interval = scheduler_poll_interval
+        self._scheduler_event_driven = scheduler_event_driven
+        self._scheduler_in_process = scheduler_in_process
         self._scheduler_base_url = scheduler_base_url
         if self._scheduler_enabled and not internal_service_token:
             import secrets
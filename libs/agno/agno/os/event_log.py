@@ -0,0 +1,465 @@
+"""
+Event logs shared between AgentOS worker processes.
+
+By default the ``EventsBuffer`` keeps the events of background runs in process memory, so a client
+can only resume a run on the worker that runs it. An ``EventLog`` stores them where every worker
+can read them:
+
+- SqliteEventLog: a SQLite file, for workers on the same host (use a path on /dev/shm to keep it in memory)
+- RedisEventLog: Redis streams, for workers on several hosts
+
+Events are stored as serialized JSON bytes, so replaying them doesn't serialize them again. They are
+written by an ``EventLogWriter`` background thread, in batches, so streaming a run never waits on the log.
+"""
+
+import sqlite3
+import threading
+from pathlib import Path
+from time import time
+from typing import Any, Dict, List, NamedTuple, Optional, Union
+
+from agno.utils.log import log_debug, log_warning
+
+# Statuses of finished runs, whose events are removed after the cleanup interval
+_FINISHED_STATUSES = ("COMPLETED", "ERROR", "CANCELLED")
+
+
+class LoggedEvent(NamedTuple):
+    """An event stored in an event log."""
+
+    event_index: int
+    # "agent", "team" or "workflow", to rebuild the event object
+    kind: str
+    event_type: str
+    # The event serialized as a JSON object
+    data: bytes
+
+
+class EventLog:
+    """Base class for event logs shared between processes."""
+
+    def __init__(
+        self,
+        max_events_per_run: int = 10000,
+        cleanup_interval: int = 1800,
+        poll_interval: float = 1.0,
+        run_ttl: int = 86400,
+    ):
+        """
+        Args:
+            max_events_per_run: Maximum number of events kept per run
+            cleanup_interval: How long (in seconds) to keep the events of finished runs
+            poll_interval: How often (in seconds) resumed clients check the log for events of runs
+                executed by another worker
+            run_ttl: How long (in seconds) to keep the events of a run that never finishes, e.g. because its
+                worker stopped. Extended by every new event of the run.
+        """
+        self.max_events_per_run = max_events_per_run
+        self.cleanup_interval = cleanup_interval
+        self.poll_interval = poll_interval
+        self.run_ttl = run_ttl
+
+    def append(self, run_id: str, events: List[LoggedEvent]) -> None:
+        """Store events of a run. Indices are assigned by the worker running it, in increasing order."""
+        raise NotImplementedError
+
+    def read(self, run_id: str, after_index: Optional[int] = None) -> List[LoggedEvent]:
+        """Get the stored events of a run with an index above after_index, or all of them."""
+        raise NotImplementedError
+
+    def count(self, run_id: str) -> int:
+        """Get the number of stored events of a run."""
+        raise NotImplementedError
+
+    def last_index(self, run_id: str) -> int:
+        """Get the index of the last event stored for a run, or -1."""
+        raise NotImplementedError
+
+    def set_status(self, run_id: str, status: str) -> None:
+        """Set the status of a run. Finished runs are removed after the cleanup interval."""
+        raise NotImplementedError
+
+    def get_status(self, run_id: str) -> Optional[str]:
+        """Get the status of a run, or None if the log has no events for it."""
+        raise NotImplementedError
+
+    def delete(self, run_id: str) -> None:
+        """Remove the events of a run."""
+        raise NotImplementedError
+
+    def cleanup(self) -> None:
+        """Remove the events of runs finished for longer than the cleanup interval, or not updated within the run TTL."""
+        pass
+
+
+class EventLogWriter:
+    """Writes events to an event log from a background thread.
+
+    Appending an event only queues it, so streaming a run never waits on the log. The thread writes
+    the queued events of each run in one batch, then the queued statuses, so a run is only marked
+    finished once its events are stored. Queued writes are visible through pending() and pending_status()
+    until they are done.
+    """
+
+    def __init__(self, event_log: EventLog):
+        self.event_log = event_log
+        self._pending: Dict[str, List[LoggedEvent]] = {}
+        self._statuses: Dict[str, str] = {}
+        self._cleanup_requested = False
+        self._writing = False
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def append(self, run_id: str, event: LoggedEvent) -> None:
+        """Queue an event of a run."""
+        with self._condition:
+            events = self._pending.setdefault(run_id, [])
+            events.append(event)
+            # The log only keeps the last max_events_per_run events of a run
+            if len(events) > self.event_log.max_events_per_run:
+                del events[0]
+            self._notify()
+
+    def set_status(self, run_id: str, status: str) -> None:
+        """Queue a status change of a run, written after the events queued before it."""
+        with self._condition:
+            self._statuses[run_id] = status
+            self._notify()
+
+    def request_cleanup(self) -> None:
+        """Queue a cleanup of the log."""
+        with self._condition:
+            self._cleanup_requested = True
+            self._notify()
+
+    def discard(self, run_id: str) -> None:
+        """Drop the queued writes of a run."""
+        with self._condition:
+            self._pending.pop(run_id, None)
+            self._statuses.pop(run_id, None)
+
+    def pending(self, run_id: str) -> List[LoggedEvent]:
+        """Get the queued events of a run that are not written yet."""
+        with self._condition:
+            return list(self._pending.get(run_id, ()))
+
+    def pending_status(self, run_id: str) -> Optional[str]:
+        """Get the queued status of a run that is not written yet."""
+        with self._condition:
+            return self._statuses.get(run_id)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued write is done. Returns False on timeout."""
+        with self._condition:
+            return self._condition.wait_for(lambda: not (self._writing or self._has_work()), timeout)
+
+    def _has_work(self) -> bool:
+        return bool(self._pending or self._statuses or self._cleanup_requested)
+
+    def _notify(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="agno-event-log-writer", daemon=True)
+            self._thread.start()
+        self._condition.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(self._has_work)
+                batches = {run_id: list(events) for run_id, events in self._pending.items() if events}
+                statuses = dict(self._statuses)
+                cleanup, self._cleanup_requested = self._cleanup_requested, False
+                self._writing = True
+
+            for run_id, events in batches.items():
+                try:
+                    self.event_log.append(run_id, events)
+                except Exception as e:
+                    log_warning(f"Failed to write {len(events)} events of run {run_id} to the event log: {str(e)}")
+
+            with self._condition:
+                # Keep the events queued while the batches were written
+                for run_id, events in batches.items():
+                    written_index = events[-1].event_index
+                    remaining = [e for e in self._pending.get(run_id, ()) if e.event_index > written_index]
+                    if remaining:
+                        self._pending[run_id] = remaining
+                    else:
+                        self._pending.pop(run_id, None)
+
+            for run_id, status in statuses.items():
+                try:
+                    self.event_log.set_status(run_id, status)
+                except Exception as e:
+                    log_warning(f"Failed to set the status of run {run_id} in the event log: {str(e)}")
+            if cleanup:
+                try:
+                    self.event_log.cleanup()
+                except Exception as e:
+                    log_warning(f"Failed to clean up the event log: {str(e)}")
+
+            with self._condition:
+                for run_id, status in statuses.items():
+                    if self._statuses.get(run_id) == status:
+                        del self._statuses[run_id]
+                self._writing = False
+                self._condition.notify_all()
+
+
+class SqliteEventLog(EventLog):
+    """Event log stored in a SQLite file, shared by the worker processes of a host."""
+
+    def __init__(
+        self,
+        db_file: Union[str, Path],
+        max_events_per_run: int = 10000,
+        cleanup_interval: int = 1800,
+        poll_interval: float = 1.0,
+        run_ttl: int = 86400,
+    ):
+        """
+        Args:
+            db_file: Path of the SQLite file
+            max_events_per_run: Maximum number of events kept per run
+            cleanup_interval: How long (in seconds) to keep the events of finished runs
+            poll_interval: How often (in seconds) resumed clients check the log for new events
+            run_ttl: How long (in seconds) to keep the events of a run that is not updated and never finishes
+        """
+        super().__init__(
+            max_events_per_run=max_events_per_run,
+            cleanup_interval=cleanup_interval,
+            poll_interval=poll_interval,
+            run_ttl=run_ttl,
+        )
+        self.db_file = Path(db_file)
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # Autocommit mode, transactions are started explicitly
+        self._conn = sqlite3.connect(str(self.db_file), timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS runs (run_id TEXT PRIMARY KEY, status TEXT NOT NULL, "
+            "next_index INTEGER NOT NULL, created_at REAL NOT NULL, updated_at REAL, completed_at REAL)"
+        )
+        # Files created before updated_at was added
+        columns = [row[1] for row in self._conn.execute("PRAGMA table_info(runs)").fetchall()]
+        if "updated_at" not in columns:
+            self._conn.execute("ALTER TABLE runs ADD COLUMN updated_at REAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS events (run_id TEXT NOT NULL, event_index INTEGER NOT NULL, "
+            "kind TEXT NOT NULL, event_type TEXT NOT NULL, data BLOB NOT NULL, PRIMARY KEY (run_id, event_index))"
+        )
+
+    def append(self, run_id: str, events: List[LoggedEvent]) -> None:
+        if not events:
+            return
+        now = time()
+        next_index = events[-1].event_index + 1
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "INSERT INTO runs (run_id, status, next_index, created_at, updated_at) VALUES (?, 'RUNNING', ?, ?, ?) "
+                    "ON CONFLICT (run_id) DO UPDATE SET next_index = MAX(next_index, excluded.next_index), "
+                    "updated_at = excluded.updated_at",
+                    (run_id, next_index, now, now),
+                )
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO events (run_id, event_index, kind, event_type, data) VALUES (?, ?, ?, ?, ?)",
+                    [(run_id, e.event_index, e.kind, e.event_type, e.data) for e in events],
+                )
+                if next_index > self.max_events_per_run:
+                    self._conn.execute(
+                        "DELETE FROM events WHERE run_id = ? AND event_index < ?",
+                        (run_id, next_index - self.max_events_per_run),
+                    )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def read(self, run_id: str, after_index: Optional[int] = None) -> List[LoggedEvent]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT event_index, kind, event_type, data FROM events "
+                "WHERE run_id = ? AND event_index > ? ORDER BY event_index",
+                (run_id, -1 if after_index is None else after_index),
+            ).fetchall()
+        return [LoggedEvent(index, kind, event_type, bytes(data)) for index, kind, event_type, data in rows]
+
+    def count(self, run_id: str) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM events WHERE run_id = ?", (run_id,)).fetchone()[0]
+
+    def last_index(self, run_id: str) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT next_index FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+        return row[0] - 1 if row is not None else -1
+
+    def set_status(self, run_id: str, status: str) -> None:
+        completed_at = time() if status in _FINISHED_STATUSES else None
+        with self._lock:
+            self._conn.execute(
+                "UPDATE runs SET status = ?, updated_at = ?, completed_at = ? WHERE run_id = ?",
+                (status, time(), completed_at, run_id),
+            )
+
+    def get_status(self, run_id: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT status FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+        return row[0] if row is not None else None
+
+    def delete(self, run_id: str) -> None:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._conn.execute("DELETE FROM events WHERE run_id = ?", (run_id,))
+            self._conn.execute("DELETE FROM runs WHERE run_id = ?", (run_id,))
+            self._conn.execute("COMMIT")
+
+    def cleanup(self) -> None:
+        now = time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            run_ids = [
+                row[0]
+                for row in self._conn.execute(
+                    "SELECT run_id FROM runs WHERE (completed_at IS NOT NULL AND completed_at < ?) "
+                    "OR (completed_at IS NULL AND COALESCE(updated_at, created_at) < ?)",
+                    (now - self.cleanup_interval, now - self.run_ttl),
+                ).fetchall()
+            ]
+            for run_id in run_ids:
+                self._conn.execute("DELETE FROM events WHERE run_id = ?", (run_id,))
+                self._conn.execute("DELETE FROM runs WHERE run_id = ?", (run_id,))
+            self._conn.execute("COMMIT")
+        if run_ids:
+            log_debug(f"Cleaned up the events of {len(run_ids)} finished or abandoned runs")
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class RedisEventLog(EventLog):
+    """Event log stored in Redis, one stream per run, shared by workers on any host.
+
+    The events of a run are a stream whose entry ids are derived from the event indices, so reading
+    the events after an index is a single XRANGE. The run status is a hash next to it. Both keys
+    expire after the run TTL, extended by every batch of events, and after the cleanup interval
+    once the run is finished.
+    """
+
+    def __init__(
+        self,
+        client: Optional[Any] = None,
+        url: Optional[str] = None,
+        key_prefix: str = "agno:run_events",
+        max_events_per_run: int = 10000,
+        cleanup_interval: int = 1800,
+        poll_interval: float = 1.0,
+        run_ttl: int = 86400,
+    ):
+        """
+        Args:
+            client: A redis.Redis client (or a compatible client)
+            url: Redis URL, used to create a client when none is given
+            key_prefix: Prefix of the Redis keys
+            max_events_per_run: Maximum number of events kept per run
+            cleanup_interval: How long (in seconds) to keep the events of finished runs
+            poll_interval: How often (in seconds) resumed clients check the log for new events
+            run_ttl: How long (in seconds) to keep the events of a run that is not updated and never finishes
+        """
+        super().__init__(
+            max_events_per_run=max_events_per_run,
+            cleanup_interval=cleanup_interval,
+            poll_interval=poll_interval,
+            run_ttl=run_ttl,
+        )
+        if client is None:
+            try:
+                from redis import Redis
+            except ImportError:
+                raise ImportError("`redis` not installed. Please install it using `pip install redis`")
+            client = Redis.from_url(url or "redis://localhost:6379/0")
+        self.client = client
+        self.key_prefix = key_prefix
+
+    def _events_key(self, run_id: str) -> str:
+        return f"{self.key_prefix}:{run_id}:events"
+
+    def _meta_key(self, run_id: str) -> str:
+        return f"{self.key_prefix}:{run_id}:meta"
+
+    @staticmethod
+    def _str(value: Any) -> str:
+        return value.decode("utf-8") if isinstance(value, bytes) else str(value)
+
+    def append(self, run_id: str, events: List[LoggedEvent]) -> None:
+        if not events:
+            return
+        meta_key = self._meta_key(run_id)
+        events_key = self._events_key(run_id)
+        # One round trip per batch
+        pipeline = self.client.pipeline(transaction=False)
+        pipeline.hsetnx(meta_key, "status", "RUNNING")
+        pipeline.hsetnx(meta_key, "created_at", time())
+        pipeline.hset(meta_key, "next_index", events[-1].event_index + 1)
+        for event in events:
+            # Entry ids must be above 0-0, so event N is stored as N+1-0
+            pipeline.xadd(
+                events_key,
+                {"kind": event.kind, "event_type": event.event_type, "data": event.data},
+                id=f"{event.event_index + 1}-0",
+                maxlen=self.max_events_per_run,
+                approximate=False,
+            )
+        # Runs whose worker stopped never finish, so their keys expire on their own
+        pipeline.expire(meta_key, self.run_ttl)
+        pipeline.expire(events_key, self.run_ttl)
+        pipeline.execute()
+
+    def read(self, run_id: str, after_index: Optional[int] = None) -> List[LoggedEvent]:
+        start = "-" if after_index is None else f"{after_index + 2}-0"
+        entries = self.client.xrange(self._events_key(run_id), min=start, max="+") or []
+        events = []
+        for entry_id, entry_fields in entries:
+            fields = {self._str(k): v for k, v in (entry_fields or {}).items()}
+            data = fields["data"]
+            events.append(
+                LoggedEvent(
+                    event_index=int(self._str(entry_id).split("-")[0]) - 1,
+                    kind=self._str(fields["kind"]),
+                    event_type=self._str(fields["event_type"]),
+                    data=data if isinstance(data, bytes) else data.encode("utf-8"),
+                )
+            )
+        return events
+
+    def count(self, run_id: str) -> int:
+        return int(self.client.xlen(self._events_key(run_id)))
+
+    def last_index(self, run_id: str) -> int:
+        next_index = self.client.hget(self._meta_key(run_id), "next_index")
+        return int(next_index) - 1 if next_index is not None else -1
+
+    def set_status(self, run_id: str, status: str) -> None:
+        meta_key = self._meta_key(run_id)
+        pipeline = self.client.pipeline(transaction=False)
+        if status in _FINISHED_STATUSES:
+            pipeline.hset(meta_key, mapping={"status": status, "completed_at": time()})
+            # Redis removes finished runs, cleanup() has nothing to do
+            pipeline.expire(meta_key, self.cleanup_interval)
+            pipeline.expire(self._events_key(run_id), self.cleanup_interval)
+        else:
+            pipeline.hset(meta_key, "status", status)
+            pipeline.expire(meta_key, self.run_ttl)
+        pipeline.execute()
+
+    def get_status(self, run_id: str) -> Optional[str]:
+        status = self.client.hget(self._meta_key(run_id), "status")
+        return self._str(status) if status is not None else None
+
+    def delete(self, run_id: str) -> None:
+        self.client.delete(self._events_key(run_id), self._meta_key(run_id))
@@ -3,7 +3,7 @@ Managers for AgentOS.
 
 This module provides various manager classes for AgentOS:
 - WebSocketManager: WebSocket connection management for real-time streaming
-- EventsBuffer: Event buffering for agent/team/workflow reconnection support
+- EventsBuffer: Event buffering for agent/team/workflow reconnection support, in memory or in a shared EventLog
 - WebSocketHandler: Handler for sending events over WebSocket connections
 - SSESubscriberManager: Subscriber management for SSE-based reconnection
 
@@ -13,17 +13,18 @@ These managers are used by agents, teams, and workflows for background WebSocket
 import asyncio
 import json
 from dataclasses import dataclass
-from time import time
+from time import monotonic, time
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 from starlette.websockets import WebSocket
 
+from agno.os.event_log import EventLog, EventLogWriter, LoggedEvent
 from agno.run.agent import RunOutputEvent
 from agno.run.base import RunStatus
 from agno.run.team import TeamRunOutputEvent
 from agno.run.workflow import WorkflowRunOutputEvent
 from agno.utils.log import log_debug, log_warning, logger
-from agno.utils.serialize import json_serializer
+from agno.utils.serialize import json_dumps_compact, json_serializer
 
 
 @dataclass
@@ -203,15 +204,25 @@ class EventsBuffer:
 
     Buffers all event types: RunOutputEvent (agents), TeamRunOutputEvent (teams),
     and WorkflowRunOutputEvent (workflows).
+
+    With an EventLog (see set_event_log()), events are stored serialized in the log instead,
+    so clients can resume a run on any worker process that shares the log. They are written by a
+    background thread, and reads include the events not written yet.
     """
 
-    def __init__(self, max_events_per_run: int = 1000, cleanup_interval: int = 3600):
+    # Minimum time (in seconds) between two cleanups of the event log
+    event_log_cleanup_interval: float = 60.0
+
+    def __init__(
+        self, max_events_per_run: int = 1000, cleanup_interval: int = 3600, event_log: Optional[EventLog] = None
+    ):
         """
         Initialize the event buffer.
 
         Args:
             max_events_per_run: Maximum number of events to store per run (prevents memory bloat)
             cleanup_interval: How long (in seconds) to keep completed runs in buffer
+            event_log: Optional shared event log to store events in, instead of process memory
         """
         # Store all event types (WorkflowRunOutputEvent, RunOutputEvent, TeamRunOutputEvent)
         self.events: Dict[str, List[Union[WorkflowRunOutputEvent, RunOutputEvent, TeamRunOutputEvent]]] = {}
@@ -219,9 +230,76 @@ class EventsBuffer:
         self.run_metadata: Dict[str, Dict[str, Any]] = {}  # {run_id: {status, last_updated, etc}}
         self.max_events_per_run = max_events_per_run
         self.cleanup_interval = cleanup_interval
+        self.event_log: Optional[EventLog] = None
+        self.event_log_writer: Optional[EventLogWriter] = None
+        self._last_event_log_cleanup: Optional[float] = None
+        self.set_event_log(event_log)
+
+    def set_event_log(self, event_log: Optional[EventLog]) -> None:
+        """Store events in a shared event log, or in process memory when None."""
+        self.event_log = event_log
+        self.event_log_writer = EventLogWriter(event_log) if event_log is not None else None
+
+    @property
+    def resume_poll_interval(self) -> float:
+        """How often resumed clients check the buffer while waiting for live events."""
+        # Live events of runs on another worker only reach a shared log, not this process's subscribers
+        return self.event_log.poll_interval if self.event_log is not None else 30.0
+
+    @staticmethod
+    def _serialize_event(
+        run_id: str, event: Union[WorkflowRunOutputEvent, RunOutputEvent, TeamRunOutputEvent]
+    ) -> bytes:
+        event_dict = event.to_dict()
+        if "run_id" not in event_dict:
+            event_dict["run_id"] = run_id
+        return json_dumps_compact(event_dict).encode()
+
+    @staticmethod
+    def _deserialize_event(kind: str, data: bytes) -> Union[WorkflowRunOutputEvent, RunOutputEvent, TeamRunOutputEvent]:
+        from agno.run.agent import run_output_event_from_dict
+        from agno.run.team import team_run_output_event_from_dict
+        from agno.run.workflow import workflow_run_output_event_from_dict
+
+        event_dict = json.loads(data)
+        if kind == "team":
+            return team_run_output_event_from_dict(event_dict)  # type: ignore[return-value]
+        if kind == "workflow":
+            return workflow_run_output_event_from_dict(event_dict)  # type: ignore[return-value]
+        return run_output_event_from_dict(event_dict)  # type: ignore[return-value]
+
+    def _read_event_log(self, run_id: str, after_index: Optional[int] = None) -> List[LoggedEvent]:
+        """Get the events of a run from the event log, including the events not written yet."""
+        assert self.event_log is not None and self.event_log_writer is not None
+        # Read the queued events first: events written in between are then returned by the log
+        pending = self.event_log_writer.pending(run_id)
+        logged = self.event_log.read(run_id, after_index=after_index)
+        last_index = logged[-1].event_index if logged else (-1 if after_index is None else after_index)
+        return logged + [e for e in pending if e.event_index > last_index]
+
+    def _get_logged_last_index(self, run_id: str) -> int:
+        assert self.event_log is not None and self.event_log_writer is not None
+        pending = self.event_log_writer.pending(run_id)
+        last_index = self.event_log.last_index(run_id)
+        return max(pending[-1].event_index, last_index) if pending else last_index
 
     def add_event(self, run_id: str, event: Union[WorkflowRunOutputEvent, RunOutputEvent, TeamRunOutputEvent]) -> int:
         """Add event to buffer for a specific run and return the event index (handles workflow, agent, and team events)"""
+        if self.event_log_writer is not None:
+            # Only the worker running a run adds its events, so indices are assigned here
+            if run_id not in self._next_index:
+                # The run may be continued from events stored by another worker
+                self._next_index[run_id] = self._get_logged_last_index(run_id) + 1
+            event_index = self._next_index[run_id]
+            self._next_index[run_id] += 1
+            # agno.run.agent / agno.run.team / agno.run.workflow
+            kind = type(event).__module__.rsplit(".", 1)[-1]
+            self.event_log_writer.append(
+                run_id,
+                LoggedEvent(event_index, kind, event.event or "message", self._serialize_event(run_id, event)),
+            )
+            return event_index
+
         current_time = time()
 
         if run_id not in self.events:
@@ -260,6 +338,12 @@ class EventsBuffer:
         Returns:
             List of (monotonic_index, event) tuples since last_event_index, or all if None
         """
+        if self.event_log is not None:
+            return [
+                (logged.event_index, self._deserialize_event(logged.kind, logged.data))
+                for logged in self._read_event_log(run_id, after_index=last_event_index)
+            ]
+
         events = self.events.get(run_id, [])
         if not events:
             return []
@@ -288,8 +372,44 @@ class EventsBuffer:
         list_offset = start_index - first_index
         return [(start_index + i, e) for i, e in enumerate(events[list_offset:])]
 
+    def get_sse_events(self, run_id: str, last_event_index: Optional[int] = None) -> List[Tuple[int, str]]:
+        """
+        Get events since the last received event index, formatted as SSE messages with their event_index.
+
+        Events from an event log are already serialized, so they are not serialized again.
+
+        Args:
+            run_id: The run ID (agent/team/workflow)
+            last_event_index: Monotonic index of last event received by client (0-based)
+
+        Returns:
+            List of (monotonic_index, sse_message) tuples since last_event_index, or all if None
+        """
+        if self.event_log is not None:
+            sse_events = []
+            for logged in self._read_event_log(run_id, after_index=last_event_index):
+                # Append event_index to the serialized JSON object
+                data = logged.data[:-1].decode() + f',"event_index":{logged.event_index}}}'
+                sse_events.append((logged.event_index, f"event: {logged.event_type}\ndata: {data}\n\n"))
+            return sse_events
+
+        sse_events = []
+        for event_index, event in self.get_events(run_id, last_event_index=last_event_index):
+            event_dict = event.to_dict()
+            event_dict["event_index"] = event_index
+            if "run_id" not in event_dict:
+                event_dict["run_id"] = run_id
+            event_type = event_dict.get("event", "message")
+            data = json_dumps_compact(event_dict)
+            sse_events.append((event_index, f"event: {event_type}\ndata: {data}\n\n"))
+        return sse_events
+
     def get_event_count(self, run_id: str) -> int:
         """Get the current number of events for a run"""
+        if self.event_log is not None and self.event_log_writer is not None:
+            last_index = self.event_log.last_index(run_id)
+            pending = [e for e in self.event_log_writer.pending(run_id) if e.event_index > last_index]
+            return min(self.event_log.count(run_id) + len(pending), self.event_log.max_events_per_run)
         return len(self.events.get(run_id, []))
 
     def get_last_index(self, run_id: str) -> int:
@@ -298,6 +418,10 @@ class EventsBuffer:
         Returns -1 if no events have been added for this run.
         Unlike get_event_count(), this survives buffer trims.
         """
+        if self.event_log is not None:
+            if run_id in self._next_index:
+                return self._next_index[run_id] - 1
+            return self._get_logged_last_index(run_id)
         next_idx = self._next_index.get(run_id)
         if next_idx is None or next_idx == 0:
             return -1
@@ -305,6 +429,19 @@ class EventsBuffer:
 
     def set_run_completed(self, run_id: str, status: RunStatus) -> None:
         """Mark a run as completed/cancelled/error for future cleanup"""
+        if self.event_log_writer is not None:
+            self.event_log_writer.set_status(run_id, status.value)
+            self._next_index.pop(run_id, None)
+            # Cleanup scans every run of the log, so it runs at most once per event_log_cleanup_interval
+            now = monotonic()
+            if (
+                self._last_event_log_cleanup is None
+                or now - self._last_event_log_cleanup >= self.event_log_cleanup_interval
+            ):
+                self._last_event_log_cleanup = now
+                self.event_log_writer.request_cleanup()
+            return
+
         if run_id in self.run_metadata:
             self.run_metadata[run_id]["status"] = status
             self.run_metadata[run_id]["completed_at"] = time()
@@ -315,6 +452,12 @@ class EventsBuffer:
 
     def cleanup_run(self, run_id: str) -> None:
         """Remove buffer for a completed run (called after retention period)"""
+        if self.event_log is not None and self.event_log_writer is not None:
+            self.event_log_writer.discard(run_id)
+            self._next_index.pop(run_id, None)
+            self.event_log.delete(run_id)
+            return
+
         if run_id in self.events:
             del self.events[run_id]
         self._next_index.pop(run_id, None)
@@ -324,6 +467,10 @@ class EventsBuffer:
 
     def cleanup_runs(self) -> None:
         """Clean up runs that have been completed for longer than cleanup_interval"""
+        if self.event_log_writer is not None:
+            self.event_log_writer.request_cleanup()
+            return
+
         current_time = time()
         runs_to_cleanup = []
 
@@ -342,6 +489,13 @@ class EventsBuffer:
 
     def get_run_status(self, run_id: str) -> Optional[RunStatus]:
         """Get the status of a run from metadata"""
+        if self.event_log is not None and self.event_log_writer is not None:
+            status = self.event_log_writer.pending_status(run_id) or self.event_log.get_status(run_id)
+            if status is None and run_id in self._next_index:
+                # The first events of the run are not written yet
+                return RunStatus.running
+            return RunStatus(status) if status is not None else None
+
         metadata = self.run_metadata.get(run_id)
         return metadata["status"] if metadata else None
 
@@ -601,7 +601,7 @@ async def _resolve_run_component(
     helpers so the MCP surface matches REST on all three axes the low-level lookup
     otherwise dropped:
 
-    - ``create_fresh=True`` (via the resolvers): each run gets a ``deep_copy()`` instead of
+    - ``create_fresh=True`` (via the resolvers): each run gets a fresh copy instead of
       the shared singleton, so concurrent MCP runs cannot contaminate each other's state.
     - ``db=os.db, registry=os.registry``: components registered in the DB registry (not the
       in-memory list) resolve and run, just like over REST.
@@ -1,6 +1,6 @@
 import asyncio
 import json
-from typing import TYPE_CHECKING, Any, AsyncGenerator, List, Literal, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, AsyncGenerator, List, Literal, Optional, Tuple, Union, cast
 from uuid import uuid4
 
 from fastapi import (
@@ -65,7 +65,7 @@ from agno.registry import Registry
 from agno.run.agent import RunErrorEvent, RunOutput
 from agno.run.base import RunStatus
 from agno.utils.log import log_debug, log_error, log_warning
-from agno.utils.serialize import json_serializer
+from agno.utils.serialize import json_dumps_compact
 
 if TYPE_CHECKING:
     from agno.os.app import AgentOS
@@ -386,7 +386,7 @@ async def _resume_stream_generator(
                     if "run_id" not in event_dict:
                         event_dict["run_id"] = run_id
                     event_type = event_dict.get("event", "message")
-                    yield f"event: {event_type}\ndata: {json.dumps(event_dict, separators=(',', ':'), default=json_serializer, ensure_ascii=False)}\n\n"
+                    yield f"event: {event_type}\ndata: {json_dumps_compact(event_dict)}\n\n"
                 return
             elif run_output:
                 meta = {
@@ -407,7 +407,7 @@ async def _resume_stream_generator(
     if buffer_status in (RunStatus.completed, RunStatus.error, RunStatus.cancelled, RunStatus.paused):
         # PATH 2: Run finished -- replay missed events from buffer
         total_buffered = event_buffer.get_event_count(run_id)
-        missed_events = event_buffer.get_events(run_id, last_event_index=last_event_index)
+        missed_events = event_buffer.get_sse_events(run_id, last_event_index=last_event_index)
         log_debug(
             f"Resume PATH 2: run_id={run_id}, status={buffer_status.value}, "
             f"last_event_index={last_event_index}, total_buffered={total_buffered}, "
@@ -425,20 +425,15 @@ async def _resume_stream_generator(
         }
         yield f"event: replay\ndata: {json.dumps(meta)}\n\n"
 
-        for ev_index, buffered_event in missed_events:
-            event_dict = buffered_event.to_dict()
-            event_dict["event_index"] = ev_index
-            if "run_id" not in event_dict:
-                event_dict["run_id"] = run_id
-            event_type = event_dict.get("event", "message")
-            yield f"event: {event_type}\ndata: {json.dumps(event_dict, separators=(',', ':'), default=json_serializer, ensure_ascii=False)}\n\n"
+        for _, sse_data in missed_events:
+            yield sse_data
         return
 
     # PATH 1: Run still active -- subscribe FIRST (to avoid race condition), then replay missed events
     queue = sse_subscriber_manager.subscribe(run_id)
 
     try:
-        missed_events = event_buffer.get_events(run_id, last_event_index)
+        missed_events = event_buffer.get_sse_events(run_id, last_event_index)
         current_count = event_buffer.get_event_count(run_id)
 
         # Track the highest replayed event_index for dedup against queue events
@@ -455,13 +450,8 @@ async def _resume_stream_generator(
             }
             yield f"event: catch_up\ndata: {json.dumps(meta)}\n\n"
 
-            for ev_index, buffered_event in missed_events:
-                event_dict = buffered_event.to_dict()
-                event_dict["event_index"] = ev_index
-                if "run_id" not in event_dict:
-                    event_dict["run_id"] = run_id
-                event_type = event_dict.get("event", "message")
-                yield f"event: {event_type}\ndata: {json.dumps(event_dict, separators=(',', ':'), default=json_serializer, ensure_ascii=False)}\n\n"
+            for ev_index, sse_data in missed_events:
+                yield sse_data
                 last_replayed_index = ev_index
 
         # Re-check buffer status after subscribing: the run may have completed
@@ -471,15 +461,10 @@ async def _resume_stream_generator(
         updated_status = event_buffer.get_run_status(run_id)
         if updated_status is not None and updated_status != RunStatus.running:
             # Run completed while we were catching up -- replay remaining from buffer
-            remaining = event_buffer.get_events(run_id, last_event_index=last_replayed_index)
+            remaining = event_buffer.get_sse_events(run_id, last_event_index=last_replayed_index)
             if remaining:
-                for ev_index, buffered_event in remaining:
-                    event_dict = buffered_event.to_dict()
-                    event_dict["event_index"] = ev_index
-                    if "run_id" not in event_dict:
-                        event_dict["run_id"] = run_id
-                    event_type = event_dict.get("event", "message")
-                    yield f"event: {event_type}\ndata: {json.dumps(event_dict, separators=(',', ':'), default=json_serializer, ensure_ascii=False)}\n\n"
+                for _, sse_data in remaining:
+                    yield sse_data
             return
 
         # Confirm subscription for live events
@@ -497,23 +482,25 @@ async def _resume_stream_generator(
         # Read from queue, dedup events already replayed by event_index
         while True:
             try:
-                item = await asyncio.wait_for(queue.get(), timeout=30.0)
+                item = await asyncio.wait_for(queue.get(), timeout=event_buffer.resume_poll_interval)
             except asyncio.TimeoutError:
                 # Check if run ended without sending sentinel
                 status = event_buffer.get_run_status(run_id)
                 if status is None or status != RunStatus.running:
                     # Run ended - replay any remaining events from buffer
-                    remaining = event_buffer.get_events(run_id, last_event_index=last_replayed_index)
-                    for ev_index, buffered_event in remaining:
-                        event_dict = buffered_event.to_dict()
-                        event_dict["event_index"] = ev_index
-                        if "run_id" not in event_dict:
-                            event_dict["run_id"] = run_id
-                        event_type = event_dict.get("event", "message")
-                        yield f"event: {event_type}\ndata: {json.dumps(event_dict, separators=(',', ':'), default=json_serializer, ensure_ascii=False)}\n\n"
+                    remaining = event_buffer.get_sse_events(run_id, last_event_index=last_replayed_index)
+                    for _, sse_data in remaining:
+                        yield sse_data
                     break
-                # Still running - send heartbeat to keep connection alive
-                yield ": heartbeat\n\n"
+                # Still running - send the events another worker added to a shared event log, or a heartbeat
+                new_events: List[Tuple[int, str]] = []
+                if event_buffer.event_log is not None:
+                    new_events = event_buffer.get_sse_events(run_id, last_event_index=last_replayed_index)
+                for ev_index, sse_data in new_events:
+                    yield sse_data
+                    last_replayed_index = ev_index
+                if not new_events:
+                    yield ": heartbeat\n\n"
                 continue
             if item is None:
                 # Sentinel: run completed
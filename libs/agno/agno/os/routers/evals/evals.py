@@ -414,7 +414,7 @@ def attach_routes(
 
         if eval_run_input.agent_id:
             # create_fresh: the eval mutates the resolved agent (e.g. agent.model below), so
-            # it must run on a per-request deep_copy, never the shared singleton instance.
+            # it must run on a per-request copy, never the shared singleton instance.
             agent = get_agent_by_id(agent_id=eval_run_input.agent_id, agents=agents, create_fresh=True)
             if not agent:
                 raise HTTPException(status_code=404, detail=f"Agent with id '{eval_run_input.agent_id}' not found")
@@ -59,6 +59,12 @@ def get_schedule_router(os_db: Any, settings: Any) -> APIRouter:
         except ImportError as exc:
             raise HTTPException(status_code=503, detail=str(exc))
 
+    def _notify_poller(request: Request) -> None:
+        """Wake up the scheduler poller of this app, so it picks up a changed schedule without waiting for its next poll."""
+        poller = getattr(request.app.state, "scheduler_poller", None)
+        if poller is not None:
+            poller.notify()
+
     async def _db_call(method_name: _SchedulerDbMethod, *args: Any, **kwargs: Any) -> Any:
         fn = getattr(os_db, method_name, None)
         if fn is None:
@@ -96,6 +102,7 @@ def get_schedule_router(os_db: Any, settings: Any) -> APIRouter:
     @router.post("/schedules", response_model=ScheduleResponse, status_code=201)
     async def create_schedule(
         body: ScheduleCreate,
+        request: Request,
         _: bool = Depends(auth_dependency),
     ) -> Dict[str, Any]:
         _check_scheduler_deps()
@@ -137,6 +144,7 @@ def get_schedule_router(os_db: Any, settings: Any) -> APIRouter:
         result = await _db_call("create_schedule", schedule_dict)
         if result is None:
             raise HTTPException(status_code=500, detail="Failed to create schedule")
+        _notify_poller(request)
         return result
 
     @router.get("/schedules/{schedule_id}", response_model=ScheduleResponse)
@@ -153,6 +161,7 @@ def get_schedule_router(os_db: Any, settings: Any) -> APIRouter:
     async def update_schedule(
         schedule_id: str,
         body: ScheduleUpdate,
+        request: Request,
         _: bool = Depends(auth_dependency),
     ) -> Dict[str, Any]:
         existing = await _db_call("get_schedule", schedule_id)
@@ -187,6 +196,7 @@ def get_schedule_router(os_db: Any, settings: Any) -> APIRouter:
         result = await _db_call("update_schedule", schedule_id, **updates)
         if result is None:
             raise HTTPException(status_code=500, detail="Failed to update schedule")
+        _notify_poller(request)
         return result
 
     @router.delete("/schedules/{schedule_id}", status_code=204)
@@ -204,6 +214,7 @@ def get_schedule_router(os_db: Any, settings: Any) -> APIRouter:
     @router.post("/schedules/{schedule_id}/enable", response_model=ScheduleStateResponse)
     async def enable_schedule(
         schedule_id: str,
+        request: Request,
         _: bool = Depends(auth_dependency),
     ) -> Dict[str, Any]:
         existing = await _db_call("get_schedule", schedule_id)
@@ -217,6 +228,7 @@ def get_schedule_router(os_db: Any, settings: Any) -> APIRouter:
         result = await _db_call("update_schedule", schedule_id, enabled=True, next_run_at=next_run_at)
         if result is None:
             raise HTTPException(status_code=500, detail="Failed to enable schedule")
+        _notify_poller(request)
         log_info(f"Schedule '{existing.get('name', schedule_id)}' enabled (next_run_at={next_run_at})")
         return result
 
@@ -32,7 +32,7 @@ from agno.os.schema import (
     WorkflowRunSchema,
     WorkflowSessionDetailSchema,
 )
-from agno.os.services.sessions import SessionNotFoundError, get_sessions_page
+from agno.os.services.sessions import SessionNotFoundError, get_session_summaries_page, get_sessions_page
 from agno.os.services.sessions import get_session_runs as get_session_runs_from_service
 from agno.os.settings import AgnoAPISettings
 from agno.remote.base import RemoteDb
@@ -119,6 +119,16 @@ def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBase
         sort_order: Optional[SortOrder] = Query(default=SortOrder.DESC, description="Sort order (asc or desc)"),
         db_id: Optional[str] = Query(default=None, description="Database ID to query sessions from"),
         table: Optional[str] = Query(default=None, description="The database table to use"),
+        cursor: Optional[str] = Query(
+            default=None,
+            description=(
+                "Page by cursor instead of by page number: pass an empty cursor for the first page, then the "
+                "next_cursor of the previous page. Sessions are sorted by created_at and their runs are not read."
+            ),
+        ),
+        with_total_count: bool = Query(
+            default=False, description="With cursor pagination, whether to count the matching sessions"
+        ),
     ) -> PaginatedResponse[SessionSchema]:
         try:
             db, effective_user_id = await resolve_db_and_scope(request, dbs, db_id, table, fallback_user_id=user_id)
@@ -139,9 +149,40 @@ def attach_routes(router: APIRouter, dbs: dict[str, list[Union[BaseDb, AsyncBase
                 sort_order=sort_order.value if sort_order else None,
                 db_id=db_id,
                 table=table,
+                cursor=cursor,
+                with_total_count=with_total_count if cursor is not None else None,
                 headers=headers,
             )
 
+        if cursor is not None:
+            # Cursor pagination reads the summary columns only, by key instead of by offset
+            try:
+                summaries = await get_session_summaries_page(
+                    db,
+                    session_type=session_type,
+                    component_id=component_id,
+                    user_id=effective_user_id,
+                    session_name=session_name,
+                    limit=limit,
+                    cursor=cursor,
+                    sort_order=sort_order,
+                    with_total_count=with_total_count,
+                )
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+
+            summary_count = summaries.total_count or 0
+            return PaginatedResponse(
+                data=[SessionSchema.from_dict(session) for session in summaries.sessions],
+                meta=PaginationInfo(
+                    page=page,
+                    limit=limit,
+                    total_count=summary_count,
+                    total_pages=(summary_count + limit - 1) // limit if limit is not None and limit > 0 else 0,
+                    next_cursor=summaries.next_cursor,
+                ),
+            )
+
         # Shared with the MCP get_sessions tool: sync-db threadpool offload lives in the
         # service so neither surface blocks its event loop and the two cannot drift.
         sessions, total_count = await get_sessions_page(
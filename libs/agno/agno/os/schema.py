@@ -791,6 +791,7 @@ class PaginationInfo(BaseModel):
     total_pages: int = Field(0, description="Total number of pages", ge=0)
     total_count: int = Field(0, description="Total count of items", ge=0)
     search_time_ms: float = Field(0, description="Search execution time in milliseconds", ge=0)
+    next_cursor: Optional[str] = Field(None, description="Cursor of the next page, with cursor pagination")
 
 
 class PaginatedResponse(BaseModel, Generic[T]):
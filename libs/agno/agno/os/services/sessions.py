@@ -13,7 +13,7 @@ from typing import Any, Dict, List, Literal, Optional, Tuple, Union
 
 from starlette.concurrency import run_in_threadpool
 
-from agno.db.base import AsyncBaseDb, BaseDb, SessionType
+from agno.db.base import AsyncBaseDb, BaseDb, SessionSummaryPage, SessionType
 from agno.db.utils import detect_session_type
 from agno.os.schema import RunSchema, TeamRunSchema, WorkflowRunSchema
 
@@ -95,6 +95,38 @@ async def get_sessions_page(
     return sessions, total_count  # type: ignore[return-value]
 
 
+async def get_session_summaries_page(
+    db: Union[BaseDb, AsyncBaseDb],
+    *,
+    session_type: Optional[SessionType] = None,
+    component_id: Optional[str] = None,
+    user_id: Optional[str] = None,
+    session_name: Optional[str] = None,
+    limit: Optional[int] = 20,
+    cursor: Optional[str] = None,
+    sort_order: Optional[Any] = "desc",
+    with_total_count: bool = False,
+) -> SessionSummaryPage:
+    """One page of session summaries, read by key after ``cursor`` instead of by offset.
+
+    Summaries only hold the session fields shown in session listings, so listing sessions
+    doesn't read their runs. Raises ``ValueError`` for an invalid cursor.
+    """
+    kwargs: Dict[str, Any] = dict(
+        session_type=session_type,
+        component_id=component_id,
+        user_id=user_id,
+        session_name=session_name,
+        limit=limit or 20,
+        cursor=cursor or None,
+        sort_order=sort_order,
+        with_total_count=with_total_count,
+    )
+    if isinstance(db, AsyncBaseDb):
+        return await db.get_session_summaries(**kwargs)
+    return await run_in_threadpool(lambda: db.get_session_summaries(**kwargs))
+
+
 async def _get_session_dict(
     db: Union[BaseDb, AsyncBaseDb],
     *,
@@ -255,7 +255,7 @@ def format_sse_event_with_index(
     Returns:
         SSE-formatted string with event_index in the data payload.
     """
-    from agno.utils.serialize import json_serializer
+    from agno.utils.serialize import json_dumps_compact
 
     try:
         event_type = event.event or "message"
@@ -266,7 +266,7 @@ def format_sse_event_with_index(
         if run_id and "run_id" not in event_dict:
             event_dict["run_id"] = run_id
 
-        clean_json = json.dumps(event_dict, separators=(",", ":"), default=json_serializer, ensure_ascii=False)
+        clean_json = json_dumps_compact(event_dict)
         return f"event: {event_type}\ndata: {clean_json}\n\n"
     except Exception:
         clean_json = event.to_json(separators=(",", ":"), indent=None)
@@ -852,9 +852,9 @@ def get_agent_by_id(
 ) -> Optional[Union[Agent, RemoteAgent, AgentProtocol]]:
     """Get an agent by ID, optionally creating a fresh instance for request isolation.
 
-    When create_fresh=True, creates a new agent instance using deep_copy() to prevent
-    state contamination between concurrent requests. The new instance shares heavy
-    resources (db, model, MCP tools) but has isolated mutable state.
+    When create_fresh=True, creates a new agent instance using request_copy() to prevent
+    state contamination between concurrent requests. The new instance shares its
+    configuration (db, model, tools, knowledge, instructions) but has isolated mutable state.
 
     If the matched entry is an AgentFactory, invokes the factory with the provided
     RequestContext to produce a fresh Agent.
@@ -862,7 +862,7 @@ def get_agent_by_id(
     Args:
         agent_id: The agent ID to look up
         agents: List of agents (and/or AgentFactory entries) to search
-        create_fresh: If True, creates a new instance using deep_copy()
+        create_fresh: If True, creates a new instance using request_copy()
         ctx: RequestContext for factory invocation (required if a factory is matched)
 
     Returns:
@@ -878,7 +878,7 @@ def get_agent_by_id(
                 # Base Agent — most common path, early exit
                 if isinstance(agent, Agent):
                     if create_fresh:
-                        fresh_agent = agent.deep_copy()
+                        fresh_agent = agent.request_copy()
                         fresh_agent.team_id = None
                         fresh_agent.workflow_id = None
                         return fresh_agent
@@ -924,7 +924,7 @@ async def get_agent_by_id_async(
                 # Base Agent — most common path, early exit
                 if isinstance(agent, Agent):
                     if create_fresh:
-                        fresh_agent = agent.deep_copy()
+                        fresh_agent = agent.request_copy()
                         fresh_agent.team_id = None
                         fresh_agent.workflow_id = None
                         return fresh_agent
@@ -1982,7 +1982,7 @@ async def resolve_agent(
     """Resolve an agent by ID with proper error handling for both factory and non-factory paths.
 
     For factory agents: builds RequestContext, invokes factory, handles factory-specific errors.
-    For non-factory agents: resolves via deep_copy or DB lookup.
+    For non-factory agents: resolves via request_copy or DB lookup.
 
     Raises HTTPException on all error paths.
     """
@@ -1,6 +1,7 @@
-from dataclasses import asdict, dataclass
+from copy import deepcopy
+from dataclasses import asdict, dataclass, fields, is_dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional, Type, Union
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Type, Union
 
 from pydantic import BaseModel
 
@@ -43,38 +44,81 @@ class RunContext:
     client_tools: Optional[List[Any]] = None
 
 
+_ATOMIC_TYPES = (str, int, float, bool)
+
+# (dataclass, excluded field names) -> names of the other fields, in definition order
+_copied_fields_cache: Dict[Tuple[type, FrozenSet[str]], Tuple[str, ...]] = {}
+
+
+def _copy_value(value: Any) -> Any:
+    """Copy a field value the way dataclasses.asdict does, returning immutable values as they are."""
+    if value is None or type(value) in _ATOMIC_TYPES or isinstance(value, Enum):
+        return value
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if isinstance(value, list):
+        return [_copy_value(v) for v in value]
+    if isinstance(value, tuple):
+        if hasattr(value, "_fields"):
+            return type(value)(*[_copy_value(v) for v in value])
+        return tuple(_copy_value(v) for v in value)
+    if isinstance(value, dict):
+        return {_copy_value(k): _copy_value(v) for k, v in value.items()}
+    return deepcopy(value)
+
+
+def fields_to_dict(obj: Any, exclude: FrozenSet[str]) -> Dict[str, Any]:
+    """Get the fields of a dataclass instance that are not None and not excluded, copied like dataclasses.asdict.
+
+    Unlike filtering the result of asdict, the excluded fields are never copied, and str, int, float, bool and
+    enum values are not copied at all.
+    """
+    cache_key = (type(obj), exclude)
+    names = _copied_fields_cache.get(cache_key)
+    if names is None:
+        names = tuple(f.name for f in fields(obj) if f.name not in exclude)
+        _copied_fields_cache[cache_key] = names
+
+    _dict = {}
+    for name in names:
+        value = getattr(obj, name)
+        if value is not None:
+            _dict[name] = _copy_value(value)
+    return _dict
+
+
+# Fields of run events that to_dict serializes on its own, or leaves out
+_EVENT_FIELDS_SERIALIZED_SEPARATELY = frozenset(
+    [
+        "tools",
+        "tool",
+        "metadata",
+        "image",
+        "images",
+        "videos",
+        "audio",
+        "response_audio",
+        "citations",
+        "member_responses",
+        "reasoning_messages",
+        "reasoning_steps",
+        "references",
+        "additional_input",
+        "session_summary",
+        "metrics",
+        "run_input",
+        "requirements",
+        "tasks",
+        "memories",
+        "followups",
+    ]
+)
+
+
 @dataclass
 class BaseRunOutputEvent:
     def to_dict(self) -> Dict[str, Any]:
-        _dict = {
-            k: v
-            for k, v in asdict(self).items()
-            if v is not None
-            and k
-            not in [
-                "tools",
-                "tool",
-                "metadata",
-                "image",
-                "images",
-                "videos",
-                "audio",
-                "response_audio",
-                "citations",
-                "member_responses",
-                "reasoning_messages",
-                "reasoning_steps",
-                "references",
-                "additional_input",
-                "session_summary",
-                "metrics",
-                "run_input",
-                "requirements",
-                "tasks",
-                "memories",
-                "followups",
-            ]
-        }
+        _dict = fields_to_dict(self, _EVENT_FIELDS_SERIALIZED_SEPARATELY)
 
         if hasattr(self, "metadata") and self.metadata is not None:
             _dict["metadata"] = self.metadata
@@ -191,7 +235,7 @@ class BaseRunOutputEvent:
     def to_json(self, separators=(", ", ": "), indent: Optional[int] = 2) -> str:
         import json
 
-        from agno.utils.serialize import json_serializer
+        from agno.utils.serialize import json_dumps_compact, json_serializer
 
         try:
             _dict = self.to_dict()
@@ -200,6 +244,8 @@ class BaseRunOutputEvent:
             raise
 
         if indent is None:
+            if tuple(separators) == (",", ":"):
+                return json_dumps_compact(_dict)
             return json.dumps(_dict, separators=separators, default=json_serializer, ensure_ascii=False)
         else:
             return json.dumps(_dict, indent=indent, separators=separators, default=json_serializer, ensure_ascii=False)
@@ -1,4 +1,4 @@
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from enum import Enum
 from time import time
 from typing import Any, Dict, List, Optional, Sequence, Union
@@ -11,7 +11,7 @@ from agno.models.metrics import RunMetrics
 from agno.models.response import ToolExecution
 from agno.reasoning.step import ReasoningStep
 from agno.run.agent import RunEvent, RunOutput, RunOutputEvent, run_output_event_from_dict
-from agno.run.base import BaseRunOutputEvent, MessageReferences, RunStatus
+from agno.run.base import BaseRunOutputEvent, MessageReferences, RunStatus, fields_to_dict
 from agno.run.requirement import RunRequirement
 from agno.utils.log import log_error
 from agno.utils.media import (
@@ -736,6 +736,33 @@ def team_run_output_event_from_dict(data: dict) -> BaseTeamRunEvent:
     return event_class.from_dict(data)  # type: ignore
 
 
+# Fields of TeamRunOutput that to_dict serializes on its own
+_TEAM_RUN_OUTPUT_FIELDS_SERIALIZED_SEPARATELY = frozenset(
+    [
+        "messages",
+        "metrics",
+        "status",
+        "tools",
+        "metadata",
+        "images",
+        "videos",
+        "audio",
+        "files",
+        "response_audio",
+        "citations",
+        "events",
+        "additional_input",
+        "reasoning_steps",
+        "reasoning_messages",
+        "references",
+        "requirements",
+        "followups",
+        "member_responses",
+        "input",
+    ]
+)
+
+
 @dataclass
 class TeamRunOutput:
     """Response returned by Team.run() functions"""
@@ -827,32 +854,7 @@ class TeamRunOutput:
         return self.status == RunStatus.cancelled
 
     def to_dict(self) -> Dict[str, Any]:
-        _dict = {
-            k: v
-            for k, v in asdict(self).items()
-            if v is not None
-            and k
-            not in [
-                "messages",
-                "metrics",
-                "status",
-                "tools",
-                "metadata",
-                "images",
-                "videos",
-                "audio",
-                "files",
-                "response_audio",
-                "citations",
-                "events",
-                "additional_input",
-                "reasoning_steps",
-                "reasoning_messages",
-                "references",
-                "requirements",
-                "followups",
-            ]
-        }
+        _dict = fields_to_dict(self, _TEAM_RUN_OUTPUT_FIELDS_SERIALIZED_SEPARATELY)
         if self.events is not None:
             _dict["events"] = [e.to_dict() for e in self.events]
 
@@ -901,7 +903,7 @@ class TeamRunOutput:
             else:
                 _dict["response_audio"] = self.response_audio
 
-        if self.member_responses:
+        if self.member_responses is not None:
             _dict["member_responses"] = [
                 response.to_dict() if hasattr(response, "to_dict") else response for response in self.member_responses
             ]
@@ -1,4 +1,4 @@
-from dataclasses import asdict, dataclass, field, fields
+from dataclasses import dataclass, field, fields
 from enum import Enum
 from time import time
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
@@ -7,7 +7,7 @@ from pydantic import BaseModel
 
 from agno.media import Audio, File, Image, Video
 from agno.run.agent import RunEvent, RunOutput, run_output_event_from_dict
-from agno.run.base import BaseRunOutputEvent, RunStatus
+from agno.run.base import BaseRunOutputEvent, RunStatus, fields_to_dict
 from agno.run.team import TeamRunEvent, TeamRunOutput, team_run_output_event_from_dict
 from agno.utils.log import log_warning
 from agno.utils.media import (
@@ -81,6 +81,21 @@ class WorkflowRunEvent(str, Enum):
     custom_event = "CustomEvent"
 
 
+# Fields of workflow events that to_dict serializes on its own, or leaves out
+_WORKFLOW_EVENT_FIELDS_SERIALIZED_SEPARATELY = frozenset(
+    [
+        "run_output",
+        "metrics",
+        "step_results",
+        "step_executor_runs",
+        "step_requirements",
+        "step_response",
+        "iteration_results",
+        "all_results",
+    ]
+)
+
+
 @dataclass
 class BaseWorkflowRunOutputEvent(BaseRunOutputEvent):
     """Base class for all workflow run response events"""
@@ -100,17 +115,9 @@ class BaseWorkflowRunOutputEvent(BaseRunOutputEvent):
     nested_depth: int = 0
 
     def to_dict(self) -> Dict[str, Any]:
-        # Temporarily clear run_output before asdict() to avoid infinite recursion:
+        # run_output is never copied, which would recurse infinitely:
         # WorkflowCompletedEvent.run_output -> WorkflowRunOutput.events -> WorkflowCompletedEvent.run_output -> ...
-        # asdict() recursively traverses all fields before we can filter, so we must clear it first.
-        saved_run_output = getattr(self, "run_output", None)
-        if saved_run_output is not None:
-            object.__setattr__(self, "run_output", None)
-        try:
-            _dict = {k: v for k, v in asdict(self).items() if v is not None and k not in ("run_output", "metrics")}
-        finally:
-            if saved_run_output is not None:
-                object.__setattr__(self, "run_output", saved_run_output)
+        _dict = fields_to_dict(self, _WORKFLOW_EVENT_FIELDS_SERIALIZED_SEPARATELY)
 
         if hasattr(self, "content") and self.content and isinstance(self.content, BaseModel):
             _dict["content"] = self.content.model_dump(exclude_none=True)
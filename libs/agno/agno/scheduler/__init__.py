@@ -1,6 +1,6 @@
 from agno.scheduler.cli import SchedulerConsole
 from agno.scheduler.cron import compute_next_run, validate_cron_expr, validate_timezone
-from agno.scheduler.executor import ScheduleExecutor
+from agno.scheduler.executor import InProcessScheduleExecutor, ScheduleExecutor
 from agno.scheduler.manager import ScheduleManager
 from agno.scheduler.poller import SchedulePoller
 
@@ -8,6 +8,7 @@ __all__ = [
     "compute_next_run",
     "validate_cron_expr",
     "validate_timezone",
+    "InProcessScheduleExecutor",
     "ScheduleExecutor",
     "ScheduleManager",
     "SchedulePoller",
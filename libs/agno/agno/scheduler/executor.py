@@ -440,39 +440,48 @@ class ScheduleExecutor:
                 log_warning(f"Invalid JSON in poll response for run {run_id}: {str(e)}")
                 continue
 
-            run_status = data.get("status")
-
-            if run_status in _TERMINAL_STATUSES:
-                if run_status == "COMPLETED":
-                    status = "success"
-                    error = None
-                elif run_status == "PAUSED":
-                    status = "paused"
-                    error = None
-                elif run_status == "CANCELLED":
-                    status = "failed"
-                    error = data.get("error") or "Run was cancelled"
-                else:
-                    status = "failed"
-                    error = data.get("error") or f"Run failed with status {run_status}"
+            if data.get("status") in _TERMINAL_STATUSES:
+                return self._build_run_result(data, run_id, session_id, resp.status_code)
 
-                # Extract input, output, and requirements from RunOutput
-                run_input = data.get("input") if isinstance(data.get("input"), dict) else None
-                run_output = self._extract_output(data)
-                run_requirements = self._extract_requirements(data) if run_status == "PAUSED" else None
+            await asyncio.sleep(self.poll_interval)
 
-                return {
-                    "status": status,
-                    "status_code": resp.status_code,
-                    "error": error,
-                    "run_id": run_id,
-                    "session_id": session_id,
-                    "input": run_input,
-                    "output": run_output,
-                    "requirements": run_requirements,
-                }
+    def _build_run_result(
+        self,
+        data: Dict[str, Any],
+        run_id: Optional[str],
+        session_id: Optional[str],
+        status_code: Optional[int],
+    ) -> Dict[str, Any]:
+        """Build the schedule run result of a run that reached a terminal state."""
+        run_status = data.get("status")
+        if run_status == "COMPLETED":
+            status = "success"
+            error = None
+        elif run_status == "PAUSED":
+            status = "paused"
+            error = None
+        elif run_status == "CANCELLED":
+            status = "failed"
+            error = data.get("error") or "Run was cancelled"
+        else:
+            status = "failed"
+            error = data.get("error") or f"Run failed with status {run_status}"
 
-            await asyncio.sleep(self.poll_interval)
+        # Extract input, output, and requirements from RunOutput
+        run_input = data.get("input") if isinstance(data.get("input"), dict) else None
+        run_output = self._extract_output(data)
+        run_requirements = self._extract_requirements(data) if run_status == "PAUSED" else None
+
+        return {
+            "status": status,
+            "status_code": status_code,
+            "error": error,
+            "run_id": run_id,
+            "session_id": session_id,
+            "input": run_input,
+            "output": run_output,
+            "requirements": run_requirements,
+        }
 
     # ------------------------------------------------------------------
     @staticmethod
@@ -493,3 +502,105 @@ class ScheduleExecutor:
         if raw and isinstance(raw, list):
             return raw
         return None
+
+
+class InProcessScheduleExecutor(ScheduleExecutor):
+    """Execute schedules that target this AgentOS's own agents, teams and workflows in process.
+
+    Run endpoints of agents, teams and workflows registered on the AgentOS are executed by calling
+    ``arun()`` directly and awaiting the result, instead of submitting a background run over HTTP
+    and polling its status. Everything else (other endpoints, remote components, factories and
+    payloads with fields that need the HTTP layer) goes through ``ScheduleExecutor``.
+    """
+
+    # Payload fields handled in process. Payloads with other fields are sent over HTTP.
+    _IN_PROCESS_FIELDS = {"message", "session_id", "user_id", "session_state", "dependencies", "metadata"}
+
+    def __init__(
+        self,
+        agent_os: Any,
+        base_url: str,
+        internal_service_token: str,
+        timeout: int = 3600,
+        poll_interval: int = _DEFAULT_POLL_INTERVAL,
+    ) -> None:
+        super().__init__(
+            base_url=base_url,
+            internal_service_token=internal_service_token,
+            timeout=timeout,
+            poll_interval=poll_interval,
+        )
+        self.agent_os = agent_os
+
+    async def _call_endpoint(self, schedule: Schedule) -> Dict[str, Any]:
+        method = (schedule.method or "POST").upper()
+        payload = schedule.payload or {}
+        match = _RUN_ENDPOINT_RE.match(schedule.endpoint)
+        if match is not None and method == "POST" and "message" in payload:
+            extra_fields = set(payload) - self._IN_PROCESS_FIELDS - {"stream", "background"}
+            component = None if extra_fields else self._get_component(match.group(1), match.group(2))
+            if component is not None:
+                return await self._run_in_process(component, payload, schedule.timeout_seconds or self.timeout)
+        return await super()._call_endpoint(schedule)
+
+    def _get_component(self, resource_type: str, resource_id: str) -> Any:
+        """Get a fresh copy of a local agent, team or workflow, or None if it must be called over HTTP."""
+        from agno.agent import Agent
+        from agno.os.utils import get_agent_by_id, get_team_by_id, get_workflow_by_id
+        from agno.team import Team
+        from agno.workflow import Workflow
+
+        # Only components registered on the AgentOS. Factories need a request, remote components are HTTP anyway.
+        if resource_type == "agents":
+            agents = [a for a in self.agent_os.agents or [] if isinstance(a, Agent)]
+            return get_agent_by_id(resource_id, agents, create_fresh=True) if agents else None
+        if resource_type == "teams":
+            teams = [t for t in self.agent_os.teams or [] if isinstance(t, Team)]
+            return get_team_by_id(resource_id, teams, create_fresh=True) if teams else None
+        workflows = [w for w in self.agent_os.workflows or [] if isinstance(w, Workflow)]
+        return get_workflow_by_id(resource_id, workflows, create_fresh=True) if workflows else None
+
+    async def _run_in_process(self, component: Any, payload: Dict[str, Any], timeout_seconds: int) -> Dict[str, Any]:
+        """Run the component and build the schedule run result from its output."""
+        run_kwargs = {k: v for k, v in payload.items() if k in self._IN_PROCESS_FIELDS and k != "message"}
+        for key in ("session_state", "dependencies", "metadata"):
+            if isinstance(run_kwargs.get(key), str):
+                run_kwargs[key] = json.loads(run_kwargs[key])
+
+        try:
+            run_output = await asyncio.wait_for(
+                component.arun(input=payload["message"], stream=False, **run_kwargs),
+                timeout=timeout_seconds,
+            )
+        except asyncio.TimeoutError:
+            return {
+                "status": "failed",
+                "status_code": None,
+                "error": f"Run timed out after {timeout_seconds}s",
+                "run_id": None,
+                "session_id": run_kwargs.get("session_id"),
+                "input": None,
+                "output": None,
+                "requirements": None,
+            }
+
+        # Only serialize the fields stored on the schedule run, not the whole run output
+        status = getattr(run_output, "status", None)
+        content = getattr(run_output, "content", None)
+        if content is not None and hasattr(content, "model_dump"):
+            content = content.model_dump(exclude_none=True, mode="json")
+        run_input = getattr(run_output, "input", None)
+        requirements = getattr(run_output, "requirements", None)
+        data: Dict[str, Any] = {
+            "status": getattr(status, "value", status),
+            "content": content,
+            "content_type": getattr(run_output, "content_type", None),
+            "input": run_input.to_dict() if run_input is not None and hasattr(run_input, "to_dict") else None,
+            "requirements": [r.to_dict() if hasattr(r, "to_dict") else r for r in requirements or []] or None,
+        }
+        return self._build_run_result(
+            data,
+            getattr(run_output, "run_id", None),
+            getattr(run_output, "session_id", None),
+            status_code=None,
+        )
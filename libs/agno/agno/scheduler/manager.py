@@ -7,6 +7,7 @@ from typing import Any, Dict, List, Literal, Optional
 from uuid import uuid4
 
 from agno.db.schemas.scheduler import Schedule, ScheduleRun
+from agno.scheduler.poller import notify_pollers
 from agno.utils.log import log_debug, log_warning
 
 # Valid DB method names for the scheduler
@@ -32,6 +33,10 @@ class ScheduleManager:
     Provides a Pythonic interface for creating, listing, updating, and
     managing schedules without going through HTTP. Used by cookbooks
     and the Rich CLI console.
+
+    Creating, updating or enabling a schedule wakes up the event-driven
+    pollers running in the same process, so they pick up the change without
+    waiting for their next poll.
     """
 
     def __init__(self, db: Any) -> None:
@@ -158,6 +163,7 @@ class ScheduleManager:
                         next_run_at=next_run_at,
                     )
                 )
+                notify_pollers()
                 return updated or existing
             raise ValueError(f"Schedule with name '{name}' already exists")
 
@@ -187,6 +193,7 @@ class ScheduleManager:
         result = self._to_schedule(self._call("create_schedule", schedule.to_dict()))
         if result is None:
             raise RuntimeError("Failed to create schedule")
+        notify_pollers()
         log_debug(f"Schedule '{name}' created (id={result.id}, cron={cron})")
         return result
 
@@ -203,7 +210,9 @@ class ScheduleManager:
 
     def update(self, schedule_id: str, **kwargs: Any) -> Optional[Schedule]:
         """Update a schedule."""
-        return self._to_schedule(self._call("update_schedule", schedule_id, **kwargs))
+        result = self._to_schedule(self._call("update_schedule", schedule_id, **kwargs))
+        notify_pollers()
+        return result
 
     def delete(self, schedule_id: str) -> bool:
         """Delete a schedule."""
@@ -217,7 +226,9 @@ class ScheduleManager:
         from agno.scheduler.cron import compute_next_run
 
         next_run_at = compute_next_run(schedule.cron_expr, schedule.timezone)
-        return self._to_schedule(self._call("update_schedule", schedule_id, enabled=True, next_run_at=next_run_at))
+        result = self._to_schedule(self._call("update_schedule", schedule_id, enabled=True, next_run_at=next_run_at))
+        notify_pollers()
+        return result
 
     def disable(self, schedule_id: str) -> Optional[Schedule]:
         """Disable a schedule."""
@@ -302,6 +313,7 @@ class ScheduleManager:
                         next_run_at=next_run_at,
                     )
                 )
+                notify_pollers()
                 return updated or existing
             raise ValueError(f"Schedule with name '{name}' already exists")
 
@@ -331,6 +343,7 @@ class ScheduleManager:
         result = self._to_schedule(await self._acall("create_schedule", schedule.to_dict()))
         if result is None:
             raise RuntimeError("Failed to create schedule")
+        notify_pollers()
         log_debug(f"Schedule '{name}' created (id={result.id}, cron={cron})")
         return result
 
@@ -347,7 +360,9 @@ class ScheduleManager:
 
     async def aupdate(self, schedule_id: str, **kwargs: Any) -> Optional[Schedule]:
         """Async update a schedule."""
-        return self._to_schedule(await self._acall("update_schedule", schedule_id, **kwargs))
+        result = self._to_schedule(await self._acall("update_schedule", schedule_id, **kwargs))
+        notify_pollers()
+        return result
 
     async def adelete(self, schedule_id: str) -> bool:
         """Async delete a schedule."""
@@ -361,9 +376,11 @@ class ScheduleManager:
         from agno.scheduler.cron import compute_next_run
 
         next_run_at = compute_next_run(schedule.cron_expr, schedule.timezone)
-        return self._to_schedule(
+        result = self._to_schedule(
             await self._acall("update_schedule", schedule_id, enabled=True, next_run_at=next_run_at)
         )
+        notify_pollers()
+        return result
 
     async def adisable(self, schedule_id: str) -> Optional[Schedule]:
         """Async disable a schedule."""
@@ -1,7 +1,10 @@
 """Schedule poller -- periodically claims and executes due schedules."""
 
 import asyncio
-from typing import Any, Dict, Optional, Set, Union
+import heapq
+import time
+import weakref
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 from uuid import uuid4
 
 from agno.db.schemas.scheduler import Schedule
@@ -10,6 +13,15 @@ from agno.utils.log import log_error, log_info, log_warning
 # Default timeout (in seconds) when stopping the poller
 _DEFAULT_STOP_TIMEOUT = 30
 
+# Pollers running in this process, woken up by notify_pollers()
+_running_pollers: "weakref.WeakSet[SchedulePoller]" = weakref.WeakSet()
+
+
+def notify_pollers() -> None:
+    """Wake up the event-driven pollers running in this process, e.g. after a schedule was created or updated."""
+    for poller in list(_running_pollers):
+        poller.notify()
+
 
 class SchedulePoller:
     """Periodically poll the DB for due schedules and execute them.
@@ -17,6 +29,12 @@ class SchedulePoller:
     Each poll tick repeatedly calls ``db.claim_due_schedule()`` until no more
     schedules are due, spawning an ``asyncio.create_task`` for each claimed
     schedule so they run concurrently.
+
+    With ``event_driven=True`` the poller instead keeps a min-heap of the
+    upcoming ``next_run_at`` of all enabled schedules, refreshed with the
+    schedules updated since the previous refresh. It sleeps until the next
+    schedule is due (at most ``poll_interval``) and claims due schedules in
+    batches of ``claim_batch_size`` with ``db.claim_due_schedules()``.
     """
 
     def __init__(
@@ -27,6 +45,9 @@ class SchedulePoller:
         worker_id: Optional[str] = None,
         max_concurrent: int = 10,
         stop_timeout: int = _DEFAULT_STOP_TIMEOUT,
+        event_driven: bool = False,
+        claim_batch_size: int = 10,
+        full_refresh_interval: int = 300,
     ) -> None:
         self.db = db
         self.executor = executor
@@ -38,17 +59,59 @@ class SchedulePoller:
         self._running = False
         self._in_flight: Set[asyncio.Task] = set()  # type: ignore[type-arg]
 
+        # Event-driven mode
+        self.event_driven = event_driven
+        self.claim_batch_size = claim_batch_size
+        self.full_refresh_interval = full_refresh_interval
+        # Heap of (next_run_at, schedule_id). Entries that don't match _next_runs are stale and skipped.
+        self._next_run_heap: List[Tuple[float, str]] = []
+        self._next_runs: Dict[str, float] = {}
+        self._last_refresh_at: Optional[int] = None
+        self._last_full_refresh_at: Optional[float] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
     async def start(self) -> None:
         """Start the polling loop as a background task."""
         if self._running:
             return
         self._running = True
-        self._task = asyncio.create_task(self._poll_loop())
-        log_info(f"Scheduler poller started (worker={self.worker_id}, interval={self.poll_interval}s)")
+        self._loop = asyncio.get_running_loop()
+        _running_pollers.add(self)
+        if self.event_driven:
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._dispatch_loop())
+        else:
+            self._task = asyncio.create_task(self._poll_loop())
+        log_info(
+            f"Scheduler poller started (worker={self.worker_id}, interval={self.poll_interval}s, "
+            f"event_driven={self.event_driven})"
+        )
+
+    def notify(self) -> None:
+        """Wake up the event-driven dispatcher, e.g. after a schedule was created or updated in this process.
+
+        Safe to call from any thread.
+        """
+        if self._wakeup is None or self._loop is None:
+            return
+        try:
+            running_loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is self._loop:
+            self._wakeup.set()
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+        except RuntimeError:
+            # The loop of the poller is closed
+            pass
 
     async def stop(self) -> None:
         """Stop the polling loop gracefully and cancel in-flight tasks."""
         self._running = False
+        _running_pollers.discard(self)
         if self._task is not None:
             self._task.cancel()
             try:
@@ -108,15 +171,131 @@ class SchedulePoller:
                 if schedule is None:
                     break
 
-                sched = Schedule.from_dict(schedule) if isinstance(schedule, dict) else schedule
-                log_info(f"Claimed schedule: {sched.name or sched.id}")
-                task = asyncio.create_task(self._execute_safe(sched))
-                self._in_flight.add(task)
-                task.add_done_callback(lambda t: self._in_flight.discard(t))
+                self._dispatch(schedule)
             except Exception as exc:
                 log_error(f"Error claiming schedule: {exc}")
                 break
 
+    def _dispatch(self, schedule: Union[Schedule, Dict[str, Any]]) -> None:
+        """Run a claimed schedule in its own task."""
+        sched = Schedule.from_dict(schedule) if isinstance(schedule, dict) else schedule
+        log_info(f"Claimed schedule: {sched.name or sched.id}")
+        task = asyncio.create_task(self._execute_safe(sched))
+        self._in_flight.add(task)
+        task.add_done_callback(self._on_task_done)
+
+    def _on_task_done(self, task: asyncio.Task) -> None:  # type: ignore[type-arg]
+        self._in_flight.discard(task)
+        # A finished execution frees a slot and has released its schedule with a new next_run_at
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _call_db(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        """Call a sync or async DB method."""
+        fn = getattr(self.db, method)
+        if asyncio.iscoroutinefunction(fn):
+            return await fn(*args, **kwargs)
+        return fn(*args, **kwargs)
+
+    # --- Event-driven mode ---
+
+    async def _dispatch_loop(self) -> None:
+        """Main loop of the event-driven mode: refresh, claim what is due, sleep until the next due time."""
+        assert self._wakeup is not None
+        while self._running:
+            try:
+                self._wakeup.clear()
+                await self._refresh_next_runs()
+                next_run_at = self._peek_next_run()
+                if next_run_at is not None and next_run_at <= time.time():
+                    await self._claim_due()
+                if not self._running:
+                    break
+
+                # Sleep until the next schedule is due, a task finishes or notify() is called. The wait is capped
+                # at poll_interval so schedules created by other processes are picked up.
+                timeout = float(self.poll_interval)
+                next_run_at = self._peek_next_run()
+                if next_run_at is not None and len(self._in_flight) < self.max_concurrent:
+                    timeout = min(max(next_run_at - time.time(), 0.0), timeout)
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    pass
+            except asyncio.CancelledError:
+                break
+            except Exception as exc:
+                log_error(f"Scheduler dispatch error: {exc}")
+                await asyncio.sleep(self.poll_interval)
+
+    async def _refresh_next_runs(self) -> None:
+        """Update the heap with the schedules updated since the last refresh, or all of them periodically."""
+        now = time.time()
+        full_refresh = (
+            self._last_full_refresh_at is None or now - self._last_full_refresh_at >= self.full_refresh_interval
+        )
+        # updated_at has a one second resolution, so overlap with the previous refresh by a second
+        updated_since = None if full_refresh else self._last_refresh_at
+        rows = await self._call_db("get_schedule_next_runs", updated_since=updated_since)
+        self._last_refresh_at = int(now) - 1
+
+        if full_refresh:
+            self._last_full_refresh_at = now
+            self._next_runs = {}
+            self._next_run_heap = []
+        for row in rows:
+            schedule_id, next_run_at = row["id"], row.get("next_run_at")
+            if not row.get("enabled") or next_run_at is None:
+                self._next_runs.pop(schedule_id, None)
+            elif self._next_runs.get(schedule_id) != next_run_at:
+                self._next_runs[schedule_id] = next_run_at
+                heapq.heappush(self._next_run_heap, (next_run_at, schedule_id))
+
+    def _peek_next_run(self) -> Optional[float]:
+        """Get the earliest next_run_at, dropping stale heap entries."""
+        while self._next_run_heap:
+            next_run_at, schedule_id = self._next_run_heap[0]
+            if self._next_runs.get(schedule_id) == next_run_at:
+                return next_run_at
+            heapq.heappop(self._next_run_heap)
+        return None
+
+    async def _claim_due(self) -> None:
+        """Claim due schedules in batches until none are left or the concurrency limit is reached."""
+        while self._running:
+            self._in_flight -= {t for t in self._in_flight if t.done()}
+            capacity = self.max_concurrent - len(self._in_flight)
+            if capacity <= 0:
+                log_warning(f"Max concurrent executions reached ({self.max_concurrent}), waiting")
+                return
+
+            now = time.time()
+            limit = min(self.claim_batch_size, capacity)
+            try:
+                schedules = await self._call_db("claim_due_schedules", self.worker_id, limit=limit)
+            except Exception as exc:
+                log_error(f"Error claiming schedules: {exc}")
+                schedules = []
+            for schedule in schedules:
+                self._dispatch(schedule)
+
+            if len(schedules) < limit:
+                self._postpone_due(now)
+                return
+
+    def _postpone_due(self, now: float) -> None:
+        """Move the due schedules that could not be claimed to the next poll.
+
+        They were claimed by us or another worker, which update next_run_at when releasing them, or they were
+        deleted. Retrying them after poll_interval covers claims that were lost.
+        """
+        retry_at = now + self.poll_interval
+        while self._next_run_heap and self._next_run_heap[0][0] <= now:
+            next_run_at, schedule_id = heapq.heappop(self._next_run_heap)
+            if self._next_runs.get(schedule_id) == next_run_at:
+                self._next_runs[schedule_id] = retry_at
+                heapq.heappush(self._next_run_heap, (retry_at, schedule_id))
+
     async def _execute_safe(self, schedule: Union[Schedule, Dict[str, Any]]) -> None:
         """Execute a schedule, catching all errors."""
         try:
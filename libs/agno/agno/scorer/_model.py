@@ -56,9 +56,11 @@ _LOCAL_BEHAVIOR_FIELDS = frozenset(
         "exponential_backoff",
         "retry_with_guidance",
         "retry_with_guidance_limit",
+        "max_tool_call_workers",
         "cache_response",
         "cache_ttl",
         "cache_dir",
+        "cache_store",
         "background_poll_interval",
         "background_max_wait",
         "vector_store_name",
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
-from typing import Any, Dict, List, Mapping, Optional, Union
+from dataclasses import asdict, dataclass, replace
+from typing import Any, Callable, Dict, List, Mapping, Optional, Set, Union
 
 from agno.models.message import Message
 from agno.run.agent import RunOutput
 from agno.run.base import RunStatus
 from agno.run.team import TeamRunOutput
+from agno.session.lazy import LazyRunList, get_run_field
 from agno.session.summary import SessionSummary
 from agno.utils.log import log_debug, log_warning
 
@@ -43,14 +44,38 @@ class AgentSession:
     # The unix timestamp when this session was last updated
     updated_at: Optional[int] = None
 
+    def __post_init__(self) -> None:
+        # IDs of the runs upserted since the runs were last saved. None while unknown, e.g. for sessions built
+        # from a dictionary, in which case saving the session writes all of its runs.
+        self._unsaved_run_ids: Optional[Set[str]] = None
+
+    def mark_runs_saved(self) -> None:
+        """Record that the stored runs match the session runs, so only runs upserted from now on are saved."""
+        self._unsaved_run_ids = set()
+
+    def get_unsaved_run_ids(self) -> Optional[Set[str]]:
+        """Return the IDs of the runs upserted since the runs were last saved, or None if all runs need saving."""
+        return getattr(self, "_unsaved_run_ids", None)
+
     def to_dict(self) -> Dict[str, Any]:
-        session_dict = asdict(self)
+        # Runs and summary are serialized below, so they are not deep-copied by asdict
+        session_dict = asdict(replace(self, runs=None, summary=None))
 
-        session_dict["runs"] = [run.to_dict() for run in self.runs] if self.runs else None
+        if isinstance(self.runs, LazyRunList):
+            session_dict["runs"] = self.runs.to_dicts() or None
+        else:
+            session_dict["runs"] = [run.to_dict() for run in self.runs] if self.runs else None
         session_dict["summary"] = self.summary.to_dict() if self.summary else None
 
         return session_dict
 
+    @staticmethod
+    def run_from_dict(run: Dict[str, Any]) -> Union[RunOutput, TeamRunOutput]:
+        """Deserialize a run stored in an Agent session."""
+        if "agent_id" in run:
+            return RunOutput.from_dict(run)
+        return TeamRunOutput.from_dict(run)
+
     @classmethod
     def from_dict(cls, data: Mapping[str, Any]) -> Optional[AgentSession]:
         if data is None or data.get("session_id") is None:
@@ -61,10 +86,8 @@ class AgentSession:
         serialized_runs: List[Union[RunOutput, TeamRunOutput]] = []
         if runs and isinstance(runs[0], dict):
             for run in runs:
-                if "agent_id" in run:
-                    serialized_runs.append(RunOutput.from_dict(run))
-                elif "team_id" in run:
-                    serialized_runs.append(TeamRunOutput.from_dict(run))
+                if "agent_id" in run or "team_id" in run:
+                    serialized_runs.append(cls.run_from_dict(run))
 
         summary = data.get("summary")
         if summary is not None and isinstance(summary, dict):
@@ -87,6 +110,58 @@ class AgentSession:
             summary=summary,
         )
 
+    @classmethod
+    def from_dict_lazy(
+        cls,
+        data: Mapping[str, Any],
+        load_older_runs: Optional[Callable[[], List[Dict[str, Any]]]] = None,
+    ) -> Optional[AgentSession]:
+        """Create an AgentSession whose runs are only deserialized when accessed.
+
+        Args:
+            data: The session dictionary, with its runs as dictionaries.
+            load_older_runs: Called to load all runs of the session when data only holds the most recent runs.
+        """
+        session = cls.from_dict({**data, "runs": None})
+        if session is None:
+            return None
+
+        def _is_session_run(run: Any) -> bool:
+            return isinstance(run, dict) and ("agent_id" in run or "team_id" in run)
+
+        runs = data.get("runs") or []
+        session.runs = LazyRunList(
+            [run for run in runs if _is_session_run(run)],
+            run_from_dict=cls.run_from_dict,
+            load_older_runs=(lambda: [run for run in load_older_runs() if _is_session_run(run)])
+            if load_older_runs is not None
+            else None,
+        )
+        return session
+
+    def _find_run_index(self, run_id: str, search_older_runs: bool = True) -> Optional[int]:
+        """Return the index of the run with the given run_id, without deserializing lazily loaded runs.
+
+        Args:
+            run_id: The run_id to look for.
+            search_older_runs: Whether to load the older runs of a lazily loaded session if the run is not found.
+        """
+        if isinstance(self.runs, LazyRunList):
+            while True:
+                # Indices are counted from the end, as loading older runs prepends them
+                loaded_runs = list(self.runs.iter_loaded())
+                for i in range(len(loaded_runs) - 1, -1, -1):
+                    if get_run_field(loaded_runs[i], "run_id") == run_id:
+                        return i - len(loaded_runs)
+                if not search_older_runs or not self.runs.has_older_runs:
+                    return None
+                self.runs.load_older_runs()
+
+        for i, existing_run in enumerate(self.runs or []):
+            if existing_run.run_id == run_id:
+                return i
+        return None
+
     def upsert_run(self, run: RunOutput):
         """Adds a RunOutput, together with some calculated data, to the runs list."""
         messages = run.messages
@@ -97,16 +172,23 @@ class AgentSession:
         if not self.runs:
             self.runs = []
 
-        for i, existing_run in enumerate(self.runs or []):
-            if existing_run.run_id == run.run_id:
-                self.runs[i] = run
-                break
+        # Runs being upserted are recent, so older runs of a lazily loaded session are not loaded to find them.
+        # A run found in them later replaces its stored copy when they are loaded.
+        index = self._find_run_index(run.run_id, search_older_runs=False)  # type: ignore
+        if index is not None:
+            self.runs[index] = run  # type: ignore
         else:
-            self.runs.append(run)
+            self.runs.append(run)  # type: ignore
+        if self.get_unsaved_run_ids() is not None and run.run_id is not None:
+            self._unsaved_run_ids.add(run.run_id)  # type: ignore[union-attr]
 
         log_debug("Added RunOutput to Agent Session")
 
     def get_run(self, run_id: str) -> Optional[Union[RunOutput, TeamRunOutput]]:
+        if isinstance(self.runs, LazyRunList):
+            index = self._find_run_index(run_id)
+            return self.runs[index] if index is not None else None
+
         for run in self.runs or []:
             if run.run_id == run_id:
                 return run
@@ -159,23 +241,38 @@ class AgentSession:
 
         runs = self.runs
 
-        # Filter by agent_id and team_id
-        if agent_id:
-            runs = [run for run in runs if hasattr(run, "agent_id") and run.agent_id == agent_id]  # type: ignore
-        if team_id:
-            runs = [run for run in runs if hasattr(run, "team_id") and run.team_id == team_id]  # type: ignore
-
-        # Skip any messages that might be part of members of teams (for session re-use)
-        runs = [run for run in runs if run.parent_run_id is None]  # type: ignore
+        if isinstance(runs, LazyRunList):
+            if last_n_runs is not None and last_n_runs <= 0:
+                return []
 
-        # Filter by status
-        runs = [run for run in runs if hasattr(run, "status") and run.status not in skip_statuses]  # type: ignore
+            def _is_history_run(run: Any) -> bool:
+                return (
+                    (not agent_id or get_run_field(run, "agent_id") == agent_id)
+                    and (not team_id or get_run_field(run, "team_id") == team_id)
+                    and get_run_field(run, "parent_run_id") is None
+                    and get_run_field(run, "status") not in skip_statuses  # type: ignore
+                )
 
-        # Filter by last_n_runs before applying message limit
-        if last_n_runs is not None:
-            if last_n_runs <= 0:
-                return []
-            runs = runs[-last_n_runs:]
+            # Filter on the stored fields, so only the selected runs are deserialized
+            runs = runs.select(_is_history_run, last_n=last_n_runs)
+        else:
+            # Filter by agent_id and team_id
+            if agent_id:
+                runs = [run for run in runs if hasattr(run, "agent_id") and run.agent_id == agent_id]  # type: ignore
+            if team_id:
+                runs = [run for run in runs if hasattr(run, "team_id") and run.team_id == team_id]  # type: ignore
+
+            # Skip any messages that might be part of members of teams (for session re-use)
+            runs = [run for run in runs if run.parent_run_id is None]  # type: ignore
+
+            # Filter by status
+            runs = [run for run in runs if hasattr(run, "status") and run.status not in skip_statuses]  # type: ignore
+
+            # Filter by last_n_runs before applying message limit
+            if last_n_runs is not None:
+                if last_n_runs <= 0:
+                    return []
+                runs = runs[-last_n_runs:]
 
         messages_from_history = []
         system_message = None
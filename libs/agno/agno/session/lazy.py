@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+from copy import deepcopy
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, SupportsIndex, Union
+
+
+def get_run_field(run: Any, field: str) -> Any:
+    """Read a top-level field of a run, without deserializing it if it is still a run dictionary."""
+    if isinstance(run, dict):
+        if isinstance(run.get("run"), dict):
+            run = run["run"]
+        return run.get(field)
+    return getattr(run, field, None)
+
+
+class LazyRunList(list):
+    """List of session runs, deserialized on first access.
+
+    Runs are kept as the dictionaries read from the database and replaced in place by their
+    deserialized run the first time they are accessed. Unchanged runs are written back as-is.
+
+    When created with load_older_runs, the list only holds the most recent runs of the session.
+    The older runs are loaded the first time an operation needs the full list, e.g. iteration,
+    len() or a non-negative index. Appending runs and reading from the end of the list do not.
+    """
+
+    def __init__(
+        self,
+        runs: Iterable[Any] = (),
+        run_from_dict: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        load_older_runs: Optional[Callable[[], List[Dict[str, Any]]]] = None,
+    ):
+        super().__init__(runs)
+        self._run_from_dict = run_from_dict
+        self._load_older_runs = load_older_runs
+
+    @property
+    def has_older_runs(self) -> bool:
+        """Whether older runs of the session have not been loaded yet."""
+        return self._load_older_runs is not None
+
+    def load_older_runs(self) -> None:
+        """Load the older runs of the session, keeping the runs already in the list."""
+        if self._load_older_runs is None:
+            return
+        load_older_runs, self._load_older_runs = self._load_older_runs, None
+
+        current_runs = list(super().__iter__())
+        current_by_id = {get_run_field(run, "run_id"): run for run in current_runs}
+        all_runs = [current_by_id.pop(get_run_field(run, "run_id"), run) for run in load_older_runs()]
+        # Runs added since the list was created are not in the database yet
+        remaining_ids = set(current_by_id)
+        all_runs.extend(run for run in current_runs if get_run_field(run, "run_id") in remaining_ids)
+        super().__init__(all_runs)
+
+    def _materialize(self, index: int) -> Any:
+        run = super().__getitem__(index)
+        if isinstance(run, dict) and self._run_from_dict is not None:
+            run = self._run_from_dict(run)
+            super().__setitem__(index, run)
+        return run
+
+    def _materialize_all(self) -> None:
+        self.load_older_runs()
+        for i in range(super().__len__()):
+            self._materialize(i)
+
+    def iter_loaded(self) -> Iterator[Any]:
+        """Iterate over the loaded runs without deserializing them. Items are run dictionaries or runs."""
+        return super().__iter__()
+
+    def select(self, predicate: Callable[[Any], bool], last_n: Optional[int] = None) -> List[Any]:
+        """Return the runs matching the predicate, deserializing only the selected runs.
+
+        Args:
+            predicate: Called with the run dictionary or run. Use get_run_field to read its fields.
+            last_n: Only return the last N matching runs. Older runs are only loaded if fewer match.
+        """
+        while True:
+            indices = [i for i, run in enumerate(super().__iter__()) if predicate(run)]
+            if self._load_older_runs is None or (last_n is not None and len(indices) >= last_n):
+                break
+            self.load_older_runs()
+
+        if last_n is not None:
+            indices = indices[-last_n:] if last_n > 0 else []
+        return [self._materialize(i) for i in indices]
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Serialize the runs, reusing the dictionaries of runs that were never deserialized."""
+        self.load_older_runs()
+        return [run if isinstance(run, dict) else run.to_dict() for run in super().__iter__()]
+
+    # -- Reads --
+
+    def __getitem__(self, index: Union[SupportsIndex, slice]) -> Any:  # type: ignore[override]
+        if isinstance(index, slice):
+            self.load_older_runs()
+            return [self._materialize(i) for i in range(*index.indices(super().__len__()))]
+
+        i = index.__index__()
+        if not (i < 0 and -i <= super().__len__()):
+            self.load_older_runs()
+        return self._materialize(i)
+
+    def __iter__(self) -> Iterator[Any]:
+        self.load_older_runs()
+        i = 0
+        while i < super().__len__():
+            yield self._materialize(i)
+            i += 1
+
+    def __reversed__(self) -> Iterator[Any]:
+        self.load_older_runs()
+        for i in range(super().__len__() - 1, -1, -1):
+            yield self._materialize(i)
+
+    def __len__(self) -> int:
+        self.load_older_runs()
+        return super().__len__()
+
+    def __bool__(self) -> bool:
+        return super().__len__() > 0 or self._load_older_runs is not None
+
+    def __contains__(self, run: object) -> bool:
+        self._materialize_all()
+        return super().__contains__(run)
+
+    def __eq__(self, other: object) -> bool:
+        self._materialize_all()
+        return super().__eq__(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        self._materialize_all()
+        return super().__repr__()
+
+    def __add__(self, other: List[Any]) -> List[Any]:  # type: ignore[override]
+        return list(self) + list(other)
+
+    def index(self, run: Any, *args: Any) -> int:  # type: ignore[override]
+        self._materialize_all()
+        return super().index(run, *args)
+
+    def count(self, run: Any) -> int:
+        self._materialize_all()
+        return super().count(run)
+
+    def copy(self) -> List[Any]:  # type: ignore[override]
+        return list(self)
+
+    def __copy__(self) -> List[Any]:
+        return list(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> List[Any]:
+        return deepcopy(list(self), memo)
+
+    def __reduce__(self) -> Any:
+        return (list, (list(self),))
+
+    # -- Writes --
+    # Appending and replacing recent runs do not need the older runs, every other write needs the full list
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        if isinstance(index, slice) or not (index.__index__() < 0 and -index.__index__() <= super().__len__()):
+            self.load_older_runs()
+        super().__setitem__(index, value)
+
+    def __delitem__(self, index: Any) -> None:
+        self.load_older_runs()
+        super().__delitem__(index)
+
+    def insert(self, index: SupportsIndex, run: Any) -> None:
+        self.load_older_runs()
+        super().insert(index, run)
+
+    def pop(self, index: SupportsIndex = -1) -> Any:
+        self.load_older_runs()
+        run = self._materialize(index.__index__())
+        super().pop(index)
+        return run
+
+    def remove(self, run: Any) -> None:
+        self._materialize_all()
+        super().remove(run)
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        self._materialize_all()
+        super().sort(*args, **kwargs)
+
+    def reverse(self) -> None:
+        self.load_older_runs()
+        super().reverse()
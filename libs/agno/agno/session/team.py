@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
-from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+from dataclasses import asdict, dataclass, replace
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple, Union
 
 from pydantic import BaseModel
 
@@ -42,8 +42,22 @@ class TeamSession:
     # The unix timestamp when this session was last updated
     updated_at: Optional[int] = None
 
+    def __post_init__(self) -> None:
+        # IDs of the runs upserted since the runs were last saved. None while unknown, e.g. for sessions built
+        # from a dictionary, in which case saving the session writes all of its runs.
+        self._unsaved_run_ids: Optional[Set[str]] = None
+
+    def mark_runs_saved(self) -> None:
+        """Record that the stored runs match the session runs, so only runs upserted from now on are saved."""
+        self._unsaved_run_ids = set()
+
+    def get_unsaved_run_ids(self) -> Optional[Set[str]]:
+        """Return the IDs of the runs upserted since the runs were last saved, or None if all runs need saving."""
+        return getattr(self, "_unsaved_run_ids", None)
+
     def to_dict(self) -> Dict[str, Any]:
-        session_dict = asdict(self)
+        # Runs and summary are serialized below, so they are not deep-copied by asdict
+        session_dict = asdict(replace(self, runs=None, summary=None))
 
         session_dict["runs"] = [run.to_dict() for run in self.runs] if self.runs else None
         session_dict["summary"] = self.summary.to_dict() if self.summary else None
@@ -108,6 +122,8 @@ class TeamSession:
                 break
         else:
             self.runs.append(run_response)
+        if self.get_unsaved_run_ids() is not None and run_response.run_id is not None:
+            self._unsaved_run_ids.add(run_response.run_id)  # type: ignore[union-attr]
 
         log_debug("Added RunOutput to Team Session")
 
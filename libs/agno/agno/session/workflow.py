@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple, Union
 
 from pydantic import BaseModel
 
@@ -126,6 +126,18 @@ class WorkflowSession:
         if self.updated_at is None:
             self.updated_at = current_time
 
+        # IDs of the runs upserted since the runs were last saved. None while unknown, e.g. for sessions built
+        # from a dictionary, in which case saving the session writes all of its runs.
+        self._unsaved_run_ids: Optional[Set[str]] = None
+
+    def mark_runs_saved(self) -> None:
+        """Record that the stored runs match the session runs, so only runs upserted from now on are saved."""
+        self._unsaved_run_ids = set()
+
+    def get_unsaved_run_ids(self) -> Optional[Set[str]]:
+        """Return the IDs of the runs upserted since the runs were last saved, or None if all runs need saving."""
+        return getattr(self, "_unsaved_run_ids", None)
+
     def get_run(self, run_id: str) -> Optional[WorkflowRunOutput]:
         for run in self.runs or []:
             if run.run_id == run_id:
@@ -144,6 +156,8 @@ class WorkflowSession:
                 break
         else:
             self.runs.append(run)
+        if self.get_unsaved_run_ids() is not None and run.run_id is not None:
+            self._unsaved_run_ids.add(run.run_id)  # type: ignore[union-attr]
 
     def get_workflow_history(self, num_runs: Optional[int] = None) -> List[Tuple[str, str]]:
         """Get workflow history as structured data (input, response pairs)
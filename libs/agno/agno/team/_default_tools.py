@@ -10,6 +10,10 @@ if TYPE_CHECKING:
 import asyncio
 import contextlib
 import json
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextvars import copy_context
 from copy import copy
 from typing import (
     Any,
@@ -18,6 +22,7 @@ from typing import (
     Iterator,
     List,
     Optional,
+    Tuple,
     Union,
     cast,
 )
@@ -975,28 +980,47 @@ def _get_delegate_task_function(
         from agno.utils.callables import get_resolved_members
 
         resolved_members = get_resolved_members(team, run_context) or []
+        if not resolved_members:
+            use_team_logger()
+            return
+
+        # Members run in worker threads. Setting up a member and merging its run into the team run touch state
+        # shared by all members, so they hold this lock.
+        state_lock = threading.RLock()
+        # Set when the caller stops consuming the stream, to cancel the member runs still going
+        stop_streaming = threading.Event()
+        done_marker = object()
+        event_queue: "queue.Queue[Union[RunOutputEvent, TeamRunOutputEvent, str, object]]" = queue.Queue()
+
+        def run_member(
+            member_index: int, member_agent: Union[Agent, "Team"]
+        ) -> Tuple[Optional[str], Optional[Union[RunOutput, TeamRunOutput]]]:
+            """Run a member and get its result, and its run if it paused without streaming.
 
-        # Run all the members sequentially
-        for _, member_agent in enumerate(resolved_members):
-            member_agent_task, history = _setup_delegate_task_to_member(member_agent=member_agent, task=task)
+            When streaming, the events of the member go to the event queue.
+            """
+            with state_lock:
+                member_agent_task, history = _setup_delegate_task_to_member(member_agent=member_agent, task=task)
+                member_session_state_copy = copy(run_context.session_state)
+            member_name = member_agent.name if member_agent.name else f"agent_{member_index}"
 
-            member_session_state_copy = copy(run_context.session_state)
             member_agent_run_response = None
             try:
+                member_run_id = str(uuid4())
+                if run_response.run_id is not None:
+                    register_member_run(run_response.run_id, member_run_id)
                 if stream:
-                    member_run_id = str(uuid4())
-                    if run_response.run_id is not None:
-                        register_member_run(run_response.run_id, member_run_id)
                     member_agent_run_response_stream = member_agent.run(
                         input=member_agent_task if not history else history,
                         user_id=user_id,
                         # All members have the same session_id
                         session_id=session.session_id,
                         session_state=member_session_state_copy,  # Send a copy to the agent
-                        images=images,
-                        videos=videos,
-                        audio=audio,
-                        files=files,
+                        # Copy the media lists, so members don't share them across threads
+                        images=list(images),
+                        videos=list(videos),
+                        audio=list(audio),
+                        files=list(files),
                         stream=True,
                         stream_events=stream_events or team.stream_member_events,
                         knowledge_filters=run_context.knowledge_filters
@@ -1022,7 +1046,7 @@ def _get_delegate_task_function(
                                 member_agent_run_response_chunk.parent_run_id
                                 or (run_response.run_id if run_response is not None else None)
                             )
-                            yield member_agent_run_response_chunk  # type: ignore
+                            event_queue.put(member_agent_run_response_chunk)
                             if member_agent_run_response_chunk.is_cancelled:
                                 draining_after_cancel = True
                             continue
@@ -1034,9 +1058,12 @@ def _get_delegate_task_function(
                             member_agent_run_response_chunk.parent_run_id
                             or (run_response.run_id if run_response is not None else None)
                         )
-                        yield member_agent_run_response_chunk  # type: ignore
+                        event_queue.put(member_agent_run_response_chunk)
 
+                        # Check if the parent team's run is cancelled - propagate to member
                         try:
+                            if stop_streaming.is_set():
+                                raise RunCancelledException("")
                             if run_response.run_id is not None:
                                 raise_if_cancelled(run_response.run_id)
                         except RunCancelledException:
@@ -1048,19 +1075,16 @@ def _get_delegate_task_function(
                         raise RunCancelledException("")
 
                 else:
-                    member_run_id = str(uuid4())
-                    if run_response.run_id is not None:
-                        register_member_run(run_response.run_id, member_run_id)
                     member_agent_run_response = member_agent.run(  # type: ignore
                         input=member_agent_task if not history else history,
                         user_id=user_id,
                         # All members have the same session_id
                         session_id=session.session_id,
                         session_state=member_session_state_copy,  # Send a copy to the agent
-                        images=images,
-                        videos=videos,
-                        audio=audio,
-                        files=files,
+                        images=list(images),
+                        videos=list(videos),
+                        audio=list(audio),
+                        files=list(files),
                         stream=False,
                         knowledge_filters=run_context.knowledge_filters
                         if not member_agent.knowledge_filters and member_agent.knowledge
@@ -1077,55 +1101,121 @@ def _get_delegate_task_function(
                     if run_response.run_id is not None:
                         raise_if_cancelled(run_response.run_id)
             except RunCancelledException:
-                _process_delegate_task_to_member(
-                    member_agent_run_response,
-                    member_agent,
-                    member_agent_task,  # type: ignore
-                    member_session_state_copy,  # type: ignore
-                )
+                with state_lock:
+                    _process_delegate_task_to_member(
+                        member_agent_run_response,
+                        member_agent,
+                        member_agent_task,  # type: ignore
+                        member_session_state_copy,  # type: ignore
+                    )
                 raise
 
             # Check if the member run is paused (HITL)
-            if member_agent_run_response is not None and member_agent_run_response.is_paused:
-                _propagate_member_pause(run_response, member_agent, member_agent_run_response)
-                use_team_logger()
+            is_paused = member_agent_run_response is not None and member_agent_run_response.is_paused
+            with state_lock:
+                if is_paused and stream and member_agent_run_response is not None:
+                    _propagate_member_pause(run_response, member_agent, member_agent_run_response)
                 _process_delegate_task_to_member(
                     member_agent_run_response,
                     member_agent,
                     member_agent_task,  # type: ignore
                     member_session_state_copy,  # type: ignore
                 )
-                yield f"Agent {member_agent.name}: Requires human input before continuing."
-                continue
 
-            if not stream:
-                try:
-                    if member_agent_run_response.content is None and (  # type: ignore
-                        member_agent_run_response.tools is None or len(member_agent_run_response.tools) == 0  # type: ignore
-                    ):
-                        yield f"Agent {member_agent.name}: No response from the member agent."
-                    elif isinstance(member_agent_run_response.content, str):  # type: ignore
-                        if len(member_agent_run_response.content.strip()) > 0:  # type: ignore
-                            yield f"Agent {member_agent.name}: {member_agent_run_response.content}"  # type: ignore
-                        elif (
-                            member_agent_run_response.tools is not None and len(member_agent_run_response.tools) > 0  # type: ignore
-                        ):
-                            yield f"Agent {member_agent.name}: {','.join([tool.result for tool in member_agent_run_response.tools])}"  # type: ignore
-                    elif issubclass(type(member_agent_run_response.content), BaseModel):  # type: ignore
-                        yield f"Agent {member_agent.name}: {member_agent_run_response.content.model_dump_json(indent=2)}"  # type: ignore
+            if is_paused:
+                # Without streaming, pauses are propagated in member order once all members are done
+                paused_run_response = None if stream else member_agent_run_response
+                return f"Agent {member_name}: Requires human input before continuing.", paused_run_response
+            if stream:
+                return None, None
+
+            result = f"Agent {member_name}: No Response"
+            try:
+                if member_agent_run_response.content is None and (  # type: ignore
+                    member_agent_run_response.tools is None or len(member_agent_run_response.tools) == 0  # type: ignore
+                ):
+                    result = f"Agent {member_name}: No response from the member agent."
+                elif isinstance(member_agent_run_response.content, str):  # type: ignore
+                    if len(member_agent_run_response.content.strip()) > 0:  # type: ignore
+                        result = f"Agent {member_name}: {member_agent_run_response.content}"  # type: ignore
+                    elif member_agent_run_response.tools is not None and len(member_agent_run_response.tools) > 0:  # type: ignore
+                        result = f"Agent {member_name}: {','.join([tool.result for tool in member_agent_run_response.tools if tool.result])}"  # type: ignore
+                elif issubclass(type(member_agent_run_response.content), BaseModel):  # type: ignore
+                    result = f"Agent {member_name}: {member_agent_run_response.content.model_dump_json(indent=2)}"  # type: ignore
+                else:
+                    result = f"Agent {member_name}: {json.dumps(member_agent_run_response.content, indent=2, ensure_ascii=False)}"  # type: ignore
+            except Exception as e:
+                result = f"Agent {member_name}: Error - {str(e)}"
+            return result, None
+
+        def stream_member(member_index: int, member_agent: Union[Agent, "Team"]) -> None:
+            try:
+                result, _ = run_member(member_index, member_agent)
+                if result is not None:
+                    event_queue.put(result)
+            finally:
+                event_queue.put(done_marker)
+
+        max_workers = min(team.max_concurrent_members or len(resolved_members), len(resolved_members))
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="agno-team-member")
+        try:
+            # Use copy_context().run to propagate context variables to the member threads
+            stream_futures: List[Future[None]] = []
+            futures: List[Future[Tuple[Optional[str], Optional[Union[RunOutput, TeamRunOutput]]]]] = []
+            if stream:
+                stream_futures = [
+                    executor.submit(copy_context().run, stream_member, member_index, member_agent)
+                    for member_index, member_agent in enumerate(resolved_members)
+                ]
+                # Yield the events of all members as they arrive, until all members reported done
+                completed = 0
+                while completed < len(stream_futures):
+                    item = event_queue.get()
+                    if item is done_marker:
+                        completed += 1
                     else:
-                        import json
+                        yield item  # type: ignore
+            else:
+                futures = [
+                    executor.submit(copy_context().run, run_member, member_index, member_agent)
+                    for member_index, member_agent in enumerate(resolved_members)
+                ]
+                wait(futures)
+        finally:
+            # Cancel the member runs still going if the caller stopped consuming the stream
+            stop_streaming.set()
+            executor.shutdown(wait=True, cancel_futures=True)
 
-                        yield f"Agent {member_agent.name}: {json.dumps(member_agent_run_response.content, indent=2, ensure_ascii=False)}"  # type: ignore
-                except Exception as e:
-                    yield f"Agent {member_agent.name}: Error - {str(e)}"
+        if stream:
+            # The results of the members were yielded with their events, only their errors are left
+            for member_index, stream_future in enumerate(stream_futures):
+                exception = stream_future.exception()
+                if isinstance(exception, RunCancelledException):
+                    raise exception
+                if exception is not None:
+                    member_agent = resolved_members[member_index]
+                    member_name = member_agent.name if member_agent.name else f"agent_{member_index}"
+                    yield f"Agent {member_name}: Error - {str(exception)}"
+            use_team_logger()
+            return
 
-            _process_delegate_task_to_member(
-                member_agent_run_response,
-                member_agent,
-                member_agent_task,  # type: ignore
-                member_session_state_copy,  # type: ignore
-            )
+        # Collect the results in member order. A cancelled member cancels the team run.
+        results: List[Tuple[Optional[str], Optional[Union[RunOutput, TeamRunOutput]]]] = []
+        for member_index, future in enumerate(futures):
+            try:
+                results.append(future.result())
+            except RunCancelledException:
+                raise
+            except Exception as e:
+                member_agent = resolved_members[member_index]
+                member_name = member_agent.name if member_agent.name else f"agent_{member_index}"
+                results.append((f"Agent {member_name}: Error - {str(e)}", None))
+
+        for member_agent, (result, paused_run_response) in zip(resolved_members, results):
+            if paused_run_response is not None:
+                _propagate_member_pause(run_response, member_agent, paused_run_response)
+            if result is not None:
+                yield result
 
         # After all the member runs, switch back to the team logger
         use_team_logger()
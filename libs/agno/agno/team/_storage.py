@@ -247,8 +247,11 @@ def _read_or_create_session(team: "Team", session_id: str, user_id: Optional[str
     if team.db is not None and team.parent_team_id is None and team.workflow_id is None:
         team_session = cast(TeamSession, _read_session(team, session_id=session_id, user_id=user_id))
 
-    # Create new session if none found
-    if team_session is None:
+    if team_session is not None:
+        # Runs are saved through upsert_run, so saving the session only writes the runs upserted from now on
+        team_session.mark_runs_saved()
+    else:
+        # Create new session if none found
         log_debug(f"Creating new TeamSession: {session_id}")
         session_data = {}
         if team.session_state is not None:
@@ -264,6 +267,7 @@ def _read_or_create_session(team: "Team", session_id: str, user_id: Optional[str
             metadata=team.metadata,
             created_at=int(time()),
         )
+        team_session.mark_runs_saved()
         if team.introduction is not None:
             from uuid import uuid4
 
@@ -314,8 +318,11 @@ async def _aread_or_create_session(team: "Team", session_id: str, user_id: Optio
         else:
             team_session = cast(TeamSession, _read_session(team, session_id=session_id, user_id=user_id))
 
-    # Create new session if none found
-    if team_session is None:
+    if team_session is not None:
+        # Runs are saved through upsert_run, so saving the session only writes the runs upserted from now on
+        team_session.mark_runs_saved()
+    else:
+        # Create new session if none found
         log_debug(f"Creating new TeamSession: {session_id}")
         session_data = {}
         if team.session_state is not None:
@@ -331,6 +338,7 @@ async def _aread_or_create_session(team: "Team", session_id: str, user_id: Optio
             metadata=team.metadata,
             created_at=int(time()),
         )
+        team_session.mark_runs_saved()
         if team.introduction is not None:
             from uuid import uuid4
 
@@ -440,6 +448,8 @@ def to_dict(team: "Team") -> Dict[str, Any]:
         config["respond_directly"] = team.respond_directly
     if team.delegate_to_all_members:
         config["delegate_to_all_members"] = team.delegate_to_all_members
+    if team.max_concurrent_members is not None:
+        config["max_concurrent_members"] = team.max_concurrent_members
     if not team.determine_input_for_members:  # default is True
         config["determine_input_for_members"] = team.determine_input_for_members
 
@@ -911,6 +921,7 @@ def from_dict(
             # --- Execution settings ---
             respond_directly=config.get("respond_directly", False),
             delegate_to_all_members=config.get("delegate_to_all_members", False),
+            max_concurrent_members=config.get("max_concurrent_members"),
             determine_input_for_members=config.get("determine_input_for_members", True),
             # --- User settings ---
             user_id=config.get("user_id"),
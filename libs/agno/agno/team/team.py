@@ -108,6 +108,9 @@ class Team:
     respond_directly: bool = False
     # If True, the team leader will delegate the task to all members, instead of deciding for a subset
     delegate_to_all_members: bool = False
+    # Maximum number of members run at the same time when a synchronous run delegates to all members.
+    # If None, all members run at the same time.
+    max_concurrent_members: Optional[int] = None
     # Set to false if you want to send the run input directly to the member agents
     determine_input_for_members: bool = True
     # Maximum number of iterations for autonomous task loop (mode=tasks)
@@ -450,6 +453,7 @@ class Team:
         respond_directly: bool = False,
         determine_input_for_members: bool = True,
         delegate_to_all_members: bool = False,
+        max_concurrent_members: Optional[int] = None,
         max_iterations: int = 10,
         user_id: Optional[str] = None,
         session_id: Optional[str] = None,
@@ -574,6 +578,7 @@ class Team:
             respond_directly=respond_directly,
             determine_input_for_members=determine_input_for_members,
             delegate_to_all_members=delegate_to_all_members,
+            max_concurrent_members=max_concurrent_members,
             max_iterations=max_iterations,
             user_id=user_id,
             session_id=session_id,
@@ -1,7 +1,11 @@
+import json
+import threading
+from collections import OrderedDict
+from copy import copy, deepcopy
 from dataclasses import dataclass
 from functools import lru_cache, partial, wraps
 from importlib.metadata import version
-from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Type, TypeVar, get_type_hints
+from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Tuple, Type, TypeVar, get_type_hints
 
 from docstring_parser import parse
 from packaging.version import Version
@@ -200,6 +204,59 @@ def isolated_runtime_value(value: Any) -> Any:
     return value
 
 
+@dataclass
+class _CompiledEntrypoint:
+    """The result of Function.process_entrypoint() for one entrypoint and set of options."""
+
+    parameters: Dict[str, Any]
+    description: str
+    user_input_schema: Optional[List[UserInputField]]
+    entrypoint: Callable
+
+
+class _CompiledEntrypointCache:
+    """Process-wide LRU cache of processed entrypoints.
+
+    Agents copy their Functions for every run and process each copy, which re-runs signature
+    inspection, docstring parsing, JSON schema generation and validate_call wrapping for the same
+    callables. The cache keeps the result, keyed by the entrypoint and the options that change it.
+    """
+
+    def __init__(self, max_entries: int = 2048):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Any, _CompiledEntrypoint]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Optional[_CompiledEntrypoint]:
+        with self._lock:
+            compiled = self._entries.get(key)
+            if compiled is not None:
+                self._entries.move_to_end(key)
+            return compiled
+
+    def set(self, key: Any, compiled: _CompiledEntrypoint) -> None:
+        with self._lock:
+            self._entries[key] = compiled
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_compiled_entrypoints = _CompiledEntrypointCache()
+
+
+def clear_compiled_entrypoints() -> None:
+    """Clear the cache of processed entrypoints, e.g. after redefining a tool."""
+    _compiled_entrypoints.clear()
+
+
 class Function(BaseModel):
     """Model for storing functions that can be called by an agent."""
 
@@ -509,9 +566,16 @@ class Function(BaseModel):
         if self.parameters != parameters:
             params_set_by_user = True
 
+        cache_key = self._get_compiled_entrypoint_key(strict=strict, params_set_by_user=params_set_by_user)
+        compiled = _compiled_entrypoints.get(cache_key) if cache_key is not None else None
+        if compiled is not None:
+            self._apply_compiled_entrypoint(compiled)
+            return
+
         if self.requires_user_input:
             self.user_input_schema = self.user_input_schema or []
 
+        docstring_description: Optional[str] = None
         try:
             sig = signature(self.entrypoint)
             type_hints = get_type_hints(self.entrypoint)
@@ -636,7 +700,8 @@ class Function(BaseModel):
                         if param.default == param.empty and name != "self" and name not in excluded_params
                     ]
 
-            self.description = self.description or get_entrypoint_docstring(self.entrypoint)
+            docstring_description = get_entrypoint_docstring(self.entrypoint)
+            self.description = self.description or docstring_description
 
             # log_debug(f"JSON schema for {self.name}: {parameters}")
         except Exception as e:
@@ -652,6 +717,46 @@ class Function(BaseModel):
             self.entrypoint = self._wrap_callable(self.entrypoint)
         except Exception as e:
             log_warning(f"Failed to add validate decorator to entrypoint: {str(e)}")
+            cache_key = None
+
+        # Only cache entrypoints that were processed without errors
+        if cache_key is not None and docstring_description is not None:
+            _compiled_entrypoints.set(
+                cache_key,
+                _CompiledEntrypoint(
+                    parameters=deepcopy(self.parameters),
+                    description=docstring_description,
+                    user_input_schema=isolated_runtime_value(self.user_input_schema)
+                    if self.requires_user_input
+                    else None,
+                    entrypoint=self.entrypoint,
+                ),
+            )
+
+    def _get_compiled_entrypoint_key(self, strict: bool, params_set_by_user: bool) -> Optional[Tuple[Any, ...]]:
+        """Build the key of this Function in the processed entrypoint cache, or None if it can't be cached."""
+        try:
+            key = (
+                self.entrypoint,
+                strict,
+                bool(self.requires_user_input),
+                tuple(self.user_input_fields) if self.user_input_fields is not None else None,
+                # Parameters set by the user are part of the result
+                json.dumps(self.parameters, sort_keys=True, default=str) if params_set_by_user else None,
+            )
+            hash(key)
+            return key
+        except Exception:
+            # E.g. a bound method of an unhashable object
+            return None
+
+    def _apply_compiled_entrypoint(self, compiled: _CompiledEntrypoint) -> None:
+        """Set the result of a cached process_entrypoint() call on this Function."""
+        self.parameters = deepcopy(compiled.parameters)
+        self.description = self.description or compiled.description
+        if self.requires_user_input:
+            self.user_input_schema = [copy(field) for field in compiled.user_input_schema or []]
+        self.entrypoint = compiled.entrypoint
 
     @staticmethod
     def _wrap_callable(func: Callable) -> Callable:
@@ -3,8 +3,11 @@ Custom OpenTelemetry SpanExporter that writes traces to Agno database.
 """
 
 import asyncio
+import queue
+import threading
 from collections import defaultdict
-from typing import Dict, List, Sequence, Union
+from time import monotonic
+from typing import Dict, List, Optional, Sequence, Set, Union
 
 from opentelemetry.sdk.trace import ReadableSpan  # type: ignore
 from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult  # type: ignore
@@ -15,19 +18,64 @@ from agno.tracing.schemas import Span, create_trace_from_spans
 from agno.utils.log import log_debug, log_error, log_warning
 
 
+class _FlushRequest:
+    """Queue marker set by the writer thread once everything queued before it is written."""
+
+    def __init__(self):
+        self.done = threading.Event()
+
+
+_STOP = object()
+
+
 class DatabaseSpanExporter(SpanExporter):
     """Custom OpenTelemetry SpanExporter that writes to Agno database"""
 
-    def __init__(self, db: Union[BaseDb, AsyncBaseDb, RemoteDb]):
+    def __init__(
+        self,
+        db: Union[BaseDb, AsyncBaseDb, RemoteDb],
+        background_export: bool = False,
+        max_queue_size: int = 2048,
+        max_batch_size: int = 512,
+        enqueue_timeout_seconds: float = 0.0,
+        shutdown_timeout_seconds: float = 30.0,
+    ):
         """
         Initialize the DatabaseSpanExporter.
 
         Args:
             db: Database instance (sync or async) to store traces
+            background_export: If True and db is a sync database, spans are queued and written by a dedicated
+                writer thread, in bulk, instead of in the thread that ended them.
+            max_queue_size: Maximum number of spans waiting to be written in background mode
+            max_batch_size: Maximum number of spans written in one transaction in background mode
+            enqueue_timeout_seconds: How long export() waits for room in a full queue before dropping spans
+            shutdown_timeout_seconds: How long shutdown() waits for the queued spans to be written
         """
         self.db = db
         self._shutdown = False
 
+        self.background_export = background_export and isinstance(db, BaseDb)
+        self.max_batch_size = max_batch_size
+        self.enqueue_timeout_seconds = enqueue_timeout_seconds
+        self.shutdown_timeout_seconds = shutdown_timeout_seconds
+
+        # Counters, see get_stats()
+        self.exported_spans = 0
+        self.dropped_spans = 0
+        self.failed_spans = 0
+        self._stats_lock = threading.Lock()
+
+        # Tasks of async exports, kept so they are not garbage collected before they complete
+        self._pending_tasks: Set[asyncio.Task] = set()
+
+        self._queue: Optional[queue.Queue] = None
+        self._writer_thread: Optional[threading.Thread] = None
+        if self.background_export:
+            self._queue = queue.Queue(maxsize=max_queue_size)
+            self._writer_thread = threading.Thread(target=self._run_writer, name="agno-span-exporter", daemon=True)
+            self._writer_thread.start()
+
     def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
         """
         Export spans to the database.
@@ -66,6 +114,10 @@ class DatabaseSpanExporter(SpanExporter):
             if not converted_spans:
                 return SpanExportResult.SUCCESS
 
+            if self._queue is not None:
+                self._enqueue(converted_spans)
+                return SpanExportResult.SUCCESS
+
             # Group spans by trace_id
             spans_by_trace: Dict[str, List[Span]] = defaultdict(list)
             for converted_span in converted_spans:
@@ -77,31 +129,90 @@ class DatabaseSpanExporter(SpanExporter):
                 pass
             elif isinstance(self.db, AsyncBaseDb):
                 self._export_async(spans_by_trace)
-            else:
-                # Synchronous database
-                self._export_sync(spans_by_trace)
+            elif not self._export_sync(spans_by_trace):
+                # Synchronous database, some traces could not be written
+                return SpanExportResult.FAILURE
 
             return SpanExportResult.SUCCESS
         except Exception as e:
             log_error(f"Failed to export spans to database: {str(e)}")
             return SpanExportResult.FAILURE
 
-    def _export_sync(self, spans_by_trace: Dict[str, List[Span]]) -> None:
-        """Export traces and spans to synchronous database"""
+    def _export_sync(self, spans_by_trace: Dict[str, List[Span]]) -> bool:
+        """Export traces and spans to synchronous database.
+
+        All traces are written at once. If that fails, they are written one trace at a time, so one bad
+        trace doesn't fail the others. Returns False if any span could not be written.
+        """
         try:
-            # Create trace and span records for each trace
-            for trace_id, spans in spans_by_trace.items():
-                # Create trace record (aggregate of all spans)
+            # Create the trace records (aggregate of all spans of each trace) and span records at once
+            traces = [trace for trace in (create_trace_from_spans(spans) for spans in spans_by_trace.values()) if trace]
+            all_spans = [span for spans in spans_by_trace.values() for span in spans]
+            self.db.upsert_traces_and_spans(traces, all_spans)  # type: ignore
+            with self._stats_lock:
+                self.exported_spans += len(all_spans)
+            return True
+        except Exception as e:
+            if len(spans_by_trace) > 1:
+                log_warning(f"Failed to export {len(spans_by_trace)} traces at once, retrying one at a time: {str(e)}")
+
+        failed_spans = 0
+        for trace_id, spans in spans_by_trace.items():
+            try:
                 trace = create_trace_from_spans(spans)
-                if trace:
-                    self.db.upsert_trace(trace)  # type: ignore
+                self.db.upsert_traces_and_spans([trace] if trace else [], spans)  # type: ignore
+                with self._stats_lock:
+                    self.exported_spans += len(spans)
+            except Exception as e:
+                log_error(f"Failed to export sync trace {trace_id}: {str(e)}")
+                failed_spans += len(spans)
 
-                # Create span records
-                self.db.create_spans(spans)  # type: ignore
+        if failed_spans:
+            with self._stats_lock:
+                self.failed_spans += failed_spans
+        return failed_spans == 0
 
-        except Exception as e:
-            log_error(f"Failed to export sync traces: {str(e)}")
-            raise
+    def _enqueue(self, spans: List[Span]) -> None:
+        """Queue spans for the writer thread, dropping them when the queue stays full."""
+        deadline = monotonic() + self.enqueue_timeout_seconds
+        for i, span in enumerate(spans):
+            try:
+                if self.enqueue_timeout_seconds > 0:
+                    self._queue.put(span, timeout=max(deadline - monotonic(), 0))  # type: ignore
+                else:
+                    self._queue.put_nowait(span)  # type: ignore
+            except queue.Full:
+                dropped = len(spans) - i
+                with self._stats_lock:
+                    self.dropped_spans += dropped
+                log_warning(f"Span export queue is full, dropped {dropped} spans")
+                return
+
+    def _run_writer(self) -> None:
+        """Write queued spans in batches until the exporter is shut down."""
+        assert self._queue is not None
+        stop = False
+        while not stop:
+            items = [self._queue.get()]
+            # Take everything already queued, up to the batch size
+            while len(items) < self.max_batch_size:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            spans = [item for item in items if isinstance(item, Span)]
+            if spans:
+                spans_by_trace: Dict[str, List[Span]] = defaultdict(list)
+                for span in spans:
+                    spans_by_trace[span.trace_id].append(span)
+                self._export_sync(spans_by_trace)
+
+            for item in items:
+                if isinstance(item, _FlushRequest):
+                    item.done.set()
+                elif item is _STOP:
+                    stop = True
 
     def _export_async(self, spans_by_trace: Dict[str, List[Span]]) -> None:
         """Handle async database export"""
@@ -109,7 +220,9 @@ class DatabaseSpanExporter(SpanExporter):
             loop = asyncio.get_event_loop()
             if loop.is_running():
                 # We're in an async context, schedule the coroutine
-                asyncio.create_task(self._do_async_export(spans_by_trace))
+                task = asyncio.create_task(self._do_async_export(spans_by_trace))
+                self._pending_tasks.add(task)
+                task.add_done_callback(self._pending_tasks.discard)
             else:
                 # No running loop, run in new loop
                 loop.run_until_complete(self._do_async_export(spans_by_trace))
@@ -137,20 +250,50 @@ class DatabaseSpanExporter(SpanExporter):
                 if create_spans_result is not None:
                     await create_spans_result
 
+                with self._stats_lock:
+                    self.exported_spans += len(spans)
+
         except Exception as e:
             log_error(f"Failed to do async export: {str(e)}")
             raise
 
+    def get_stats(self) -> Dict[str, int]:
+        """Get the number of exported, dropped and failed spans, and the number of spans waiting in the queue."""
+        with self._stats_lock:
+            return {
+                "exported_spans": self.exported_spans,
+                "dropped_spans": self.dropped_spans,
+                "failed_spans": self.failed_spans,
+                "queued_spans": self._queue.qsize() if self._queue is not None else 0,
+            }
+
     def shutdown(self) -> None:
-        """Shutdown the exporter"""
+        """Shutdown the exporter, writing the queued spans first"""
+        if self._shutdown:
+            return
         self._shutdown = True
+        if self._queue is not None and self._writer_thread is not None:
+            deadline = monotonic() + self.shutdown_timeout_seconds
+            try:
+                # The writer stops after writing everything queued before the stop marker
+                self._queue.put(_STOP, timeout=self.shutdown_timeout_seconds)
+            except queue.Full:
+                # The writer is stuck, it is a daemon thread so it doesn't keep the process alive
+                log_warning("Timed out queueing the stop of the span writer on shutdown")
+            else:
+                self._writer_thread.join(timeout=max(deadline - monotonic(), 0))
+                if self._writer_thread.is_alive():
+                    log_warning("Timed out writing the queued spans on shutdown")
+        if self._pending_tasks:
+            log_debug(f"DatabaseSpanExporter shutdown with {len(self._pending_tasks)} async exports in progress")
         log_debug("DatabaseSpanExporter shutdown")
 
     def force_flush(self, timeout_millis: int = 30000) -> bool:
         """
         Force flush any pending spans.
 
-        Since we write immediately to the database, this is a no-op.
+        In background mode, waits until the spans queued so far are written. Otherwise spans are written
+        immediately, so this is a no-op.
 
         Args:
             timeout_millis: Timeout in milliseconds
@@ -158,4 +301,12 @@ class DatabaseSpanExporter(SpanExporter):
         Returns:
             True if flush was successful
         """
-        return True
+        if self._queue is None or self._shutdown:
+            return True
+
+        flush_request = _FlushRequest()
+        try:
+            self._queue.put(flush_request, timeout=timeout_millis / 1000)
+        except queue.Full:
+            return False
+        return flush_request.done.wait(timeout=timeout_millis / 1000)
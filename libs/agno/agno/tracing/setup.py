@@ -26,6 +26,7 @@ def setup_tracing(
     max_queue_size: int = 2048,
     max_export_batch_size: int = 512,
     schedule_delay_millis: int = 5000,
+    background_export: bool = False,
 ) -> None:
     """
     Set up OpenTelemetry tracing with database export for Agno agents.
@@ -45,6 +46,8 @@ def setup_tracing(
         max_queue_size: Maximum queue size for batch processor
         max_export_batch_size: Maximum batch size for export
         schedule_delay_millis: Delay in milliseconds between batch exports
+        background_export: If True, spans are written to a sync database by a dedicated writer thread,
+                            in bulk, so ending a span never waits on the database
 
     Raises:
         ImportError: If OpenTelemetry packages are not installed
@@ -79,7 +82,12 @@ def setup_tracing(
         tracer_provider = TracerProvider()
 
         # Create database exporter
-        exporter = DatabaseSpanExporter(db=db)
+        exporter = DatabaseSpanExporter(
+            db=db,
+            background_export=background_export,
+            max_queue_size=max_queue_size,
+            max_batch_size=max_export_batch_size,
+        )
 
         # Configure span processor
         processor: SpanProcessor
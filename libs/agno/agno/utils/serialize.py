@@ -1,9 +1,15 @@
 """JSON serialization utilities for handling datetime and enum objects."""
 
+import json
 from datetime import date, datetime, time
 from enum import Enum
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 
 def json_serializer(obj: Any) -> Any:
     """Custom JSON serializer for objects not serializable by default json module.
@@ -30,3 +36,30 @@ def json_serializer(obj: Any) -> Any:
 
     # Fallback to string
     return str(obj)
+
+
+if orjson is not None:
+    # Let json_serializer handle dataclasses and datetimes, so the output matches the json module
+    _ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
+
+
+def json_dumps_compact(obj: Any) -> str:
+    """Serialize an object to compact JSON, keeping non-ASCII characters and using json_serializer for other types.
+
+    Equivalent to json.dumps(obj, separators=(",", ":"), default=json_serializer, ensure_ascii=False). orjson
+    is used when it is installed, falling back to the json module for values orjson rejects, like integers
+    above 64 bits or dictionaries with non-string keys. With orjson, NaN and infinite floats become null, large
+    floats use exponents without a sign (1e16 instead of 1e+16) and enums are always serialized as their values.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        The JSON string
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=json_serializer, option=_ORJSON_OPTIONS).decode("utf-8")
+        except (orjson.JSONEncodeError, TypeError):
+            pass
+    return json.dumps(obj, separators=(",", ":"), default=json_serializer, ensure_ascii=False)
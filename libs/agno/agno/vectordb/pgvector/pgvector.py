@@ -1,8 +1,9 @@
 import asyncio
 import re
+from concurrent.futures import Future, ThreadPoolExecutor
 from hashlib import md5
 from math import sqrt
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union, cast
 
 from agno.utils.string import generate_id
 
@@ -328,8 +329,7 @@ class PgVector(VectorDb):
         """
         try:
             with self.Session() as sess:
-                for i in range(0, len(documents), batch_size):
-                    batch_docs = documents[i : i + batch_size]
+                for i, batch_docs in self._iter_embedded_batches(documents, batch_size):
                     log_debug(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
                     try:
                         # Prepare documents for insertion
@@ -459,8 +459,7 @@ class PgVector(VectorDb):
         """
         try:
             with self.Session() as sess:
-                for i in range(0, len(documents), batch_size):
-                    batch_docs = documents[i : i + batch_size]
+                for i, batch_docs in self._iter_embedded_batches(documents, batch_size):
                     log_info(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
                     try:
                         # Prepare documents for upserting
@@ -508,7 +507,8 @@ class PgVector(VectorDb):
     def _get_document_record(
         self, doc: Document, filters: Optional[Dict[str, Any]] = None, content_hash: str = ""
     ) -> Dict[str, Any]:
-        doc.embed(embedder=self.embedder)
+        if doc.embedding is None:
+            doc.embed(embedder=self.embedder)
         cleaned_content = self._clean_content(doc.content)
         # Include content_hash in ID to ensure uniqueness across different content hashes
         # This allows the same URL/content to be inserted with different descriptions
@@ -531,91 +531,131 @@ class PgVector(VectorDb):
             "content_id": doc.content_id,
         }
 
-    async def _async_embed_documents(self, batch_docs: List[Document]) -> None:
+    @staticmethod
+    def _is_rate_limit_error(error: BaseException) -> bool:
+        error_str = str(error).lower()
+        return any(
+            phrase in error_str
+            for phrase in ["rate limit", "too many requests", "429", "trial key", "api calls / minute"]
+        )
+
+    def _get_batch_embed_method(self, name: str) -> Optional[Callable]:
+        """Get the batch embedding method of the embedder, or None if batch embedding is disabled or unsupported."""
+        if not self.embedder.enable_batch:
+            return None
+        batch_embed = getattr(self.embedder, name, None)
+        if batch_embed is None:
+            log_debug(f"{type(self.embedder).__name__} has no {name}, embedding documents one by one")
+        return batch_embed
+
+    @staticmethod
+    def _set_batch_embeddings(
+        batch_docs: List[Document], embeddings: List[List[float]], usages: List[Optional[Dict[str, Any]]]
+    ) -> None:
+        for j, doc in enumerate(batch_docs):
+            if j < len(embeddings):
+                doc.embedding = embeddings[j]
+                doc.usage = usages[j] if j < len(usages) else None
+
+    def _handle_batch_embedding_error(self, error: Exception) -> None:
+        """Re-raise rate limit errors, as falling back to individual embeddings would make things worse."""
+        if self._is_rate_limit_error(error):
+            log_error(f"Rate limit detected during batch embedding.: {str(error)}")
+            raise error
+        log_warning(f"Batch embedding failed, falling back to individual embeddings: {str(error)}")
+
+    def _handle_individual_embedding_results(self, results: List[Any]) -> None:
+        """Log the errors of individual embeddings, re-raising rate limits to avoid writing NULL embeddings."""
+        rate_limit_error: Optional[BaseException] = None
+        for i, result in enumerate(results):
+            if not isinstance(result, BaseException):
+                continue
+            if self._is_rate_limit_error(result) and rate_limit_error is None:
+                rate_limit_error = result
+
+            # If it's an event loop closure error, log it but don't fail
+            if "Event loop is closed" in str(result) or "RuntimeError" in type(result).__name__:
+                log_warning(
+                    f"Event loop closure during embedding for document {i}, but operation may have succeeded: {result}"
+                )
+            else:
+                log_error(f"Error embedding document {i}: {result}")
+
+        if rate_limit_error is not None:
+            raise rate_limit_error
+
+    def _embed_documents(self, batch_docs: List[Document]) -> None:
         """
         Embed a batch of documents using either batch embedding or individual embedding.
 
         Args:
             batch_docs: List of documents to embed
         """
-        if self.embedder.enable_batch and hasattr(self.embedder, "async_get_embeddings_batch_and_usage"):
-            # Use batch embedding when enabled and supported
+        batch_embed = self._get_batch_embed_method("get_embeddings_batch_and_usage")
+        if batch_embed is not None:
             try:
-                # Extract content from all documents
-                doc_contents = [doc.content for doc in batch_docs]
+                embeddings, usages = batch_embed([doc.content for doc in batch_docs])
+                self._set_batch_embeddings(batch_docs, embeddings, usages)
+                return
+            except Exception as e:
+                self._handle_batch_embedding_error(e)
 
-                # Get batch embeddings and usage
-                embeddings, usages = await self.embedder.async_get_embeddings_batch_and_usage(doc_contents)
+        # Use individual embedding
+        results: List[Optional[Exception]] = []
+        for doc in batch_docs:
+            try:
+                doc.embed(embedder=self.embedder)
+                results.append(None)
+            except Exception as e:
+                results.append(e)
+        self._handle_individual_embedding_results(results)
 
-                # Process documents with pre-computed embeddings
-                for j, doc in enumerate(batch_docs):
-                    try:
-                        if j < len(embeddings):
-                            doc.embedding = embeddings[j]
-                            doc.usage = usages[j] if j < len(usages) else None
-                    except Exception as e:
-                        log_error(f"Error assigning batch embedding to document '{doc.name}': {str(e)}")
+    def _iter_embedded_batches(
+        self, documents: List[Document], batch_size: int
+    ) -> Iterator[Tuple[int, List[Document]]]:
+        """
+        Yield (start index, documents) batches with their embeddings computed.
 
-            except Exception as e:
-                # Check if this is a rate limit error - don't fall back as it would make things worse
-                error_str = str(e).lower()
-                is_rate_limit = any(
-                    phrase in error_str
-                    for phrase in ["rate limit", "too many requests", "429", "trial key", "api calls / minute"]
-                )
+        The next batch is embedded in a background thread while the caller writes the current batch.
+        """
+        if not documents:
+            return
 
-                if is_rate_limit:
-                    log_error(f"Rate limit detected during batch embedding.: {str(e)}")
-                    raise e
-                else:
-                    log_warning(f"Async batch embedding failed, falling back to individual embeddings: {str(e)}")
-                    # Fall back to individual embedding
-                    embed_tasks = [doc.async_embed(embedder=self.embedder) for doc in batch_docs]
-                    results = await asyncio.gather(*embed_tasks, return_exceptions=True)
-
-                    # Check for exceptions and handle them
-                    for i, result in enumerate(results):
-                        if isinstance(result, Exception):
-                            error_msg = str(result)
-                            # If it's an event loop closure error, log it but don't fail
-                            if "Event loop is closed" in error_msg or "RuntimeError" in type(result).__name__:
-                                log_warning(
-                                    f"Event loop closure during embedding for document {i}, but operation may have succeeded: {result}: {e}",
-                                )
-
-                            else:
-                                log_error(f"Error embedding document {i}: {result}: {str(e)}")
-        else:
-            # Use individual embedding
-            embed_tasks = [doc.async_embed(embedder=self.embedder) for doc in batch_docs]
-            results = await asyncio.gather(*embed_tasks, return_exceptions=True)
-
-            # Re-raise on rate limits to avoid writing NULL embeddings.
-            rate_limit_error: Optional[Exception] = None
-
-            # Check for exceptions and handle them
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    error_msg = str(result)
-
-                    error_str = error_msg.lower()
-                    is_rate_limit = any(
-                        phrase in error_str
-                        for phrase in ["rate limit", "too many requests", "429", "trial key", "api calls / minute"]
-                    )
-                    if is_rate_limit and rate_limit_error is None:
-                        rate_limit_error = result
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="agno-pgvector-embed") as executor:
+            batch_starts = range(0, len(documents), batch_size)
+            next_future: Future = executor.submit(self._embed_documents, documents[0:batch_size])
+            try:
+                for i in batch_starts:
+                    future = next_future
+                    if i + batch_size < len(documents):
+                        next_batch = documents[i + batch_size : i + 2 * batch_size]
+                        next_future = executor.submit(self._embed_documents, next_batch)
+                    future.result()
+                    yield i, documents[i : i + batch_size]
+            finally:
+                # Don't embed a batch that won't be written
+                next_future.cancel()
 
-                    # If it's an event loop closure error, log it but don't fail
-                    if "Event loop is closed" in error_msg or "RuntimeError" in type(result).__name__:
-                        log_warning(
-                            f"Event loop closure during embedding for document {i}, but operation may have succeeded: {result}"
-                        )
-                    else:
-                        log_error(f"Error embedding document {i}: {result}")
+    async def _async_embed_documents(self, batch_docs: List[Document]) -> None:
+        """
+        Embed a batch of documents using either batch embedding or individual embedding.
+
+        Args:
+            batch_docs: List of documents to embed
+        """
+        async_batch_embed = self._get_batch_embed_method("async_get_embeddings_batch_and_usage")
+        if async_batch_embed is not None:
+            try:
+                embeddings, usages = await async_batch_embed([doc.content for doc in batch_docs])
+                self._set_batch_embeddings(batch_docs, embeddings, usages)
+                return
+            except Exception as e:
+                self._handle_batch_embedding_error(e)
 
-            if rate_limit_error is not None:
-                raise rate_limit_error
+        # Use individual embedding
+        embed_tasks = [doc.async_embed(embedder=self.embedder) for doc in batch_docs]
+        results = await asyncio.gather(*embed_tasks, return_exceptions=True)
+        self._handle_individual_embedding_results(results)
 
     async def async_upsert(
         self,
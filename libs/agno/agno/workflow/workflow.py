@@ -1304,6 +1304,8 @@ class Workflow:
                 metadata=self.metadata,
                 created_at=int(time()),
             )
+        # Runs are saved through upsert_run, so saving the session only writes the runs upserted from now on
+        workflow_session.mark_runs_saved()
 
         # Cache the session if relevant
         if workflow_session is not None and self.cache_session:
@@ -1350,6 +1352,8 @@ class Workflow:
                 metadata=self.metadata,
                 created_at=int(time()),
             )
+        # Runs are saved through upsert_run, so saving the session only writes the runs upserted from now on
+        workflow_session.mark_runs_saved()
 
         # Cache the session if relevant
         if workflow_session is not None and self.cache_session:
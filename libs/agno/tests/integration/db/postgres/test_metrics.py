@@ -77,6 +77,23 @@ def test_get_all_sessions_for_metrics_calculation(postgres_db_real: PostgresDb,
     assert all("session_type" in session for session in sessions)
 
 
+def test_get_all_sessions_for_metrics_calculation_only_selects_metrics_fields(
+    postgres_db_real: PostgresDb, sample_agent_sessions_for_metrics
+):
+    """Test that run contents and other session data are not loaded to calculate metrics"""
+    session = sample_agent_sessions_for_metrics[0]
+    session.runs[0].model = "gpt-4o"  # type: ignore
+    session.runs[0].model_provider = "OpenAI"  # type: ignore
+    session.session_data = {"session_name": "Test", "session_metrics": {"input_tokens": 10}}
+    postgres_db_real.upsert_session(session)
+
+    sessions = postgres_db_real._get_all_sessions_for_metrics_calculation()
+
+    assert len(sessions) == 1
+    assert sessions[0]["runs"] == [{"model": "gpt-4o", "model_provider": "OpenAI"}]
+    assert sessions[0]["session_data"] == {"session_metrics": {"input_tokens": 10}}
+
+
 def test_get_all_sessions_for_metrics_calculation_with_timestamp_filter(
     postgres_db_real: PostgresDb, sample_agent_sessions_for_metrics
 ):
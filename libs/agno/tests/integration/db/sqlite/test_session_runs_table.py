@@ -0,0 +1,252 @@
+"""Integration tests for storing session runs in their own table with SqliteDb"""
+
+import time
+
+import pytest
+from sqlalchemy import select
+
+from agno.db import utils as db_utils
+from agno.db.base import SessionType
+from agno.db.sqlite.sqlite import SqliteDb
+from agno.run.agent import RunOutput
+from agno.run.base import RunStatus
+from agno.run.team import TeamRunOutput
+from agno.session.agent import AgentSession
+from agno.session.team import TeamSession
+
+
+@pytest.fixture
+def runs_db(temp_storage_db_file) -> SqliteDb:
+    """SqliteDb storing each run in its own row"""
+    return SqliteDb(
+        session_table="test_sessions",
+        runs_table="test_runs",
+        store_runs_in_table=True,
+        db_file=temp_storage_db_file,
+    )
+
+
+def _agent_run(run_id: str, content: str = "content") -> RunOutput:
+    return RunOutput(
+        run_id=run_id,
+        agent_id="test_agent",
+        session_id="test_session",
+        user_id="test_user",
+        content=content,
+        status=RunStatus.completed,
+    )
+
+
+@pytest.fixture
+def agent_session() -> AgentSession:
+    return AgentSession(
+        session_id="test_session",
+        agent_id="test_agent",
+        user_id="test_user",
+        runs=[_agent_run("run_1"), _agent_run("run_2")],
+        created_at=int(time.time()),
+    )
+
+
+def _count_run_rows(db: SqliteDb, session_id: str) -> int:
+    table = db._get_table("runs")
+    with db.Session() as sess:
+        return len(sess.execute(select(table.c.run_id).where(table.c.session_id == session_id)).fetchall())
+
+
+def test_upsert_session_stores_runs_in_runs_table(runs_db: SqliteDb, agent_session: AgentSession):
+    result = runs_db.upsert_session(agent_session)
+
+    assert isinstance(result, AgentSession)
+    assert [run.run_id for run in result.runs] == ["run_1", "run_2"]
+    assert _count_run_rows(runs_db, "test_session") == 2
+
+    # The sessions table no longer holds the runs
+    sessions_table = runs_db._get_table("sessions")
+    with runs_db.Session() as sess:
+        runs_column = sess.execute(select(sessions_table.c.runs)).scalar()
+    assert runs_column is None
+
+
+def test_get_session_reads_runs_in_order(runs_db: SqliteDb, agent_session: AgentSession):
+    runs_db.upsert_session(agent_session)
+    agent_session.runs.append(_agent_run("run_3"))
+    runs_db.upsert_session(agent_session)
+
+    session = runs_db.get_session(session_id="test_session", session_type=SessionType.AGENT)
+
+    assert isinstance(session, AgentSession)
+    assert [run.run_id for run in session.runs] == ["run_1", "run_2", "run_3"]
+
+
+def test_upsert_session_only_writes_changed_runs(runs_db: SqliteDb, agent_session: AgentSession):
+    runs_db.upsert_session(agent_session)
+
+    written_rows = []
+    original_upsert_run_rows = runs_db._upsert_run_rows
+
+    def _record_rows(sess, table, rows):
+        written_rows.extend(row["run_id"] for row in rows)
+        return original_upsert_run_rows(sess, table, rows)
+
+    runs_db._upsert_run_rows = _record_rows  # type: ignore
+    agent_session.runs[1].content = "updated"
+    agent_session.runs.append(_agent_run("run_3"))
+    runs_db.upsert_session(agent_session)
+
+    assert written_rows == ["run_2", "run_3"]
+    session = runs_db.get_session(session_id="test_session", session_type=SessionType.AGENT)
+    assert [run.content for run in session.runs] == ["content", "updated", "content"]
+
+
+def test_upsert_run(runs_db: SqliteDb, agent_session: AgentSession):
+    runs_db.upsert_session(agent_session)
+
+    runs_db.upsert_run("test_session", _agent_run("run_1", content="edited"), user_id="test_user")
+    runs_db.upsert_run("test_session", _agent_run("run_3"), user_id="test_user")
+
+    session = runs_db.get_session(session_id="test_session", session_type=SessionType.AGENT)
+    assert [run.run_id for run in session.runs] == ["run_1", "run_2", "run_3"]
+    assert session.runs[0].content == "edited"
+
+
+def test_get_runs_last_n_runs_includes_member_runs(runs_db: SqliteDb):
+    team_session = TeamSession(
+        session_id="test_team_session",
+        team_id="test_team",
+        runs=[
+            TeamRunOutput(run_id="team_run_1", team_id="test_team"),
+            RunOutput(run_id="member_run_1", agent_id="test_agent", parent_run_id="team_run_1"),
+            TeamRunOutput(run_id="team_run_2", team_id="test_team"),
+            RunOutput(run_id="member_run_2", agent_id="test_agent", parent_run_id="team_run_2"),
+        ],
+        created_at=int(time.time()),
+    )
+    runs_db.upsert_session(team_session)
+
+    runs = runs_db.get_runs("test_team_session", last_n_runs=1)
+    assert [run.run_id for run in runs] == ["team_run_2", "member_run_2"]
+    assert isinstance(runs[0], TeamRunOutput)
+    assert isinstance(runs[1], RunOutput)
+
+    assert len(runs_db.get_runs("test_team_session")) == 4
+    assert runs_db.get_runs("test_team_session", deserialize=False)[0]["run_id"] == "team_run_1"
+
+
+def test_get_sessions_hydrates_runs(runs_db: SqliteDb, agent_session: AgentSession):
+    runs_db.upsert_session(agent_session)
+
+    sessions = runs_db.get_sessions(session_type=SessionType.AGENT)
+    assert [run.run_id for run in sessions[0].runs] == ["run_1", "run_2"]
+
+    sessions_raw, total_count = runs_db.get_sessions(session_type=SessionType.AGENT, deserialize=False)
+    assert total_count == 1
+    assert [run["run_id"] for run in sessions_raw[0]["runs"]] == ["run_1", "run_2"]
+
+
+def test_delete_session_deletes_runs(runs_db: SqliteDb, agent_session: AgentSession):
+    runs_db.upsert_session(agent_session)
+
+    assert runs_db.delete_session("test_session") is True
+    assert _count_run_rows(runs_db, "test_session") == 0
+
+    # Saving the session again writes all of its runs
+    runs_db.upsert_session(agent_session)
+    assert _count_run_rows(runs_db, "test_session") == 2
+
+
+def test_delete_sessions_only_deletes_runs_of_the_users_sessions(runs_db: SqliteDb, agent_session: AgentSession):
+    runs_db.upsert_session(agent_session)
+
+    runs_db.delete_sessions(["test_session"], user_id="other_user")
+    assert _count_run_rows(runs_db, "test_session") == 2
+
+    runs_db.delete_sessions(["test_session"], user_id="test_user")
+    assert _count_run_rows(runs_db, "test_session") == 0
+
+
+def test_upsert_session_deletes_removed_runs(runs_db: SqliteDb, agent_session: AgentSession):
+    runs_db.upsert_session(agent_session)
+
+    removed_run = agent_session.runs.pop(0)
+    runs_db.upsert_session(agent_session)
+    assert _count_run_rows(runs_db, "test_session") == 1
+
+    # A removed run added back is written again
+    agent_session.runs.append(removed_run)
+    runs_db.upsert_session(agent_session)
+    assert _count_run_rows(runs_db, "test_session") == 2
+
+    agent_session.runs = []
+    runs_db.upsert_session(agent_session)
+    assert _count_run_rows(runs_db, "test_session") == 0
+
+
+def test_rejected_upsert_does_not_write_runs(runs_db: SqliteDb, agent_session: AgentSession):
+    runs_db.upsert_session(agent_session)
+
+    agent_session.user_id = "other_user"
+    agent_session.runs.append(_agent_run("run_3"))
+
+    assert runs_db.upsert_session(agent_session) is None
+    assert _count_run_rows(runs_db, "test_session") == 2
+
+
+def test_reads_sessions_saved_without_runs_table(temp_storage_db_file, agent_session: AgentSession):
+    legacy_db = SqliteDb(session_table="test_sessions", db_file=temp_storage_db_file)
+    legacy_db.upsert_session(agent_session)
+
+    runs_db = SqliteDb(
+        session_table="test_sessions", runs_table="test_runs", store_runs_in_table=True, db_file=temp_storage_db_file
+    )
+    session = runs_db.get_session(session_id="test_session", session_type=SessionType.AGENT)
+    assert [run.run_id for run in session.runs] == ["run_1", "run_2"]
+
+    # The next save moves the runs to the runs table
+    runs_db.upsert_session(session)
+    assert _count_run_rows(runs_db, "test_session") == 2
+    session = runs_db.get_session(session_id="test_session", session_type=SessionType.AGENT)
+    assert [run.run_id for run in session.runs] == ["run_1", "run_2"]
+
+
+def test_upsert_session_only_serializes_runs_upserted_since_last_save(
+    runs_db: SqliteDb, agent_session: AgentSession, monkeypatch
+):
+    runs_db.upsert_session(agent_session)
+    session = runs_db.get_session(session_id="test_session", session_type=SessionType.AGENT)
+    session.mark_runs_saved()
+
+    serialized_run_ids = []
+    original_serialize_run_row = db_utils.serialize_run_row
+
+    def _record_serialized_run(session_id, run, *args, **kwargs):
+        serialized_run_ids.append(run.run_id)
+        return original_serialize_run_row(session_id, run, *args, **kwargs)
+
+    monkeypatch.setattr(db_utils, "serialize_run_row", _record_serialized_run)
+    session.upsert_run(_agent_run("run_3"))
+    runs_db.upsert_session(session)
+    assert serialized_run_ids == ["run_3"]
+
+    # Saved runs are not written again
+    serialized_run_ids.clear()
+    runs_db.upsert_session(session)
+    assert serialized_run_ids == []
+
+    session = runs_db.get_session(session_id="test_session", session_type=SessionType.AGENT)
+    assert [run.run_id for run in session.runs] == ["run_1", "run_2", "run_3"]
+
+
+def test_tracked_session_saved_without_runs_table_moves_all_runs(temp_storage_db_file, agent_session: AgentSession):
+    legacy_db = SqliteDb(session_table="test_sessions", db_file=temp_storage_db_file)
+    legacy_db.upsert_session(agent_session)
+
+    runs_db = SqliteDb(
+        session_table="test_sessions", runs_table="test_runs", store_runs_in_table=True, db_file=temp_storage_db_file
+    )
+    session = runs_db.get_session(session_id="test_session", session_type=SessionType.AGENT)
+    session.mark_runs_saved()
+    session.upsert_run(_agent_run("run_3"))
+    runs_db.upsert_session(session)
+
+    assert _count_run_rows(runs_db, "test_session") == 3
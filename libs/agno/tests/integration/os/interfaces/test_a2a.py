@@ -44,8 +44,8 @@ from agno.workflow import Workflow
 def test_agent():
     """Create a test agent for A2A."""
     agent = Agent(name="test-a2a-agent", instructions="You are a helpful assistant.")
-    # Return same instance from deep_copy so arun patches work
-    agent.deep_copy = lambda **kwargs: agent
+    # Return same instance from request_copy so arun patches work
+    agent.request_copy = lambda: agent
     return agent
 
 
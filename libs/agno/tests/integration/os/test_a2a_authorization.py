@@ -58,8 +58,8 @@ def _message_body():
 @pytest.fixture
 def agent():
     agent = Agent(id=AGENT_ID, name="Authz Agent", db=InMemoryDb())
-    # Return same instance from deep_copy so arun patches work
-    agent.deep_copy = lambda **kwargs: agent
+    # Return same instance from request_copy so arun patches work
+    agent.request_copy = lambda: agent
     return agent
 
 
@@ -91,8 +91,8 @@ def multi_entity_authz_client():
     agent = Agent(id=AGENT_ID, name="Authz Agent", db=InMemoryDb())
     team = Team(id="authz-team", name="Authz Team", members=[agent], db=InMemoryDb())
     workflow = Workflow(id="authz-wf", name="Authz WF", steps=[Step(name="s", agent=agent)], db=InMemoryDb())
-    # Return same instance from deep_copy so arun patches work
-    agent.deep_copy = lambda **kwargs: agent
+    # Return same instance from request_copy/deep_copy so arun patches work
+    agent.request_copy = lambda: agent
     team.deep_copy = lambda **kwargs: team
     workflow.deep_copy = lambda **kwargs: workflow
     agent_os = AgentOS(
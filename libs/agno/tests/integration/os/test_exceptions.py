@@ -115,10 +115,10 @@ def test_internal_server_error_response_format(test_agent: Agent, caplog):
     app = agent_os.get_app()
     client = TestClient(app, raise_server_exceptions=False)
 
-    # Mock deep_copy to return the same instance, then mock arun to raise an exception
-    # (AgentOS uses create_fresh=True which calls deep_copy)
+    # Mock request_copy to return the same instance, then mock arun to raise an exception
+    # (AgentOS uses create_fresh=True which calls request_copy)
     with (
-        patch.object(test_agent, "deep_copy", return_value=test_agent),
+        patch.object(test_agent, "request_copy", return_value=test_agent),
         patch.object(test_agent, "arun", new_callable=AsyncMock, side_effect=Exception("Internal error")),
         caplog.at_level(logging.ERROR),
     ):
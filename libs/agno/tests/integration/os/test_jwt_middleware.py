@@ -43,10 +43,10 @@ def jwt_test_agent():
         db=InMemoryDb(),
         instructions="You are a test agent that can access JWT information and user profiles.",
     )
-    # Override deep_copy to return the same instance for testing
-    # This is needed because AgentOS uses create_fresh=True which calls deep_copy,
+    # Override request_copy to return the same instance for testing
+    # This is needed because AgentOS uses create_fresh=True which calls request_copy,
     # and our mocks need to be on the same instance that gets used
-    agent.deep_copy = lambda **kwargs: agent
+    agent.request_copy = lambda: agent
     return agent
 
 
@@ -47,7 +47,7 @@ def sqlite_db(tmp_path):
 @pytest.fixture
 def test_agent(sqlite_db):
     agent = Agent(id="sa-test-agent", name="sa-test-agent", db=sqlite_db)
-    agent.deep_copy = lambda **kwargs: agent
+    agent.request_copy = lambda: agent
     return agent
 
 
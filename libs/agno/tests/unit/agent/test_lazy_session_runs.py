@@ -0,0 +1,114 @@
+"""Tests for lazily loading the runs of an Agent session."""
+
+import pytest
+
+from agno.agent import Agent, _storage
+from agno.db.sqlite import SqliteDb
+from agno.models.message import Message
+from agno.run.agent import RunOutput
+from agno.run.base import RunStatus
+from agno.session import AgentSession
+from agno.session.lazy import LazyRunList
+
+
+def _run(i: int, status: RunStatus = RunStatus.completed) -> RunOutput:
+    return RunOutput(
+        run_id=f"run_{i}",
+        agent_id="agent_1",
+        session_id="session_1",
+        status=status,
+        messages=[Message(role="user", content=f"user_{i}"), Message(role="assistant", content=f"assistant_{i}")],
+    )
+
+
+def _count_deserialized(runs: LazyRunList) -> int:
+    return sum(not isinstance(run, dict) for run in runs.iter_loaded())
+
+
+@pytest.fixture(params=[False, True], ids=["runs_in_sessions_table", "runs_in_runs_table"])
+def db(request, tmp_path) -> SqliteDb:
+    db = SqliteDb(db_file=str(tmp_path / "agent.db"), store_runs_in_table=request.param)
+    db.upsert_session(
+        AgentSession(session_id="session_1", agent_id="agent_1", runs=[_run(i) for i in range(10)], created_at=1)
+    )
+    return db
+
+
+def test_lazy_session_only_deserializes_history_runs(db: SqliteDb):
+    agent = Agent(db=db, lazy_load_session_runs=True, num_history_runs=2)
+    session = _storage.read_or_create_session(agent, session_id="session_1")
+
+    assert isinstance(session.runs, LazyRunList)
+    assert _count_deserialized(session.runs) == 0
+    # Databases storing runs in their own table only load the last runs
+    assert session.runs.has_older_runs == db.store_runs_in_table
+
+    messages = session.get_messages(last_n_runs=2)
+
+    assert [m.content for m in messages] == ["user_8", "assistant_8", "user_9", "assistant_9"]
+    assert _count_deserialized(session.runs) == 2
+
+
+def test_lazy_session_loads_older_runs_on_demand(db: SqliteDb):
+    agent = Agent(db=db, lazy_load_session_runs=True, num_history_runs=2)
+    session = _storage.read_or_create_session(agent, session_id="session_1")
+
+    assert session.get_run("run_0").run_id == "run_0"  # type: ignore
+    assert [run.run_id for run in session.runs] == [f"run_{i}" for i in range(10)]  # type: ignore
+
+
+def test_lazy_session_history_skips_filtered_runs(tmp_path):
+    db = SqliteDb(db_file=str(tmp_path / "agent.db"), store_runs_in_table=True)
+    runs = [_run(0), _run(1), _run(2, status=RunStatus.error), _run(3, status=RunStatus.cancelled)]
+    db.upsert_session(AgentSession(session_id="session_1", agent_id="agent_1", runs=runs, created_at=1))
+
+    agent = Agent(db=db, lazy_load_session_runs=True, num_history_runs=2)
+    session = _storage.read_or_create_session(agent, session_id="session_1")
+
+    # The last two runs are skipped, so the older runs are loaded to fill the history
+    messages = session.get_messages(last_n_runs=2)
+    assert [m.content for m in messages] == ["user_0", "assistant_0", "user_1", "assistant_1"]
+
+
+def test_lazy_session_save_keeps_all_runs(db: SqliteDb):
+    agent = Agent(db=db, lazy_load_session_runs=True, num_history_runs=2)
+    session = _storage.read_or_create_session(agent, session_id="session_1")
+
+    session.upsert_run(_run(10))
+    db.upsert_session(session)
+
+    stored_session = db.get_session(session_id="session_1")
+    assert [run.run_id for run in stored_session.runs] == [f"run_{i}" for i in range(11)]  # type: ignore
+    # Saving does not deserialize the runs that were never accessed
+    assert _count_deserialized(session.runs) == 1
+
+
+def test_lazy_run_list_behaves_like_a_list():
+    runs = LazyRunList([_run(0).to_dict(), _run(1).to_dict()], run_from_dict=RunOutput.from_dict)
+
+    assert bool(runs)
+    assert runs[-1].run_id == "run_1"
+    assert _count_deserialized(runs) == 1
+    assert [run.run_id for run in runs] == ["run_0", "run_1"]
+    assert [run.run_id for run in runs[::-1]] == ["run_1", "run_0"]
+    assert len(runs) == 2
+
+    runs.append(_run(2))
+    assert [run["run_id"] for run in runs.to_dicts()] == ["run_0", "run_1", "run_2"]
+
+
+def test_lazy_run_list_merges_older_runs():
+    appended_run = _run(3)
+    runs = LazyRunList(
+        [_run(2).to_dict()],
+        run_from_dict=RunOutput.from_dict,
+        load_older_runs=lambda: [_run(i).to_dict() for i in range(3)],
+    )
+    runs.append(appended_run)
+
+    assert runs.has_older_runs
+    assert runs[-1] is appended_run
+    assert runs.has_older_runs
+
+    assert [run.run_id for run in runs] == ["run_0", "run_1", "run_2", "run_3"]
+    assert not runs.has_older_runs
@@ -198,3 +198,112 @@ async def test_ashould_compress_count_based_above_limit():
 
     assert sync_result == async_result
     assert sync_result is True
+
+
+def _tool_messages(*contents):
+    return [Message(role="tool", content=content, tool_name="search") for content in contents]
+
+
+def test_compress_runs_in_parallel_and_reuses_identical_results():
+    """Identical tool results are compressed once, and distinct ones concurrently."""
+    import threading
+    import time
+    from unittest.mock import MagicMock, patch
+
+    from agno.compression.manager import CompressionManager, clear_compression_cache
+    from agno.models.openai import OpenAIChat
+
+    clear_compression_cache()
+    model = OpenAIChat(id="gpt-4o")
+    thread_names = set()
+
+    def fake_response(messages):
+        thread_names.add(threading.current_thread().name)
+        time.sleep(0.05)
+        return MagicMock(content="compressed: " + messages[1].content.split("\n")[-2])
+
+    messages = _tool_messages("result a", "result b", "result a", "result c")
+    cm = CompressionManager(model=model, max_concurrent_compressions=3)
+
+    with patch.object(model, "response", side_effect=fake_response) as response:
+        cm.compress(messages)
+
+    assert response.call_count == 3
+    assert len(thread_names) > 1
+    assert [m.compressed_content for m in messages] == [
+        "compressed: result a",
+        "compressed: result b",
+        "compressed: result a",
+        "compressed: result c",
+    ]
+    assert cm.stats["tool_results_compressed"] == 4
+
+    # A later run with the same tool result is served from the cache
+    later = _tool_messages("result b")
+    with patch.object(model, "response", side_effect=fake_response) as response:
+        CompressionManager(model=model).compress(later)
+
+    assert response.call_count == 0
+    assert later[0].compressed_content == "compressed: result b"
+
+
+@pytest.mark.asyncio
+async def test_acompress_limits_concurrency():
+    """Async compression runs at most max_concurrent_compressions model calls at a time."""
+    import asyncio
+    from unittest.mock import MagicMock, patch
+
+    from agno.compression.manager import CompressionManager
+    from agno.models.openai import OpenAIChat
+
+    model = OpenAIChat(id="gpt-4o")
+    running = 0
+    max_running = 0
+
+    async def fake_aresponse(messages):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return MagicMock(content="compressed")
+
+    messages = _tool_messages(*[f"result {i}" for i in range(6)])
+    cm = CompressionManager(model=model, max_concurrent_compressions=2, cache_compressed_results=False)
+
+    with patch.object(model, "aresponse", side_effect=fake_aresponse):
+        await cm.acompress(messages)
+
+    assert max_running == 2
+    assert all(m.compressed_content == "compressed" for m in messages)
+
+
+@pytest.mark.asyncio
+async def test_acompress_is_unbounded_by_default():
+    """Without max_concurrent_compressions, async compression runs all model calls at once."""
+    import asyncio
+    from unittest.mock import MagicMock, patch
+
+    from agno.compression.manager import CompressionManager
+    from agno.models.openai import OpenAIChat
+
+    model = OpenAIChat(id="gpt-4o")
+    running = 0
+    max_running = 0
+
+    async def fake_aresponse(messages):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return MagicMock(content="compressed")
+
+    messages = _tool_messages(*[f"result {i}" for i in range(6)])
+    cm = CompressionManager(model=model, cache_compressed_results=False)
+
+    with patch.object(model, "aresponse", side_effect=fake_aresponse):
+        await cm.acompress(messages)
+
+    assert max_running == 6
+    assert all(m.compressed_content == "compressed" for m in messages)
@@ -8,3 +8,109 @@ def test_json_db_round_trips_non_ascii_content(tmp_path):
     db._write_json_file("unicode_rows", rows)
 
     assert db._read_json_file("unicode_rows") == rows
+
+
+def test_json_db_stores_sessions_in_record_files(tmp_path):
+    from agno.db.base import SessionType
+    from agno.session import AgentSession
+
+    db = JsonDb(db_path=str(tmp_path), store_records_in_files=True)
+    db.upsert_session(AgentSession(session_id="s1", agent_id="a1", user_id="u1"))
+    db.upsert_session(AgentSession(session_id="s2", agent_id="a1", user_id="u2"))
+    db.rename_session("s1", SessionType.AGENT, "renamed")
+
+    session_files = list((tmp_path / db.session_table_name).glob("*.json"))
+    assert len(session_files) == 2
+
+    # A new instance rebuilds its index from the record files
+    reloaded = JsonDb(db_path=str(tmp_path), store_records_in_files=True)
+    session = reloaded.get_session("s1", SessionType.AGENT)
+    assert session is not None and session.session_data["session_name"] == "renamed"  # type: ignore
+    sessions, total = reloaded.get_sessions(user_id="u2", deserialize=False)  # type: ignore
+    assert total == 1 and sessions[0]["session_id"] == "s2"
+
+    assert reloaded.delete_session("s1")
+    assert reloaded.get_session("s1", SessionType.AGENT) is None
+    assert len(list((tmp_path / db.session_table_name).glob("*.json"))) == 1
+
+
+def test_json_db_session_record_keeps_its_file_when_other_ids_change(tmp_path):
+    from agno.db.base import SessionType
+    from agno.session import AgentSession
+
+    db = JsonDb(db_path=str(tmp_path), store_records_in_files=True)
+    db.upsert_session(AgentSession(session_id="s1", agent_id="a1", user_id="u1"))
+    # Agent sessions are matched by agent_id only, so this updates the same session
+    db.upsert_session(AgentSession(session_id="s1", agent_id="a1", team_id="t1", user_id="u1"))
+
+    assert len(list((tmp_path / db.session_table_name).glob("*.json"))) == 1
+    session = db.get_session("s1", SessionType.AGENT)
+    assert session is not None and session.team_id == "t1"  # type: ignore
+
+
+def test_json_db_stores_memories_in_record_files(tmp_path):
+    from agno.db.schemas.memory import UserMemory
+
+    db = JsonDb(db_path=str(tmp_path), store_records_in_files=True)
+    db.upsert_user_memory(UserMemory(memory="likes tea", memory_id="m1", user_id="u1"))
+    db.upsert_user_memory(UserMemory(memory="likes coffee", memory_id="m2", user_id="u2"))
+    db.upsert_user_memory(UserMemory(memory="likes green tea", memory_id="m1", user_id="u1"))
+
+    memory = db.get_user_memory("m1")
+    assert memory is not None and memory.memory == "likes green tea"  # type: ignore
+    assert [m.memory_id for m in db.get_user_memories(user_id="u2")] == ["m2"]  # type: ignore
+
+    db.delete_user_memory("m2", user_id="u1")
+    assert db.get_user_memory("m2") is not None
+    db.delete_user_memory("m2")
+    assert db.get_user_memory("m2") is None
+
+    db.clear_memories()
+    assert db.get_user_memories() == []
+    assert list((tmp_path / db.memory_table_name).glob("*.json")) == []
+
+
+def test_json_db_record_files_pick_up_writes_of_other_instances(tmp_path):
+    from agno.db.base import SessionType
+    from agno.session import AgentSession
+
+    db = JsonDb(db_path=str(tmp_path), store_records_in_files=True)
+    other = JsonDb(db_path=str(tmp_path), store_records_in_files=True)
+    db.upsert_session(AgentSession(session_id="s1", agent_id="a1", user_id="u1"))
+    assert other.get_session("s1", SessionType.AGENT) is not None
+
+    other.upsert_session(AgentSession(session_id="s2", agent_id="a1", user_id="u1"))
+    other.rename_session("s1", SessionType.AGENT, "renamed")
+    session = db.get_session("s1", SessionType.AGENT)
+    assert session is not None and session.session_data["session_name"] == "renamed"  # type: ignore
+    sessions, total = db.get_sessions(user_id="u1", deserialize=False)  # type: ignore
+    assert total == 2
+
+    other.delete_session("s2")
+    assert db.get_session("s2", SessionType.AGENT) is None
+
+
+def test_json_record_store_write_does_not_hide_other_writes(tmp_path, monkeypatch):
+    import threading
+    import time
+
+    from agno.db.json.record_store import JsonRecordStore
+
+    store = JsonRecordStore(tmp_path, key_fields=["id"], index_fields=["id"])
+    other = JsonRecordStore(tmp_path, key_fields=["id"], index_fields=["id"])
+    store.put({"id": "a"})
+
+    # Another store writes while this store is writing
+    other_writer = threading.Thread(target=other.put, args=({"id": "b"},))
+    write_file = store._write_file
+
+    def write_while_other_writes(key, serialized):
+        other_writer.start()
+        time.sleep(0.1)
+        write_file(key, serialized)
+
+    monkeypatch.setattr(store, "_write_file", write_while_other_writes)
+    store.put({"id": "c"})
+    other_writer.join(timeout=5)
+
+    assert sorted(r["id"] for r in store.all()) == ["a", "b", "c"]
@@ -415,3 +415,19 @@ def test_get_table_schema_definition_invalid():
     """Test getting schema for invalid table type"""
     with pytest.raises(ValueError, match="Unknown table type"):
         get_table_schema_definition("invalid_table")
+
+
+def test_learnings_search_index_is_rechecked_until_valid(postgres_db):
+    """Searches never build the index, and an index not valid yet is checked again a minute later"""
+    with (
+        patch("agno.db.postgres.postgres.is_learnings_search_index_valid", side_effect=[False, True]) as is_valid,
+        patch("agno.db.postgres.postgres.create_learnings_search_index") as create_index,
+        patch("agno.db.postgres.postgres.time.time", side_effect=[1000.0, 1000.0, 1030.0, 1061.0, 1061.0]),
+    ):
+        assert postgres_db._has_learnings_search_index() is False
+        assert postgres_db._has_learnings_search_index() is False
+        assert postgres_db._has_learnings_search_index() is True
+        assert postgres_db._has_learnings_search_index() is True
+
+    assert is_valid.call_count == 2
+    create_index.assert_not_called()
@@ -0,0 +1,174 @@
+"""Unit tests for the secondary indexes of RedisDb, run against fakeredis."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from agno.db.base import SessionType  # noqa: E402
+from agno.db.redis import RedisDb  # noqa: E402
+from agno.db.schemas.evals import EvalFilterType, EvalRunRecord, EvalType  # noqa: E402
+from agno.db.schemas.knowledge import KnowledgeRow  # noqa: E402
+from agno.db.schemas.memory import UserMemory  # noqa: E402
+from agno.session import AgentSession, TeamSession  # noqa: E402
+
+
+@pytest.fixture
+def redis_client():
+    return fakeredis.FakeRedis(decode_responses=True)
+
+
+@pytest.fixture
+def db(redis_client):
+    db = RedisDb(redis_client=redis_client)
+    for i in range(6):
+        db.upsert_session(
+            AgentSession(
+                session_id=f"session_{i}",
+                agent_id="agent_1" if i % 2 == 0 else "agent_2",
+                user_id="user_1" if i < 4 else "user_2",
+                created_at=100 + i,
+            )
+        )
+    db.upsert_session(TeamSession(session_id="team_session", team_id="agent_1", user_id="user_1", created_at=50))
+    return db
+
+
+def _read_ids(db, table_type):
+    """Spy on the records RedisDb reads, returning the list of IDs read per call."""
+    read_ids = []
+    original = db._get_records
+
+    def get_records(table, record_ids):
+        if table == table_type:
+            read_ids.append(list(record_ids))
+        return original(table, record_ids)
+
+    return read_ids, patch.object(db, "_get_records", side_effect=get_records)
+
+
+def test_filtered_sessions_only_read_the_page(db):
+    read_ids, spy = _read_ids(db, "sessions")
+    with spy:
+        sessions, total_count = db.get_sessions(
+            session_type=SessionType.AGENT,
+            user_id="user_1",
+            limit=2,
+            page=1,
+            sort_by="created_at",
+            sort_order="desc",
+            deserialize=False,
+        )
+
+    assert [s["session_id"] for s in sessions] == ["session_3", "session_2"]
+    assert total_count == 4
+    assert read_ids == [["session_3", "session_2"]]
+
+
+def test_unfiltered_sessions_read_the_page_from_the_sorted_index(db):
+    sessions, total_count = db.get_sessions(limit=3, page=2, sort_by="created_at", deserialize=False)
+
+    assert [s["session_id"] for s in sessions] == ["session_2", "session_3", "session_4"]
+    assert total_count == 7
+
+
+def test_component_and_timestamp_filters(db):
+    agent_sessions = db.get_sessions(session_type=SessionType.AGENT, component_id="agent_1", sort_by="created_at")
+    assert [s.session_id for s in agent_sessions] == ["session_0", "session_2", "session_4"]
+
+    # Without a session type, the component can be an agent, a team or a workflow
+    all_sessions = db.get_sessions(component_id="agent_1", sort_by="created_at")
+    assert [s.session_id for s in all_sessions] == ["team_session", "session_0", "session_2", "session_4"]
+
+    in_range = db.get_sessions(start_timestamp=101, end_timestamp=103, sort_by="created_at")
+    assert [s.session_id for s in in_range] == ["session_1", "session_2", "session_3"]
+
+
+def test_session_name_is_matched_on_indexed_candidates(db):
+    db.rename_session("session_1", SessionType.AGENT, "Weekly report")
+
+    sessions, total_count = db.get_sessions(user_id="user_1", session_name="report", deserialize=False)
+
+    assert [s["session_id"] for s in sessions] == ["session_1"]
+    assert total_count == 1
+
+
+def test_changed_and_deleted_records_leave_the_indexes(db, redis_client):
+    db.upsert_user_memory(UserMemory(memory_id="memory_1", memory="likes tea", user_id="user_1", agent_id="agent_1"))
+    db.upsert_user_memory(UserMemory(memory_id="memory_1", memory="likes tea", user_id="user_1", agent_id="agent_2"))
+
+    assert db.get_user_memories(agent_id="agent_1") == []
+    assert [m.memory_id for m in db.get_user_memories(agent_id="agent_2")] == ["memory_1"]
+
+    db.delete_session("session_0")
+
+    assert "session_0" not in redis_client.smembers("agno:sessions:index:agent_id:agent_1")
+    assert redis_client.zscore("agno:sessions:index:sorted:created_at", "session_0") is None
+    assert db.get_sessions(deserialize=False)[1] == 6
+
+
+def test_expired_records_are_skipped_and_pruned(db, redis_client):
+    # Simulate the TTL of a record running out
+    redis_client.delete("agno:sessions:session_2")
+
+    sessions = db.get_sessions(user_id="user_1", sort_by="created_at")
+
+    assert [s.session_id for s in sessions] == ["team_session", "session_0", "session_1", "session_3"]
+    assert redis_client.zscore("agno:sessions:index:sorted:created_at", "session_2") is None
+
+
+def test_records_stored_before_indexing_are_indexed_on_first_use(redis_client):
+    for i in range(3):
+        record = {"session_id": f"old_{i}", "session_type": "agent", "user_id": "user_1", "created_at": i}
+        redis_client.set(f"agno:sessions:old_{i}", json.dumps(record))
+
+    db = RedisDb(redis_client=redis_client)
+    sessions, total_count = db.get_sessions(
+        user_id="user_1", sort_by="created_at", sort_order="desc", deserialize=False
+    )
+
+    assert [s["session_id"] for s in sessions] == ["old_2", "old_1", "old_0"]
+    assert total_count == 3
+
+
+def test_memories_topics_and_stats_use_the_user_index(db):
+    db.upsert_user_memory(UserMemory(memory="likes tea", user_id="user_1", topics=["food"], created_at=1))
+    db.upsert_user_memory(UserMemory(memory="plays chess", user_id="user_1", topics=["games"], created_at=2))
+    db.upsert_user_memory(UserMemory(memory="likes coffee", user_id="user_2", topics=["food"], created_at=3))
+
+    memories, total_count = db.get_user_memories(user_id="user_1", topics=["food"], deserialize=False)
+    assert [m["memory"] for m in memories] == ["likes tea"]
+    assert total_count == 1
+
+    assert sorted(db.get_all_memory_topics(user_id="user_1")) == ["food", "games"]
+    stats, _ = db.get_user_memory_stats(user_id="user_2")
+    assert [(s["user_id"], s["total_memories"]) for s in stats] == [("user_2", 1)]
+
+    db.clear_memories()
+    assert db.get_user_memories(deserialize=False) == ([], 0)
+
+
+def test_eval_runs_filter_by_type_and_component(db):
+    db.create_eval_run(EvalRunRecord(run_id="eval_1", eval_type=EvalType.ACCURACY, eval_data={}, agent_id="agent_1"))
+    db.create_eval_run(EvalRunRecord(run_id="eval_2", eval_type=EvalType.PERFORMANCE, eval_data={}, team_id="team_1"))
+
+    accuracy_runs = db.get_eval_runs(eval_type=[EvalType.ACCURACY])
+    assert [r.run_id for r in accuracy_runs] == ["eval_1"]
+
+    team_runs = db.get_eval_runs(filter_type=EvalFilterType.TEAM)
+    assert [r.run_id for r in team_runs] == ["eval_2"]
+
+    db.delete_eval_run("eval_1")
+    assert db.get_eval_runs(eval_type=[EvalType.ACCURACY]) == []
+
+
+def test_knowledge_contents_filter_by_linked_to(db):
+    db.upsert_knowledge_content(KnowledgeRow(id="doc_1", name="a", description="", linked_to="kb_1", created_at=1))
+    db.upsert_knowledge_content(KnowledgeRow(id="doc_2", name="b", description="", linked_to="kb_2", created_at=2))
+
+    contents, total_count = db.get_knowledge_contents(linked_to="kb_2")
+
+    assert [c.id for c in contents] == ["doc_2"]
+    assert total_count == 1
@@ -10,7 +10,7 @@ import pytest
 
 from agno.db.base import AsyncBaseDb, BaseDb
 from agno.db.sqlite import SqliteDb
-from agno.db.utils import learning_search_patterns
+from agno.db.utils import learning_search_patterns, learning_search_terms
 
 
 @pytest.fixture
@@ -52,6 +52,12 @@ class TestPatterns:
     def test_ascii_queries_get_no_wildcard_padding(self) -> None:
         assert all("______" not in pattern for pattern in learning_search_patterns("sarah chen"))
 
+    def test_search_terms_split_on_separators(self) -> None:
+        assert learning_search_terms("Sarah_Chen, sarah-chen 50% done") == ["sarah", "chen", "50", "done"]
+        assert learning_search_terms("% _ %") == []
+        # Non-ASCII queries are left to the patterns
+        assert learning_search_terms("café") == []
+
 
 class TestBaseDefaults:
     def test_base_db_default_raises(self) -> None:
@@ -151,3 +157,51 @@ class TestSqliteSearchLearnings:
             db.search_learnings(query="content")
         # ...while get_learnings demonstrates today's swallowing behavior
         assert db.get_learnings() == []
+
+
+class TestSqliteFullTextIndex:
+    @staticmethod
+    def _indexed_count(db: SqliteDb, term: str) -> int:
+        from sqlalchemy import text
+
+        with db.Session() as sess:
+            return sess.execute(
+                text("SELECT count(*) FROM agno_learnings_fts WHERE agno_learnings_fts MATCH :term"), {"term": term}
+            ).scalar()
+
+    def test_orders_by_relevance(self, db: SqliteDb) -> None:
+        _seed(db, "named", {"name": "harbor", "facts": [{"content": "harbor ingest"}]})
+        filler = " ".join(f"word{i}" for i in range(50))
+        _seed(db, "mentioned", {"name": "radar", "facts": [{"content": f"{filler} works on harbor"}]})
+
+        rows = db.search_learnings(query="harbor")
+        assert [r["learning_id"] for r in rows] == ["named", "mentioned"]
+
+    def test_indexes_rows_written_before_and_after_the_index(self, db: SqliteDb) -> None:
+        _seed(db, "before", {"x": "first needle"})
+        assert [r["learning_id"] for r in db.search_learnings(query="needle")] == ["before"]
+        assert db._learnings_search_index is True
+
+        _seed(db, "after", {"x": "second needle"})
+        assert {r["learning_id"] for r in db.search_learnings(query="needle")} == {"before", "after"}
+
+    def test_index_follows_updates_and_deletes(self, db: SqliteDb) -> None:
+        _seed(db, "a", {"x": "alpha"})
+        db.search_learnings(query="alpha")
+
+        db.update_learning(id="a", content={"x": "beta"})
+        assert self._indexed_count(db, "alpha") == 0
+        assert [r["learning_id"] for r in db.search_learnings(query="beta")] == ["a"]
+
+        _seed(db, "a", {"x": "gamma"})
+        assert self._indexed_count(db, "beta") == 0
+        assert self._indexed_count(db, "gamma") == 1
+
+        db.delete_learning(id="a")
+        assert self._indexed_count(db, "gamma") == 0
+        assert db.search_learnings(query="gamma") == []
+
+    def test_indexes_json_escaped_text(self, db: SqliteDb) -> None:
+        _seed(db, "a", {"x": "first line\nharbor ingest"})
+        assert [r["learning_id"] for r in db.search_learnings(query="harbor")] == ["a"]
+        assert self._indexed_count(db, "harbor") == 1
@@ -0,0 +1,109 @@
+"""Tests for listing session summaries with cursor pagination."""
+
+import pytest
+
+from agno.db.base import SessionType
+from agno.db.in_memory import InMemoryDb
+from agno.db.sqlite import SqliteDb
+from agno.models.message import Message
+from agno.os.schema import SessionSchema
+from agno.run.agent import RunOutput
+from agno.run.team import TeamRunOutput
+from agno.session import AgentSession, TeamSession
+
+
+def _agent_session(i: int, created_at: int, **kwargs) -> AgentSession:
+    return AgentSession(
+        session_id=f"session_{i}",
+        agent_id="agent_1",
+        user_id="user_1",
+        created_at=created_at,
+        runs=[RunOutput(run_id=f"run_{i}", agent_id="agent_1", messages=[Message(role="user", content=f"hi {i}")])],
+        **kwargs,
+    )
+
+
+@pytest.fixture(params=["sqlite", "sqlite_runs_table", "in_memory"])
+def db(request, tmp_path):
+    if request.param == "in_memory":
+        db = InMemoryDb()
+    else:
+        db = SqliteDb(db_file=str(tmp_path / "sessions.db"), store_runs_in_table=request.param == "sqlite_runs_table")
+
+    # Sessions 0 and 1 share their creation time, the cursor tells them apart by session_id
+    for i, created_at in enumerate([300, 300, 200, 100]):
+        session_data = {"session_name": "Named"} if i == 2 else {"session_state": {"step": i}}
+        db.upsert_session(_agent_session(i, created_at, session_data=session_data))
+    db.upsert_session(
+        TeamSession(
+            session_id="team_session",
+            team_id="team_1",
+            created_at=50,
+            runs=[
+                # Member runs are stored before the team run they belong to
+                RunOutput(run_id="member_run", agent_id="agent_1", parent_run_id="team_run"),
+                TeamRunOutput(
+                    run_id="team_run", team_id="team_1", messages=[Message(role="user", content="team question")]
+                ),
+            ],
+        )
+    )
+    return db
+
+
+def _read_all_pages(db, **kwargs):
+    sessions, cursor = [], None
+    while True:
+        page = db.get_session_summaries(cursor=cursor, **kwargs)
+        sessions.extend(page.sessions)
+        cursor = page.next_cursor
+        if cursor is None:
+            return sessions
+
+
+def test_pages_follow_created_at_then_session_id(db):
+    sessions = _read_all_pages(db, limit=2)
+
+    assert [s["session_id"] for s in sessions] == [
+        "session_1",
+        "session_0",
+        "session_2",
+        "session_3",
+        "team_session",
+    ]
+
+    ascending = _read_all_pages(db, limit=3, sort_order="asc")
+    assert [s["session_id"] for s in ascending] == [s["session_id"] for s in reversed(sessions)]
+
+
+def test_summaries_only_hold_the_listed_fields(db):
+    summaries = {s["session_id"]: s for s in db.get_session_summaries(limit=10).sessions}
+
+    assert summaries["session_0"]["session_data"] == {"session_state": {"step": 0}}
+    assert summaries["session_0"]["user_id"] == "user_1"
+    assert "agent_data" not in summaries["session_0"]
+    # Named sessions don't read any run
+    assert summaries["session_2"]["session_data"] == {"session_name": "Named"}
+    assert summaries["session_2"]["runs"] == []
+
+    names = {session_id: SessionSchema.from_dict(s).session_name for session_id, s in summaries.items()}
+    assert names == {
+        "session_0": "hi 0",
+        "session_1": "hi 1",
+        "session_2": "Named",
+        "session_3": "hi 3",
+        "team_session": "team question",
+    }
+
+
+def test_total_count_is_only_counted_on_request(db):
+    assert db.get_session_summaries(limit=2).total_count is None
+
+    page = db.get_session_summaries(limit=2, session_type=SessionType.AGENT, with_total_count=True)
+    assert page.total_count == 4
+    assert len(page.sessions) == 2
+
+
+def test_invalid_cursor_is_rejected(db):
+    with pytest.raises(ValueError, match="Invalid session cursor"):
+        db.get_session_summaries(cursor="not-a-cursor")
@@ -1180,6 +1180,8 @@ async def test_hermetic_real_agent_full_override_set(tmp_path):
         assert attempt_agent.compression_manager is not compression_manager
         assert attempt_agent.compression_manager.stats == {}
         assert attempt_agent.compression_manager.stats is not compression_manager.stats
+        assert attempt_agent.compression_manager.cache_compressed_results is False
+        assert compression_manager.cache_compressed_results is True
         assert attempt_agent.culture_manager is not culture_manager
         assert attempt_agent.culture_manager.db is culture_manager.db
         assert attempt_agent.reasoning_agent is not caller.reasoning_agent
@@ -92,3 +92,89 @@ async def test_async_all_iterations_fail_returns_none_stats():
     assert result is not None
     assert len(result.results) == 0
     assert result.avg_score is None
+
+
+def _mock_scoring_evaluator(eval_instance: AccuracyEval):
+    """Helper to mock the evaluator agent to score each answer with the iteration number found in it."""
+    import re
+
+    def score(evaluation_input: str) -> AccuracyAgentResponse:
+        iteration = int(re.search(r"answer (\d+)", evaluation_input).group(1))
+        return AccuracyAgentResponse(accuracy_score=iteration, accuracy_reason=f"Iteration {iteration}.")
+
+    evaluator = eval_instance.get_evaluator_agent()
+    evaluator.model = MagicMock()
+    evaluator.run = MagicMock(side_effect=lambda evaluation_input, stream: RunOutput(content=score(evaluation_input)))
+
+    async def arun(evaluation_input, stream):
+        return RunOutput(content=score(evaluation_input))
+
+    evaluator.arun = arun
+    eval_instance.evaluator_agent = evaluator
+    return evaluator
+
+
+def test_iterations_run_concurrently_and_keep_their_order():
+    import threading
+
+    from agno.agent import Agent
+
+    # Every iteration waits for the others, so the eval only finishes if they run at the same time
+    barrier = threading.Barrier(3, timeout=5)
+
+    def run(input, session_id, stream):
+        barrier.wait()
+        return RunOutput(content=f"answer {session_id.rsplit('_', 1)[-1]}")
+
+    agent = Agent(name="Test Agent")
+    agent.run = run
+    eval = AccuracyEval(
+        input="What is 2 + 2?",
+        expected_output="4",
+        agent=agent,
+        num_iterations=3,
+        max_concurrency=3,
+        show_spinner=False,
+        telemetry=False,
+    )
+    _mock_scoring_evaluator(eval)
+
+    result = eval.run(print_results=False, print_summary=False)
+
+    assert [r.score for r in result.results] == [1, 2, 3]
+    assert result.avg_score == 2
+
+
+async def test_async_iterations_are_bounded_by_max_concurrency():
+    import asyncio
+
+    from agno.agent import Agent
+
+    running = 0
+    max_running = 0
+
+    async def arun(input, session_id, stream):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return RunOutput(content=f"answer {session_id.rsplit('_', 1)[-1]}")
+
+    agent = Agent(name="Test Agent")
+    agent.arun = arun
+    eval = AccuracyEval(
+        input="What is 2 + 2?",
+        expected_output="4",
+        agent=agent,
+        num_iterations=4,
+        max_concurrency=2,
+        show_spinner=False,
+        telemetry=False,
+    )
+    _mock_scoring_evaluator(eval)
+
+    result = await eval.arun(print_results=False, print_summary=False)
+
+    assert [r.score for r in result.results] == [1, 2, 3, 4]
+    assert max_running == 2
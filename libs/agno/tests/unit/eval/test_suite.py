@@ -2,6 +2,7 @@
 
 import asyncio
 import json
+import time
 from types import SimpleNamespace
 
 import pytest
@@ -1562,3 +1563,130 @@ def test_case_and_case_result_type_hints_resolve():
 
     assert typing.get_type_hints(Case)["scorer"] is not None
     assert typing.get_type_hints(CaseResult)["score"] is not None
+
+
+# ---------------------------------------------------------------------------
+# Concurrency and result cache
+# ---------------------------------------------------------------------------
+
+
+class ConfigStubAgent(StubAgent):
+    """StubAgent with a config, so its cases can be cached."""
+
+    def __init__(self, *, instructions="Answer briefly.", **kwargs):
+        super().__init__(**kwargs)
+        self.instructions = instructions
+
+    def to_dict(self):
+        return {"id": self.id, "instructions": self.instructions}
+
+
+def test_concurrent_cases_report_hooks_in_selection_order(monkeypatch):
+    _install_fake_evals(monkeypatch)
+    # The first case is the slowest, so the others finish before it
+    cases = [
+        _make_case(agent=StubAgent(delay=0.3), name="slow"),
+        _make_case(agent=StubAgent(delay=0.1), name="medium"),
+        _make_case(agent=StubAgent(), name="fast"),
+    ]
+    calls = []
+
+    start = time.perf_counter()
+    suite_result = run_cases(
+        cases,
+        max_concurrency=3,
+        on_case_start=lambda case: calls.append(("start", case.name)),
+        on_case_end=lambda case, result: calls.append(("end", case.name)),
+    )
+
+    assert [result.name for result in suite_result.results] == ["slow", "medium", "fast"]
+    assert calls == [
+        ("start", "slow"),
+        ("start", "medium"),
+        ("start", "fast"),
+        ("end", "slow"),
+        ("end", "medium"),
+        ("end", "fast"),
+    ]
+    assert suite_result.status == "PASS"
+    assert time.perf_counter() - start < 0.4
+
+
+def test_max_concurrency_bounds_the_running_cases(monkeypatch):
+    _install_fake_evals(monkeypatch, judge_delay=0.02)
+    running = {"now": 0, "max": 0}
+
+    def on_case_start(case):
+        running["now"] += 1
+        running["max"] = max(running["max"], running["now"])
+
+    def on_case_end(case, result):
+        running["now"] -= 1
+
+    cases = [_make_case(agent=StubAgent(delay=0.02), name=f"case_{i}") for i in range(6)]
+
+    suite_result = run_cases(cases, max_concurrency=2, on_case_start=on_case_start, on_case_end=on_case_end)
+
+    assert suite_result.passed == 6
+    assert running["max"] == 2
+
+
+def test_max_concurrency_must_be_positive():
+    with pytest.raises(ValueError, match="max_concurrency"):
+        run_cases([_make_case()], max_concurrency=0)
+
+
+def test_passed_cases_are_cached_until_their_config_changes(monkeypatch, tmp_path):
+    from agno.models.cache import DirectoryResponseCache
+
+    _install_fake_evals(monkeypatch)
+    cache = DirectoryResponseCache(cache_dir=tmp_path)
+    agent = ConfigStubAgent(output=_output(content="Paris."))
+    case = _make_case(agent=agent)
+
+    first = run_cases([case], cache=cache).results[0]
+    second = run_cases([case], cache=cache).results[0]
+
+    assert agent.run_count == 1
+    assert first.cached is False
+    assert second.cached is True
+    assert second.passed is True
+    assert second.output == "Paris."
+    assert second.session_id == first.session_id
+    assert second.judge_reason == "meets the criteria"
+
+    # A changed agent config runs the case again
+    agent.instructions = "Answer in one word."
+    third = run_cases([case], cache=cache).results[0]
+    assert agent.run_count == 2
+    assert third.cached is False
+
+
+def test_failed_cases_are_not_cached(monkeypatch, tmp_path):
+    from agno.models.cache import DirectoryResponseCache
+
+    _install_fake_evals(monkeypatch, judge_passed=False)
+    cache = DirectoryResponseCache(cache_dir=tmp_path)
+    agent = ConfigStubAgent()
+    case = _make_case(agent=agent)
+
+    run_cases([case], cache=cache)
+    result = run_cases([case], cache=cache).results[0]
+
+    assert agent.run_count == 2
+    assert result.cached is False
+
+
+def test_cases_without_a_config_are_never_cached(monkeypatch, tmp_path):
+    from agno.models.cache import DirectoryResponseCache
+
+    _install_fake_evals(monkeypatch)
+    cache = DirectoryResponseCache(cache_dir=tmp_path)
+    # StubAgent has no to_dict, so there is no cache key
+    agent = StubAgent()
+    case = _make_case(agent=agent)
+
+    run_cases([case], cache=cache)
+    run_cases([case], cache=cache)
+
+    assert agent.run_count == 2
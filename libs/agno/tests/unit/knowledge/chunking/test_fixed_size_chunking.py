@@ -32,3 +32,14 @@ def test_long_document_still_chunks_with_overlap_and_no_duplication():
 
     assert len(chunks) == 7
     assert [len(c.content) for c in chunks] == [20, 20, 20, 20, 20, 20, 10]
+
+
+def test_chunk_iter_yields_the_same_chunks_lazily():
+    """Test that chunk_iter yields the chunks of chunk one at a time."""
+    strategy = FixedSizeChunking(chunk_size=20, overlap=5)
+    doc = Document(name="long", content="a" * 100)
+
+    chunks = strategy.chunk_iter(doc)
+
+    assert next(chunks).meta_data["chunk"] == 1
+    assert [c.content for c in strategy.chunk_iter(doc)] == [c.content for c in strategy.chunk(doc)]
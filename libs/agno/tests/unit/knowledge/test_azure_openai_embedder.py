@@ -127,3 +127,24 @@ class TestAzureOpenAIEmbedderInputFormat:
         call_kwargs = async_mock.embeddings.create.call_args[1]
         assert isinstance(call_kwargs["input"], list)
         assert call_kwargs["input"] == ["test async input"]
+
+
+def test_get_embeddings_batch_and_usage_sends_one_request_per_batch(_mock_openai):
+    mock_client, mock_response = _mock_openai
+    mock_response.data = [MagicMock(embedding=[0.1]), MagicMock(embedding=[0.2])]
+
+    from agno.knowledge.embedder.azure_openai import AzureOpenAIEmbedder
+
+    embedder = AzureOpenAIEmbedder(
+        api_key="test-key",
+        azure_endpoint="https://test.openai.azure.com/",
+        openai_client=mock_client,
+        batch_size=2,
+    )
+
+    embeddings, usages = embedder.get_embeddings_batch_and_usage(["a", "b", "c", "d"])
+
+    assert mock_client.embeddings.create.call_count == 2
+    assert mock_client.embeddings.create.call_args_list[0][1]["input"] == ["a", "b"]
+    assert embeddings == [[0.1], [0.2], [0.1], [0.2]]
+    assert usages == [{"prompt_tokens": 5, "total_tokens": 5}] * 4
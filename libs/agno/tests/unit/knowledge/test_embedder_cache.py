@@ -0,0 +1,83 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from agno.knowledge.embedder.base import Embedder
+from agno.knowledge.embedder.cache import CachedEmbedder, InMemoryEmbeddingCache, SqliteEmbeddingCache
+
+
+@dataclass
+class CountingEmbedder(Embedder):
+    id: str = "counting"
+    dimensions: Optional[int] = 3
+    calls: List[List[str]] = field(default_factory=list)
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        self.calls.append([text])
+        return [float(len(text)), 0.5, 1.0], {"total_tokens": len(text)}
+
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        self.calls.append(list(texts))
+        return [[float(len(t)), 0.5, 1.0] for t in texts], [{"total_tokens": len(t)} for t in texts]
+
+
+def test_cached_embedder_serves_repeated_text_from_cache():
+    inner = CountingEmbedder()
+    embedder = CachedEmbedder(embedder=inner)
+
+    first, usage = embedder.get_embedding_and_usage("hello")
+    second, cached_usage = embedder.get_embedding_and_usage("hello")
+
+    assert first == second == [5.0, 0.5, 1.0]
+    assert usage == {"total_tokens": 5}
+    assert cached_usage is None
+    assert inner.calls == [["hello"]]
+    assert embedder.get_stats()["hits"] == 1
+    assert embedder.hit_rate == 0.5
+
+
+def test_cached_embedder_batch_only_embeds_missing_texts():
+    inner = CountingEmbedder()
+    embedder = CachedEmbedder(embedder=inner)
+    embedder.get_embedding("bb")
+
+    embeddings, usages = embedder.get_embeddings_batch_and_usage(["a", "bb", "ccc"])
+
+    assert [e[0] for e in embeddings] == [1.0, 2.0, 3.0]
+    assert usages[1] is None
+    assert inner.calls[-1] == ["a", "ccc"]
+
+
+def test_cache_key_depends_on_model_and_dimensions():
+    cache = InMemoryEmbeddingCache()
+    small = CachedEmbedder(embedder=CountingEmbedder(id="small"), cache=cache)
+    large = CachedEmbedder(embedder=CountingEmbedder(id="large"), cache=cache)
+
+    assert small.cache_key("text") != large.cache_key("text")
+
+
+def test_in_memory_cache_evicts_least_recently_used():
+    cache = InMemoryEmbeddingCache(max_entries=2)
+    cache.set("a", [1.0])
+    cache.set("b", [2.0])
+    cache.get("a")
+    cache.set("c", [3.0])
+
+    assert cache.get("b") is None
+    assert cache.get("a") == [1.0]
+    assert len(cache) == 2
+
+
+def test_sqlite_cache_persists_and_evicts(tmp_path):
+    db_file = tmp_path / "embeddings.db"
+    cache = SqliteEmbeddingCache(db_file=db_file, max_entries=2)
+    cache.set_many({"a": [0.1, 0.2], "b": [0.3, 0.4]})
+    cache.close()
+
+    reopened = SqliteEmbeddingCache(db_file=db_file, max_entries=2)
+    assert reopened.get("a") == pytest.approx([0.1, 0.2])
+    reopened.set("c", [0.5, 0.6])
+
+    assert reopened.get("b") is None
+    assert len(reopened) == 2
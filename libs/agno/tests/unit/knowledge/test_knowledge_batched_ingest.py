@@ -0,0 +1,88 @@
+"""Tests for loading files in batches with readers that read incrementally."""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from agno.knowledge.content import Content, ContentStatus
+from agno.knowledge.document.base import Document
+from agno.knowledge.knowledge import Knowledge
+from agno.knowledge.reader.csv_reader import CSVReader
+from agno.vectordb.base import VectorDb
+
+
+@pytest.fixture
+def csv_path(tmp_path) -> Path:
+    path = tmp_path / "rows.csv"
+    path.write_text("\n".join(f"row{i},{i}" for i in range(8)))
+    return path
+
+
+def _knowledge() -> Knowledge:
+    vector_db = MagicMock(spec=VectorDb)
+    vector_db.exists.return_value = True
+    vector_db.upsert_available.return_value = True
+    return Knowledge(vector_db=vector_db, ingest_batch_size=3)
+
+
+def _content(path: Path) -> Content:
+    return Content(path=str(path), reader=CSVReader(), content_hash="hash", id="content-id")
+
+
+def test_documents_are_inserted_one_batch_at_a_time(csv_path):
+    knowledge = _knowledge()
+    content = _content(csv_path)
+
+    knowledge._load_from_path(content, upsert=True, skip_if_exists=False)
+
+    # The first batch replaces the stored documents of the content, the next ones are added
+    upserted = knowledge.vector_db.upsert.call_args_list
+    inserted = knowledge.vector_db.insert.call_args_list
+    assert [len(call.args[1]) for call in upserted] == [3]
+    assert [len(call.kwargs["documents"]) for call in inserted] == [3, 2]
+    assert inserted[-1].kwargs["documents"][-1].content == "row7, 7"
+    assert all(doc.content_id == "content-id" for call in inserted for doc in call.kwargs["documents"])
+    assert content.status == ContentStatus.COMPLETED
+
+
+def test_failed_batch_marks_the_content_failed(csv_path):
+    knowledge = _knowledge()
+    knowledge.vector_db.insert.side_effect = RuntimeError("boom")
+    content = _content(csv_path)
+
+    knowledge._load_from_path(content, upsert=False, skip_if_exists=False)
+
+    assert knowledge.vector_db.insert.call_count == 1
+    assert content.status == ContentStatus.FAILED
+    assert content.status_message == "Could not insert embedding"
+    # Nothing was inserted, so there is nothing to remove
+    knowledge.vector_db.delete_by_content_id.assert_not_called()
+
+
+def test_read_error_is_reported_and_removes_inserted_batches(csv_path):
+    knowledge = _knowledge()
+    content = _content(csv_path)
+
+    def documents():
+        yield from [Document(content="row0"), Document(content="row1"), Document(content="row2")]
+        raise ValueError("bad row")
+
+    knowledge._handle_vector_db_insert_batches(content, knowledge._iter_batches(documents()), upsert=False)
+
+    assert knowledge.vector_db.insert.call_count == 1
+    knowledge.vector_db.delete_by_content_id.assert_called_once_with("content-id")
+    assert content.status == ContentStatus.FAILED
+    assert content.status_message == "Could not read content: bad row"
+
+
+@pytest.mark.asyncio
+async def test_async_documents_are_inserted_one_batch_at_a_time(csv_path):
+    knowledge = _knowledge()
+    content = _content(csv_path)
+
+    await knowledge._aload_from_path(content, upsert=False, skip_if_exists=False)
+
+    inserted = knowledge.vector_db.async_insert.call_args_list
+    assert [len(call.kwargs["documents"]) for call in inserted] == [3, 3, 2]
+    assert content.status == ContentStatus.COMPLETED
@@ -0,0 +1,81 @@
+"""Tests for concurrent loading in insert_many() and ainsert_many()."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from agno.knowledge.knowledge import Knowledge
+from agno.vectordb.base import VectorDb
+
+
+def test_insert_many_loads_items_concurrently():
+    knowledge = Knowledge(vector_db=MagicMock(spec=VectorDb), max_concurrent_inserts=4)
+    lock = threading.Lock()
+    active = 0
+    max_active = 0
+    inserted = []
+
+    def fake_insert(**kwargs):
+        nonlocal active, max_active
+        with lock:
+            active += 1
+            max_active = max(max_active, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+            inserted.append(kwargs["text_content"])
+
+    with patch.object(knowledge, "insert", side_effect=fake_insert):
+        knowledge.insert_many(text_contents=[f"doc{i}" for i in range(8)])
+
+    assert sorted(inserted) == sorted(f"doc{i}" for i in range(8))
+    assert 1 < max_active <= 4
+
+
+def test_insert_many_is_sequential_by_default():
+    knowledge = Knowledge(vector_db=MagicMock(spec=VectorDb))
+    calls = []
+
+    with patch.object(knowledge, "insert", side_effect=lambda **kwargs: calls.append(kwargs["text_content"])):
+        knowledge.insert_many([{"text_content": "a"}, {"text_content": "b"}, {"text_content": "c"}])
+
+    assert calls == ["a", "b", "c"]
+
+
+def test_insert_many_raises_after_loading_the_other_items():
+    knowledge = Knowledge(vector_db=MagicMock(spec=VectorDb))
+    calls = []
+
+    def fake_insert(**kwargs):
+        calls.append(kwargs["text_content"])
+        if kwargs["text_content"] == "bad":
+            raise ValueError("cannot read")
+
+    with patch.object(knowledge, "insert", side_effect=fake_insert):
+        with pytest.raises(ValueError):
+            knowledge.insert_many([{"text_content": "bad"}, {"text_content": "good"}], max_concurrency=2)
+
+    assert sorted(calls) == ["bad", "good"]
+
+
+@pytest.mark.asyncio
+async def test_ainsert_many_bounds_concurrency():
+    knowledge = Knowledge(vector_db=MagicMock(spec=VectorDb))
+    active = 0
+    max_active = 0
+
+    async def fake_ainsert(**kwargs):
+        nonlocal active, max_active
+        active += 1
+        max_active = max(max_active, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+
+    with patch.object(knowledge, "ainsert", side_effect=fake_ainsert) as mock_ainsert:
+        await knowledge.ainsert_many([{"text_content": f"doc{i}"} for i in range(10)], max_concurrency=3)
+
+    assert mock_ainsert.call_count == 10
+    assert max_active == 3
@@ -0,0 +1,123 @@
+"""Tests for the "semantic" retrieval method of MemoryManager."""
+
+from dataclasses import dataclass, field
+from typing import List
+from unittest.mock import MagicMock
+
+import pytest
+
+from agno.db.schemas import UserMemory
+from agno.knowledge.embedder.base import Embedder
+from agno.memory.manager import MemoryManager
+
+_VOCABULARY = ["cats", "dogs", "coffee", "tea", "work"]
+
+
+@dataclass
+class KeywordEmbedder(Embedder):
+    """Embeds a text as the counts of a few keywords, and records the embedded texts."""
+
+    calls: List[str] = field(default_factory=list)
+
+    def get_embedding(self, text: str) -> List[float]:
+        self.calls.append(text)
+        return [float(text.lower().count(word)) + 0.01 for word in _VOCABULARY]
+
+    async def async_get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding(text)
+
+
+@pytest.fixture
+def memories():
+    return [
+        UserMemory(memory_id="m1", user_id="user1", memory="I like cats"),
+        UserMemory(memory_id="m2", user_id="user1", memory="I drink coffee every morning"),
+        UserMemory(memory_id="m3", user_id="user1", memory="I walk my dogs after work"),
+    ]
+
+
+@pytest.fixture
+def manager(memories):
+    db = MagicMock()
+    db.get_user_memories = MagicMock(side_effect=lambda **kwargs: list(memories))
+    return MemoryManager(db=db, embedder=KeywordEmbedder())
+
+
+def test_semantic_search_returns_most_similar_memories(manager):
+    results = manager.search_user_memories(query="coffee", retrieval_method="semantic", user_id="user1", limit=1)
+
+    assert [m.memory_id for m in results] == ["m2"]
+
+
+def test_semantic_search_only_embeds_changed_memories(manager, memories):
+    manager.search_user_memories(query="cats", retrieval_method="semantic", user_id="user1")
+    # 3 memories and the query
+    assert len(manager.embedder.calls) == 4
+
+    manager.embedder.calls.clear()
+    memories[0].memory = "I like tea"
+    results = manager.search_user_memories(query="tea", retrieval_method="semantic", user_id="user1", limit=1)
+
+    assert manager.embedder.calls == ["I like tea", "tea"]
+    assert results[0].memory_id == "m1"
+
+
+def test_semantic_search_drops_deleted_memories(manager, memories):
+    manager.search_user_memories(query="cats", retrieval_method="semantic", user_id="user1")
+
+    memories.pop(0)
+    results = manager.search_user_memories(query="cats", retrieval_method="semantic", user_id="user1")
+
+    assert "m1" not in [m.memory_id for m in results]
+    assert "m1" not in manager.get_memory_index()._entries["user1"]
+
+
+def test_semantic_search_requires_query(manager):
+    with pytest.raises(ValueError):
+        manager.search_user_memories(retrieval_method="semantic", user_id="user1")
+
+
+@pytest.fixture
+def db_manager(memories):
+    from agno.db.in_memory import InMemoryDb
+
+    db = InMemoryDb()
+    for memory in memories:
+        db.upsert_user_memory(memory)
+    return MemoryManager(db=db, embedder=KeywordEmbedder())
+
+
+def test_semantic_search_skips_reading_all_memories_when_unchanged(db_manager, monkeypatch):
+    db_manager.search_user_memories(query="cats", retrieval_method="semantic", user_id="user1", limit=1)
+
+    read_from_db = MagicMock(side_effect=db_manager.read_from_db)
+    monkeypatch.setattr(db_manager, "read_from_db", read_from_db)
+    results = db_manager.search_user_memories(query="coffee", retrieval_method="semantic", user_id="user1", limit=1)
+
+    assert [m.memory_id for m in results] == ["m2"]
+    read_from_db.assert_not_called()
+
+    db_manager.db.upsert_user_memory(UserMemory(memory_id="m4", user_id="user1", memory="I drink tea"))
+    results = db_manager.search_user_memories(query="tea", retrieval_method="semantic", user_id="user1", limit=1)
+
+    assert [m.memory_id for m in results] == ["m4"]
+    read_from_db.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_async_semantic_search(db_manager):
+    results = await db_manager.asearch_user_memories(
+        query="coffee", retrieval_method="semantic", user_id="user1", limit=1
+    )
+
+    assert [m.memory_id for m in results] == ["m2"]
+
+
+def test_index_keeps_the_most_recently_searched_users(manager):
+    index = manager.get_memory_index()
+    index.max_users = 2
+    for user_id in ["user1", "user2", "user3"]:
+        index.sync(user_id, [UserMemory(memory_id=f"{user_id}-m", user_id=user_id, memory="I like cats")])
+        index.search(user_id, "cats")
+
+    assert list(index._entries) == ["user2", "user3"]
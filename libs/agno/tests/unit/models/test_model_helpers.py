@@ -236,6 +236,18 @@ class TestModelCaching:
         path = model._get_model_cache_file_path("abc123")
         assert path == tmp_path / "abc123.json"
 
+    def test_default_cache_store_is_shared_per_cache_dir(self, tmp_path):
+        """Models with the same cache_dir share the default store, without it being set on the model."""
+        model = OpenAIChat(id="gpt-4o-mini", cache_dir=str(tmp_path / "a"))
+        same_dir = OpenAIChat(id="gpt-4o", cache_dir=str(tmp_path / "a"))
+        store = model._get_model_cache_store()
+        assert same_dir._get_model_cache_store() is store
+        assert model.cache_store is None
+        assert store.max_bytes is not None
+
+        model.cache_dir = str(tmp_path / "b")
+        assert model._get_model_cache_store() is not store
+
     def test_save_and_retrieve_cache(self, tmp_path):
         """Saved responses can be retrieved from cache."""
         model = OpenAIChat(id="gpt-4o-mini", cache_dir=str(tmp_path))
@@ -0,0 +1,99 @@
+"""Tests for running the tool calls of a model response in a thread pool in sync runs."""
+
+import threading
+import time
+from typing import List
+
+from agno.models.message import Message
+from agno.models.openai import OpenAIChat
+from agno.models.response import ModelResponse, ModelResponseEvent
+from agno.tools.function import Function, FunctionCall
+
+
+def _function_call(name: str, delay: float = 0.0, requires_confirmation: bool = False) -> FunctionCall:
+    def tool() -> str:
+        time.sleep(delay)
+        return f"{name}:{threading.current_thread().name}"
+
+    tool.__name__ = name
+    function = Function.from_callable(tool)
+    function.requires_confirmation = requires_confirmation
+    function.process_entrypoint()
+    return FunctionCall(function=function, arguments={}, call_id=f"call_{name}")
+
+
+def _run(model: OpenAIChat, function_calls: List[FunctionCall], **kwargs) -> List[Message]:
+    results: List[Message] = []
+    list(model.run_function_calls(function_calls=function_calls, function_call_results=results, **kwargs))
+    return results
+
+
+def test_parallel_tool_calls_keep_order():
+    model = OpenAIChat(id="gpt-4o-mini", max_tool_call_workers=4)
+    # The first tool call finishes last
+    function_calls = [_function_call(f"tool_{i}", delay=0.2 - i * 0.05) for i in range(4)]
+
+    start = time.perf_counter()
+    results = _run(model, function_calls)
+    elapsed = time.perf_counter() - start
+
+    assert [r.tool_call_id for r in results] == [f"call_tool_{i}" for i in range(4)]
+    assert all("agno-tools" in str(r.content) for r in results)
+    assert elapsed < 0.4
+
+
+def test_tool_calls_run_sequentially_by_default():
+    model = OpenAIChat(id="gpt-4o-mini")
+    results = _run(model, [_function_call("tool_0"), _function_call("tool_1")])
+
+    assert [r.tool_call_id for r in results] == ["call_tool_0", "call_tool_1"]
+    assert all("agno-tools" not in str(r.content) for r in results)
+
+
+def test_parallel_tool_calls_respect_tool_call_limit():
+    model = OpenAIChat(id="gpt-4o-mini", max_tool_call_workers=4)
+    results = _run(model, [_function_call(f"tool_{i}") for i in range(3)], function_call_limit=2)
+
+    assert [r.tool_call_id for r in results] == ["call_tool_0", "call_tool_1", "call_tool_2"]
+    assert "agno-tools" in str(results[0].content)
+    assert "agno-tools" not in str(results[2].content)
+
+
+def test_parallel_tool_calls_pause_for_confirmation():
+    model = OpenAIChat(id="gpt-4o-mini", max_tool_call_workers=4)
+    function_calls = [
+        _function_call("tool_0"),
+        _function_call("tool_1", requires_confirmation=True),
+        _function_call("tool_2"),
+    ]
+
+    results: List[Message] = []
+    events = list(model.run_function_calls(function_calls=function_calls, function_call_results=results))
+
+    paused = [
+        e for e in events if isinstance(e, ModelResponse) and e.event == ModelResponseEvent.tool_call_paused.value
+    ]
+    assert len(paused) == 1
+    assert paused[0].tool_executions[0].tool_name == "tool_1"  # type: ignore
+    assert [r.tool_call_id for r in results] == ["call_tool_0", "call_tool_2"]
+
+
+def test_parallel_tool_calls_stream_events_as_they_complete():
+    model = OpenAIChat(id="gpt-4o-mini", max_tool_call_workers=4)
+    # The first tool call finishes last
+    function_calls = [_function_call("tool_0", delay=0.2), _function_call("tool_1")]
+
+    results: List[Message] = []
+    events = [
+        (e.event, e.tool_executions[0].tool_name)  # type: ignore
+        for e in model.run_function_calls(function_calls=function_calls, function_call_results=results)
+        if isinstance(e, ModelResponse) and e.tool_executions
+    ]
+
+    assert events == [
+        (ModelResponseEvent.tool_call_started.value, "tool_0"),
+        (ModelResponseEvent.tool_call_started.value, "tool_1"),
+        (ModelResponseEvent.tool_call_completed.value, "tool_1"),
+        (ModelResponseEvent.tool_call_completed.value, "tool_0"),
+    ]
+    assert [r.tool_call_id for r in results] == ["call_tool_0", "call_tool_1"]
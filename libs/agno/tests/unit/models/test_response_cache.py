@@ -0,0 +1,78 @@
+"""Tests for the model response cache stores."""
+
+import os
+from time import time
+
+import pytest
+
+from agno.models.cache import DirectoryResponseCache, InMemoryResponseCache, SqliteResponseCache
+
+
+def _entry(content: str, age: int = 0) -> dict:
+    return {"timestamp": int(time()) - age, "is_streaming": False, "result": {"content": content}}
+
+
+@pytest.fixture(params=["memory", "sqlite", "directory"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        return InMemoryResponseCache()
+    if request.param == "sqlite":
+        return SqliteResponseCache(db_file=tmp_path / "cache.db")
+    return DirectoryResponseCache(cache_dir=tmp_path / "cache")
+
+
+def test_store_round_trip_and_stats(store):
+    store.set("key", _entry("hello"))
+
+    assert store.get("key")["result"]["content"] == "hello"
+    assert store.get("missing") is None
+
+    stats = store.get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+    assert stats["bytes_read"] == stats["bytes_written"] > 0
+
+
+def test_store_expires_entries(store):
+    store.set("old", _entry("old", age=100))
+
+    assert store.get("old", ttl=10) is None
+    # The expired entry was removed
+    assert store.get("old") is None
+
+
+def test_in_memory_cache_evicts_least_recently_used():
+    store = InMemoryResponseCache(max_entries=2)
+    store.set("a", _entry("a"))
+    store.set("b", _entry("b"))
+    store.get("a")
+    store.set("c", _entry("c"))
+
+    assert store.get("b") is None
+    assert store.get("a") is not None
+
+
+def test_sqlite_cache_evicts_by_size(tmp_path):
+    store = SqliteResponseCache(db_file=tmp_path / "cache.db", max_bytes=250)
+    for i in range(5):
+        store.set(f"key_{i}", _entry("x" * 50))
+
+    assert store.get("key_0") is None
+    assert store.get("key_4") is not None
+
+
+def test_directory_cache_shards_and_evicts_by_size(tmp_path):
+    store = DirectoryResponseCache(cache_dir=tmp_path, shard_depth=2, max_bytes=250, prune_interval_bytes=0)
+
+    assert store.get_path("abcdef") == tmp_path / "ab" / "cd" / "abcdef.json"
+
+    for i in range(5):
+        key = f"{i:02d}key"
+        store.set(key, _entry("x" * 50))
+        # Make the write order visible to the eviction, whatever the file system time resolution
+        os.utime(store.get_path(key), (i, i))
+
+    store.prune()
+    assert not store.get_path("00key").exists()
+    assert store.get_path("04key").exists()
@@ -248,6 +248,18 @@ class TestEnableSchedule:
         assert resp.status_code == 200
         assert resp.json()["enabled"] is True
 
+    @patch("agno.scheduler.cron._require_pytz")
+    @patch("agno.scheduler.cron._require_croniter")
+    @patch("agno.scheduler.cron.compute_next_run", return_value=int(time.time()) + 60)
+    def test_enable_wakes_up_the_poller(self, mock_compute, mock_req_cron, mock_req_pytz, client, mock_db):
+        mock_db.get_schedule = MagicMock(return_value=_make_schedule_dict(enabled=False))
+        poller = MagicMock()
+        client.app.state.scheduler_poller = poller
+
+        resp = client.post("/schedules/sched-1/enable")
+        assert resp.status_code == 200
+        poller.notify.assert_called_once()
+
     def test_enable_not_found(self, client, mock_db):
         mock_db.get_schedule = MagicMock(return_value=None)
         resp = client.post("/schedules/missing/enable")
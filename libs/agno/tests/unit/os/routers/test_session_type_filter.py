@@ -181,6 +181,36 @@ class TestGetSessionsWithType:
         assert resp.status_code == 422
 
 
+class TestGetSessionsWithCursor:
+    """GET /sessions?cursor= pages session summaries by key."""
+
+    def test_cursor_pages_cover_all_sessions_newest_first(self, db_with_sessions):
+        db, agent_s, team_s, wf_s = db_with_sessions
+        client = _build_client(db)
+
+        resp = client.get("/sessions?user_id=user-1&limit=2&cursor=")
+        assert resp.status_code == 200
+        first_page, meta = _get_data(resp)
+        assert [s["session_id"] for s in first_page] == [wf_s.session_id, team_s.session_id]
+        assert [s["session_name"] for s in first_page] == ["Workflow Run", "Team Chat"]
+        # The total count is only counted on request
+        assert meta["total_count"] == 0
+        assert meta["next_cursor"]
+
+        resp = client.get(f"/sessions?user_id=user-1&limit=2&cursor={meta['next_cursor']}&with_total_count=true")
+        second_page, meta = _get_data(resp)
+        assert [s["session_id"] for s in second_page] == [agent_s.session_id]
+        assert meta["total_count"] == 3
+        assert "next_cursor" not in meta
+
+    def test_invalid_cursor_returns_400(self, db_with_sessions):
+        db, *_ = db_with_sessions
+        client = _build_client(db)
+
+        resp = client.get("/sessions?cursor=not-a-cursor")
+        assert resp.status_code == 400
+
+
 class TestGetSessionByIdAutoDetect:
     """GET /sessions/{id} auto-detects session type when no type param is provided."""
 
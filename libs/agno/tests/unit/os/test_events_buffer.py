@@ -1,7 +1,14 @@
 """Tests for EventsBuffer — monotonic indexing and trim correctness."""
 
+import json
+import threading
+
+import pytest
+
+from agno.os.event_log import RedisEventLog, SqliteEventLog
 from agno.os.managers import EventsBuffer
 from agno.run.agent import RunContentEvent
+from agno.run.base import RunStatus
 
 
 def _make_event(content: str) -> RunContentEvent:
@@ -155,3 +162,193 @@ class TestMultipleRuns:
         assert len(events_b) == 2
         assert events_b[0][0] == 6
         assert events_b[0][1].content == "b6"
+
+
+class FakeRedis:
+    """Minimal in-process stand-in for the Redis commands used by RedisEventLog."""
+
+    def __init__(self):
+        self.hashes = {}
+        self.streams = {}
+        self.ttls = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def hsetnx(self, key, field, value):
+        self.hashes.setdefault(key, {}).setdefault(field, value)
+
+    def hset(self, key, field=None, value=None, mapping=None):
+        h = self.hashes.setdefault(key, {})
+        if field is not None:
+            h[field] = value
+        h.update(mapping or {})
+
+    def hget(self, key, field):
+        return self.hashes.get(key, {}).get(field)
+
+    def xadd(self, key, fields, id, maxlen=None, approximate=True):
+        stream = self.streams.setdefault(key, [])
+        stream.append((id, dict(fields)))
+        if maxlen is not None:
+            del stream[:-maxlen]
+
+    def xrange(self, key, min="-", max="+"):
+        def seq(entry_id):
+            return int(entry_id.split("-")[0])
+
+        return [e for e in self.streams.get(key, []) if min == "-" or seq(e[0]) >= seq(min)]
+
+    def xlen(self, key):
+        return len(self.streams.get(key, []))
+
+    def expire(self, key, seconds):
+        self.ttls[key] = seconds
+
+    def delete(self, *keys):
+        for key in keys:
+            self.hashes.pop(key, None)
+            self.streams.pop(key, None)
+
+
+class FakePipeline:
+    """Queues commands and runs them on execute(), like a redis-py pipeline."""
+
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.commands.append((getattr(self.client, name), args, kwargs))
+
+        return queue
+
+    def execute(self):
+        return [command(*args, **kwargs) for command, args, kwargs in self.commands]
+
+
+@pytest.fixture(params=["sqlite", "redis"])
+def event_log(request, tmp_path):
+    if request.param == "sqlite":
+        return SqliteEventLog(db_file=tmp_path / "events.db", max_events_per_run=3)
+    return RedisEventLog(client=FakeRedis(), max_events_per_run=3)
+
+
+class TestSharedEventLog:
+    """EventsBuffer backed by an event log shared between processes."""
+
+    def test_events_visible_to_other_buffers(self, event_log):
+        writer = EventsBuffer(event_log=event_log)
+        reader = EventsBuffer(event_log=event_log)
+        indices = [writer.add_event("r1", _make_event(f"e{i}")) for i in range(5)]
+        assert writer.event_log_writer.flush(timeout=5)
+
+        assert indices == [0, 1, 2, 3, 4]
+        # Only the last 3 events are kept, with their monotonic indices
+        events = reader.get_events("r1", last_event_index=2)
+        assert [(i, e.content) for i, e in events] == [(3, "e3"), (4, "e4")]
+        assert reader.get_event_count("r1") == 3
+        assert reader.get_last_index("r1") == 4
+        assert reader.get_run_status("r1") == RunStatus.running
+
+    def test_sse_events_use_stored_json(self, event_log):
+        buf = EventsBuffer(event_log=event_log)
+        buf.add_event("r1", _make_event("hello"))
+
+        [(index, sse_data)] = buf.get_sse_events("r1")
+        event_type, data = sse_data.split("\n")[:2]
+
+        assert index == 0
+        assert event_type == "event: RunContent"
+        payload = json.loads(data[len("data: ") :])
+        assert payload["content"] == "hello"
+        assert payload["event_index"] == 0
+        assert payload["run_id"] == "r1"
+
+    def test_run_completion_and_cleanup(self, event_log):
+        buf = EventsBuffer(event_log=event_log)
+        buf.add_event("r1", _make_event("e0"))
+        buf.set_run_completed("r1", RunStatus.completed)
+
+        assert buf.get_run_status("r1") == RunStatus.completed
+        assert buf.event_log_writer.flush(timeout=5)
+        assert event_log.get_status("r1") == "COMPLETED"
+        buf.cleanup_run("r1")
+        assert buf.get_run_status("r1") is None
+        assert buf.get_events("r1") == []
+
+    def test_continued_run_keeps_indices(self, event_log):
+        first = EventsBuffer(event_log=event_log)
+        first.add_event("r1", _make_event("e0"))
+        first.set_run_completed("r1", RunStatus.completed)
+        assert first.event_log_writer.flush(timeout=5)
+
+        # The run is continued on another worker
+        second = EventsBuffer(event_log=event_log)
+        assert second.add_event("r1", _make_event("e1")) == 1
+        assert [i for i, _ in second.get_events("r1")] == [0, 1]
+
+
+class BlockingEventLog(SqliteEventLog):
+    """Event log whose writes wait until they are released."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.release = threading.Event()
+
+    def append(self, run_id, events):
+        self.release.wait(timeout=5)
+        super().append(run_id, events)
+
+
+def test_add_event_does_not_wait_for_the_event_log(tmp_path):
+    event_log = BlockingEventLog(db_file=tmp_path / "events.db")
+    buf = EventsBuffer(event_log=event_log)
+
+    assert [buf.add_event("r1", _make_event(f"e{i}")) for i in range(3)] == [0, 1, 2]
+    # Events not written yet are still returned
+    assert event_log.read("r1") == []
+    assert [e.content for _, e in buf.get_events("r1", last_event_index=0)] == ["e1", "e2"]
+    assert buf.get_last_index("r1") == 2
+    assert buf.get_run_status("r1") == RunStatus.running
+
+    event_log.release.set()
+    assert buf.event_log_writer.flush(timeout=5)
+    assert [e.event_index for e in event_log.read("r1")] == [0, 1, 2]
+
+
+def test_redis_keys_expire_before_the_run_finishes():
+    client = FakeRedis()
+    buf = EventsBuffer(event_log=RedisEventLog(client=client, run_ttl=600, cleanup_interval=60))
+    buf.add_event("r1", _make_event("e0"))
+    assert buf.event_log_writer.flush(timeout=5)
+    assert client.ttls == {"agno:run_events:r1:meta": 600, "agno:run_events:r1:events": 600}
+
+    buf.set_run_completed("r1", RunStatus.completed)
+    assert buf.event_log_writer.flush(timeout=5)
+    assert client.ttls == {"agno:run_events:r1:meta": 60, "agno:run_events:r1:events": 60}
+
+
+def test_event_log_cleanup_is_rate_limited(tmp_path):
+    event_log = SqliteEventLog(db_file=tmp_path / "events.db")
+    buf = EventsBuffer(event_log=event_log)
+    cleanups = []
+    event_log.cleanup = lambda: cleanups.append(1)
+
+    for run_id in ("r1", "r2", "r3"):
+        buf.add_event(run_id, _make_event("e0"))
+        buf.set_run_completed(run_id, RunStatus.completed)
+        assert buf.event_log_writer.flush(timeout=5)
+    assert len(cleanups) == 1
+
+
+def test_in_memory_sse_events_match_shared_log(tmp_path):
+    memory_buffer = EventsBuffer()
+    shared_buffer = EventsBuffer(event_log=SqliteEventLog(db_file=tmp_path / "events.db"))
+    for buf in (memory_buffer, shared_buffer):
+        buf.add_event("r1", _make_event("hello"))
+
+    [(_, memory_sse)] = memory_buffer.get_sse_events("r1")
+    [(_, shared_sse)] = shared_buffer.get_sse_events("r1")
+    assert json.loads(memory_sse.split("data: ")[1]) == json.loads(shared_sse.split("data: ")[1])
@@ -35,7 +35,7 @@ def _patch_request(monkeypatch, **state):
 
 
 async def test_resolve_run_component_returns_a_fresh_copy_each_call():
-    """create_fresh: every run resolves a distinct deep_copy, never the shared singleton,
+    """create_fresh: every run resolves a distinct copy, never the shared singleton,
     so concurrent MCP runs cannot contaminate each other's state."""
     agent = Agent(id="a1", name="A1")
     os = AgentOS(agents=[agent], mcp_server=True)
@@ -327,7 +327,7 @@ def test_detached_trace_context_starts_a_new_root_trace():
 # back to its sticky per-instance session. The autouse _resolve_by_identity fixture hands
 # the run tools the SHARED instance -- the same resolution shape as an AgentProtocol /
 # RemoteAgent / RemoteTeam / remote workflow, which get_agent_by_id returns without a
-# per-call deep_copy -- so these tests exercise exactly the path where the bug (every
+# per-call copy -- so these tests exercise exactly the path where the bug (every
 # "sessionless" call collapsing into one ever-growing conversation) manifested.
 
 
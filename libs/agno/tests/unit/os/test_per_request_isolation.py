@@ -265,6 +265,81 @@ class TestAgentDeepCopy:
         assert copy.workflow_id is None
 
 
+class TestAgentRequestCopy:
+    """Tests for Agent.request_copy() method."""
+
+    def test_request_copy_shares_configuration(self):
+        """request_copy shares the configuration with the original instead of copying it."""
+        from agno.tools.toolkit import Toolkit
+
+        tool = Toolkit(name="shared")
+        instructions = ["Do this", "Do that"]
+        agent = Agent(name="test-agent", id="test-id", tools=[tool], instructions=instructions)
+
+        copy = agent.request_copy()
+
+        assert copy is not agent
+        assert copy.id == agent.id
+        assert copy.instructions is instructions
+        assert copy.tools[0] is tool
+        # The tools list itself is not shared
+        copy.tools.append(Toolkit(name="extra"))
+        assert len(agent.tools) == 1
+
+    def test_request_copy_isolates_run_state(self):
+        """request_copy copies mutable containers and resets the internal run state."""
+        agent = Agent(
+            name="test-agent",
+            id="test-id",
+            session_state={"items": ["a"]},
+            dependencies={"key": "value"},
+            metadata={"counter": 0},
+        )
+        agent.team_id = "parent-team-id"
+        agent._cached_session = "cached_value"  # type: ignore
+        agent._tool_instructions = ["instruction"]
+        agent._mcp_tools_initialized_on_run = ["tool"]
+
+        copy = agent.request_copy()
+        copy.session_state["items"].append("b")
+        copy.dependencies["key"] = "changed"
+        copy.metadata["counter"] = 1
+
+        assert agent.session_state == {"items": ["a"]}
+        assert agent.dependencies == {"key": "value"}
+        assert agent.metadata == {"counter": 0}
+        assert copy.team_id is None
+        assert copy._cached_session is None
+        assert copy._tool_instructions is None
+        assert copy._mcp_tools_initialized_on_run == []
+        assert agent._mcp_tools_initialized_on_run == ["tool"]
+
+    def test_request_copy_does_not_run_init(self, monkeypatch):
+        """request_copy does not construct a new Agent."""
+        agent = Agent(name="test-agent", id="test-id")
+
+        def fail_init(self, *args, **kwargs):
+            raise AssertionError("Agent.__init__ should not be called")
+
+        monkeypatch.setattr(Agent, "__init__", fail_init)
+
+        copy = get_agent_by_id("test-id", [agent], create_fresh=True)
+
+        assert copy is not agent
+        assert copy.name == "test-agent"
+
+    def test_request_copy_copies_reasoning_agent(self):
+        """The reasoning agent gets its own request copy."""
+        reasoning_agent = Agent(name="reasoner", metadata={"key": "value"})
+        agent = Agent(name="test-agent", id="test-id", reasoning_agent=reasoning_agent)
+
+        copy = agent.request_copy()
+
+        assert copy.reasoning_agent is not reasoning_agent
+        assert copy.reasoning_agent.metadata == {"key": "value"}
+        assert copy.reasoning_agent.metadata is not reasoning_agent.metadata
+
+
 # ============================================================================
 # Team Deep Copy Tests
 # ============================================================================
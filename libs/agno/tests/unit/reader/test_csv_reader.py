@@ -4,6 +4,7 @@ from pathlib import Path
 
 import pytest
 
+from agno.knowledge.chunking.row import RowChunking
 from agno.knowledge.document.base import Document
 from agno.knowledge.reader.csv_reader import CSVReader
 
@@ -371,3 +372,73 @@ def test_default_chunking_strategy_is_not_shared_between_instances():
     reader_a.chunking_strategy.skip_header = True
 
     assert reader_b.chunking_strategy.skip_header is False
+
+
+def test_read_iter_reads_one_page_at_a_time(multi_page_csv_file):
+    reader = CSVReader()
+    documents = reader.read_iter(multi_page_csv_file, page_size=5)
+
+    first = next(documents)
+    assert first.content == "name, age, city"
+    assert first.meta_data["page"] == 1
+
+    rest = list(documents)
+    assert [d.content for d in rest][-1] == "row10, 39, City10"
+    assert rest[-1].meta_data["page"] == 3
+    # Row numbers continue across pages
+    assert rest[-1].meta_data["row_number"] == 11
+
+
+@pytest.mark.parametrize("skip_header", [False, True])
+def test_read_iter_matches_read(multi_page_csv_file, skip_header):
+    reader = CSVReader(chunking_strategy=RowChunking(skip_header=skip_header))
+
+    read_docs = reader.read(multi_page_csv_file)
+    iter_docs = list(reader.read_iter(multi_page_csv_file, page_size=3))
+
+    def rows(documents):
+        # Chunk ids are "<document id>_row_<row number>", the document id is random per read
+        return [(d.content, d.meta_data["row_number"], d.id.split("_", 1)[1]) for d in documents]
+
+    assert rows(iter_docs) == rows(read_docs)
+    assert len({d.id for d in iter_docs}) == len(iter_docs)
+
+
+def test_read_iter_without_chunking_matches_read():
+    reader = CSVReader(chunk=False)
+    file_obj = io.BytesIO(SAMPLE_CSV.encode("utf-8"))
+    file_obj.name = "people.csv"
+
+    [document] = list(reader.read_iter(file_obj, page_size=2))
+
+    assert document.content == reader.read(file_obj)[0].content
+    assert document.name == "people"
+    # The caller's file object is left open
+    assert not file_obj.closed
+
+
+def test_read_iter_raises_read_errors(temp_dir):
+    file_path = temp_dir / "latin1.csv"
+    # Decoding only fails past the first pages
+    file_path.write_bytes(("name\n" + "ok\n" * 5000).encode() + "caf\xe9\n".encode("latin-1"))
+
+    documents = CSVReader().read_iter(file_path, page_size=1)
+
+    assert next(documents).content == "name"
+    with pytest.raises(UnicodeDecodeError):
+        list(documents)
+
+
+def test_read_iter_nonexistent_file(temp_dir):
+    with pytest.raises(FileNotFoundError, match="Could not find file"):
+        list(CSVReader().read_iter(temp_dir / "nonexistent.csv"))
+
+
+@pytest.mark.asyncio
+async def test_async_read_iter(multi_page_csv_file):
+    reader = CSVReader()
+
+    documents = [doc async for doc in reader.async_read_iter(multi_page_csv_file, page_size=5)]
+
+    assert len(documents) == 11
+    assert documents[10].meta_data["page"] == 3
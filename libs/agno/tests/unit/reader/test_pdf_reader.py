@@ -1,10 +1,12 @@
 import asyncio
 from io import BytesIO
 from pathlib import Path
+from typing import Optional
 
 import httpx
 import pytest
 
+from agno.knowledge.chunking.fixed import FixedSizeChunking
 from agno.knowledge.reader.pdf_reader import (
     PDFImageReader,
     PDFReader,
@@ -532,3 +534,106 @@ def test_pdf_reader_multiple_instances_independent():
     assert reader1.chunking_strategy is not reader2.chunking_strategy
     assert reader1.chunking_strategy.chunk_size == 300
     assert reader2.chunking_strategy.chunk_size == 400
+
+
+def _create_text_pdf(num_pages: int, password: Optional[str] = None) -> BytesIO:
+    """Create a PDF whose pages hold a line of text followed by their page number."""
+    from pypdf import PdfWriter
+    from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+    writer = PdfWriter()
+    font = writer._add_object(
+        DictionaryObject(
+            {
+                NameObject("/Type"): NameObject("/Font"),
+                NameObject("/Subtype"): NameObject("/Type1"),
+                NameObject("/BaseFont"): NameObject("/Helvetica"),
+            }
+        )
+    )
+    for i in range(num_pages):
+        page = writer.add_blank_page(width=612, height=792)
+        page[NameObject("/Resources")] = DictionaryObject(
+            {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+        )
+        content = DecodedStreamObject()
+        content.set_data(f"BT /F1 12 Tf 72 720 Td (Text of page {i}) Tj 0 -20 Td ({i + 1}) Tj ET".encode())
+        page[NameObject("/Contents")] = writer._add_object(content)
+    if password is not None:
+        writer.encrypt(user_password=password, owner_password="owner123")
+
+    buffer = BytesIO()
+    writer.write(buffer)
+    buffer.seek(0)
+    buffer.name = "text.pdf"
+    return buffer
+
+
+def _contents(docs):
+    return [(doc.content, doc.meta_data) for doc in docs]
+
+
+def test_pdf_reader_max_workers_matches_serial_extraction(tmp_path):
+    pdf_path = tmp_path / "text.pdf"
+    pdf_path.write_bytes(_create_text_pdf(9).getvalue())
+
+    serial_docs = PDFReader().read(pdf_path)
+    parallel_docs = PDFReader(max_workers=2).read(pdf_path)
+
+    assert _contents(parallel_docs) == _contents(serial_docs)
+    assert [doc.meta_data["page"] for doc in parallel_docs] == list(range(1, 10))
+    # The page numbers printed on the pages are replaced by the page markers
+    assert parallel_docs[3].content == "<start page 4>\nText of page 3\n<end page 4>"
+
+
+def test_pdf_reader_max_workers_reads_file_objects_and_encrypted_pdfs():
+    serial_docs = PDFReader().read(_create_text_pdf(5))
+
+    assert _contents(PDFReader(max_workers=3).read(_create_text_pdf(5))) == _contents(serial_docs)
+    encrypted_docs = PDFReader(max_workers=2, password="secret").read(_create_text_pdf(5, password="secret"))
+    assert _contents(encrypted_docs) == _contents(serial_docs)
+
+
+def test_pdf_reader_max_workers_reuses_the_worker_processes():
+    from agno.knowledge.reader import pdf_reader
+
+    reader = PDFReader(max_workers=2)
+    reader.read(_create_text_pdf(4))
+    pool = pdf_reader._process_pools[(2, "spawn")]
+    reader.read(_create_text_pdf(4))
+    PDFReader(max_workers=2).read(_create_text_pdf(4))
+
+    assert pdf_reader._process_pools[(2, "spawn")] is pool
+    assert pool._mp_context.get_start_method() == "spawn"
+
+
+@pytest.mark.asyncio
+async def test_pdf_reader_async_max_workers_matches_serial_extraction():
+    serial_docs = PDFReader().read(_create_text_pdf(6))
+    parallel_docs = await PDFReader(max_workers=2).async_read(_create_text_pdf(6))
+
+    assert _contents(parallel_docs) == _contents(serial_docs)
+
+
+def test_pdf_reader_read_iter_yields_the_documents_of_read():
+    reader = PDFReader(max_workers=2, chunking_strategy=FixedSizeChunking(chunk_size=10, overlap=0))
+
+    docs = reader.read(_create_text_pdf(4))
+    iterated_docs = list(reader.read_iter(_create_text_pdf(4)))
+
+    assert len(docs) > 4
+    assert _contents(iterated_docs) == _contents(docs)
+
+
+@pytest.mark.asyncio
+async def test_pdf_reader_async_read_iter_yields_the_documents_of_read():
+    reader = PDFReader(split_on_pages=False)
+
+    iterated_docs = [doc async for doc in reader.async_read_iter(_create_text_pdf(3))]
+
+    assert _contents(iterated_docs) == _contents(reader.read(_create_text_pdf(3)))
+
+
+def test_pdf_reader_max_workers_must_be_positive():
+    with pytest.raises(ValueError, match="max_workers"):
+        PDFReader(max_workers=0)
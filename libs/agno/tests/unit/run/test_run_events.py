@@ -523,3 +523,48 @@ def test_requirements_in_run_paused_event():
     assert reconstructed.requirements[0].tool_execution.tool_name == "get_the_weather"
     assert reconstructed.requirements[0].tool_execution.requires_confirmation is True
     assert reconstructed.requirements[0].needs_confirmation is True
+
+
+def test_to_dict_matches_asdict_without_copying_excluded_fields():
+    from dataclasses import asdict, replace
+
+    from agno.models.message import Message
+    from agno.run.agent import RunOutput
+
+    class NotCopyable:
+        def __deepcopy__(self, memo):
+            raise AssertionError("excluded fields must not be copied")
+
+    run_output = RunOutput(
+        run_id="run_1",
+        content="Hello",
+        session_state={"cart": [{"item": "apple"}]},
+        messages=[Message(role="user", content="Hi")],
+        metadata={"key": NotCopyable()},
+    )
+
+    run_dict = run_output.to_dict()
+
+    # The fields asdict would have kept are the same
+    expected = asdict(replace(run_output, messages=None, metadata=None))
+    for key, value in expected.items():
+        if value is not None and key != "status":
+            assert run_dict[key] == value
+    assert run_dict["messages"][0]["content"] == "Hi"
+    # Mutable values are still copied, as with asdict
+    assert run_dict["session_state"] == {"cart": [{"item": "apple"}]}
+    assert run_dict["session_state"]["cart"] is not run_output.session_state["cart"]
+
+
+def test_compact_to_json_matches_json_module():
+    from agno.run.agent import RunContentEvent
+    from agno.utils.serialize import json_serializer
+
+    event = RunContentEvent(agent_id="agent_1", agent_name="Agent", run_id="run_1", content="Grüße 👋")
+
+    compact_json = event.to_json(separators=(",", ":"), indent=None)
+
+    assert compact_json == json.dumps(
+        event.to_dict(), separators=(",", ":"), default=json_serializer, ensure_ascii=False
+    )
+    assert "Grüße 👋" in compact_json
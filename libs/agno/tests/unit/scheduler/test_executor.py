@@ -2,11 +2,12 @@
 
 import asyncio
 import json
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from agno.scheduler.executor import ScheduleExecutor, _to_form_value
+from agno.scheduler.executor import InProcessScheduleExecutor, ScheduleExecutor, _to_form_value
 
 
 class TestToFormValue:
@@ -326,3 +327,83 @@ class TestExecutorExecute:
         mock_db.update_schedule_run.assert_called()
         cancel_call = mock_db.update_schedule_run.call_args
         assert cancel_call[1]["status"] == "cancelled"
+
+
+class TestInProcessExecutor:
+    """Test running schedules that target local components in process."""
+
+    @pytest.fixture
+    def executor(self):
+        return InProcessScheduleExecutor(
+            agent_os=MagicMock(), base_url="http://localhost:8000", internal_service_token="tok", poll_interval=0
+        )
+
+    @staticmethod
+    def _schedule(payload):
+        from agno.db.schemas.scheduler import Schedule
+
+        return Schedule.from_dict(
+            {
+                "id": "sched-1",
+                "name": "test-schedule",
+                "cron_expr": "* * * * *",
+                "endpoint": "/agents/a1/runs",
+                "method": "POST",
+                "payload": payload,
+            }
+        )
+
+    @pytest.mark.asyncio
+    async def test_runs_local_component_without_http(self, executor):
+        run_output = SimpleNamespace(
+            run_id="run-1",
+            session_id="sess-1",
+            status=SimpleNamespace(value="COMPLETED"),
+            content="done",
+            content_type="str",
+            input=None,
+            requirements=None,
+        )
+        component = MagicMock()
+        component.arun = AsyncMock(return_value=run_output)
+
+        with patch.object(executor, "_get_component", return_value=component):
+            with patch.object(executor, "_background_run", new_callable=AsyncMock) as mock_background_run:
+                result = await executor._call_endpoint(self._schedule({"message": "hi", "user_id": "u1"}))
+
+        component.arun.assert_awaited_once_with(input="hi", stream=False, user_id="u1")
+        mock_background_run.assert_not_called()
+        assert result["status"] == "success"
+        assert result["run_id"] == "run-1"
+        assert result["output"] == {"content": "done", "content_type": "str"}
+
+    @pytest.mark.asyncio
+    async def test_paused_run_keeps_requirements(self, executor):
+        requirement = MagicMock()
+        requirement.to_dict = MagicMock(return_value={"id": "req-1"})
+        run_output = SimpleNamespace(
+            run_id="run-1",
+            session_id="sess-1",
+            status=SimpleNamespace(value="PAUSED"),
+            content=None,
+            input=None,
+            requirements=[requirement],
+        )
+        component = MagicMock()
+        component.arun = AsyncMock(return_value=run_output)
+
+        with patch.object(executor, "_get_component", return_value=component):
+            result = await executor._call_endpoint(self._schedule({"message": "hi"}))
+
+        assert result["status"] == "paused"
+        assert result["requirements"] == [{"id": "req-1"}]
+
+    @pytest.mark.asyncio
+    async def test_unsupported_payload_goes_over_http(self, executor):
+        http_result = {"status": "success"}
+        with patch.object(executor, "_get_component") as mock_get_component:
+            with patch.object(ScheduleExecutor, "_call_endpoint", new_callable=AsyncMock, return_value=http_result):
+                result = await executor._call_endpoint(self._schedule({"message": "hi", "output_schema": "{}"}))
+
+        mock_get_component.assert_not_called()
+        assert result is http_result
@@ -1,7 +1,7 @@
 """Tests for the ScheduleManager Pythonic API."""
 
 import time
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -131,6 +131,11 @@ class TestManagerUpdate:
         assert result is not None
         mock_db.update_schedule.assert_called_once_with("sched-1", description="Updated")
 
+    def test_update_notifies_pollers(self, mgr):
+        with patch("agno.scheduler.manager.notify_pollers") as notify_pollers:
+            mgr.update("sched-1", description="Updated")
+        notify_pollers.assert_called_once()
+
 
 class TestManagerDelete:
     def test_delete(self, mgr, mock_db):
@@ -1,12 +1,13 @@
 """Tests for the SchedulePoller."""
 
 import asyncio
+import time
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from agno.db.schemas.scheduler import Schedule
-from agno.scheduler.poller import SchedulePoller
+from agno.scheduler.poller import SchedulePoller, notify_pollers
 
 
 def _make_schedule_dict(**overrides):
@@ -192,6 +193,93 @@ class TestPollerPollOnce:
         assert call_args[0][0].id == "s1"
 
 
+class TestPollerEventDriven:
+    @pytest.mark.asyncio
+    async def test_refresh_builds_heap_incrementally(self, mock_db, mock_executor):
+        now = int(time.time())
+        mock_db.get_schedule_next_runs = MagicMock(
+            return_value=[
+                {"id": "s1", "enabled": True, "next_run_at": now + 60, "updated_at": now},
+                {"id": "s2", "enabled": True, "next_run_at": now + 30, "updated_at": now},
+                {"id": "s3", "enabled": False, "next_run_at": now + 10, "updated_at": now},
+            ]
+        )
+        poller = SchedulePoller(db=mock_db, executor=mock_executor, event_driven=True)
+
+        await poller._refresh_next_runs()
+        assert poller._peek_next_run() == now + 30
+        mock_db.get_schedule_next_runs.assert_called_with(updated_since=None)
+
+        # s2 moved later, only the updated row is returned
+        mock_db.get_schedule_next_runs.return_value = [
+            {"id": "s2", "enabled": True, "next_run_at": now + 90, "updated_at": now + 1}
+        ]
+        await poller._refresh_next_runs()
+        assert poller._peek_next_run() == now + 60
+        assert mock_db.get_schedule_next_runs.call_args[1]["updated_since"] is not None
+
+    @pytest.mark.asyncio
+    async def test_claims_due_schedules_in_batches(self, mock_db, mock_executor):
+        now = int(time.time())
+        batches = [
+            [_make_schedule_dict(id="s1"), _make_schedule_dict(id="s2")],
+            [_make_schedule_dict(id="s3")],
+        ]
+        mock_db.claim_due_schedules = MagicMock(side_effect=lambda worker_id, limit: batches.pop(0))
+        poller = SchedulePoller(db=mock_db, executor=mock_executor, event_driven=True, claim_batch_size=2)
+        poller._running = True
+        poller._next_runs = {"s1": now - 1}
+        poller._next_run_heap = [(now - 1, "s1")]
+
+        await poller._claim_due()
+        await asyncio.sleep(0.05)
+
+        assert mock_db.claim_due_schedules.call_count == 2
+        assert mock_executor.execute.call_count == 3
+        # The due entry is retried after poll_interval unless a refresh brings a new next_run_at
+        assert poller._peek_next_run() > now
+
+    @pytest.mark.asyncio
+    async def test_dispatch_loop_sleeps_until_next_due_time(self, mock_db, mock_executor):
+        now = time.time()
+        mock_db.get_schedule_next_runs = MagicMock(
+            return_value=[{"id": "s1", "enabled": True, "next_run_at": now + 0.2, "updated_at": int(now)}]
+        )
+        claimed = asyncio.Event()
+
+        def claim(worker_id, limit):
+            claimed.set()
+            return []
+
+        mock_db.claim_due_schedules = MagicMock(side_effect=claim)
+        poller = SchedulePoller(db=mock_db, executor=mock_executor, poll_interval=100, event_driven=True)
+
+        await poller.start()
+        await asyncio.wait_for(claimed.wait(), timeout=2)
+        assert time.time() - now < 1
+        await poller.stop()
+
+    @pytest.mark.asyncio
+    async def test_notify_from_another_thread_wakes_up_the_dispatcher(self, mock_db, mock_executor):
+        mock_db.get_schedule_next_runs = MagicMock(return_value=[])
+        mock_db.claim_due_schedules = MagicMock(return_value=[])
+        poller = SchedulePoller(db=mock_db, executor=mock_executor, poll_interval=100, event_driven=True)
+
+        await poller.start()
+        await asyncio.sleep(0.05)
+        assert mock_db.get_schedule_next_runs.call_count == 1
+
+        # e.g. a ScheduleManager used from a tool running in a worker thread
+        await asyncio.to_thread(notify_pollers)
+        await asyncio.sleep(0.05)
+        assert mock_db.get_schedule_next_runs.call_count == 2
+        await poller.stop()
+
+        notify_pollers()
+        await asyncio.sleep(0.05)
+        assert mock_db.get_schedule_next_runs.call_count == 2
+
+
 class TestPollerTrigger:
     @pytest.mark.asyncio
     async def test_trigger_found(self, mock_db, mock_executor):
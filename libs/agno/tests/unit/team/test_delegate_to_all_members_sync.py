@@ -0,0 +1,98 @@
+"""Tests for delegating a task to all members from a synchronous team run."""
+
+import threading
+from typing import List
+
+from agno.agent import Agent
+from agno.run import RunContext
+from agno.run.agent import RunContentEvent, RunOutput
+from agno.run.team import TeamRunOutput
+from agno.session.team import TeamSession
+from agno.team.team import Team
+
+
+def _get_delegate_function(team: Team, stream: bool = False):
+    return team._get_delegate_task_function(
+        session=TeamSession(session_id="session-id"),
+        run_response=TeamRunOutput(run_id="run-id", content=""),
+        run_context=RunContext(session_state={}, run_id="run-id", session_id="session-id"),
+        team_run_context={},
+        stream=stream,
+    )
+
+
+def _make_member(name: str, on_run) -> Agent:
+    agent = Agent(name=name, id=name.lower())
+
+    def run(*args, stream: bool = False, **kwargs):
+        on_run(name)
+        output = RunOutput(run_id=kwargs.get("run_id"), agent_id=agent.id, agent_name=name, content=f"from {name}")
+        if not stream:
+            return output
+
+        def events():
+            yield RunContentEvent(agent_id=agent.id, agent_name=name, content=f"chunk from {name}")
+            yield output
+
+        return events()
+
+    agent.run = run  # type: ignore[method-assign]
+    return agent
+
+
+def test_members_run_concurrently_and_results_keep_member_order():
+    # Every member waits for all the others, so the run only finishes if they run at the same time
+    barrier = threading.Barrier(3, timeout=5)
+    members = [_make_member(f"Worker{i}", lambda name: barrier.wait()) for i in range(3)]
+    team = Team(name="Team", members=members, delegate_to_all_members=True)
+
+    results = list(_get_delegate_function(team).entrypoint(task="Do the task"))
+
+    assert results == ["Agent Worker0: from Worker0", "Agent Worker1: from Worker1", "Agent Worker2: from Worker2"]
+
+
+def test_streaming_merges_the_events_of_all_members():
+    barrier = threading.Barrier(2, timeout=5)
+    members = [_make_member(f"Worker{i}", lambda name: barrier.wait()) for i in range(2)]
+    team = Team(name="Team", members=members, delegate_to_all_members=True)
+
+    events = list(_get_delegate_function(team, stream=True).entrypoint(task="Do the task"))
+
+    contents = sorted(event.content for event in events if isinstance(event, RunContentEvent))
+    assert contents == ["chunk from Worker0", "chunk from Worker1"]
+    assert all(event.parent_run_id == "run-id" for event in events if isinstance(event, RunContentEvent))
+
+
+def test_max_concurrent_members_limits_the_members_running_at_once():
+    lock = threading.Lock()
+    running: List[int] = [0]
+    max_running: List[int] = [0]
+
+    def on_run(name: str) -> None:
+        with lock:
+            running[0] += 1
+            max_running[0] = max(max_running[0], running[0])
+        threading.Event().wait(0.05)
+        with lock:
+            running[0] -= 1
+
+    members = [_make_member(f"Worker{i}", on_run) for i in range(3)]
+    team = Team(name="Team", members=members, delegate_to_all_members=True, max_concurrent_members=1)
+
+    results = list(_get_delegate_function(team).entrypoint(task="Do the task"))
+
+    assert len(results) == 3
+    assert max_running[0] == 1
+
+
+def test_member_error_does_not_stop_the_other_members():
+    def on_run(name: str) -> None:
+        if name == "Worker1":
+            raise ValueError("boom")
+
+    members = [_make_member(f"Worker{i}", on_run) for i in range(3)]
+    team = Team(name="Team", members=members, delegate_to_all_members=True)
+
+    results = list(_get_delegate_function(team).entrypoint(task="Do the task"))
+
+    assert results == ["Agent Worker0: from Worker0", "Agent Worker1: Error - boom", "Agent Worker2: from Worker2"]
@@ -189,6 +189,59 @@ def test_function_process_entrypoint():
     assert "param2" not in func.parameters["required"]
 
 
+def test_process_entrypoint_reuses_compiled_entrypoint(mocker):
+    """Functions with the same entrypoint and options are only processed once."""
+    import agno.utils.json_schema as json_schema_module
+
+    function_module.clear_compiled_entrypoints()
+    schema_spy = mocker.spy(json_schema_module, "get_json_schema")
+
+    def test_func(param1: str, param2: int = 42) -> str:
+        """Test function with parameters."""
+        return f"{param1}-{param2}"
+
+    first = Function(name="test_func", entrypoint=test_func)
+    first.process_entrypoint()
+    second = Function(name="test_func", entrypoint=test_func)
+    second.process_entrypoint()
+
+    assert schema_spy.call_count == 1
+    assert second.parameters == first.parameters
+    # Each Function gets its own copy of the schema
+    assert second.parameters is not first.parameters
+    assert second.description == "Test function with parameters."
+    assert second.entrypoint is first.entrypoint
+    assert second.entrypoint._wrapped_for_validation is True
+
+    # Strict mode changes the schema, so it is processed separately
+    strict = Function(name="test_func", entrypoint=test_func)
+    strict.process_entrypoint(strict=True)
+
+    assert schema_spy.call_count == 2
+    assert strict.parameters["required"] == ["param1", "param2"]
+    assert "param2" not in second.parameters["required"]
+
+
+def test_process_entrypoint_cache_isolates_user_input_schema():
+    """Cached user input schemas are copied, so one run's input doesn't leak into another."""
+    function_module.clear_compiled_entrypoints()
+
+    def test_func(param1: str, param2: int = 42) -> str:
+        """Test function with parameters."""
+        return f"{param1}-{param2}"
+
+    first = Function(name="test_func", entrypoint=test_func, requires_user_input=True, user_input_fields=["param1"])
+    first.process_entrypoint()
+    first.user_input_schema[0].value = "answer"
+
+    second = Function(name="test_func", entrypoint=test_func, requires_user_input=True, user_input_fields=["param1"])
+    second.process_entrypoint()
+
+    assert second.user_input_schema[0].name == "param1"
+    assert second.user_input_schema[0].value is None
+    assert second.parameters == first.parameters
+
+
 def test_function_process_entrypoint_with_user_input():
     """Test processing the entrypoint with user input fields."""
 
@@ -0,0 +1,121 @@
+"""Tests for the background mode of DatabaseSpanExporter."""
+
+import threading
+import time
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+pytest.importorskip("opentelemetry.sdk")
+
+from agno.db.base import BaseDb  # noqa: E402
+from agno.tracing.exporter import DatabaseSpanExporter  # noqa: E402
+from agno.tracing.schemas import Span  # noqa: E402
+
+
+def _span(span_id: str, trace_id: str) -> Span:
+    now = datetime.now(timezone.utc)
+    return Span(
+        span_id=span_id,
+        trace_id=trace_id,
+        parent_span_id=None,
+        name="agent.run",
+        span_kind="INTERNAL",
+        status_code="OK",
+        status_message=None,
+        start_time=now,
+        end_time=now,
+        duration_ms=0,
+        attributes={},
+        created_at=now,
+    )
+
+
+def test_background_export_writes_batches_on_flush():
+    db = MagicMock(spec=BaseDb)
+    exporter = DatabaseSpanExporter(db=db, background_export=True)
+
+    exporter._enqueue([_span("a", "t1"), _span("b", "t1"), _span("c", "t2")])
+    assert exporter.force_flush(timeout_millis=5000)
+
+    written_spans = [span for call in db.upsert_traces_and_spans.call_args_list for span in call.args[1]]
+    assert sorted(span.span_id for span in written_spans) == ["a", "b", "c"]
+    assert exporter.get_stats()["exported_spans"] == 3
+    exporter.shutdown()
+
+
+def test_background_export_drops_spans_when_queue_is_full():
+    db = MagicMock(spec=BaseDb)
+    release = threading.Event()
+    db.upsert_traces_and_spans.side_effect = lambda traces, spans: release.wait(5)
+    exporter = DatabaseSpanExporter(db=db, background_export=True, max_queue_size=2, max_batch_size=1)
+
+    # The writer holds the first span, the queue takes two more and the rest are dropped
+    exporter._enqueue([_span(str(i), "t1") for i in range(10)])
+    release.set()
+    exporter.shutdown()
+
+    stats = exporter.get_stats()
+    assert stats["dropped_spans"] > 0
+    assert stats["exported_spans"] + stats["dropped_spans"] == 10
+
+
+def test_shutdown_writes_queued_spans():
+    db = MagicMock(spec=BaseDb)
+    exporter = DatabaseSpanExporter(db=db, background_export=True)
+
+    exporter._enqueue([_span("a", "t1")])
+    exporter.shutdown()
+
+    assert exporter.get_stats()["exported_spans"] == 1
+    assert exporter.get_stats()["queued_spans"] == 0
+
+
+def test_failed_writes_are_counted_as_failed():
+    db = MagicMock(spec=BaseDb)
+    db.upsert_traces_and_spans.side_effect = RuntimeError("connection lost")
+    exporter = DatabaseSpanExporter(db=db, background_export=True)
+
+    exporter._enqueue([_span("a", "t1"), _span("b", "t1")])
+    assert exporter.force_flush(timeout_millis=5000)
+
+    assert exporter.get_stats()["failed_spans"] == 2
+    assert exporter.get_stats()["exported_spans"] == 0
+    exporter.shutdown()
+
+
+def test_failed_trace_does_not_fail_the_other_traces():
+    db = MagicMock(spec=BaseDb)
+
+    def upsert_traces_and_spans(traces, spans):
+        if any(span.trace_id == "bad" for span in spans):
+            raise ValueError("invalid trace")
+
+    db.upsert_traces_and_spans.side_effect = upsert_traces_and_spans
+    exporter = DatabaseSpanExporter(db=db)
+
+    spans_by_trace = {"t1": [_span("a", "t1")], "bad": [_span("b", "bad")], "t2": [_span("c", "t2")]}
+    assert exporter._export_sync(spans_by_trace) is False
+
+    stats = exporter.get_stats()
+    assert stats["exported_spans"] == 2
+    assert stats["failed_spans"] == 1
+
+
+def test_shutdown_does_not_block_on_a_stuck_writer():
+    db = MagicMock(spec=BaseDb)
+    release = threading.Event()
+    db.upsert_traces_and_spans.side_effect = lambda traces, spans: release.wait(5)
+    exporter = DatabaseSpanExporter(
+        db=db, background_export=True, max_queue_size=1, max_batch_size=1, shutdown_timeout_seconds=0.2
+    )
+
+    # The writer holds the first span and the second one fills the queue
+    exporter._enqueue([_span("a", "t1")])
+    exporter._enqueue([_span("b", "t1")])
+    started = time.monotonic()
+    exporter.shutdown()
+
+    assert time.monotonic() - started < 2
+    release.set()
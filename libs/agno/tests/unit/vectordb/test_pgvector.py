@@ -314,6 +314,33 @@ def test_upsert_builds_records_and_sets_conflict_on_id(mock_pgvector, mock_embed
         assert sess.commit.called
 
 
+def test_insert_embeds_each_batch_with_one_batch_call(mock_pgvector):
+    """Validate insert embeds each batch with a single batched embedder call when batching is enabled."""
+    docs = [Document(content=f"doc {i}", name=f"D{i}") for i in range(5)]
+
+    batch_embedder = MagicMock()
+    batch_embedder.enable_batch = True
+    batch_embedder.get_embeddings_batch_and_usage.side_effect = lambda texts: (
+        [[0.1] * 1024 for _ in texts],
+        [{"total_tokens": 1} for _ in texts],
+    )
+    mock_pgvector.embedder = batch_embedder
+
+    sess = MagicMock()
+    cm = MagicMock()
+    cm.__enter__.return_value = sess
+    mock_pgvector.Session.return_value = cm
+
+    with patch("agno.vectordb.pgvector.pgvector.postgresql.insert"):
+        mock_pgvector.insert("test_content_hash", docs, batch_size=2)
+
+    batch_calls = [c.args[0] for c in batch_embedder.get_embeddings_batch_and_usage.call_args_list]
+    assert batch_calls == [["doc 0", "doc 1"], ["doc 2", "doc 3"], ["doc 4"]]
+    batch_embedder.get_embedding_and_usage.assert_not_called()
+    assert sess.execute.call_count == 3
+    assert all(record["embedding"] == [0.1] * 1024 for c in sess.execute.call_args_list for record in c.args[1])
+
+
 def test_search(mock_pgvector):
     """Test search method."""
     # Test vector search